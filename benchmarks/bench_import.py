@@ -0,0 +1,65 @@
+""" Import time benchmark
+
+Measures, in fresh interpreters, the time spent in `import depict` alone and
+the time spent until the first plot is ready (import, default session
+creation and one small line plot). Since numpy, bokeh, pandas and seaborn are
+only imported when the first session is created, the first figure should be
+much smaller than the second one.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPETS = {
+    'import depict': 'import depict',
+    'import depict + first plot': (
+        'import depict\n'
+        'depict.line([1, 2, 3], show_plot=False)'
+    ),
+}
+
+TEMPLATE = """
+import sys
+import time
+t_0 = time.perf_counter()
+{snippet}
+print(time.perf_counter() - t_0)
+print(','.join(m for m in ('bokeh', 'pandas', 'seaborn', 'matplotlib',
+                           'numpy') if m in sys.modules))
+"""
+
+
+def time_snippet(snippet, repeat):
+    durations = []
+    modules = ''
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c',
+                              TEMPLATE.format(snippet=snippet)],
+                             cwd=ROOT, check=True, stdout=subprocess.PIPE,
+                             universal_newlines=True).stdout.splitlines()
+        durations.append(float(out[0]))
+        modules = out[1] if len(out) > 1 else ''
+    return durations, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, snippet in SNIPPETS.items():
+        durations, modules = time_snippet(snippet, args.repeat)
+        print('{:<30} median {:8.1f} ms   min {:8.1f} ms   heavy modules '
+              'loaded: {}'.format(name, 1000 * statistics.median(durations),
+                                  1000 * min(durations), modules or 'none'))
+
+
+if __name__ == '__main__':
+    main()
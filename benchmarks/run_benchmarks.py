@@ -0,0 +1,227 @@
+""" Benchmark suite of depict
+
+Times the construction of line, point and histogram plots, the addition of
+plots (`Plot.__add__`), the layout building done by `show` and the
+serialization done by `save`, for n points split in k series. For each case,
+the wall time, the peak memory (traced by tracemalloc, NumPy buffers
+included) and the size of the saved HTML are recorded.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e5 --series 1 100 \
+        --cases line point --json results.json
+    python benchmarks/run_benchmarks.py --compare results.json
+
+With `--compare`, the results are compared with a previous JSON file and
+the cases slower (or heavier) than `--tolerance` are reported. The exit code
+is 1 if there is at least one regression.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+import depict  # noqa: E402
+from bench_import import SNIPPETS, time_snippet  # noqa: E402
+
+DEFAULT_SIZES = [1e3, 1e4, 1e5, 1e6, 1e7]
+DEFAULT_SERIES = [1, 10, 100, 1000]
+
+
+def _split(values, nb_series):
+    return np.array_split(values, nb_series)
+
+
+def make_line(n, k, rng):
+    if k == 1:
+        return depict.line(y=np.cumsum(rng.rand(n) - 0.5))
+    return depict.line(y=[np.cumsum(y_i - 0.5) for y_i in
+                          _split(rng.rand(n), k)])
+
+
+def make_point(n, k, rng):
+    legend = None if k == 1 else np.repeat(
+        ['group {}'.format(i) for i in range(k)], n // k + 1)[:n].tolist()
+    return depict.point(x=rng.rand(n), y=rng.rand(n), legend=legend)
+
+
+def make_histogram(n, k, rng):
+    legend = None if k == 1 else np.repeat(
+        ['group {}'.format(i) for i in range(k)], n // k + 1)[:n].tolist()
+    return depict.histogram(x=np.arange(n), y=rng.rand(n), legend=legend)
+
+
+def make_sum(n, k, rng):
+    plots = [depict.line(y=y_i) for y_i in _split(rng.rand(n), k)]
+    plot_sum = plots[0]
+    for plot in plots[1:]:
+        plot_sum = plot_sum + plot
+    return plot_sum
+
+
+BUILDERS = {
+    'line': make_line,
+    'point': make_point,
+    'histogram': make_histogram,
+    'add': make_sum,
+}
+
+
+def measure(function, *args, trace_memory=True):
+    """ Run `function(*args)` and return (result, seconds, peak MB)
+
+    The time is measured without tracemalloc, which slows down allocations.
+    If `trace_memory`, the function is run a second time to trace the peak
+    of memory.
+    """
+    gc.collect()
+    t_0 = time.perf_counter()
+    result = function(*args)
+    duration = time.perf_counter() - t_0
+    if not trace_memory:
+        return result, duration, None
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, duration, peak / 1e6
+
+
+def run_case(case, n, k, save_dir, trace_memory):
+    from depict.core.tools import _build_layout, clear_layout_cache
+    plot, build_s, build_mb = measure(
+        lambda: BUILDERS[case](n, k, np.random.RandomState(0)),
+        trace_memory=trace_memory)
+    # The layouts are built without the cache, as on the first show / save
+    _, show_s, show_mb = measure(_build_layout, plot, False, False, False,
+                                 trace_memory=trace_memory)
+    save_path = os.path.join(save_dir, '{}_{}_{}.html'.format(case, n, k))
+
+    def save():
+        clear_layout_cache()
+        depict.save(plot, save_path, 'overwrite')
+    _, save_s, save_mb = measure(save, trace_memory=trace_memory)
+    result = {'case': case, 'n': n, 'k': k, 'build_s': build_s,
+              'show_s': show_s, 'save_s': save_s,
+              'html_bytes': os.path.getsize(save_path)}
+    if trace_memory:
+        result.update({'build_peak_mb': build_mb, 'show_peak_mb': show_mb,
+                       'save_peak_mb': save_mb})
+    return result
+
+
+def run_import(repeat):
+    results = []
+    for name, snippet in SNIPPETS.items():
+        durations, _ = time_snippet(snippet, repeat)
+        results.append({'case': name, 'n': 0, 'k': 0,
+                        'build_s': min(durations)})
+    return results
+
+
+def compare(results, reference, tolerance, min_seconds):
+    """ Cases of `results` slower or heavier than `reference`
+
+    Durations are only compared when the difference is above `min_seconds`,
+    shorter differences being mostly noise.
+    """
+    metrics = ['build_s', 'show_s', 'save_s', 'build_peak_mb', 'html_bytes']
+    reference = {(r['case'], r['n'], r['k']): r for r in reference}
+    regressions = []
+    for res in results:
+        ref = reference.get((res['case'], res['n'], res['k']))
+        if ref is None:
+            continue
+        for metric in metrics:
+            if (metric not in res) or (metric not in ref) or not ref[metric]:
+                continue
+            if metric.endswith('_s') and (
+                    res[metric] - ref[metric] < min_seconds):
+                continue
+            if res[metric] > ref[metric] * (1 + tolerance):
+                regressions.append('{} n={} k={}: {} {:.4g} -> {:.4g}'.format(
+                    res['case'], res['n'], res['k'], metric, ref[metric],
+                    res[metric]))
+    return regressions
+
+
+def print_results(results):
+    header = ('{:<28}{:>10}{:>6}{:>10}{:>10}{:>10}{:>10}{:>12}{:>14}'.format(
+        'case', 'n', 'k', 'build s', 'show s', 'save s', 'build MB',
+        'save MB', 'HTML bytes'))
+    print(header)
+    print('-' * len(header))
+    for res in results:
+        print('{:<28}{:>10}{:>6}{:>10.3f}{:>10}{:>10}{:>10}{:>12}{:>14}'
+              .format(res['case'], res['n'], res['k'], res['build_s'],
+                      *['{:.3f}'.format(res[m]) if m in res else '-'
+                        for m in ['show_s', 'save_s']],
+                      *['{:.1f}'.format(res[m]) if m in res else '-'
+                        for m in ['build_peak_mb', 'save_peak_mb']],
+                      res.get('html_bytes', '-')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', nargs='+',
+                        default=list(BUILDERS) + ['import'],
+                        choices=list(BUILDERS) + ['import'])
+    parser.add_argument('--sizes', nargs='+', type=float,
+                        default=DEFAULT_SIZES, help='Numbers of points')
+    parser.add_argument('--series', nargs='+', type=int,
+                        default=DEFAULT_SERIES, help='Numbers of series')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Repetitions of the import benchmark')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Do not trace the peak of memory (faster)')
+    parser.add_argument('--json', help='Write the results in this file')
+    parser.add_argument('--compare', help='JSON file of reference results')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Relative slowdown reported as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help='Smallest slowdown reported as a regression')
+    args = parser.parse_args()
+
+    depict.session(show_plot=False, width_total_as_session=False)
+    results = []
+    with tempfile.TemporaryDirectory() as save_dir:
+        for case in args.cases:
+            if case == 'import':
+                results.extend(run_import(args.repeat))
+                continue
+            for n in [int(s) for s in args.sizes]:
+                for k in args.series:
+                    if k > n:
+                        continue
+                    print('{} n={} k={}'.format(case, n, k), file=sys.stderr)
+                    results.append(run_case(case, n, k, save_dir,
+                                            not args.no_memory))
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance,
+                                  args.min_seconds)
+        print()
+        print('\n'.join(regressions) if regressions else 'No regression')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
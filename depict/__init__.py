@@ -1,29 +1,54 @@
-from .core.histogram import histogram_base as _histogram_base
-from .core.histogram import _update_histogram_default_args
-from .core.line import line_base as _line_base
-from .core.line import _update_line_default_args
+from .core import api as _api
 
-from .core.point import point_base as _point_base
-from .core.point import _update_point_default_args
+__all__ = ['session', 'line', 'point', 'histogram', 'show', 'save',
+           'clear_cache', 'HistogramAccumulator', 'TimingCollector']
 
-from .core.tools import save_base as _save_base
-from .core.tools import _update_save_default_args
+# The default session is only created the first time one of the plotting
+# functions is called. This keeps `import depict` cheap: bokeh and pandas are
+# imported by `session`, not at import time.
+_SESSION = None
 
-from .core.tools import show_base as _show_base
-from .core.tools import _update_show_default_args
+# Same for the classes, imported on first access (the accumulator imports
+# numpy)
+_LAZY_CLASSES = ['HistogramAccumulator', 'TimingCollector']
 
-from .core.session import Session as _Session
 
+def __getattr__(name):
+    if name == 'HistogramAccumulator':
+        from .core.accumulator import HistogramAccumulator
+        return HistogramAccumulator
+    if name == 'TimingCollector':
+        from .core.timing import TimingCollector
+        return TimingCollector
+    raise AttributeError('module {!r} has no attribute {!r}'.format(
+        __name__, name))
 
-__all__ = ['session', 'line', 'point', 'histogram', 'show', 'save']
+
+def __dir__():
+    return sorted(list(globals()) + _LAZY_CLASSES)
 
 
 def session(width=900, height=400, save_path=None, file_exists_mode='append',
             description='', title='', jupyter_notebook=False,
             background_color='aliceblue', palette_name='categories_10',
             grid_visible=True, show_plot=True, width_total_as_session=True,
-            automatic_color_mapping=True):
+            automatic_color_mapping=True, color_mapping='python',
+            timing_callback=None, downsampling=None, points_per_pixel=2,
+            pyramid=False, pyramid_max_points=100000, output_backend='canvas',
+            webgl_threshold=100000):
     global _SESSION, histogram, line, point, save, show
+    from .core.histogram import histogram_base as _histogram_base
+    from .core.histogram import _update_histogram_default_args
+    from .core.line import line_base as _line_base
+    from .core.line import _update_line_default_args
+    from .core.point import point_base as _point_base
+    from .core.point import _update_point_default_args
+    from .core.session import Session as _Session
+    from .core.tools import save_base as _save_base
+    from .core.tools import _update_save_default_args
+    from .core.tools import show_base as _show_base
+    from .core.tools import _update_show_default_args
+
     _SESSION = _Session(width=width, height=height, save_path=save_path,
                         file_exists_mode=file_exists_mode,
                         description=description, title=title,
@@ -32,7 +57,15 @@ def session(width=900, height=400, save_path=None, file_exists_mode='append',
                         palette_name=palette_name,
                         grid_visible=grid_visible, show_plot=show_plot,
                         width_total_as_session=width_total_as_session,
-                        automatic_color_mapping=automatic_color_mapping)
+                        automatic_color_mapping=automatic_color_mapping,
+                        color_mapping=color_mapping,
+                        timing_callback=timing_callback,
+                        downsampling=downsampling,
+                        points_per_pixel=points_per_pixel,
+                        pyramid=pyramid,
+                        pyramid_max_points=pyramid_max_points,
+                        output_backend=output_backend,
+                        webgl_threshold=webgl_threshold)
 
     save = _update_save_default_args(save_base=_save_base, session=_SESSION)
     histogram = _update_histogram_default_args(histogram_base=_histogram_base,
@@ -42,4 +75,44 @@ def session(width=900, height=400, save_path=None, file_exists_mode='append',
     show = _update_show_default_args(show_base=_show_base, session=_SESSION)
 
 
-session()
+def clear_cache(plot=None):
+    """ Forget the layouts cached by `show` and `save`
+
+    `show` and `save` reuse the layout built for the same plots with the same
+    options. It is rebuilt when the plots change, but not when the data drawn
+    is modified in place: the cache must then be cleared.
+
+    Args:
+        plot (None, depict plot): If None, all the layouts are forgotten.
+            Otherwise, the layouts containing this plot
+    """
+    from .core.tools import clear_layout_cache
+    clear_layout_cache(plot)
+
+
+def _make_lazy_function(name):
+    # Placeholder with the signature and the documentation of the function
+    # bound to the default session (cf `core.api`, which imports nothing
+    # heavy)
+    documented = getattr(_api, name)
+
+    def lazy_function(*args, **kwargs):
+        if _SESSION is None:
+            session()
+        # `session` has replaced the module attribute by the function bound
+        # to the new session
+        return globals()[name](*args, **kwargs)
+    lazy_function.__name__ = name
+    lazy_function.__qualname__ = name
+    lazy_function.__doc__ = documented.__doc__
+    # `inspect.signature` follows `__wrapped__` (`inspect` itself is not
+    # imported: it would take ten times longer than `import depict`)
+    lazy_function.__wrapped__ = documented
+    return lazy_function
+
+
+line = _make_lazy_function('line')
+point = _make_lazy_function('point')
+histogram = _make_lazy_function('histogram')
+show = _make_lazy_function('show')
+save = _make_lazy_function('save')
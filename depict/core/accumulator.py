@@ -0,0 +1,142 @@
+""" Streaming histogram of samples
+
+The samples are added by chunks and only the counts of the bins are kept, so
+that the memory does not depend on the number of samples. Accumulators with
+the same bins (e.g. filled in several processes) can be merged, and pickled
+to be sent from a process to another.
+"""
+import numbers
+
+import numpy as np
+
+CHUNK_SIZE = 2 ** 20
+
+
+class HistogramAccumulator:
+    """ Histogram of samples added incrementally, with fixed bins
+
+    The bins are `nb_bins` bins of the same width between `low` and `high`,
+    or of the same width in log scale if `log` is True. As with
+    `np.histogram`, the last bin includes `high`. The samples out of the bins
+    are counted in `underflow` and `overflow`, the NaNs are ignored.
+
+    The accumulator is rendered by passing it as `y` to `depict.histogram`.
+
+    Args:
+        low (float): Left edge of the first bin
+        high (float): Right edge of the last bin
+        nb_bins (int): Number of bins
+        log (bool): If True, the bins are log-spaced (`low` must be > 0)
+
+    Example:
+        acc = HistogramAccumulator(1e-3, 10, nb_bins=50, log=True)
+        for chunk in chunks:
+            acc.add(chunk)
+        acc.merge(accumulator_of_another_worker)
+        depict.histogram(y=acc, x_axis_type='log')
+    """
+    def __init__(self, low, high, nb_bins=10, log=False):
+        if not isinstance(nb_bins, numbers.Integral) or (nb_bins < 1):
+            raise ValueError('`nb_bins` must be a positive integer')
+        if not (np.isfinite(low) and np.isfinite(high)) or (low >= high):
+            raise ValueError('`low` and `high` must be finite, and `low` < '
+                             '`high`')
+        if log and (low <= 0):
+            raise ValueError('With log-spaced bins, `low` must be positive')
+        self.low = float(low)
+        self.high = float(high)
+        self.nb_bins = int(nb_bins)
+        self.log = bool(log)
+        self.counts = np.zeros(self.nb_bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self):
+        """ Edges of the bins (np.ndarray of length nb_bins + 1) """
+        if self.log:
+            return np.geomspace(self.low, self.high, self.nb_bins + 1)
+        return np.linspace(self.low, self.high, self.nb_bins + 1)
+
+    @property
+    def nb_samples(self):
+        """ Number of samples added (NaNs excluded), out of the bins
+        included """
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def _bin_indexes(self, chunk, edges):
+        if self.log:
+            scaled = np.log(chunk / self.low) / np.log(self.high / self.low)
+        else:
+            scaled = (chunk - self.low) / (self.high - self.low)
+        indexes = np.clip((scaled * self.nb_bins).astype(np.int64), 0,
+                          self.nb_bins - 1)
+        # Rounding errors are corrected by comparing with the edges
+        indexes[chunk < edges[indexes]] -= 1
+        indexes[(chunk >= edges[indexes + 1])
+                & (indexes < self.nb_bins - 1)] += 1
+        return indexes
+
+    def add(self, samples, chunk_size=CHUNK_SIZE):
+        """ Add samples to the histogram
+
+        Args:
+            samples (array-like of numbers): The samples
+            chunk_size (int): Number of samples processed at once
+
+        Returns:
+            The accumulator itself
+        """
+        samples = np.asarray(samples)
+        if samples.dtype.kind not in 'biuf':
+            raise ValueError('The samples must be numbers')
+        samples = samples.ravel()
+        edges = self.edges
+        for start in range(0, len(samples), chunk_size):
+            chunk = samples[start:start + chunk_size].astype(float,
+                                                             copy=False)
+            chunk = chunk[~np.isnan(chunk)]
+            below = chunk < self.low
+            above = chunk > self.high
+            self.underflow += int(below.sum())
+            self.overflow += int(above.sum())
+            chunk = chunk[~(below | above)]
+            self.counts += np.bincount(self._bin_indexes(chunk, edges),
+                                       minlength=self.nb_bins)
+        return self
+
+    def merge(self, other):
+        """ Add the counts of another accumulator with the same bins
+
+        Args:
+            other (HistogramAccumulator): The accumulator merged
+
+        Returns:
+            The accumulator itself
+        """
+        if not isinstance(other, HistogramAccumulator):
+            raise ValueError('Only a HistogramAccumulator can be merged')
+        if (self.low, self.high, self.nb_bins, self.log) != (
+                other.low, other.high, other.nb_bins, other.log):
+            raise ValueError('Only accumulators with the same bins can be '
+                             'merged')
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def bars(self):
+        """ The histogram as bars
+
+        Returns:
+            (centers, widths, counts): The center and the width of each bar,
+                and the number of samples in the bar
+        """
+        edges = self.edges
+        widths = np.diff(edges)
+        return edges[:-1] + widths / 2, widths, self.counts.copy()
+
+    def __repr__(self):
+        return ('HistogramAccumulator(low={}, high={}, nb_bins={}, log={}, '
+                'nb_samples={})'.format(self.low, self.high, self.nb_bins,
+                                        self.log, self.nb_samples))
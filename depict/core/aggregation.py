@@ -0,0 +1,196 @@
+""" Aggregation of points in grids
+
+Large scatter plots are aggregated in Python, so that only the grid (not
+every point) is sent to the browser. The points are processed by chunks,
+so that the temporary arrays stay small whatever the number of points.
+"""
+import numpy as np
+
+REDUCTIONS = ['count', 'mean', 'max']
+CHUNK_SIZE = 2 ** 20
+
+
+def to_float(values):
+    """ Values as floats. Dates are converted into milliseconds since epoch,
+    the unit of the datetime axes of bokeh """
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ms]').astype('int64').astype(float)
+    return values.astype(float)
+
+
+def bounds(values):
+    """ (min, max) of values (numbers or dates) as floats, NaNs ignored.
+    Equal bounds are moved apart, so that the range is never empty """
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        low, high = to_float([values.min(), values.max()])
+    else:
+        low, high = float(np.nanmin(values)), float(np.nanmax(values))
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return low, high
+
+
+def _reduce(flat_indexes, values, nb_cells, reduction, counts, results):
+    counts += np.bincount(flat_indexes, minlength=nb_cells)
+    if reduction == 'mean':
+        results += np.bincount(flat_indexes, weights=values,
+                               minlength=nb_cells)
+    elif reduction == 'max':
+        np.maximum.at(results, flat_indexes, values)
+
+
+def _finalize(counts, results, reduction):
+    if reduction == 'count':
+        return counts.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if reduction == 'mean':
+            results = results / counts
+    results[counts == 0] = np.nan
+    return results
+
+
+def _check_reduction(reduction, values, nb_points):
+    if reduction not in REDUCTIONS:
+        raise ValueError('`reduction` must be one of {}'.format(REDUCTIONS))
+    if reduction != 'count':
+        if values is None or len(values) != nb_points:
+            raise ValueError("With the reductions 'mean' and 'max', one "
+                             "value (`color`) by point is needed")
+
+
+def raster(x, y, shape, x_bounds, y_bounds, values=None, reduction='count',
+           chunk_size=CHUNK_SIZE):
+    """ Aggregate points in a regular 2-D grid
+
+    Args:
+        x (array-like of numbers or dates): x of the points
+        y (array-like of numbers or dates): y of the points
+        shape (tuple of int): (number of rows, number of columns) of the grid,
+            the rows being along y and the columns along x
+        x_bounds (tuple of float): (min, max) of x covered by the grid. Dates
+            are in milliseconds since epoch
+        y_bounds (tuple of float): (min, max) of y covered by the grid
+        values (None, array-like of numbers): Value of each point, needed by
+            the reductions 'mean' and 'max'
+        reduction ({'count', 'mean', 'max'}): Reduction of the points of each
+            cell: their number, or the mean or the max of their values
+        chunk_size (int): Number of points processed at once
+
+    Returns:
+        np.ndarray of shape `shape`: The grid, the first row being at the
+            bottom (min of y). The cells without point are 0 for 'count',
+            NaN otherwise
+    """
+    _check_reduction(reduction, values, len(x))
+    nb_rows, nb_columns = shape
+    nb_cells = nb_rows * nb_columns
+    counts = np.zeros(nb_cells, dtype=np.int64)
+    results = np.zeros(nb_cells) if reduction == 'mean' else np.full(
+        nb_cells, -np.inf)
+    x_scale = nb_columns / (x_bounds[1] - x_bounds[0])
+    y_scale = nb_rows / (y_bounds[1] - y_bounds[0])
+    for start in range(0, len(x), chunk_size):
+        x_c = (to_float(x[start:start + chunk_size]) - x_bounds[0]) * x_scale
+        y_c = (to_float(y[start:start + chunk_size]) - y_bounds[0]) * y_scale
+        # The points on the max bounds belong to the last cells
+        x_c[x_c == nb_columns] = nb_columns - 1
+        y_c[y_c == nb_rows] = nb_rows - 1
+        inside = (x_c >= 0) & (x_c < nb_columns) & (y_c >= 0) & (
+            y_c < nb_rows)
+        v_c = None
+        if values is not None:
+            v_c = np.asarray(values[start:start + chunk_size], dtype=float)
+            inside &= ~np.isnan(v_c)
+            v_c = v_c[inside]
+        flat_indexes = (y_c[inside].astype(np.int64) * nb_columns
+                        + x_c[inside].astype(np.int64))
+        _reduce(flat_indexes, v_c, nb_cells, reduction, counts, results)
+    return _finalize(counts, results, reduction).reshape(shape)
+
+
+def _axial(x, y, size, aspect_scale):
+    # Fractional axial coordinates (q, r) of pointy-top hexagons of radius
+    # `size` (in y units), the x being scaled by `aspect_scale`
+    x = x * aspect_scale / size
+    y = -y / size
+    return np.sqrt(3) / 3 * x - y / 3, 2 / 3 * y
+
+
+def _round_axial(q, r):
+    # Axial coordinates of the hexagons containing the fractional (q, r):
+    # the cube coordinates (q, -q - r, r) are rounded, and the one which
+    # moved the most is recomputed from the 2 others
+    s = -q - r
+    q_round, r_round, s_round = np.round(q), np.round(r), np.round(s)
+    q_diff = np.abs(q_round - q)
+    r_diff = np.abs(r_round - r)
+    s_diff = np.abs(s_round - s)
+    q_fix = (q_diff > r_diff) & (q_diff > s_diff)
+    r_fix = ~q_fix & (r_diff > s_diff)
+    q_round = np.where(q_fix, -r_round - s_round, q_round)
+    r_round = np.where(r_fix, -q_round - s_round, r_round)
+    return q_round.astype(np.int64), r_round.astype(np.int64)
+
+
+def hexbin(x, y, size, x_bounds, y_bounds, aspect_scale=1., values=None,
+           reduction='count', chunk_size=CHUNK_SIZE):
+    """ Aggregate points in pointy-top hexagonal tiles
+
+    The tiles follow the axial coordinates (q, r) of bokeh's `hex_tile`.
+
+    Args:
+        x (array-like of numbers or dates): x of the points
+        y (array-like of numbers or dates): y of the points
+        size (float): Radius of the hexagons, in y units
+        x_bounds (tuple of float): (min, max) of x. Dates are in milliseconds
+            since epoch
+        y_bounds (tuple of float): (min, max) of y
+        aspect_scale (float): Scale of x relatively to y, so that the
+            hexagons are regular on screen
+        values (None, array-like of numbers): Value of each point, needed by
+            the reductions 'mean' and 'max'
+        reduction ({'count', 'mean', 'max'}): Reduction of the points of each
+            tile: their number, or the mean or the max of their values
+        chunk_size (int): Number of points processed at once
+
+    Returns:
+        (q, r, result): The axial coordinates and the reduction of the tiles
+            containing at least one point (np.ndarray each)
+    """
+    _check_reduction(reduction, values, len(x))
+    # The tiles are first indexed in the rectangle of (q, r) covering the
+    # bounds (the axial coordinates are linear in x and y)
+    q_corners, r_corners = _axial(np.array(x_bounds)[[0, 0, 1, 1]],
+                                  np.array(y_bounds)[[0, 1, 0, 1]], size,
+                                  aspect_scale)
+    q_min = int(np.floor(q_corners.min())) - 1
+    r_min = int(np.floor(r_corners.min())) - 1
+    nb_q = int(np.ceil(q_corners.max())) + 2 - q_min
+    nb_r = int(np.ceil(r_corners.max())) + 2 - r_min
+    nb_cells = nb_q * nb_r
+    counts = np.zeros(nb_cells, dtype=np.int64)
+    results = np.zeros(nb_cells) if reduction == 'mean' else np.full(
+        nb_cells, -np.inf)
+    for start in range(0, len(x), chunk_size):
+        q, r = _axial(to_float(x[start:start + chunk_size]),
+                      to_float(y[start:start + chunk_size]), size,
+                      aspect_scale)
+        inside = np.isfinite(q) & np.isfinite(r)
+        v_c = None
+        if values is not None:
+            v_c = np.asarray(values[start:start + chunk_size], dtype=float)
+            inside &= ~np.isnan(v_c)
+            v_c = v_c[inside]
+        q, r = _round_axial(q[inside], r[inside])
+        # Points out of the bounds (given by the user) are ignored
+        kept = (q >= q_min) & (q < q_min + nb_q) & (r >= r_min) & (
+            r < r_min + nb_r)
+        if v_c is not None:
+            v_c = v_c[kept]
+        flat_indexes = (q[kept] - q_min) * nb_r + (r[kept] - r_min)
+        _reduce(flat_indexes, v_c, nb_cells, reduction, counts, results)
+    occupied = np.flatnonzero(counts)
+    result = _finalize(counts, results, reduction)[occupied]
+    return occupied // nb_r + q_min, occupied % nb_r + r_min, result
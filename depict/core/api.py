@@ -0,0 +1,485 @@
+""" Signatures and documentation of the public plotting functions
+
+`import depict` does not import bokeh nor pandas: until the first session is
+created, `depict.line`, `depict.point`, ... are placeholders. They take the
+signature (with the defaults of the default session) and the documentation
+of the functions below, which are also the documentation of the functions
+bound to a session. This module must not import anything heavy.
+"""
+
+
+def line(y, x=None, source_dataframe=None, width=900, height=400,
+         description='', title='', x_label=None, y_label=None, show_plot=True,
+         color=None, colorbar_type='auto', legend='auto', line_width=1,
+         alpha=1, style='solid', x_axis_type='auto', y_axis_type='auto',
+         x_range=None, y_range=None, fill_between=False, save_path=None,
+         grid_visible=True, downsampling=None, points_per_pixel=2,
+         pyramid=False):
+    """Plot a graph with one-dimensional line(s)
+
+    Args:
+        y (array-like of dimension 1 or 2): The y-coordinates for the
+            points of the line(s). If `y` is 1-d, one line will be drawn,
+            if  it is 2-d, a set of lines will be drawn.
+            The values can be either numbers, or dates (datetimes or
+            parsable strings). If a `source_dataframe` is given, `x` and
+            `y` should be column names / keys.
+
+        x (None, array-like of dimension 1 or 2): The x-coordinates for the
+            points of the line(s). If `None`, indexes starting from 0 and
+            adapted to `y` will be used. If `y` is 1-d, one line will be
+            drawn, if  it is 2-d, a set of lines will be drawn.
+            The values can be either numbers, or dates (datetimes or
+            parsable strings). If a `source_dataframe` is given, `x` and
+            `y` should be column names / keys.
+
+        source_dataframe (None, Pandas DataFrame or dict): Input data as
+            Pandas DataFrame or dictionary. If it is a Pandas DataFrame,
+            and `x` is None, the index of the dataframe is used as `x`
+
+        width (int): The width of the graph, including any axes, titles,
+            etc
+
+        height (int): The height of the graph, including any axes, titles,
+            etc
+
+        description (str): HTML-formatted text that will be kept bellow the
+            graph. It generally includes metadata, details about the,
+            graphs, etc. It will be kept when the graph is displayed,
+            exported or rendered in a grid with other graphs. If The graph
+            is summed with other graph, their metadata will be concatenated
+            (adding a new line between both)
+
+        title (str): Title of the graph. The attributes of the title
+            (font), cannot be tuned directly in depict
+
+        x_label (None, str): Label of the x-axis
+
+        y_label (None, str): Label of the y-axis
+
+        show_plot (bool): Whether or not the graph must be displayed
+            immediatly after its creation
+
+        color (None, str, array-like): If None, the first color of the
+            palette is used.
+            If string, a color name is expected (hexadecimal, RGB, and
+            usual colors are accepted), and it will be the same for all
+            the lines.
+            If array-like, the length of color should correspond to the
+            number of lines drawn, they will correspond to each line
+            respectively
+
+        colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
+            the best type will be chosen wrt the data. If `categorical`:
+            a legend will be used, not a colorbar. If `continuous`, a
+            colorbar will be displayed on the right side of the plot.
+            The data defining the color must be passed in `color`
+
+        legend ('auto', array-like): If `auto`, the legend will be set when
+            a Pandas DataFrame ora dictionary is provided (the name of the
+            columns / keys will be the legend). If array-like, the length
+            of `legend` must match with the number of curves dranw
+
+        line_width (Number, array-like): Width of the line(s). If Number
+            it will the same for all the lines. If it is an array-like,
+            its length must match with the number of lines drawn. They will
+            correspond to each line respectively
+
+        alpha (Number, array-like): Alpha value of the line(s). If Number
+            it will the same for all the lines. If it is an array-like,
+            its length must match with the number of lines drawn. They will
+            correspond to each line respectively
+
+        style ({'solid', 'dashed', 'dotted', 'dotdash', dashdot'} or array
+            like of those): Style of the line(s). If it is an array-like,
+            its length must match with the number of lines drawn. They will
+            correspond to each line respectively
+
+        x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly
+
+        y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly
+
+        x_range (array-like): Range of the x-axis
+
+        y_range (array-like): Range of the y-axis
+
+        fill_between (bool): If True, there must be at least 2 curves to
+            plot and the area between the first 2 curves is filled. The
+            color of the first line and its alpha value are used for the
+            part filled. In depict, you cannot have more control about
+            this area
+
+        save_path (None, str): If None, the graph is not saved. If str,
+            the graph is saved in html at the gicen path. If the html
+            extension is missing, it will be added automatically
+
+        grid_visible (bool): Whether the background grid must be displayed.
+            In depict, you cannot have further control about the background
+            grid
+
+        downsampling (None, {'lttb', 'min_max'}): If None, all the points
+            are drawn. Otherwise, the lines having more than
+            `points_per_pixel` points per pixel of `width` are downsampled:
+            'lttb' keeps the points forming the largest triangles with
+            their neighbours (Largest-Triangle-Three-Buckets), 'min_max'
+            keeps the minimum and the maximum of each bucket of points.
+            Both keep the visual extremes of the lines
+
+        points_per_pixel (Number): Number of points per pixel of width
+            kept by the downsampling
+
+        pyramid (bool): If True, the lines having more than
+            `points_per_pixel` points per pixel of width (and sorted x) are
+            embedded at several levels of detail, from a downsampled level
+            to the full data. The level displayed is switched in the
+            browser when zooming, so that the details are kept without
+            drawing all the points. With `fill_between`, the 2 lines and
+            the area between them share one pyramid. Each data source
+            embedded has at most `pyramid_max_points` points (option of
+            the session), and a line embeds at most 4/3 of its points plus
+            the points of its coarsest level
+
+    Returns:
+        None
+    """
+
+
+def point(x, y, source_dataframe=None, width=900, height=400, description='',
+          title='', x_label=None, y_label=None, show_plot=True, color=None,
+          colorbar_type='auto', legend='auto', size=6, alpha=1,
+          x_axis_type='auto', y_axis_type='auto', x_range=None, y_range=None,
+          save_path=None, grid_visible=True, color_mapping='python',
+          pyramid=False, aggregation=None, reduction='count', hex_size=8):
+    """Plot a graph with points (scatter-plot)
+
+    Args:
+        x (array-like of dimension 1): The x-coordinates for the points.
+            The values can be either numbers, or dates (datetimes or
+            parsable strings). If a `source_dataframe` is given, `x` and
+            `y` should be column names / keys. `x` can be None is a special
+            case: when a pandas dataframe is given as `source_dataframe`
+            and you want to use the index of the dataframe as `x`
+
+        y (array-like of dimension 1): The y-coordinates for the points.
+            The values can be either numbers, or dates (datetimes or
+            parsable strings). If a `source_dataframe` is given, `x` and
+            `y` should be column names / keys.
+
+        source_dataframe (None, Pandas DataFrame or dict): Input
+            data as Pandas DataFrame or dictionary. If it is a Pandas
+            DataFrame, and `x` is None, the index of the dataframe is used
+            as `x`
+
+        width (int): The width of the graph, including any axes, titles,
+            etc
+
+        height (int): The height of the graph, including any axes, titles,
+            etc
+
+        description (str): HTML-formatted text that will be kept bellow the
+            graph. It generally includes metadata, details about the,
+            graphs, etc. It will be kept when the graph is displayed,
+            exported or rendered in a grid with other graphs. If The graph
+            is summed with other graph, their metadata will be concatenated
+            (adding a new line between both)
+
+        title (str): Title of the graph. The attributes of the title
+            (font, etc), cannot be tuned directly in depict
+
+        x_label (None, str): Label of the x-axis
+
+        y_label (None, str): Label of the y-axis
+
+        show_plot (bool): Whether or not the graph must be displayed
+            immediatly after its creation
+
+        color (None, str, array-like): If None, the first color of the
+            palette is used.
+            If string, a color name is expected (hexadecimal, RGB, and
+            usual colors are accepted (like 'red', etc)), and it will be
+            the same for all the points.
+            If array-like, the length of color should correspond to the
+            number of points drawn, they will correspond to each point
+            respectively
+
+        colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
+            the best type will be chosen wrt the data.
+            If `categorical`: a legend will be used, not a colorbar.
+            If `continuous`, a colorbar will be displayed on the right
+            side of the plot. The data defining the color must be passed
+            in `color`
+
+        legend ('auto', array-like): If `auto`, the legend will be set when
+            a Pandas DataFrame or a dictionary is provided (the name of the
+            columns / keys will be the legend). If array-like, the length
+            of `legend` must match with the number of points drawn
+
+        size (Number, array-like): Size of the points. If Number
+            it will the same for all the points. If it is an array-like,
+            its length must match with the number of points drawn. They
+            will correspond to each point respectively. A size of 6 is a
+            reasonable default value
+
+        alpha (Number, array-like): Alpha value of the points. If Number
+            it will the same for all the points. If it is an array-like,
+            its length must match with the number of points drawn. They
+            will correspond to each line respectively. alpha=1 means no
+            transparency, alpha=0 means completely transparent.
+
+        x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly.
+
+        y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly.
+
+        x_range (array-like): Range of the x-axis
+
+        y_range (array-like): Range of the y-axis
+
+        save_path (None, str): If None, the graph is not saved. If str,
+            the graph is saved in html at the given path. If the html
+            extension is missing, it will be added automatically
+
+        grid_visible (bool): Whether the background grid must be displayed.
+            In depict, you cannot have further control about the background
+            grid
+
+        color_mapping ({'python', 'browser'}): How the values of `color`
+            are mapped to the palette. If 'python', one color string is
+            computed for each point. If 'browser', the values (continuous
+            colorbar) or the codes of the categories (categorical
+            colorbar) are sent as numbers and mapped to the palette in the
+            browser, which is faster and lighter for large plots
+
+        pyramid (bool): If True and there are more than
+            `pyramid_max_points` points (option of the session), the
+            points are embedded at several levels of detail, from a sample
+            of `pyramid_max_points` points to all of them. The level
+            displayed is switched in the browser when zooming, so that at
+            most `pyramid_max_points` points are drawn at once. All the
+            levels together embed at most 4/3 of the points plus
+            `pyramid_max_points`
+
+        aggregation (None, 'raster', 'hexbin'): If None, every point is
+            drawn. If 'raster', the points are aggregated in a grid of one
+            cell per pixel of the graph (`width` x `height`), drawn as an
+            image with a colorbar. If 'hexbin', they are aggregated in
+            hexagonal tiles of radius `hex_size` pixels, and only the tiles
+            containing points are drawn. Only the aggregates are sent to
+            the browser, which is suited to millions of points. `legend`,
+            `size` and `alpha` are not used
+
+        reduction ({'count', 'mean', 'max'}): With `aggregation`, how the
+            points of each cell are reduced: their number, or the mean or
+            the max of their values given in `color` (one number by point)
+
+        hex_size (Number): With `aggregation='hexbin'`, radius of the
+            hexagons in pixels
+
+    Returns:
+        depict.plot
+    """
+
+
+def histogram(y, x=None, source_dataframe=None, tick_label=None,
+              label_orientation='horizontal', width=900, height=400,
+              description='', title='', x_label=None, y_label=None,
+              show_plot=True, color=None, colorbar_type='auto', legend='auto',
+              bar_width='auto', alpha=1, x_axis_type='auto',
+              y_axis_type='auto', x_range=None, y_range=None, save_path=None,
+              grid_visible=True, color_mapping='python', bins=None,
+              nb_bins=10):
+    """ Plot a histogram
+
+    Args:
+        y (array-like of dimension 1 or dict key or pd.dataframe col name):
+            The height of each bar in the histogram. The values can be
+            either numbers, or dates (datetimes or parsable strings).
+            It can also be a `depict.HistogramAccumulator`, whose bins
+            are drawn as the bars (`x` and `bins` must then be None).
+            If a `source_dataframe` is given, `x` and `y` should be column
+            names / keys.
+
+        x (array-like of dim 1 or None or dict key or dataframe col name):
+            The x-coordinates of the center of the bars of the histogram.
+            If None and source_dataframe not is a pandas dataframe:
+            `range(len(y))` is used as `x`.
+            If None and source_dataframe is a pandas dataframe: the index
+            of the dataframe is used as `x`.
+            The values can be either numbers, or dates (datetimes or
+            parsable strings). If a `source_dataframe` is given, `x` and
+            `y` should be column names / keys.
+
+        source_dataframe (None, Pandas DataFrame or dict): Input
+            data as Pandas DataFrame or dictionary. If it is a Pandas
+            DataFrame, and `x` is None, the index of the dataframe is used
+            as `x`
+
+        tick_label (str or array like of str): Labels for each bar. If
+            `tick_label` is an array like, its length must be the same as
+            the number of bars.
+            Consider the argument `label_orientation`
+
+        label_orientation ({'horizontal', 'vertical'}): Orientation of the
+            labels
+
+        width (int): The width of the graph, including any axes, titles,
+            etc
+
+        height (int): The height of the graph, including any axes, titles,
+            etc
+
+        description (str): HTML-formatted text that will be kept bellow the
+            graph. It generally includes metadata, details about the,
+            graphs, etc. It will be kept when the graph is displayed,
+            exported or rendered in a grid with other graphs. If The graph
+            is summed with other graph, their metadata will be concatenated
+            (adding a new line between both)
+
+        title (str): Title of the graph. The attributes of the title
+            (font, etc), cannot be tuned directly in depict
+
+        x_label (None, str): Label of the x-axis
+
+        y_label (None, str): Label of the y-axis
+
+        show_plot (bool): Whether or not the graph must be displayed
+            immediately after its creation.
+            Notes: The plot object will be returned regardless this
+            parameter. Saving the plot is independant from this parameter.
+
+        color (None, str, array-like): If None, the first color of the
+            palette is used.
+            If string, a color name is expected (hexadecimal, RGB, and
+            usual colors are accepted (like 'red', etc)), and it will be
+            the same for all the bars.
+            If array-like, the length of color should correspond to the
+            number of bars, they will correspond to each bar respectively
+
+        colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
+            the best type will be chosen wrt the data.
+            If `categorical`: a legend will be used, not a colorbar.
+            If `continuous`, a colorbar will be displayed on the right
+            side of the plot. The data defining the color must be passed
+            in `color`
+
+        legend ('auto', array-like): If `auto`, the legend will be set when
+            a Pandas DataFrame or a dictionary is provided (the name of the
+            columns / keys will be the legend). If array-like, the length
+            of `legend` must match with the number of bars drawn
+
+        bar_width ('auto', Number, t-delta, array of number or t-delta):
+            The width of the bars (the total width).
+            If 'auto': the bar_width will be defined smartly considering
+            the minimum distance between 2 bars so that they do not
+            overlap.
+            If Number: The absolute value that holds for all the bars
+            If timedelta: The absolute value that holds for all the bars,
+            only for datetime axis.
+            If array-like of Number or timedelta: The width of each bar
+            is defined separately
+
+        alpha (Number, array-like): Alpha value of the bars.
+            If Number: it will the same for all the bars.
+            If array-like: its length must match with the number of bars
+            drawn. They will correspond to each bar respectively. alpha=1
+            means no transparency, alpha=0 means completely transparent.
+
+        x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly.
+
+        y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
+            If 'auto', the type will be set automatically based on the data
+            provided. If 'numerical', 'datetime', the type is set
+            accordingly.
+
+        x_range (array-like): Range of the x-axis
+
+        y_range (array-like): Range of the y-axis
+
+        save_path (None, str): If None, the graph is not saved. If str,
+            the graph is saved in html at the given path. If the html
+            extension is missing, it will be added automatically
+
+        grid_visible (bool): Whether the background grid must be displayed.
+            In depict, you cannot have further control about the background
+            grid
+
+        color_mapping ({'python', 'browser'}): How the values of `color`
+            are mapped to the palette. If 'python', one color string is
+            computed for each bar. If 'browser', the values (continuous
+            colorbar) or the codes of the categories (categorical
+            colorbar) are sent as numbers and mapped to the palette in the
+            browser
+
+        bins (None, int, 'fd', 'quantile', array-like, time delta): If
+            None, `y` contains the heights of the bars. Otherwise, `y`
+            contains raw samples (numbers or dates), and the bars are the
+            number of samples in each bin. The bins are: if int, this
+            number of bins of the same width; if 'fd', bins of the same
+            width given by the Freedman-Diaconis rule; if 'quantile',
+            `nb_bins` bins containing the same number of samples; if
+            array-like, the edges of the bins; for dates, a time delta
+            (e.g. '1h') gives the width of the bins. The samples are
+            processed by chunks, so large arrays are not copied
+
+        nb_bins (int): Number of bins when `bins` is 'quantile'
+
+    Returns:
+        depict.plot
+    """
+
+
+def show(plot, width_total_as_session=True, share_x=False, share_y=False):
+    """ Show a plot or a grid of plots
+
+    Args:
+        plot (depict plot, list): A plot, or a grid of plots: a list whose
+            elements are plots (one per row) or lists of plots (a row)
+
+        width_total_as_session (bool): If True, each row of the grid takes the
+            width of the session
+
+        share_x (bool): If True, the plots of the grid share their x range
+
+        share_y (bool): If True, the plots of the grid share their y range
+
+    Returns:
+        None
+    """
+
+
+def save(plot, save_path=None, file_exists_mode='append',
+         width_total_as_session=True, share_x=False, share_y=False):
+    """ Save a plot or a grid of plots in an HTML file
+
+    Args:
+        plot (depict plot, list): A plot, or a grid of plots (see `show`)
+
+        save_path (str): Path of the HTML file
+
+        file_exists_mode ({'append', 'overwrite'}): If the file exists, the
+            plot is either appended to it, or replaces it
+
+        width_total_as_session (bool): If True, each row of the grid takes the
+            width of the session
+
+        share_x (bool): If True, the plots of the grid share their x range
+
+        share_y (bool): If True, the plots of the grid share their y range
+
+    Returns:
+        None
+    """
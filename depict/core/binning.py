@@ -0,0 +1,193 @@
+""" Binning of raw samples into histograms
+
+The samples (numbers or dates) are processed by chunks: the only arrays
+allocated are a chunk and the counts, so that very large arrays (1e8
+samples) can be binned without copying them. Dates are binned as int64
+nanoseconds.
+"""
+import numbers
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 2 ** 20
+# Above this number of samples, the quantiles are computed from a fine
+# histogram instead of sorting a copy of the samples
+EXACT_QUANTILES_MAX_SAMPLES = 10 ** 7
+QUANTILE_RESOLUTION = 2 ** 20
+
+
+def as_samples(samples):
+    """ Samples as a 1-D array of numbers or of datetime64[ns]
+
+    Strings are parsed as dates.
+    """
+    samples = np.asarray(samples)
+    if samples.dtype.kind in 'OSU':
+        samples = np.asarray(pd.to_datetime(samples))
+    if samples.dtype.kind == 'M':
+        samples = samples.astype('datetime64[ns]', copy=False)
+    if samples.ndim != 1:
+        raise ValueError('The samples must be a one dimensional array like')
+    return samples
+
+
+def _chunks(samples, chunk_size=CHUNK_SIZE):
+    # Chunks of the samples as floats (int64 nanoseconds for dates), without
+    # the NaNs / NaTs
+    is_date = samples.dtype.kind == 'M'
+    for start in range(0, len(samples), chunk_size):
+        chunk = samples[start:start + chunk_size]
+        if is_date:
+            chunk = chunk[~np.isnat(chunk)].view('int64')
+        else:
+            chunk = chunk.astype(float, copy=False)
+            chunk = chunk[~np.isnan(chunk)]
+        yield chunk
+
+
+def sample_bounds(samples):
+    """ (min, max) of the samples, as floats (int64 nanoseconds for dates) """
+    low, high = np.inf, -np.inf
+    for chunk in _chunks(samples):
+        if len(chunk):
+            low = min(low, chunk.min())
+            high = max(high, chunk.max())
+    if low > high:
+        raise ValueError('There is no valid sample to bin')
+    return float(low), float(high)
+
+
+def count_samples(samples, edges):
+    """ Number of samples in each bin, as `np.histogram` counts them (the
+    last bin includes its right edge)
+
+    Args:
+        samples (np.ndarray): Numbers or datetime64[ns]
+        edges (np.ndarray): Sorted edges of the bins, as floats (int64
+            nanoseconds for dates)
+
+    Returns:
+        np.ndarray of int64 of length len(edges) - 1
+    """
+    edges = np.asarray(edges, dtype=float)
+    nb_bins = len(edges) - 1
+    widths = np.diff(edges)
+    uniform = np.allclose(widths, widths[0])
+    counts = np.zeros(nb_bins, dtype=np.int64)
+    for chunk in _chunks(samples):
+        if uniform:
+            indexes = ((chunk - edges[0]) * (nb_bins / (edges[-1] - edges[0]))
+                       ).astype(np.int64)
+            # Rounding errors are corrected by comparing with the edges
+            indexes = np.clip(indexes, 0, nb_bins - 1)
+            indexes[chunk < edges[indexes]] -= 1
+            indexes[(chunk >= edges[indexes + 1]) & (
+                indexes < nb_bins - 1)] += 1
+        else:
+            indexes = np.searchsorted(edges, chunk, side='right') - 1
+            indexes[chunk == edges[-1]] = nb_bins - 1
+        inside = (chunk >= edges[0]) & (chunk <= edges[-1])
+        counts += np.bincount(indexes[inside], minlength=nb_bins)
+    return counts
+
+
+def quantiles(samples, q):
+    """ Quantiles `q` (between 0 and 1) of the samples
+
+    Up to `EXACT_QUANTILES_MAX_SAMPLES` samples, they are exact. Above, they
+    are interpolated in a histogram of `QUANTILE_RESOLUTION` bins, so that
+    the samples are neither copied nor sorted.
+
+    Returns:
+        np.ndarray of floats (int64 nanoseconds for dates)
+    """
+    if len(samples) <= EXACT_QUANTILES_MAX_SAMPLES:
+        values = np.concatenate(list(_chunks(samples)))
+        return np.quantile(values, q)
+    low, high = sample_bounds(samples)
+    edges = np.linspace(low, high, QUANTILE_RESOLUTION + 1)
+    cumulated = np.concatenate([[0], np.cumsum(count_samples(samples,
+                                                             edges))])
+    return np.interp(np.asarray(q) * cumulated[-1], cumulated, edges)
+
+
+def bin_edges(samples, bins, nb_bins=10):
+    """ Edges of the bins of the samples
+
+    Args:
+        samples (np.ndarray): Numbers or datetime64[ns]
+        bins (int, 'fd', 'quantile', array-like or time delta): Number of
+            bins of the same width, 'fd' for bins of the same width given by
+            the Freedman-Diaconis rule (2 * IQR / n^(1/3)), 'quantile' for
+            `nb_bins` bins containing the same number of samples, the edges
+            themselves, or for dates, the width of the bins (e.g. '1h',
+            aligned on multiples of the width)
+        nb_bins (int): Number of bins of 'quantile'
+
+    Returns:
+        np.ndarray: The edges, as floats (int64 nanoseconds for dates)
+    """
+    is_date = samples.dtype.kind == 'M'
+    if isinstance(bins, str) and bins.lower() == 'quantile':
+        edges = np.unique(quantiles(samples, np.linspace(0, 1, nb_bins + 1)))
+        return edges if len(edges) > 1 else np.array(
+            [edges[0] - 0.5, edges[0] + 0.5])
+    if isinstance(bins, (list, tuple, np.ndarray)):
+        edges = np.asarray(bins)
+        if is_date or edges.dtype.kind in 'OSUM':
+            edges = np.asarray(pd.to_datetime(edges)).astype(
+                'datetime64[ns]').view('int64')
+        edges = edges.astype(float)
+        if (len(edges) < 2) or np.any(np.diff(edges) <= 0):
+            raise ValueError('The edges given in `bins` must be increasing')
+        return edges
+
+    low, high = sample_bounds(samples)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    if isinstance(bins, str) and bins.lower() == 'fd':
+        q_25, q_75 = quantiles(samples, [0.25, 0.75])
+        width = 2 * (q_75 - q_25) / len(samples) ** (1 / 3)
+        nb = int(np.ceil((high - low) / width)) if width > 0 else 1
+        return np.linspace(low, high, max(nb, 1) + 1)
+    if isinstance(bins, numbers.Integral) and not isinstance(bins, bool):
+        return np.linspace(low, high, int(bins) + 1)
+    if is_date:
+        try:
+            width = pd.to_timedelta(bins).value
+        except ValueError:
+            width = None
+        if width:
+            first = np.floor(low / width) * width
+            nb = max(int(np.ceil((high - first) / width)), 1)
+            edges = first + width * np.arange(nb + 1)
+            if edges[-1] < high:
+                edges = np.append(edges, edges[-1] + width)
+            return edges
+    raise ValueError("`bins` must be a number of bins, 'fd', 'quantile', the "
+                     "edges of the bins, or for dates, the width of the bins")
+
+
+def histogram_samples(samples, bins, nb_bins=10):
+    """ Histogram of raw samples, as bars
+
+    Args:
+        samples (array-like of numbers or dates): The raw samples
+        bins: See `bin_edges`
+        nb_bins (int): Number of bins of 'quantile'
+
+    Returns:
+        (centers, widths, counts): The center and the width of each bar
+            (datetime64 and timedelta64 for dates) and the number of samples
+            in the bar
+    """
+    samples = as_samples(samples)
+    edges = bin_edges(samples, bins, nb_bins)
+    counts = count_samples(samples, edges)
+    widths = np.diff(edges)
+    centers = edges[:-1] + widths / 2
+    if samples.dtype.kind == 'M':
+        centers = np.round(centers).astype('int64').view('datetime64[ns]')
+        widths = np.round(widths).astype('int64').view('timedelta64[ns]')
+    return centers, widths, counts
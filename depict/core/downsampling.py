@@ -0,0 +1,124 @@
+""" Downsampling of the lines
+
+The series are reduced to a number of points related to the width of the
+plot, so that the HTML stays small while the shape of the lines, their
+extremes in particular, is kept. The functions return the indexes of the
+points kept, so that they can be applied to x and y whatever their types
+(numbers, dates).
+"""
+import numpy as np
+
+DOWNSAMPLING_METHODS = ['lttb', 'min_max']
+
+
+def _to_numeric(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'mM':
+        return values.astype('int64').astype(float)
+    return values.astype(float)
+
+
+def _buckets(values, bucket_size, nb_buckets):
+    # Equal-size buckets as the rows of a 2-D array. The last bucket is
+    # padded with its last value, so that padding never adds a new extreme
+    padding = bucket_size * nb_buckets - len(values)
+    return np.pad(values, (0, padding), mode='edge').reshape(nb_buckets,
+                                                             bucket_size)
+
+
+def min_max_indexes(y, nb_points):
+    """ Indexes of the min and max of `y` in nb_points / 2 buckets
+
+    The first and the last points are kept too.
+
+    Args:
+        y (array-like of numbers or dates): The values of the series
+        nb_points (int): Maximum number of points to keep (at least 4)
+
+    Returns:
+        np.ndarray: Sorted indexes of the points kept
+    """
+    y = _to_numeric(y)
+    nb_values = len(y)
+    nb_buckets = max((nb_points - 2) // 2, 1)
+    if nb_values <= nb_points:
+        return np.arange(nb_values)
+    bucket_size = int(np.ceil(nb_values / nb_buckets))
+    nb_buckets = int(np.ceil(nb_values / bucket_size))
+    buckets = _buckets(y, bucket_size, nb_buckets)
+    offsets = bucket_size * np.arange(nb_buckets)
+    indexes = np.concatenate([[0, nb_values - 1],
+                              offsets + np.argmin(buckets, axis=1),
+                              offsets + np.argmax(buckets, axis=1)])
+    return np.unique(np.minimum(indexes, nb_values - 1))
+
+
+def lttb_indexes(x, y, nb_points):
+    """ Indexes of the points kept by the Largest-Triangle-Three-Buckets
+    algorithm
+
+    Cf S. Steinarsson (2013). "Downsampling Time Series for Visual
+    Representation". The points between the first and the last ones are split
+    in buckets. In each bucket, the point kept is the one forming the largest
+    triangle with the point kept in the previous bucket and the mean of the
+    next bucket. The buckets are processed in sequence, the points of each
+    bucket at once.
+
+    Args:
+        x (array-like of numbers or dates): The x of the series, sorted
+        y (array-like of numbers or dates): The y of the series
+        nb_points (int): Maximum number of points to keep (at least 3)
+
+    Returns:
+        np.ndarray: Sorted indexes of the points kept
+    """
+    x = _to_numeric(x)
+    y = _to_numeric(y)
+    nb_values = len(y)
+    if nb_values <= max(nb_points, 3):
+        return np.arange(nb_values)
+    nb_inner = nb_values - 2
+    bucket_size = int(np.ceil(nb_inner / (nb_points - 2)))
+    nb_buckets = int(np.ceil(nb_inner / bucket_size))
+    x_buckets = _buckets(x[1:-1], bucket_size, nb_buckets)
+    y_buckets = _buckets(y[1:-1], bucket_size, nb_buckets)
+
+    # Mean of each bucket, the last point being the "next bucket" of the last
+    # bucket
+    starts = bucket_size * np.arange(nb_buckets)
+    counts = np.diff(np.append(starts, nb_inner))
+    x_means = np.append(np.add.reduceat(x[1:-1], starts) / counts, x[-1])
+    y_means = np.append(np.add.reduceat(y[1:-1], starts) / counts, y[-1])
+
+    indexes = np.empty(nb_buckets + 2, dtype=int)
+    indexes[0] = 0
+    indexes[-1] = nb_values - 1
+    x_a, y_a = x[0], y[0]
+    for i in range(nb_buckets):
+        # Twice the area of the triangles (a, b, c) for all the b of bucket i
+        areas = np.abs((x_a - x_means[i + 1]) * (y_buckets[i] - y_a)
+                       - (x_a - x_buckets[i]) * (y_means[i + 1] - y_a))
+        j = np.argmax(areas)
+        indexes[i + 1] = 1 + starts[i] + j
+        x_a, y_a = x_buckets[i, j], y_buckets[i, j]
+    return np.minimum(indexes, nb_values - 1)
+
+
+def downsampling_indexes(x, y, method, nb_points):
+    """ Indexes of the points of a series kept by a downsampling method
+
+    Args:
+        x (array-like): The x of the series
+        y (array-like): The y of the series
+        method ({'lttb', 'min_max'}): The downsampling method
+        nb_points (int): Maximum number of points to keep
+
+    Returns:
+        np.ndarray: Sorted indexes of the points kept
+    """
+    if method == 'lttb':
+        return lttb_indexes(x, y, nb_points)
+    elif method == 'min_max':
+        return min_max_indexes(y, nb_points)
+    raise ValueError('`downsampling` must be None or one of {}'.format(
+        DOWNSAMPLING_METHODS))
@@ -1,13 +1,18 @@
+from . import api
+from .accumulator import HistogramAccumulator
+from .binning import histogram_samples
 from .plot import Plot
-from .tools import show_base, save_base, is_color, format_color, is_iterable
-from ..tools.color_palettes import palette_from_name_to_function
+from .timing import StageTimer
+from .tools import show_base, save_base, is_color, format_color, format_colors
+from .tools import colors_to_rgba, group_by_legend, is_iterable, split_scalars
+from ..tools.color_palettes import get_palette
 
 import copy
 import numbers
 
 from bokeh.models import Range1d
 from bokeh.plotting import figure
-from bokeh.models import ColorBar, LinearColorMapper
+from bokeh.models import ColorBar, ColumnDataSource, LinearColorMapper
 import numpy as np
 import pandas as pd
 
@@ -16,13 +21,15 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
                    width, height, description, title, x_label, y_label,
                    show_plot, color, colorbar_type, legend, bar_width, alpha,
                    x_axis_type, y_axis_type, x_range, y_range, grid_visible,
-                   session, save_path):
+                   color_mapping, bins, nb_bins, session, save_path):
     """ Scatter plot
 
     Args:
         x (array-like): X-axis data
         y (array-like): y-axis data
     """
+    timer = StageTimer('histogram', session.timing_callback)
+
     # We convert (source, x and y) into only x and y. x and y will be processed
     # normally. source will not be used any more.
     if source_dataframe is not None:
@@ -67,6 +74,22 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
     if y is None:
         raise ValueError('y must be specified. It must be a one dimensional '
                          'array like')
+    if isinstance(y, HistogramAccumulator):
+        # The bars are the bins of the accumulator
+        if (x is not None) or (bins is not None):
+            raise ValueError('When `y` is a HistogramAccumulator, `x` and '
+                             '`bins` must be None')
+        x, bin_widths, y = y.bars()
+        if isinstance(bar_width, str) and (bar_width.lower() == 'auto'):
+            bar_width = bin_widths
+    elif bins is not None:
+        # `y` contains raw samples: the bars are their bins
+        if x is not None:
+            raise ValueError('When `bins` is given, `y` contains the samples '
+                             'and `x` must be None')
+        x, bin_widths, y = histogram_samples(y, bins=bins, nb_bins=nb_bins)
+        if isinstance(bar_width, str) and (bar_width.lower() == 'auto'):
+            bar_width = bin_widths
     if x is None:
         x = np.arange(len(y))
     if (not isinstance(x, (list, np.ndarray, tuple))) \
@@ -75,13 +98,18 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
     if (np.ndim(x) != 1) or (np.ndim(y) != 1):
         raise ValueError('X and y must be a one dimensional array like')
 
+    if color_mapping not in ['python', 'browser']:
+        raise ValueError("`color_mapping` must be either 'python' or "
+                         "'browser'")
+
+    timer.lap('input')
+
     # We pre-process `color`
     _color_bar_made = False
+    _color_mapped_in_browser = False
     if color is None:
         nb_color_needed = 1
-        color = palette_from_name_to_function[session.palette_name](
-            nb_color_needed)
-        color = [color[0] for _ in y]
+        color = get_palette(session.palette_name, nb_color_needed)[0]
     # We pre-process `color`
     # Corner case: if color = [0.5, 0.6, 0.7] and len(y) == 3, we cannot say if
     # color means actually the color defined by [0.5, 0.6, 0.7] or if this
@@ -93,11 +121,11 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
             and isinstance(color[0], numbers.Real)\
             and session.automatic_color_mapping \
             and (len(y) == 3):
-        color = [color, color, color]
+        pass  # One color for all the bars
     else:
         # General case
         if is_color(color):
-            color = [color for _ in y]
+            pass  # One color for all the bars
         elif isinstance(color, (list, np.ndarray, tuple))\
                 and is_color(color[0]):
             if len(color) == len(y):
@@ -134,23 +162,38 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
             if colorbar_type == 'categorical':
                 if isinstance(legend, str) and (legend.lower() == 'auto'):
                     legend = [str(c) for c in color]
-                color_unique = sorted(list(np.unique(color)))
-                nb_color_needed = len(color_unique)
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](nb_color_needed)
-                color = [palette_colors[color_unique.index(c)] for c in color]
+                color_codes, color_unique = pd.factorize(np.asarray(color),
+                                                         sort=True)
+                palette_colors = get_palette(session.palette_name,
+                                             len(color_unique))
+                if color_mapping == 'browser':
+                    # The codes of the categories are sent, the browser maps
+                    # each code c to the color c of the palette
+                    _color_mapped_in_browser = True
+                    color = color_codes
+                    mapper_low = -0.5
+                    mapper_high = len(color_unique) - 0.5
+                else:
+                    color = np.asarray(palette_colors)[color_codes].tolist()
             elif colorbar_type == 'continuous':
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](256)
+                palette_colors = get_palette(session.palette_name, 256)
                 color_mapper = LinearColorMapper(palette=palette_colors,
                                                  low=np.min(color),
                                                  high=np.max(color))
                 color = np.array(color)
-                col_indexes = (color - color.min()) / (
-                            (color.max() - color.min()) / (256 - 1))
                 color_min = np.min(color)
                 color_max = np.max(color)
-                color = [palette_colors[int(ci)] for ci in col_indexes]
+                if color_mapping == 'browser':
+                    # The values are kept as numbers, the browser maps them
+                    # to the palette
+                    _color_mapped_in_browser = True
+                    mapper_low = color_min
+                    mapper_high = color_max
+                else:
+                    col_indexes = (color - color.min()) / (
+                                (color.max() - color.min()) / (256 - 1))
+                    color = np.asarray(palette_colors)[
+                        col_indexes.astype(int)]
                 if _add_color_bar:
                     color_bar = ColorBar(color_mapper=color_mapper,
                                          location=(0, 0))
@@ -170,17 +213,29 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
                 raise ValueError(error_msg)
             if isinstance(legend, str) and (legend.lower() == 'auto'):
                 legend = [str(c) for c in color]
-            color_unique = sorted(list(np.unique(color)))
-            nb_color_needed = len(color_unique)
-            palette_colors = palette_from_name_to_function[
-                session.palette_name](nb_color_needed)
-            color = [palette_colors[color_unique.index(c)] for c in color]
+            color_codes, color_unique = pd.factorize(np.asarray(color),
+                                                     sort=True)
+            palette_colors = get_palette(session.palette_name,
+                                         len(color_unique))
+            if color_mapping == 'browser':
+                _color_mapped_in_browser = True
+                color = color_codes
+                mapper_low = -0.5
+                mapper_high = len(color_unique) - 0.5
+            else:
+                color = np.asarray(palette_colors)[color_codes].tolist()
 
-    color = [format_color(c) for c in color]
+    # A color shared by all the bars stays a single value
+    if is_color(color):
+        color = format_color(color)
+    elif not _color_mapped_in_browser:
+        # Packed as numbers, so that they are embedded as a binary array
+        color = colors_to_rgba(format_colors(color))
+    timer.lap('color')
 
     # We pre-process `legend`
     # add_legend = True
-    if (legend is None) or (legend == 'auto'):
+    if (legend is None) or (isinstance(legend, str) and legend == 'auto'):
         legend = ['' for _ in y]
         # add_legend = False
     elif isinstance(legend, str):
@@ -192,12 +247,14 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
 
     # We pre-process `alpha`
     if isinstance(alpha, numbers.Real):
-        alpha = [alpha for _ in y]
+        pass  # Given to the glyph, not sent as one value per bar
     elif isinstance(alpha, (list, np.ndarray, tuple)):
         if len(alpha) != len(y):
             raise ValueError(
                 'The alpha argument given is non consistent with the data')
 
+    timer.lap('options')
+
     # We pre-process `x_axis_type` and `y_axis_type`
     if x_axis_type.lower() == 'auto':
         if isinstance(x[0], numbers.Real):
@@ -235,9 +292,11 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
         y_axis_type = 'datetime'
         y = pd.to_datetime(y)
 
+    timer.lap('axis_type')
+
     # We pre-process `bar_width`
     if isinstance(bar_width, numbers.Real):
-        bar_width = [bar_width for _ in y]
+        bar_width = np.full(len(y), bar_width)
     elif isinstance(bar_width, (list, np.ndarray, tuple)):
         if len(bar_width) != len(y):
             raise ValueError(
@@ -245,17 +304,17 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
                 'with the data')
     elif isinstance(bar_width, str) and (bar_width.lower() == 'auto'):
         if len(x) == 1:
-            bar_width = [1 for _ in y]
+            bar_width = np.ones(len(y))
         else:
-            bar_width = [
-                np.min(np.abs(np.diff(sorted(x)))) * 0.8 for _ in y
-            ]
+            bar_width_auto = np.min(np.abs(np.diff(np.sort(np.asarray(x)))))
+            bar_width = np.full(len(y), bar_width_auto * 0.8)
     else:
         try:
             bar_width_td = pd.to_timedelta(bar_width)
-            bar_width = [bar_width_td for _ in y]
+            bar_width = np.full(len(y), bar_width_td.to_timedelta64())
         except ValueError:
             raise ValueError('Error in the `bar_width` argument')
+    left, right = _bar_edges(x, bar_width)
 
     # We pre-process `tick_label`
     def _format_x_val(x_val):
@@ -278,49 +337,54 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
         major_label_overrides = {_format_x_val(x_i): str(tick_label) for x_i in
                                  x}
 
+    timer.lap('bars')
+
     # We group x and y based on legend because in bokek, figure.scatter can
     # only set one legend label by scatter plot. So if the legend contains
-    # an iterable of strings, we need to look for unique values and mask
-    # all attributes
-    legend_unique = np.unique(legend)
-    mask_all = [l_i == np.array(legend) for l_i in legend_unique]
+    # an iterable of strings, we need to split all attributes by legend (in
+    # one pass)
     x_copy = copy.deepcopy(x)
-    x = [np.array(x)[mask] for mask in mask_all]
-    y = [np.array(y)[mask] for mask in mask_all]
-    color = [np.array(color)[mask] for mask in mask_all]
-    bar_width = [np.array(bar_width)[mask] for mask in mask_all]
-    alpha = [np.array(alpha)[mask] for mask in mask_all]
+    legend_unique, (left, right, y, color, alpha) = group_by_legend(
+        legend, [left, right, y, color, alpha])
 
     steps = []
     legend_exist = False
     legend_unique = [str(lu) for lu in legend_unique]
-    for (x_i, y_i, col_i, leg_i, bw_i, a_i) in zip(x, y, color, legend_unique,
-                                                   bar_width, alpha):
-        if leg_i:
-            legend_exist = True
-
-            def step(f, x_c=x_i, y_copy=y_i, col_c=col_i, leg_c=leg_i,
-                     bw_c=bw_i, a_c=a_i):
-                left = [x_c_i - (bw_c_i / 2) for x_c_i, bw_c_i in
-                        zip(x_c, bw_c)]
-                right = [x_c_i + (bw_c_i / 2) for x_c_i, bw_c_i in
-                         zip(x_c, bw_c)]
-                f.quad(bottom=0, top=y_copy, left=left, right=right,
-                       color=col_c, legend_label=leg_c, alpha=a_c)
+    for (l_i, r_i, y_i, col_i, leg_i, a_i) in zip(left, right, y, color,
+                                                  legend_unique, alpha):
+        if _color_mapped_in_browser:
+            if leg_i:
+                legend_exist = True
+
+            def step(f, l_c=l_i, r_c=r_i, y_copy=y_i, col_c=col_i,
+                     leg_c=leg_i, a_c=a_i):
+                columns, values = split_scalars({'alpha': a_c})
+                source = ColumnDataSource(data=dict(
+                    {'top': y_copy, 'left': l_c, 'right': r_c,
+                     'color_value': col_c}, **columns))
+                color_mapper = LinearColorMapper(palette=palette_colors,
+                                                 low=mapper_low,
+                                                 high=mapper_high)
+                legend_args = {'legend_label': leg_c} if leg_c else {}
+                f.quad(bottom=0, top='top', left='left', right='right',
+                       color={'field': 'color_value',
+                              'transform': color_mapper},
+                       source=source, **values, **legend_args)
         else:
-            def step(f, x_c=x_i, y_copy=y_i, col_c=col_i,
-                     bw_c=bw_i, a_c=a_i):
-                # Done sequencially because because in vectorial we cannot
-                # substract numpy.int64 and pandas timedeltas
-                left = [x_c_i - (bw_c_i / 2) for x_c_i, bw_c_i in
-                        zip(x_c, bw_c)]
-                right = [
-                    x_c_i + (bw_c_i / 2) for x_c_i, bw_c_i in zip(x_c, bw_c)
-                ]
-                # left = np.array(x_c) - (np.array(bw_c) / 2)
-                # right = np.array(x_c) + (np.array(bw_c) / 2)
-                f.quad(bottom=0, top=y_copy, left=left, right=right,
-                       color=col_c, alpha=a_c)
+            if leg_i:
+                legend_exist = True
+
+            def step(f, l_c=l_i, r_c=r_i, y_copy=y_i, col_c=col_i,
+                     leg_c=leg_i, a_c=a_i):
+                # One column by property (bokeh would copy the colors in
+                # the 3 columns line_color, fill_color and hatch_color)
+                columns, values = split_scalars({'color': col_c,
+                                                 'alpha': a_c})
+                source = ColumnDataSource(data=dict(
+                    {'top': y_copy, 'left': l_c, 'right': r_c}, **columns))
+                legend_args = {'legend_label': leg_c} if leg_c else {}
+                f.quad(bottom=0, top='top', left='left', right='right',
+                       source=source, **values, **legend_args)
         steps.append(step)
 
     if legend_exist:
@@ -343,6 +407,17 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
             and isinstance(x_copy[0], numbers.Real) and major_label_overrides:
         steps.append(format_ticks)
 
+    # Used to choose the output backend
+    nb_points = sum([len(y_i) for y_i in y])
+
+    timer.lap('steps')
+
+    # The figure is only built when needed, its ranges are checked now
+    if (x_range is not None) and not is_iterable(x_range):
+        raise ValueError('`x_range` argument should be an iterable')
+    if (y_range is not None) and not is_iterable(y_range):
+        raise ValueError('`y_range` argument should be an iterable')
+
     def _make_fig():
         fig = figure(width=width, height=height, title=title,
                      background_fill_color=session.background_color,
@@ -354,12 +429,8 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
         fig.ygrid.grid_line_dash = [8, 3, 2, 3]
         fig.toolbar.autohide = True
         if x_range is not None:
-            if not is_iterable(x_range):
-                raise ValueError('`x_range` argument should be an iterable')
             fig.x_range = Range1d(x_range[0], x_range[1])
         if y_range is not None:
-            if not is_iterable(y_range):
-                raise ValueError('`y_range` argument should be an iterable')
             fig.y_range = Range1d(y_range[0], y_range[1])
         # if (x_axis_type == 'linear') and isinstance(x_copy[0], numbers.Real):
         #     if major_label_overrides:
@@ -375,8 +446,11 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
         return fig
 
     plot = Plot(make_figure=_make_fig, steps=steps, description=description,
-                figure=_make_fig(), width=width, grid_visible=grid_visible,
-                width_session=session.width, session=session)
+                width=width, grid_visible=grid_visible,
+                width_session=session.width, session=session,
+                nb_points=nb_points)
+    timer.lap('plot')
+    timer.done()
 
     if save_path:
         save_base(plot=plot, save_path=save_path,
@@ -389,6 +463,28 @@ def histogram_base(x, y, source_dataframe, tick_label, label_orientation,
         return plot
 
 
+def _bar_edges(x, bar_width):
+    # Left and right edges of the bars, as arrays. The dates are
+    # datetime64[ns], their widths timedelta64[ns] (a number is a width in
+    # milliseconds, the unit of the datetime axes of bokeh)
+    x = np.asarray(x)
+    bar_width = np.asarray(bar_width)
+    if x.dtype.kind == 'M':
+        x = x.astype('datetime64[ns]')
+        if bar_width.dtype.kind in 'biuf':
+            bar_width = np.round(bar_width * 1e6).astype('timedelta64[ns]')
+        else:
+            bar_width = np.asarray(pd.to_timedelta(bar_width)).astype(
+                'timedelta64[ns]')
+        half = bar_width // 2
+        return x - half, x + (bar_width - half)
+    if bar_width.dtype.kind in 'Om':
+        raise ValueError('A time delta `bar_width` needs dates as `x`')
+    x = x.astype(float)
+    half = bar_width.astype(float) / 2
+    return x - half, x + half
+
+
 def _update_histogram_default_args(histogram_base, session):
     def histogram_updated(y, x=None, source_dataframe=None, tick_label=None,
                           label_orientation='horizontal', width=session.width,
@@ -400,126 +496,9 @@ def _update_histogram_default_args(histogram_base, session):
                           bar_width='auto', alpha=1, x_axis_type='auto',
                           y_axis_type='auto', x_range=None, y_range=None,
                           save_path=session.save_path,
-                          grid_visible=session.grid_visible):
-        """ Plot a graph with points (scatter-plot)
-
-        Args:
-            y (array-like of dimension 1 or dict key or pd.dataframe col name):
-                The height of each bar in the histogram. The values can be
-                either numbers, or dates (datetimes or parsable strings).
-                If a `source_dataframe` is given, `x` and `y` should be column
-                names / keys.
-
-            x (array-like of dim 1 or None or dict key or dataframe col name):
-                The x-coordinates of the center of the bars of the histogram.
-                If None and source_dataframe not is a pandas dataframe:
-                `range(len(y))` is used as `x`.
-                If None and source_dataframe is a pandas dataframe: the index
-                of the dataframe is used as `x`.
-                The values can be either numbers, or dates (datetimes or
-                parsable strings). If a `source_dataframe` is given, `x` and
-                `y` should be column names / keys.
-
-            source_dataframe (None, Pandas DataFrame or dict): Input
-                data as Pandas DataFrame or dictionary. If it is a Pandas
-                DataFrame, and `x` is None, the index of the dataframe is used
-                as `x`
-
-            tick_label (str or array like of str): Labels for each bar. If
-                `tick_label` is an array like, its length must be the same as
-                the number of bars.
-                Consider the argument `label_orientation`
-
-            label_orientation ({'horizontal', 'vertical'}): Orientation of the
-                labels
-
-            width (int): The width of the graph, including any axes, titles,
-                etc
-
-            height (int): The height of the graph, including any axes, titles,
-                etc
-
-            description (str): HTML-formatted text that will be kept bellow the
-                graph. It generally includes metadata, details about the,
-                graphs, etc. It will be kept when the graph is displayed,
-                exported or rendered in a grid with other graphs. If The graph
-                is summed with other graph, their metadata will be concatenated
-                (adding a new line between both)
-
-            title (str): Title of the graph. The attributes of the title
-                (font, etc), cannot be tuned directly in depict
-
-            x_label (None, str): Label of the x-axis
-
-            y_label (None, str): Label of the y-axis
-
-            show_plot (bool): Whether or not the graph must be displayed
-                immediately after its creation.
-                Notes: The plot object will be returned regardless this
-                parameter. Saving the plot is independant from this parameter.
-
-            color (None, str, array-like): If None, the first color of the
-                palette is used.
-                If string, a color name is expected (hexadecimal, RGB, and
-                usual colors are accepted (like 'red', etc)), and it will be
-                the same for all the bars.
-                If array-like, the length of color should correspond to the
-                number of bars, they will correspond to each bar respectively
-
-            colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
-                the best type will be chosen wrt the data.
-                If `categorical`: a legend will be used, not a colorbar.
-                If `continuous`, a colorbar will be displayed on the right
-                side of the plot. The data defining the color must be passed
-                in `color`
-
-            legend ('auto', array-like): If `auto`, the legend will be set when
-                a Pandas DataFrame or a dictionary is provided (the name of the
-                columns / keys will be the legend). If array-like, the length
-                of `legend` must match with the number of bars drawn
-
-            bar_width ('auto', Number, t-delta, array of number or t-delta):
-                The width of the bars (the total width).
-                If 'auto': the bar_width will be defined smartly considering
-                the minimum distance between 2 bars so that they do not
-                overlap.
-                If Number: The absolute value that holds for all the bars
-                If timedelta: The absolute value that holds for all the bars,
-                only for datetime axis.
-                If array-like of Number or timedelta: The width of each bar
-                is defined separately
-
-            alpha (Number, array-like): Alpha value of the bars.
-                If Number: it will the same for all the bars.
-                If array-like: its length must match with the number of bars
-                drawn. They will correspond to each bar respectively. alpha=1
-                means no transparency, alpha=0 means completely transparent.
-
-            x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly.
-
-            y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly.
-
-            x_range (array-like): Range of the x-axis
-
-            y_range (array-like): Range of the y-axis
-
-            save_path (None, str): If None, the graph is not saved. If str,
-                the graph is saved in html at the given path. If the html
-                extension is missing, it will be added automatically
-
-            grid_visible (bool): Whether the background grid must be displayed.
-                In depict, you cannot have further control about the background
-                grid
-
-        Returns:
-            depict.plot
-        """
+                          grid_visible=session.grid_visible,
+                          color_mapping=session.color_mapping, bins=None,
+                          nb_bins=10):
         plot = histogram_base(x=x, y=y, source_dataframe=source_dataframe,
                               tick_label=tick_label,
                               label_orientation=label_orientation, width=width,
@@ -530,7 +509,10 @@ def _update_histogram_default_args(histogram_base, session):
                               bar_width=bar_width, alpha=alpha,
                               x_axis_type=x_axis_type, y_axis_type=y_axis_type,
                               x_range=x_range, y_range=y_range,
-                              grid_visible=grid_visible, session=session,
+                              grid_visible=grid_visible,
+                              color_mapping=color_mapping, bins=bins,
+                              nb_bins=nb_bins, session=session,
                               save_path=save_path)
         return plot
+    histogram_updated.__doc__ = api.histogram.__doc__
     return histogram_updated
@@ -1,10 +1,15 @@
+from . import api
+from .downsampling import DOWNSAMPLING_METHODS, downsampling_indexes
 from .plot import Plot
-from .tools import show_base, save_base, is_color, format_color, is_iterable
-from ..tools.color_palettes import palette_from_name_to_function
+from .pyramid import Pyramid, is_sorted
+from .timing import StageTimer
+from .tools import show_base, save_base, is_color, format_colors, is_iterable
+from .tools import as_column, colors_to_rgba
+from ..tools.color_palettes import get_palette
 
 import numbers
 
-from bokeh.models import Range1d
+from bokeh.models import ColumnDataSource, CustomJSExpr, Range1d
 from bokeh.plotting import figure
 from bokeh.models import ColorBar, LinearColorMapper
 import numpy as np
@@ -14,7 +19,8 @@ import pandas as pd
 def line_base(y, x, source_dataframe, width, height, description, title,
               x_label, y_label, show_plot, color, colorbar_type, legend,
               line_width, alpha, style, x_axis_type, y_axis_type, x_range,
-              y_range, fill_between, grid_visible, session, save_path):
+              y_range, fill_between, grid_visible, downsampling,
+              points_per_pixel, pyramid, session, save_path):
     """ One dimensional plot. This is the docstring of line
 
     Args:
@@ -23,6 +29,8 @@ def line_base(y, x, source_dataframe, width, height, description, title,
         x_range (array-like) Range of the x-axis. E.g. `[0, 1]`
         y_range (array-like) Range of the y-axis. E.g. `[0, 1]`
     """
+    timer = StageTimer('line', session.timing_callback)
+
     # We convert (source, x and y) into only x and y. x and y will be processed
     # normally. source will not be used any more.
     if source_dataframe is not None:
@@ -101,7 +109,11 @@ def line_base(y, x, source_dataframe, width, height, description, title,
     # We pre-process `x` and `y`
     if x is None:
         if isinstance(y[0], (list, np.ndarray, tuple)):
-            x = [np.arange(len(y_i)) for y_i in y]
+            if len(set([len(y_i) for y_i in y])) == 1:
+                x_0 = np.arange(len(y[0]))
+                x = [x_0 for _ in y]
+            else:
+                x = [np.arange(len(y_i)) for y_i in y]
         else:
             x = [np.arange(len(y))]
             y = [y]
@@ -114,13 +126,16 @@ def line_base(y, x, source_dataframe, width, height, description, title,
     elif np.ndim(x) == 2:
         if np.ndim(y) == 1:  # Corner case
             y = [y for _ in x]
+    # When all the lines share the same x, it is serialized only once
+    x_shared = (len(x) > 1) and all([x_i is x[0] for x_i in x])
+
+    timer.lap('input')
 
     # We pre-process `color`
     _color_bar_made = False
     if color is None:
         nb_color_needed = len(y)
-        color = palette_from_name_to_function[session.palette_name](
-            nb_color_needed)
+        color = get_palette(session.palette_name, nb_color_needed)
     # We pre-process `color`
     # Corner case: if color = [0.5, 0.6, 0.7] and len(y) == 3, we cannot say if
     # color means actually the color defined by [0.5, 0.6, 0.7] or if this
@@ -173,14 +188,13 @@ def line_base(y, x, source_dataframe, width, height, description, title,
             if colorbar_type == 'categorical':
                 if isinstance(legend, str) and (legend.lower() == 'auto'):
                     legend = [str(c) for c in color]
-                color_unique = sorted(list(np.unique(color)))
-                nb_color_needed = len(color_unique)
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](nb_color_needed)
-                color = [palette_colors[color_unique.index(c)] for c in color]
+                color_codes, color_unique = pd.factorize(np.asarray(color),
+                                                         sort=True)
+                palette_colors = get_palette(session.palette_name,
+                                             len(color_unique))
+                color = np.asarray(palette_colors)[color_codes].tolist()
             elif colorbar_type == 'continuous':
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](256)
+                palette_colors = get_palette(session.palette_name, 256)
                 color_mapper = LinearColorMapper(palette=palette_colors,
                                                  low=np.min(color),
                                                  high=np.max(color))
@@ -195,7 +209,8 @@ def line_base(y, x, source_dataframe, width, height, description, title,
                                          location=(0, 0))
                     _color_bar_made = True
 
-    color = [format_color(c) for c in color]
+    color = format_colors(color)
+    timer.lap('color')
 
     # We pre-process `legend`
     # add_legend = True
@@ -251,6 +266,8 @@ def line_base(y, x, source_dataframe, width, height, description, title,
             return style
     style = [guess_style(s) for s in style]
 
+    timer.lap('options')
+
     # We pre-process `x_axis_type` and `y_axis_type`
     if x_axis_type.lower() == 'auto':
         if isinstance(x[0][0], numbers.Real):
@@ -268,12 +285,12 @@ def line_base(y, x, source_dataframe, width, height, description, title,
                 ).format(x[0][0])
                 raise ValueError(error_msg)
             x_axis_type = 'datetime'
-            x = [pd.to_datetime(x_i) for x_i in x]
+            x = _to_datetime(x)
     elif x_axis_type.lower() in ['numeric', 'numerical']:
         x_axis_type = 'linear'
     elif x_axis_type.lower() in ['date', 'datetime', 'time']:
         x_axis_type = 'datetime'
-        x = [pd.to_datetime(x_i) for x_i in x]
+        x = _to_datetime(x)
     # Same with y axis
     if y_axis_type.lower() == 'auto':
         if isinstance(y[0][0], numbers.Real):
@@ -296,24 +313,131 @@ def line_base(y, x, source_dataframe, width, height, description, title,
         y_axis_type = 'datetime'
         y = [pd.to_datetime(y_i) for y_i in y]
 
+    timer.lap('axis_type')
+
+    # We downsample the lines having more than `points_per_pixel` points per
+    # pixel of width. With `pyramid`, these lines (if their x is sorted) are
+    # embedded at several levels of detail instead
+    if (downsampling is not None) and (
+            downsampling not in DOWNSAMPLING_METHODS):
+        raise ValueError('`downsampling` must be None or one of '
+                         '{}'.format(DOWNSAMPLING_METHODS))
+    nb_points = max(int(points_per_pixel * width), 4)
+    pyramids = [None for _ in y]
+    if pyramid:
+        pyramids = [Pyramid(data={'x': x_i, 'y': y_i}, x_name='x',
+                            nb_points=nb_points,
+                            max_points=session.pyramid_max_points,
+                            method=downsampling or 'min_max')
+                    if (len(y_i) > nb_points) and is_sorted(x_i) else None
+                    for x_i, y_i in zip(x, y)]
+    # The 2 lines filled between and the area share one pyramid, decimated
+    # on both lines
+    y_names = ['y' for _ in y]
+    if fill_between and (len(y) >= 2) and (pyramids[0] is not None) and (
+            pyramids[1] is not None) and np.array_equal(x[0], x[1]):
+        pyramids[0] = pyramids[1] = Pyramid(
+            data={'x': x[0], 'y1': y[0], 'y2': y[1]}, x_name='x',
+            nb_points=nb_points, max_points=session.pyramid_max_points,
+            method=downsampling or 'min_max', y_names=('y1', 'y2'))
+        y_names[0], y_names[1] = 'y1', 'y2'
+    use_pyramid = any([p_i is not None for p_i in pyramids])
+    if downsampling is not None:
+        indexes = [downsampling_indexes(x_i, y_i, downsampling, nb_points)
+                   if (len(y_i) > nb_points) and (p_i is None) else None
+                   for x_i, y_i, p_i in zip(x, y, pyramids)]
+        if fill_between and (len(y) >= 2) and (indexes[0] is not None) and (
+                indexes[1] is not None):
+            # The 2 lines filled between must keep the same x
+            indexes[0] = indexes[1] = np.union1d(indexes[0], indexes[1])
+        if any([idx is not None for idx in indexes]):
+            x = [x_i if idx is None else np.asarray(x_i)[idx]
+                 for x_i, idx in zip(x, indexes)]
+            y = [y_i if idx is None else np.asarray(y_i)[idx]
+                 for y_i, idx in zip(y, indexes)]
+            x_shared = False
+
+    # The x and y are embedded as binary arrays
+    x = [as_column(x[0]) for _ in x] if x_shared else [as_column(x_i)
+                                                       for x_i in x]
+    y = [as_column(y_i) for y_i in y]
+
+    timer.lap('downsampling')
+
     steps = []
-    legend_exist = False
-    for (x_i, y_i, col_i, leg_i, lw_i, a_i, s_i) in zip(x, y, color, legend,
-                                                        line_width, alpha,
-                                                        style):
-        if leg_i:
-            legend_exist = True
-
-            def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, leg_c=leg_i,
-                     lw_c=lw_i, a_c=a_i, s_c=s_i):
-                f.line(x=x_copy, y=y_copy, color=col_c, legend_label=leg_c,
-                       line_width=lw_c, alpha=a_c, line_dash=s_c)
-        else:
-            def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, lw_c=lw_i,
-                     a_c=a_i, s_c=s_i):
-                f.line(x=x_copy, y=y_copy, color=col_c, line_width=lw_c,
-                       alpha=a_c, line_dash=s_c)
+    legend_exist = any([bool(leg_i) for leg_i in legend])
+    if (len(y) > 1) and not (legend_exist or use_pyramid):
+        # Without legend, all the lines are drawn by one `multi_line` glyph
+        # backed by one ColumnDataSource, instead of one glyph per line
+        def step(f, x_copy=x, ys=list(y), col_c=list(color),
+                 lw_c=list(line_width), a_c=list(alpha), s_c=list(style)):
+            # The properties shared by all the lines are given to the glyph,
+            # the others are columns (of typed arrays, except `line_dash`)
+            properties = {'color': col_c, 'line_width': lw_c, 'alpha': a_c,
+                          'line_dash': s_c}
+            values = {}
+            data = {'ys': ys}
+            for name, value in properties.items():
+                if all([v_i == value[0] for v_i in value]):
+                    values[name] = value[0]
+                else:
+                    values[name] = name
+                    data[name] = value
+            if 'color' in data:
+                data['color'] = colors_to_rgba(data['color'])
+            for name in ['line_width', 'alpha']:
+                if name in data:
+                    data[name] = np.asarray(data[name], dtype=float)
+            if x_shared:
+                # The x of each line is built in the browser from one array
+                xs = {'expr': CustomJSExpr(
+                    args={'x': np.asarray(x_copy[0])},
+                    code='return this.data.ys.map(() => x)')}
+            else:
+                data['xs'] = list(x_copy)
+                xs = 'xs'
+            f.multi_line(xs=xs, ys='ys', source=ColumnDataSource(data=data),
+                         **values)
+        steps.append(step)
+    elif x_shared and not use_pyramid:
+        # The lines are kept separated (for the legend) but share one
+        # ColumnDataSource with the columns x, y0, y1, ...
+        def step(f, x_0=x[0], y_copy=y, col_c=color, leg_c=legend,
+                 lw_c=line_width, a_c=alpha, s_c=style):
+            data = {'x': x_0}
+            data.update({'y{}'.format(i): y_i for i, y_i in enumerate(y_copy)})
+            source = ColumnDataSource(data=data)
+            for i, (col_i, leg_i, lw_i, a_i, s_i) in enumerate(
+                    zip(col_c, leg_c, lw_c, a_c, s_c)):
+                legend_args = {'legend_label': leg_i} if leg_i else {}
+                f.line(x='x', y='y{}'.format(i), source=source, color=col_i,
+                       line_width=lw_i, alpha=a_i, line_dash=s_i,
+                       **legend_args)
         steps.append(step)
+    else:
+        for (x_i, y_i, col_i, leg_i, lw_i, a_i, s_i, p_i, y_n_i) in zip(
+                x, y, color, legend, line_width, alpha, style, pyramids,
+                y_names):
+            if p_i is not None:
+                def step(f, pyramid_c=p_i, col_c=col_i, leg_c=leg_i,
+                         lw_c=lw_i, a_c=a_i, s_c=s_i, y_name_c=y_n_i):
+                    legend_args = {'legend_label': leg_c} if leg_c else {}
+                    pyramid_c.add_glyph(f, lambda source: f.line(
+                        x='x', y=y_name_c, source=source, color=col_c,
+                        line_width=lw_c, alpha=a_c, line_dash=s_c,
+                        **legend_args))
+            elif leg_i:
+                def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, leg_c=leg_i,
+                         lw_c=lw_i, a_c=a_i, s_c=s_i):
+                    f.line(x=x_copy, y=y_copy, color=col_c,
+                           legend_label=leg_c, line_width=lw_c, alpha=a_c,
+                           line_dash=s_c)
+            else:
+                def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, lw_c=lw_i,
+                         a_c=a_i, s_c=s_i):
+                    f.line(x=x_copy, y=y_copy, color=col_c, line_width=lw_c,
+                           alpha=a_c, line_dash=s_c)
+            steps.append(step)
 
     if legend_exist:
         def make_legend_interactive(f):
@@ -331,10 +455,29 @@ def line_base(y, x, source_dataframe, width, height, description, title,
                 raise ValueError('When `fill_between` is True, x[0] and x[1] '
                                  'must be the same.')
 
-            def fill_between_curves(f, x_0=x[0], y_0=y[0], y_1=y[1]):
-                f.varea(x=x_0, y1=y_0, y2=y_1, alpha=alpha[0], color=color[0])
+            if pyramids[0] is not None:
+                # The area is drawn from the pyramid of the 2 lines
+                def fill_between_curves(f, pyramid_c=pyramids[0]):
+                    pyramid_c.add_glyph(f, lambda source: f.varea(
+                        x='x', y1='y1', y2='y2', source=source,
+                        alpha=alpha[0], color=color[0]))
+            else:
+                def fill_between_curves(f, x_0=x[0], y_0=y[0], y_1=y[1]):
+                    f.varea(x=x_0, y1=y_0, y2=y_1, alpha=alpha[0],
+                            color=color[0])
             steps.append(fill_between_curves)
 
+    # Used to choose the output backend
+    nb_points = sum([len(y_i) for y_i in y])
+
+    timer.lap('steps')
+
+    # The figure is only built when needed, its ranges are checked now
+    if (x_range is not None) and not is_iterable(x_range):
+        raise ValueError('`x_range` argument should be an iterable')
+    if (y_range is not None) and not is_iterable(y_range):
+        raise ValueError('`y_range` argument should be an iterable')
+
     def _make_fig():
         fig = figure(width=width, height=height, title=title,
                      background_fill_color=session.background_color,
@@ -346,12 +489,8 @@ def line_base(y, x, source_dataframe, width, height, description, title,
         fig.ygrid.grid_line_dash = [8, 3, 2, 3]
         fig.toolbar.autohide = True
         if x_range is not None:
-            if not is_iterable(x_range):
-                raise ValueError('`x_range` argument should be an iterable')
             fig.x_range = Range1d(x_range[0], x_range[1])
         if y_range is not None:
-            if not is_iterable(y_range):
-                raise ValueError('`y_range` argument should be an iterable')
             fig.y_range = Range1d(y_range[0], y_range[1])
         if _color_bar_made and _add_color_bar:
             color_mapper = LinearColorMapper(palette=palette_colors,
@@ -362,8 +501,11 @@ def line_base(y, x, source_dataframe, width, height, description, title,
         return fig
 
     plot = Plot(make_figure=_make_fig, steps=steps, description=description,
-                figure=_make_fig(), width=width, grid_visible=grid_visible,
-                width_session=session.width, session=session)
+                width=width, grid_visible=grid_visible,
+                width_session=session.width, session=session,
+                nb_points=nb_points)
+    timer.lap('plot')
+    timer.done()
 
     if save_path:
         save_base(plot=plot, save_path=save_path,
@@ -376,6 +518,16 @@ def line_base(y, x, source_dataframe, width, height, description, title,
         return plot
 
 
+def _to_datetime(arrays):
+    # Converts each array once, so that an x shared by several lines stays
+    # shared
+    converted = {}
+    for array in arrays:
+        if id(array) not in converted:
+            converted[id(array)] = pd.to_datetime(array)
+    return [converted[id(array)] for array in arrays]
+
+
 def _update_line_default_args(line, session):
     def line_updated(y, x=None, source_dataframe=None, width=session.width,
                      height=session.height, description=session.description,
@@ -385,118 +537,10 @@ def _update_line_default_args(line, session):
                      alpha=1, style='solid', x_axis_type='auto',
                      y_axis_type='auto', x_range=None, y_range=None,
                      fill_between=False, save_path=session.save_path,
-                     grid_visible=session.grid_visible):
-        """Plot a graph with one-dimensional line(s)
-
-        Args:
-            y (array-like of dimension 1 or 2): The y-coordinates for the
-                points of the line(s). If `y` is 1-d, one line will be drawn,
-                if  it is 2-d, a set of lines will be drawn.
-                The values can be either numbers, or dates (datetimes or
-                parsable strings). If a `source_dataframe` is given, `x` and
-                `y` should be column names / keys.
-
-            x (None, array-like of dimension 1 or 2): The x-coordinates for the
-                points of the line(s). If `None`, indexes starting from 0 and
-                adapted to `y` will be used. If `y` is 1-d, one line will be
-                drawn, if  it is 2-d, a set of lines will be drawn.
-                The values can be either numbers, or dates (datetimes or
-                parsable strings). If a `source_dataframe` is given, `x` and
-                `y` should be column names / keys.
-
-            source_dataframe (None, Pandas DataFrame or dict): Input data as
-                Pandas DataFrame or dictionary. If it is a Pandas DataFrame,
-                and `x` is None, the index of the dataframe is used as `x`
-
-            width (int): The width of the graph, including any axes, titles,
-                etc
-
-            height (int): The height of the graph, including any axes, titles,
-                etc
-
-            description (str): HTML-formatted text that will be kept bellow the
-                graph. It generally includes metadata, details about the,
-                graphs, etc. It will be kept when the graph is displayed,
-                exported or rendered in a grid with other graphs. If The graph
-                is summed with other graph, their metadata will be concatenated
-                (adding a new line between both)
-
-            title (str): Title of the graph. The attributes of the title
-                (font), cannot be tuned directly in depict
-
-            x_label (None, str): Label of the x-axis
-
-            y_label (None, str): Label of the y-axis
-
-            show_plot (bool): Whether or not the graph must be displayed
-                immediatly after its creation
-
-            color (None, str, array-like): If None, the first color of the
-                palette is used.
-                If string, a color name is expected (hexadecimal, RGB, and
-                usual colors are accepted), and it will be the same for all
-                the lines.
-                If array-like, the length of color should correspond to the
-                number of lines drawn, they will correspond to each line
-                respectively
-
-            colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
-                the best type will be chosen wrt the data. If `categorical`:
-                a legend will be used, not a colorbar. If `continuous`, a
-                colorbar will be displayed on the right side of the plot.
-                The data defining the color must be passed in `color`
-
-            legend ('auto', array-like): If `auto`, the legend will be set when
-                a Pandas DataFrame ora dictionary is provided (the name of the
-                columns / keys will be the legend). If array-like, the length
-                of `legend` must match with the number of curves dranw
-
-            line_width (Number, array-like): Width of the line(s). If Number
-                it will the same for all the lines. If it is an array-like,
-                its length must match with the number of lines drawn. They will
-                correspond to each line respectively
-
-            alpha (Number, array-like): Alpha value of the line(s). If Number
-                it will the same for all the lines. If it is an array-like,
-                its length must match with the number of lines drawn. They will
-                correspond to each line respectively
-
-            style ({'solid', 'dashed', 'dotted', 'dotdash', dashdot'} or array
-                like of those): Style of the line(s). If it is an array-like,
-                its length must match with the number of lines drawn. They will
-                correspond to each line respectively
-
-            x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly
-
-            y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly
-
-            x_range (array-like): Range of the x-axis
-
-            y_range (array-like): Range of the y-axis
-
-            fill_between (bool): If True, there must be at least 2 curves to
-                plot and the area between the first 2 curves is filled. The
-                color of the first line and its alpha value are used for the
-                part filled. In depict, you cannot have more control about
-                this area
-
-            save_path (None, str): If None, the graph is not saved. If str,
-                the graph is saved in html at the gicen path. If the html
-                extension is missing, it will be added automatically
-
-            grid_visible (bool): Whether the background grid must be displayed.
-                In depict, you cannot have further control about the background
-                grid
-
-        Returns:
-            None
-        """
+                     grid_visible=session.grid_visible,
+                     downsampling=session.downsampling,
+                     points_per_pixel=session.points_per_pixel,
+                     pyramid=session.pyramid):
         plot = line(y=y, x=x, source_dataframe=source_dataframe, width=width,
                     height=height, description=description, title=title,
                     x_label=x_label, y_label=y_label, show_plot=show_plot,
@@ -505,6 +549,9 @@ def _update_line_default_args(line, session):
                     x_axis_type=x_axis_type, y_axis_type=y_axis_type,
                     x_range=x_range, y_range=y_range,
                     fill_between=fill_between, grid_visible=grid_visible,
+                    downsampling=downsampling,
+                    points_per_pixel=points_per_pixel, pyramid=pyramid,
                     session=session, save_path=save_path)
         return plot
+    line_updated.__doc__ = api.line.__doc__
     return line_updated
@@ -1,24 +1,125 @@
 class Plot:
-    def __init__(self, make_figure, steps, description, figure, width,
-                 grid_visible, width_session, session):
+    """ Plot made of a function building an empty figure and of the steps
+    drawing on it
+
+    The sum of plots is a plot drawing the steps of both on one figure. It
+    only keeps its 2 operands: the steps and the descriptions of a chain of
+    additions are flattened once, when they are first needed (when the plot
+    is shown, saved, or its steps, description or figure accessed). The sum
+    is a snapshot of its operands at that time: it sees the changes made to
+    their steps or descriptions before, not the ones made after
+    """
+    def __init__(self, make_figure, steps, description, width, grid_visible,
+                 width_session, session, nb_points=0):
+        # The 2 plots added, for a sum whose steps are not flattened yet
+        self._operands = None
         self.make_figure = make_figure
         self.steps = steps
         self.description = description
-        self.figure = figure
         self.width = width
         self.grid_visible = grid_visible
         self.width_session = width_session
         self.session = session
+        # Number of points (or bars) drawn by the plot
+        self.nb_points = nb_points
+
+    @property
+    def steps(self):
+        if self._operands is not None:
+            self._take_snapshot()
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps):
+        self._steps = steps
+        self._figure = None
+        self._figure_steps = None
+
+    @property
+    def description(self):
+        if self._operands is not None:
+            self._take_snapshot()
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        self._description = description
+
+    def _take_snapshot(self):
+        # The steps and the description of a sum are read from its operands
+        # at once (unless they were set), then the operands are released
+        plots = self._flatten()
+        if self._steps is None:
+            self._steps = [step for plot in plots for step in plot.steps]
+        if self._description is None:
+            self._description = '<br>'.join(
+                [plot.description for plot in plots])
+        self._operands = None
+
+    def _flatten(self):
+        # Plots with their own steps whose sum is this plot, from left to
+        # right. Iterative, so that long chains of additions do not reach the
+        # recursion limit
+        plots = []
+        stack = [self]
+        while stack:
+            plot = stack.pop()
+            if (plot is not self) and (plot._steps is not None):
+                plots.append(plot)
+            else:
+                stack.extend(reversed(plot._operands))
+        return plots
+
+    @property
+    def figure(self):
+        """ Bokeh figure of the plot
+
+        It is only built on first access, and then cached until the steps of
+        the plot change (they are replaced, or the list is modified)
+        """
+        steps = tuple(self.steps)
+        if (self._figure is None) or (steps != self._figure_steps):
+            fig = self.new_figure()
+            for step in steps:
+                step(fig)
+            self._figure = fig
+            self._figure_steps = steps
+        return self._figure
+
+    @property
+    def output_backend(self):
+        """ Output backend of the figures: 'canvas' or 'webgl'
+
+        With the 'auto' backend of the session, WebGL is used when the plot
+        draws more than `webgl_threshold` points
+        """
+        backend = getattr(self.session, 'output_backend', 'canvas')
+        if backend == 'auto':
+            if self.nb_points > self.session.webgl_threshold:
+                return 'webgl'
+            return 'canvas'
+        return backend
+
+    def new_figure(self):
+        """ Empty figure of the plot, with its output backend """
+        fig = self.make_figure()
+        fig.output_backend = self.output_backend
+        return fig
 
     def __add__(self, other):
-        new_description = self.description + '<br>' + other.description
-        fig_sum = self.make_figure()
-        for step in self.steps + other.steps:
-            step(fig_sum)
-        return Plot(make_figure=self.make_figure,
-                    steps=self.steps + other.steps,
-                    description=new_description,
-                    figure=fig_sum, width=self.width,
-                    grid_visible=self.grid_visible,
-                    width_session=self.width_session,
-                    session=self.session)
+        if not isinstance(other, Plot):
+            return NotImplemented
+        plot_sum = Plot(make_figure=self.make_figure, steps=None,
+                        description=None, width=self.width,
+                        grid_visible=self.grid_visible,
+                        width_session=self.width_session,
+                        session=self.session,
+                        nb_points=self.nb_points + other.nb_points)
+        plot_sum._operands = (self, other)
+        return plot_sum
+
+    def __radd__(self, other):
+        # `sum(plots)` starts with 0
+        if isinstance(other, int) and (other == 0):
+            return self
+        return NotImplemented
@@ -1,19 +1,27 @@
+from . import api
+from .aggregation import bounds, hexbin, raster, to_float
 from .plot import Plot
-from .tools import show_base, save_base, is_color, format_color, is_iterable
-from ..tools.color_palettes import palette_from_name_to_function
+from .pyramid import Pyramid
+from .timing import StageTimer
+from .tools import show_base, save_base, is_color, format_color, format_colors
+from .tools import colors_to_rgba, group_by_legend, is_iterable, split_scalars
+from ..tools.color_palettes import get_palette
 
 import numbers
 
 from bokeh.models import Range1d
 from bokeh.plotting import figure
-from bokeh.models import ColorBar, LinearColorMapper
+from bokeh.models import ColorBar, ColumnDataSource, LinearColorMapper
 import numpy as np
 import pandas as pd
 
+AGGREGATIONS = ['raster', 'hexbin']
+
 
 def point_base(x, y, source_dataframe, width, height, description, title,
                x_label, y_label, show_plot, color, colorbar_type, legend, size,
                alpha, x_axis_type, y_axis_type, x_range, y_range, grid_visible,
+               color_mapping, pyramid, aggregation, reduction, hex_size,
                session, save_path):
     """ Scatter plot
 
@@ -21,6 +29,8 @@ def point_base(x, y, source_dataframe, width, height, description, title,
         x (array-like): X-axis data
         y (array-like): y-axis data
     """
+    timer = StageTimer('point', session.timing_callback)
+
     # We convert (source, x and y) into only x and y. x and y will be processed
     # normally. source will not be used any more.
     if source_dataframe is not None:
@@ -71,13 +81,30 @@ def point_base(x, y, source_dataframe, width, height, description, title,
     if (np.ndim(x) != 1) or (np.ndim(y) != 1):
         raise ValueError('X and y must be a one dimensional array like')
 
+    if color_mapping not in ['python', 'browser']:
+        raise ValueError("`color_mapping` must be either 'python' or "
+                         "'browser'")
+
+    timer.lap('input')
+
+    if aggregation is not None:
+        # The points are aggregated in a grid, they are not drawn one by one
+        return _point_aggregated(
+            x=x, y=y, color=color, aggregation=aggregation,
+            reduction=reduction, hex_size=hex_size, width=width,
+            height=height,
+            description=description, title=title, x_label=x_label,
+            y_label=y_label, show_plot=show_plot, x_axis_type=x_axis_type,
+            y_axis_type=y_axis_type, x_range=x_range, y_range=y_range,
+            grid_visible=grid_visible, session=session, save_path=save_path,
+            timer=timer)
+
     # We pre-process `color`
     _color_bar_made = False
+    _color_mapped_in_browser = False
     if color is None:
         nb_color_needed = 1
-        color = palette_from_name_to_function[session.palette_name](
-            nb_color_needed)
-        color = [color[0] for _ in y]
+        color = get_palette(session.palette_name, nb_color_needed)[0]
     # We pre-process `color`
     # Corner case: if color = [0.5, 0.6, 0.7] and len(y) == 3, we cannot say if
     # color means actually the color defined by [0.5, 0.6, 0.7] or if this
@@ -89,11 +116,11 @@ def point_base(x, y, source_dataframe, width, height, description, title,
             and isinstance(color[0], numbers.Real)\
             and session.automatic_color_mapping\
             and (len(y) == 3):
-        color = [color, color, color]
+        pass  # One color for all the points
     else:
         # General case
         if is_color(color):
-            color = [color for _ in y]
+            pass  # One color for all the points
         elif isinstance(color, (list, np.ndarray, tuple))\
                 and is_color(color[0]):
             if len(color) == len(y):
@@ -130,45 +157,65 @@ def point_base(x, y, source_dataframe, width, height, description, title,
             if colorbar_type == 'categorical':
                 if isinstance(legend, str) and (legend.lower() == 'auto'):
                     legend = [str(c) for c in color]
-                color_unique = sorted(list(np.unique(color)))
-                nb_color_needed = len(color_unique)
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](nb_color_needed)
-                color = [palette_colors[color_unique.index(c)] for c in color]
+                color_codes, color_unique = pd.factorize(np.asarray(color),
+                                                         sort=True)
+                palette_colors = get_palette(session.palette_name,
+                                             len(color_unique))
+                if color_mapping == 'browser':
+                    # The codes of the categories are sent, the browser maps
+                    # each code c to the color c of the palette
+                    _color_mapped_in_browser = True
+                    color = color_codes
+                    mapper_low = -0.5
+                    mapper_high = len(color_unique) - 0.5
+                else:
+                    color = np.asarray(palette_colors)[color_codes].tolist()
             elif colorbar_type == 'continuous':
-                palette_colors = palette_from_name_to_function[
-                    session.palette_name](256)
+                palette_colors = get_palette(session.palette_name, 256)
                 color_mapper = LinearColorMapper(palette=palette_colors,
                                                  low=np.min(color),
                                                  high=np.max(color))
                 color = np.array(color)
-                col_indexes = (color - color.min()) / (
-                            (color.max() - color.min()) / (256 - 1))
                 color_min = np.min(color)
                 color_max = np.max(color)
-                color = [palette_colors[int(ci)] for ci in col_indexes]
+                if color_mapping == 'browser':
+                    # The values are kept as numbers, the browser maps them
+                    # to the palette
+                    _color_mapped_in_browser = True
+                    mapper_low = color_min
+                    mapper_high = color_max
+                else:
+                    col_indexes = (color - color.min()) / (
+                                (color.max() - color.min()) / (256 - 1))
+                    color = np.asarray(palette_colors)[
+                        col_indexes.astype(int)]
                 if _add_color_bar:
                     color_bar = ColorBar(color_mapper=color_mapper,
                                          location=(0, 0))
                     _color_bar_made = True
 
-    color = [format_color(c) for c in color]
+    # A color shared by all the points stays a single value
+    if is_color(color):
+        color = format_color(color)
+    elif not _color_mapped_in_browser:
+        # Packed as numbers, so that they are embedded as a binary array
+        color = colors_to_rgba(format_colors(color))
+    timer.lap('color')
 
     # We pre-process `legend`
     # add_legend = True
-    if (legend is None) or (legend == 'auto'):
-        legend = ['' for _ in y]
+    if (legend is None) or (isinstance(legend, str) and legend == 'auto'):
+        legend = ''
         # add_legend = False
-    elif isinstance(legend, str):
-        legend = [legend for _ in y]
     elif isinstance(legend, (list, np.ndarray, tuple)):
         if len(legend) != len(y):
             raise ValueError('The number of elements in `legend` is not '
                              'consistent with the data')
 
-    # We pre-process `size`
+    # We pre-process `size`. The scalars are kept as is: they are given to
+    # the glyph, not sent as one value per point
     if isinstance(size, numbers.Real):
-        size = [size for _ in y]
+        pass
     elif isinstance(size, (list, np.ndarray, tuple)):
         if len(size) != len(y):
             raise ValueError('The size argument given is non consistent '
@@ -176,79 +223,98 @@ def point_base(x, y, source_dataframe, width, height, description, title,
 
     # We pre-process `alpha`
     if isinstance(alpha, numbers.Real):
-        alpha = [alpha for _ in y]
+        pass
     elif isinstance(alpha, (list, np.ndarray, tuple)):
         if len(alpha) != len(y):
             raise ValueError(
                 'The alpha argument given is non consistent with the data')
 
+    timer.lap('options')
+
     # We pre-process `x_axis_type` and `y_axis_type`
-    if x_axis_type.lower() == 'auto':
-        if isinstance(x[0], numbers.Real):
-            x_axis_type = 'linear'
-        else:
-            try:
-                pd.to_datetime(x[0], errors='raise')
-            except ValueError:
-                raise ValueError('`x_axis_type` is set to `auto` and x[0] '
-                                 'is neither a number, nor an object parsable '
-                                 'as a date. Object x[0]: {}'.format(x[0]))
-            x_axis_type = 'datetime'
-            x = pd.to_datetime(x)
-    elif x_axis_type.lower() in ['numeric', 'numerical']:
-        x_axis_type = 'linear'
-    elif x_axis_type.lower() in ['date', 'datetime', 'time']:
-        x_axis_type = 'datetime'
-        x = pd.to_datetime(x)
-    # Same with y axis
-    if y_axis_type.lower() == 'auto':
-        if isinstance(y[0], numbers.Real):
-            y_axis_type = 'linear'
-        else:
-            try:
-                pd.to_datetime(y[0], errors='raise')
-            except ValueError:
-                raise ValueError('`y_axis_type` is set to `auto` and y[0] '
-                                 'is neither a number, nor an object parsable '
-                                 'as a date. Object y[0]: {}'.format(y[0]))
-            y_axis_type = 'datetime'
-            y = pd.to_datetime(y)
-    elif y_axis_type.lower() in ['numeric', 'numerical']:
-        y_axis_type = 'linear'
-    elif y_axis_type.lower() in ['date', 'datetime', 'time']:
-        y_axis_type = 'datetime'
-        y = pd.to_datetime(y)
+    x_axis_type, x = _process_axis_type(x, x_axis_type, 'x')
+    y_axis_type, y = _process_axis_type(y, y_axis_type, 'y')
+
+    timer.lap('axis_type')
 
     # We group x and y based on legend because in bokek, figure.scatter can
     # only set one legend label by scatter plot. So if the legend contains
-    # an iterable of strings, we need to look for unique values and mask
-    # all attributes
-    legend_unique = np.unique(legend)
-    mask_all = [l_i == np.array(legend) for l_i in legend_unique]
-    x = [np.array(x)[mask] for mask in mask_all]
-    y = [np.array(y)[mask] for mask in mask_all]
-    color = [np.array(color)[mask] for mask in mask_all]
-    if isinstance(color[0][0], np.ndarray):
+    # an iterable of strings, we need to split all attributes by legend (in
+    # one pass). The scalar attributes are shared by all the groups
+    legend_unique, (x, y, color, size, alpha) = group_by_legend(
+        legend, [x, y, color, size, alpha])
+    if (np.ndim(color[0]) > 0) and isinstance(color[0][0], np.ndarray):
         color = [[tuple(c_i_i) for c_i_i in c_i] for c_i in color]
-    size = [np.array(size)[mask] for mask in mask_all]
-    alpha = [np.array(alpha)[mask] for mask in mask_all]
 
     steps = []
     legend_exist = False
     legend_unique = [str(lu) for lu in legend_unique]
     for (x_i, y_i, col_i, leg_i, s_i, a_i) in zip(x, y, color, legend_unique,
                                                   size, alpha):
-        if leg_i:
-            legend_exist = True
+        if pyramid and (len(x_i) > session.pyramid_max_points):
+            # The points are embedded at several levels of detail, sorted by
+            # x, the browser displays at most `pyramid_max_points` of them
+            if leg_i:
+                legend_exist = True
+            order = np.argsort(np.asarray(x_i), kind='stable')
+            color_name = ('color_value' if _color_mapped_in_browser
+                          else 'color')
+            columns, values = split_scalars({color_name: col_i,
+                                             'size': s_i, 'alpha': a_i})
+            pyramid_i = Pyramid(
+                data=dict({'x': np.asarray(x_i)[order], 'y': y_i[order]},
+                          **{name: np.asarray(column)[order]
+                             for name, column in columns.items()}),
+                x_name='x', nb_points=session.pyramid_max_points,
+                max_points=session.pyramid_max_points, method='sample')
+
+            def step(f, pyramid_c=pyramid_i, leg_c=leg_i,
+                     color_name_c=color_name, values_c=values):
+                values_c = dict(values_c)
+                if color_name_c == 'color_value':
+                    color_mapper = LinearColorMapper(palette=palette_colors,
+                                                     low=mapper_low,
+                                                     high=mapper_high)
+                    del values_c['color_value']
+                    values_c['color'] = {'field': 'color_value',
+                                         'transform': color_mapper}
+                legend_args = {'legend_label': leg_c} if leg_c else {}
+                pyramid_c.add_glyph(f, lambda source: f.scatter(
+                    x='x', y='y', source=source, **values_c, **legend_args))
+        elif _color_mapped_in_browser:
+            if leg_i:
+                legend_exist = True
 
             def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, leg_c=leg_i,
                      s_c=s_i, a_c=a_i):
-                f.scatter(x=x_copy, y=y_copy, color=col_c, legend_label=leg_c,
-                          size=s_c, alpha=a_c)
+                columns, values = split_scalars({'size': s_c,
+                                                 'alpha': a_c})
+                source = ColumnDataSource(data=dict(
+                    {'x': x_copy, 'y': y_copy, 'color_value': col_c},
+                    **columns))
+                color_mapper = LinearColorMapper(palette=palette_colors,
+                                                 low=mapper_low,
+                                                 high=mapper_high)
+                legend_args = {'legend_label': leg_c} if leg_c else {}
+                f.scatter(x='x', y='y',
+                          color={'field': 'color_value',
+                                 'transform': color_mapper},
+                          source=source, **values, **legend_args)
         else:
-            def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i,
+            if leg_i:
+                legend_exist = True
+
+            def step(f, x_copy=x_i, y_copy=y_i, col_c=col_i, leg_c=leg_i,
                      s_c=s_i, a_c=a_i):
-                f.scatter(x=x_copy, y=y_copy, color=col_c, size=s_c, alpha=a_c)
+                # One column by property (bokeh would copy the colors in
+                # the 3 columns line_color, fill_color and hatch_color)
+                columns, values = split_scalars({'color': col_c,
+                                                 'size': s_c, 'alpha': a_c})
+                source = ColumnDataSource(data=dict(
+                    {'x': x_copy, 'y': y_copy}, **columns))
+                legend_args = {'legend_label': leg_c} if leg_c else {}
+                f.scatter(x='x', y='y', source=source, **values,
+                          **legend_args)
         steps.append(step)
 
     if legend_exist:
@@ -256,6 +322,17 @@ def point_base(x, y, source_dataframe, width, height, description, title,
             f.legend.click_policy = "hide"
         steps.append(make_legend_interactive)
 
+    # Used to choose the output backend
+    nb_points = sum([len(y_i) for y_i in y])
+
+    timer.lap('steps')
+
+    # The figure is only built when needed, its ranges are checked now
+    if (x_range is not None) and not is_iterable(x_range):
+        raise ValueError('`x_range` argument should be an iterable')
+    if (y_range is not None) and not is_iterable(y_range):
+        raise ValueError('`y_range` argument should be an iterable')
+
     def _make_fig():
         fig = figure(width=width, height=height, title=title,
                      background_fill_color=session.background_color,
@@ -267,12 +344,8 @@ def point_base(x, y, source_dataframe, width, height, description, title,
         fig.ygrid.grid_line_dash = [8, 3, 2, 3]
         fig.toolbar.autohide = True
         if x_range is not None:
-            if not is_iterable(x_range):
-                raise ValueError('`x_range` argument should be an iterable')
             fig.x_range = Range1d(x_range[0], x_range[1])
         if y_range is not None:
-            if not is_iterable(y_range):
-                raise ValueError('`y_range` argument should be an iterable')
             fig.y_range = Range1d(y_range[0], y_range[1])
         if _color_bar_made and _add_color_bar:
             color_mapper = LinearColorMapper(palette=palette_colors,
@@ -283,8 +356,156 @@ def point_base(x, y, source_dataframe, width, height, description, title,
         return fig
 
     plot = Plot(make_figure=_make_fig, steps=steps, description=description,
-                figure=_make_fig(), width=width, grid_visible=grid_visible,
-                width_session=session.width, session=session)
+                width=width, grid_visible=grid_visible,
+                width_session=session.width, session=session,
+                nb_points=nb_points)
+    timer.lap('plot')
+    timer.done()
+
+    if save_path:
+        save_base(plot=plot, save_path=save_path,
+                  file_exists_mode=session.file_exists_mode,
+                  width_total_as_session=False, share_x=False, share_y=False)
+
+    if show_plot:
+        return show_base(plot) or plot
+    else:
+        return plot
+
+
+def _process_axis_type(values, axis_type, axis_name):
+    # Returns the bokeh type of the axis ('linear' or 'datetime') and the
+    # values, converted into dates for a datetime axis
+    if axis_type.lower() == 'auto':
+        if isinstance(values[0], numbers.Real):
+            return 'linear', values
+        try:
+            pd.to_datetime(values[0], errors='raise')
+        except ValueError:
+            raise ValueError('`{0}_axis_type` is set to `auto` and {0}[0] '
+                             'is neither a number, nor an object parsable '
+                             'as a date. Object {0}[0]: {1}'.format(
+                                 axis_name, values[0]))
+        return 'datetime', pd.to_datetime(values)
+    elif axis_type.lower() in ['numeric', 'numerical']:
+        return 'linear', values
+    elif axis_type.lower() in ['date', 'datetime', 'time']:
+        return 'datetime', pd.to_datetime(values)
+    return axis_type, values
+
+
+def _range_bounds(axis_range, axis_type):
+    if axis_type == 'datetime':
+        axis_range = pd.to_datetime(axis_range)
+    return tuple(to_float(axis_range[:2]))
+
+
+def _point_aggregated(x, y, color, aggregation, reduction, hex_size, width,
+                      height, description, title, x_label, y_label, show_plot,
+                      x_axis_type, y_axis_type, x_range, y_range,
+                      grid_visible, session, save_path, timer):
+    # Scatter plot of the points aggregated in a grid, drawn as an image with
+    # one pixel per cell ('raster') or as hexagonal tiles ('hexbin')
+    if aggregation not in AGGREGATIONS:
+        raise ValueError('`aggregation` must be None or one of {}'.format(
+            AGGREGATIONS))
+    values = None
+    if reduction != 'count':
+        if (color is None) or is_color(color) or not isinstance(
+                color[0], numbers.Real):
+            raise ValueError("With the reductions 'mean' and 'max', `color` "
+                             "must contain one number by point")
+        values = np.asarray(color, dtype=float)
+    timer.lap('color')
+
+    x_axis_type, x = _process_axis_type(x, x_axis_type, 'x')
+    y_axis_type, y = _process_axis_type(y, y_axis_type, 'y')
+    x = np.asarray(x)
+    y = np.asarray(y)
+    timer.lap('axis_type')
+
+    x_bounds = bounds(x) if x_range is None else _range_bounds(x_range,
+                                                               x_axis_type)
+    y_bounds = bounds(y) if y_range is None else _range_bounds(y_range,
+                                                               y_axis_type)
+    if aggregation == 'raster':
+        grid = raster(x, y, shape=(height, width), x_bounds=x_bounds,
+                      y_bounds=y_bounds, values=values, reduction=reduction)
+        if reduction == 'count':
+            grid[grid == 0] = np.nan  # Empty cells are transparent
+        result = grid
+    else:
+        # `hex_size` is in pixels. The radius of the hexagons is in y units,
+        # and x is scaled so that the hexagons are regular on screen
+        x_span = x_bounds[1] - x_bounds[0]
+        y_span = y_bounds[1] - y_bounds[0]
+        size = hex_size * y_span / height
+        aspect_scale = (width / x_span) / (height / y_span)
+        q, r, result = hexbin(x, y, size=size, x_bounds=x_bounds,
+                              y_bounds=y_bounds, aspect_scale=aspect_scale,
+                              values=values, reduction=reduction)
+    timer.lap('aggregation')
+
+    palette_name = session.palette_name
+    if not palette_name.startswith('linear'):
+        palette_name = 'linear_blue'
+    palette_colors = get_palette(palette_name, 256)
+    if np.all(np.isnan(result)):
+        low, high = 0, 1
+    else:
+        low, high = np.nanmin(result), np.nanmax(result)
+
+    if aggregation == 'raster':
+        def step(f, grid_c=grid):
+            color_mapper = LinearColorMapper(palette=palette_colors, low=low,
+                                             high=high,
+                                             nan_color=(0, 0, 0, 0))
+            f.image(image=[grid_c], x=x_bounds[0], y=y_bounds[0],
+                    dw=x_bounds[1] - x_bounds[0],
+                    dh=y_bounds[1] - y_bounds[0], color_mapper=color_mapper)
+            f.add_layout(ColorBar(color_mapper=color_mapper,
+                                  location=(0, 0)), 'right')
+        fig_ranges = {'x_range': x_bounds, 'y_range': y_bounds}
+    else:
+        def step(f, q_c=q, r_c=r, result_c=result):
+            color_mapper = LinearColorMapper(palette=palette_colors, low=low,
+                                             high=high)
+            source = ColumnDataSource(data={'q': q_c, 'r': r_c,
+                                            'value': result_c})
+            f.hex_tile(q='q', r='r', size=size, aspect_scale=aspect_scale,
+                       fill_color={'field': 'value',
+                                   'transform': color_mapper},
+                       line_color=None, source=source)
+            f.add_layout(ColorBar(color_mapper=color_mapper,
+                                  location=(0, 0)), 'right')
+        # The ranges fit the tiles, unless given
+        fig_ranges = {}
+        if x_range is not None:
+            fig_ranges['x_range'] = x_bounds
+        if y_range is not None:
+            fig_ranges['y_range'] = y_bounds
+    steps = [step]
+    timer.lap('steps')
+
+    def _make_fig():
+        fig = figure(width=width, height=height, title=title,
+                     background_fill_color=session.background_color,
+                     x_axis_label=x_label, y_axis_label=y_label,
+                     x_axis_type=x_axis_type, y_axis_type=y_axis_type,
+                     **fig_ranges)
+        fig.title.align = 'center'
+        fig.title.text_color = '#33331a'
+        fig.xgrid.grid_line_dash = [8, 3, 2, 3]
+        fig.ygrid.grid_line_dash = [8, 3, 2, 3]
+        fig.toolbar.autohide = True
+        return fig
+
+    plot = Plot(make_figure=_make_fig, steps=steps, description=description,
+                width=width, grid_visible=grid_visible,
+                width_session=session.width, session=session,
+                nb_points=np.size(result))
+    timer.lap('plot')
+    timer.done()
 
     if save_path:
         save_base(plot=plot, save_path=save_path,
@@ -305,115 +526,20 @@ def _update_point_default_args(point, session):
                       colorbar_type='auto', legend='auto', size=6, alpha=1,
                       x_axis_type='auto', y_axis_type='auto', x_range=None,
                       y_range=None, save_path=session.save_path,
-                      grid_visible=session.grid_visible):
-        """Plot a graph with points (scatter-plot)
-
-        Args:
-            x (array-like of dimension 1): The x-coordinates for the points.
-                The values can be either numbers, or dates (datetimes or
-                parsable strings). If a `source_dataframe` is given, `x` and
-                `y` should be column names / keys. `x` can be None is a special
-                case: when a pandas dataframe is given as `source_dataframe`
-                and you want to use the index of the dataframe as `x`
-
-            y (array-like of dimension 1): The y-coordinates for the points.
-                The values can be either numbers, or dates (datetimes or
-                parsable strings). If a `source_dataframe` is given, `x` and
-                `y` should be column names / keys.
-
-            source_dataframe (None, Pandas DataFrame or dict): Input
-                data as Pandas DataFrame or dictionary. If it is a Pandas
-                DataFrame, and `x` is None, the index of the dataframe is used
-                as `x`
-
-            width (int): The width of the graph, including any axes, titles,
-                etc
-
-            height (int): The height of the graph, including any axes, titles,
-                etc
-
-            description (str): HTML-formatted text that will be kept bellow the
-                graph. It generally includes metadata, details about the,
-                graphs, etc. It will be kept when the graph is displayed,
-                exported or rendered in a grid with other graphs. If The graph
-                is summed with other graph, their metadata will be concatenated
-                (adding a new line between both)
-
-            title (str): Title of the graph. The attributes of the title
-                (font, etc), cannot be tuned directly in depict
-
-            x_label (None, str): Label of the x-axis
-
-            y_label (None, str): Label of the y-axis
-
-            show_plot (bool): Whether or not the graph must be displayed
-                immediatly after its creation
-
-            color (None, str, array-like): If None, the first color of the
-                palette is used.
-                If string, a color name is expected (hexadecimal, RGB, and
-                usual colors are accepted (like 'red', etc)), and it will be
-                the same for all the points.
-                If array-like, the length of color should correspond to the
-                number of points drawn, they will correspond to each point
-                respectively
-
-            colorbar_type ({`auto`, `categorical`, `continuous`}): If 'auto',
-                the best type will be chosen wrt the data.
-                If `categorical`: a legend will be used, not a colorbar.
-                If `continuous`, a colorbar will be displayed on the right
-                side of the plot. The data defining the color must be passed
-                in `color`
-
-            legend ('auto', array-like): If `auto`, the legend will be set when
-                a Pandas DataFrame or a dictionary is provided (the name of the
-                columns / keys will be the legend). If array-like, the length
-                of `legend` must match with the number of points drawn
-
-            size (Number, array-like): Size of the points. If Number
-                it will the same for all the points. If it is an array-like,
-                its length must match with the number of points drawn. They
-                will correspond to each point respectively. A size of 6 is a
-                reasonable default value
-
-            alpha (Number, array-like): Alpha value of the points. If Number
-                it will the same for all the points. If it is an array-like,
-                its length must match with the number of points drawn. They
-                will correspond to each line respectively. alpha=1 means no
-                transparency, alpha=0 means completely transparent.
-
-            x_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly.
-
-            y_axis_type ({'auto', 'numerical', 'datetime'}): Type of the axis.
-                If 'auto', the type will be set automatically based on the data
-                provided. If 'numerical', 'datetime', the type is set
-                accordingly.
-
-            x_range (array-like): Range of the x-axis
-
-            y_range (array-like): Range of the y-axis
-
-            save_path (None, str): If None, the graph is not saved. If str,
-                the graph is saved in html at the given path. If the html
-                extension is missing, it will be added automatically
-
-            grid_visible (bool): Whether the background grid must be displayed.
-                In depict, you cannot have further control about the background
-                grid
-
-        Returns:
-            depict.plot
-        """
+                      grid_visible=session.grid_visible,
+                      color_mapping=session.color_mapping,
+                      pyramid=session.pyramid, aggregation=None,
+                      reduction='count', hex_size=8):
         plot = point(x=x, y=y, source_dataframe=source_dataframe, width=width,
                      height=height, description=description, title=title,
                      x_label=x_label, y_label=y_label, show_plot=show_plot,
                      color=color, colorbar_type=colorbar_type, legend=legend,
                      size=size, alpha=alpha, x_axis_type=x_axis_type,
                      y_axis_type=y_axis_type, x_range=x_range, y_range=y_range,
-                     grid_visible=grid_visible, session=session,
-                     save_path=save_path)
+                     grid_visible=grid_visible, color_mapping=color_mapping,
+                     pyramid=pyramid, aggregation=aggregation,
+                     reduction=reduction, hex_size=hex_size,
+                     session=session, save_path=save_path)
         return plot
+    point_updated.__doc__ = api.point.__doc__
     return point_updated
@@ -0,0 +1,220 @@
+""" Multi-resolution pyramid of the data of a glyph
+
+The data of a glyph is stored at several levels of detail: the full data,
+and decimated levels of `PYRAMID_FACTOR`, `PYRAMID_FACTOR ** 2`... times
+fewer points, down to a coarsest level of `nb_points` points. The decimated
+levels hold at most a third of the points of the data (plus `nb_points`),
+so a pyramid embeds at most 4/3 of its points plus `nb_points`. Each level
+is split in chunks of at most `max_points` points, each chunk being its own
+ColumnDataSource. The glyph displays the coarsest level, and a
+`CustomJS` callback on the x-range replaces its data by the finest level
+having at most `nb_points` points in the visible range. Everything is
+embedded in the document, so it works in a saved HTML file, without server.
+"""
+from .downsampling import downsampling_indexes
+
+from bokeh.models import ColumnDataSource, CustomJS
+import numpy as np
+
+PYRAMID_FACTOR = 4
+
+_SWITCH_LEVEL_CODE = """
+const start = x_range.start
+const end = x_range.end
+
+function bisect(values, v) {
+    let low = 0
+    let high = values.length
+    while (low < high) {
+        const mid = (low + high) >> 1
+        if (values[mid] < v) {
+            low = mid + 1
+        } else {
+            high = mid
+        }
+    }
+    return low
+}
+
+// Parts of the chunks of a level in the visible range (with one point
+// more on each side, so that the lines reach the borders)
+function visible(level) {
+    const parts = []
+    let count = 0
+    for (const chunk of level) {
+        const xs = chunk.data[x_name]
+        const n = xs.length
+        if ((n == 0) || (xs[n - 1] < start) || (xs[0] > end)) {
+            continue
+        }
+        const low = Math.max(bisect(xs, start) - 1, 0)
+        const high = Math.min(bisect(xs, end) + 1, n)
+        parts.push([chunk, low, high])
+        count += high - low
+    }
+    return [parts, count]
+}
+
+let chosen = visible(levels[0])
+for (let i = 1; i < levels.length; i++) {
+    const candidate = visible(levels[i])
+    if (candidate[1] > nb_points) {
+        break
+    }
+    chosen = candidate
+}
+
+const data = {}
+for (const name of Object.keys(source.data)) {
+    data[name] = [].concat(...chosen[0].map(
+        ([chunk, low, high]) => Array.from(chunk.data[name].slice(low, high))))
+}
+source.data = data
+"""
+
+
+def is_sorted(values):
+    values = np.asarray(values)
+    if values.dtype.kind in 'mM':
+        values = values.astype('int64')
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+class Pyramid:
+    """ Multi-resolution pyramid of columns of data sharing a sorted x
+
+    The levels are only computed when the pyramid is first added to a figure
+    (i.e. when the plot is shown or saved), and then reused.
+
+    Args:
+        data (dict): Columns of the glyph, all of the same length. The column
+            `x_name` must be sorted
+        x_name (str): Name of the x column
+        nb_points (int): Number of points of the coarsest level, and maximum
+            number of points displayed at once
+        max_points (int): Maximum number of points of each data source
+            embedded (the levels are split in chunks of `max_points`
+            points). It does not bound the whole pyramid, which embeds up to
+            4/3 of the points of the data plus `nb_points`
+        method ({'lttb', 'min_max', 'sample'}): How the levels are decimated.
+            'lttb' and 'min_max' are the downsampling methods of lines,
+            'sample' keeps nested random samples of the points (for scatter
+            plots)
+        y_names (tuple of str): With 'lttb' and 'min_max', the columns whose
+            shape is kept by the decimation (the points kept for each of
+            them are merged)
+    """
+    def __init__(self, data, x_name, nb_points, max_points, method,
+                 y_names=('y',)):
+        self.data = {name: np.asarray(values) for name, values in
+                     data.items()}
+        self.x_name = x_name
+        self.nb_points = int(min(nb_points, max_points))
+        self.max_points = int(max_points)
+        self.method = method
+        self.y_names = tuple(y_names)
+        self._levels = None
+        # The last figure the pyramid was added to, and its source displayed
+        self._figure_source = None
+
+    @property
+    def nb_values(self):
+        return len(self.data[self.x_name])
+
+    def level_sizes(self):
+        """ Number of points of each decimated level, from the coarsest one
+
+        The levels have `PYRAMID_FACTOR`, `PYRAMID_FACTOR ** 2`... times fewer
+        points than the data, down to `nb_points` points: together they have
+        at most a third of the points of the data, plus `nb_points`
+
+        Returns:
+            list of int
+        """
+        nb_values = self.nb_values
+        if nb_values <= self.nb_points:
+            return []
+        sizes = []
+        size = nb_values // PYRAMID_FACTOR
+        while size > self.nb_points:
+            sizes.append(size)
+            size //= PYRAMID_FACTOR
+        sizes.append(self.nb_points)
+        return sizes[::-1]
+
+    def level_indexes(self):
+        """ Indexes of the points of each level, from the coarsest one to the
+        full data
+
+        Returns:
+            list of np.ndarray
+        """
+        nb_values = self.nb_values
+        if self.method == 'sample':
+            order = np.random.RandomState(0).permutation(nb_values)
+        levels = []
+        for nb_level_points in self.level_sizes():
+            if self.method == 'sample':
+                # Nested samples, the first and last points always included
+                indexes = np.union1d(order[:nb_level_points - 2],
+                                     [0, nb_values - 1])
+            else:
+                # The points kept for each column share the level
+                nb_column_points = max(nb_level_points // len(self.y_names),
+                                       4)
+                indexes = downsampling_indexes(
+                    self.data[self.x_name], self.data[self.y_names[0]],
+                    self.method, nb_column_points)
+                for name in self.y_names[1:]:
+                    indexes = np.union1d(indexes, downsampling_indexes(
+                        self.data[self.x_name], self.data[name], self.method,
+                        nb_column_points))
+            levels.append(indexes)
+        levels.append(np.arange(nb_values))
+        return levels
+
+    @property
+    def levels(self):
+        """ For each level, the list of its chunks (dict of columns) """
+        if self._levels is None:
+            self._levels = []
+            for indexes in self.level_indexes():
+                self._levels.append([
+                    {name: values[indexes[start:start + self.max_points]]
+                     for name, values in self.data.items()}
+                    for start in range(0, len(indexes), self.max_points)])
+        return self._levels
+
+    def add_glyph(self, f, glyph_function):
+        """ Add the glyph and the callback switching the levels to a figure
+
+        The glyphs added to the same figure share the data sources and the
+        callback, so that a pyramid drawn by several glyphs (e.g. two lines
+        and the area between them) is embedded once.
+
+        Args:
+            f (bokeh figure): The figure
+            glyph_function (callable): Called with the ColumnDataSource
+                displayed, it adds the glyph to `f`
+
+        Returns:
+            The result of `glyph_function`
+        """
+        if (self._figure_source is not None) and (
+                self._figure_source[0] is f):
+            return glyph_function(self._figure_source[1])
+        levels = [[ColumnDataSource(data=chunk) for chunk in level]
+                  for level in self.levels]
+        coarsest = self.levels[0]
+        source = ColumnDataSource(data={
+            name: np.concatenate([chunk[name] for chunk in coarsest])
+            for name in self.data})
+        glyph = glyph_function(source)
+        callback = CustomJS(args={'source': source, 'levels': levels,
+                                  'x_range': f.x_range, 'x_name': self.x_name,
+                                  'nb_points': self.nb_points},
+                            code=_SWITCH_LEVEL_CODE)
+        f.x_range.js_on_change('start', callback)
+        f.x_range.js_on_change('end', callback)
+        self._figure_source = (f, source)
+        return glyph
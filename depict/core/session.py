@@ -5,7 +5,10 @@ class Session:
     def __init__(self, width, height, save_path, file_exists_mode,
                  description, title, jupyter_notebook,
                  background_color, palette_name, grid_visible, show_plot,
-                 width_total_as_session, automatic_color_mapping):
+                 width_total_as_session, automatic_color_mapping,
+                 color_mapping, timing_callback, downsampling,
+                 points_per_pixel, pyramid, pyramid_max_points,
+                 output_backend, webgl_threshold):
         self.width = width
         self.height = height
         self.save_path = save_path
@@ -22,3 +25,16 @@ class Session:
         self.show_plot = show_plot
         self.width_total_as_session = width_total_as_session
         self.automatic_color_mapping = automatic_color_mapping
+        self.color_mapping = color_mapping
+        # Called with the duration of each stage of the plotting functions
+        # (see `depict.core.timing`), if not None
+        self.timing_callback = timing_callback
+        self.downsampling = downsampling
+        self.points_per_pixel = points_per_pixel
+        self.pyramid = pyramid
+        self.pyramid_max_points = pyramid_max_points
+        if output_backend not in ['canvas', 'webgl', 'auto']:
+            raise ValueError("`output_backend` must be 'canvas', 'webgl' or "
+                             "'auto'")
+        self.output_backend = output_backend
+        self.webgl_threshold = webgl_threshold
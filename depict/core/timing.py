@@ -0,0 +1,65 @@
+import time
+
+
+class StageTimer:
+    """ Measure the duration of the successive stages of a function
+
+    Each call to `lap` closes the current stage: the time elapsed since the
+    previous lap is added to the duration of the stage. `done` sends the
+    durations to the callback of the session, if any.
+
+    Args:
+        function (str): Name of the timed function (e.g. 'line', 'save')
+        callback (None or callable): Called with the timing record. If None,
+            nothing is reported
+    """
+    def __init__(self, function, callback):
+        self.function = function
+        self.callback = callback
+        self.durations = {}
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.durations[stage] = self.durations.get(stage, 0.) + (
+            now - self._last)
+        self._last = now
+
+    def done(self):
+        if self.callback is not None:
+            self.callback({'function': self.function,
+                           'durations': dict(self.durations),
+                           'total': time.perf_counter() - self._start})
+
+
+class TimingCollector:
+    """ Timing callback keeping all the records it receives
+
+    Example:
+        timings = depict.TimingCollector()
+        depict.session(timing_callback=timings)
+        ...
+        timings.total_by_stage()
+    """
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def total_by_stage(self, function=None):
+        """ Sum of the durations of each stage (for `function` only if given)
+
+        Returns:
+            dict: {stage: seconds}
+        """
+        totals = {}
+        for record in self.records:
+            if (function is None) or (record['function'] == function):
+                for stage, duration in record['durations'].items():
+                    totals[stage] = totals.get(stage, 0.) + duration
+        return totals
+
+    def clear(self):
+        self.records = []
@@ -1,5 +1,12 @@
+from . import api
 from .plot import Plot
+from .timing import StageTimer
 
+from collections import OrderedDict
+import json
+import re
+
+from bokeh.colors import named
 from bokeh.embed import file_html
 from bokeh.layouts import column, row
 from bokeh.models.widgets import Div
@@ -8,10 +15,98 @@ from bokeh.resources import CDN
 import numpy as np
 
 
-def _make_plot(plot, width_total_as_session, share_x, share_y):
+# Layouts built by `depict.show` and `depict.save`, reused when the same plots
+# are shown or saved again with the same options. The plots shown or saved by
+# the plotting functions themselves (`show_plot`, `save_path`) are not cached,
+# since they are rarely rendered twice. The least recently used layouts are
+# dropped beyond `LAYOUT_CACHE_SIZE`
+LAYOUT_CACHE_SIZE = 8
+_LAYOUT_CACHE = OrderedDict()
+
+
+def _plots_of(plot):
+    # The plots of a plot or of a grid of plots
+    if isinstance(plot, Plot):
+        return [plot]
+    return [p for p_1 in plot for p in _plots_of(p_1)]
+
+
+def _plot_key(plot):
+    # Everything a plot uses to build its figure, the options of the session
+    # read by `make_figure` included. The plot itself is kept in the cache, so
+    # its id and the id of its `make_figure` cannot be reused while the key
+    # exists
+    session = plot.session
+    return (id(plot), id(plot.make_figure), tuple(plot.steps),
+            plot.description, plot.grid_visible, plot.width,
+            plot.width_session, plot.output_backend,
+            getattr(session, 'output_backend', None),
+            getattr(session, 'webgl_threshold', None),
+            getattr(session, 'background_color', None))
+
+
+def _layout_key(plot, width_total_as_session, share_x, share_y):
+    if isinstance(plot, Plot):
+        structure = _plot_key(plot)
+    else:
+        structure = tuple([_plot_key(p_1) if isinstance(p_1, Plot) else
+                           tuple([_plot_key(pp) for pp in p_1])
+                           for p_1 in plot])
+    return (structure, bool(width_total_as_session), bool(share_x),
+            bool(share_y))
+
+
+def clear_layout_cache(plot=None):
+    ''' Forget the layouts built by `show` and `save`
+
+    A layout is rebuilt when its plots change (steps, description, width...)
+    but not when the data drawn by the steps is modified in place: the cache
+    must then be cleared.
+
+    Args:
+        plot (None, Plot): If None, all the layouts are forgotten. Otherwise,
+            the layouts containing this plot
+    '''
+    if plot is None:
+        _LAYOUT_CACHE.clear()
+        return
+    for key, (plots, _) in list(_LAYOUT_CACHE.items()):
+        if any([p is plot for p in plots]):
+            del _LAYOUT_CACHE[key]
+
+
+def _make_plot(plot, width_total_as_session, share_x, share_y, timer=None,
+               use_cache=False):
+    # The layout of a plot or a grid of plots. If `use_cache`, it is taken
+    # from the cache if it was already built, and cached otherwise
+    if not use_cache:
+        return _build_layout(plot, width_total_as_session, share_x, share_y,
+                             timer)
+    key = _layout_key(plot, width_total_as_session, share_x, share_y)
+    if key in _LAYOUT_CACHE:
+        _LAYOUT_CACHE.move_to_end(key)
+        if timer is not None:
+            timer.lap('layout_cache')
+        return _LAYOUT_CACHE[key][1]
+    plot_made = _build_layout(plot, width_total_as_session, share_x, share_y,
+                              timer)
+    _LAYOUT_CACHE[key] = (_plots_of(plot), plot_made)
+    while len(_LAYOUT_CACHE) > LAYOUT_CACHE_SIZE:
+        _LAYOUT_CACHE.popitem(last=False)
+    return plot_made
+
+
+def _build_layout(plot, width_total_as_session, share_x, share_y,
+                  timer=None):
     # TODO: Check the shape first, the types etc
+    def lap(stage):
+        if timer is not None:
+            timer.lap(stage)
+
     def build_plot(plot, width=None, x_range=None, y_range=None):
-        fig = plot.make_figure()
+        lap('layout')
+        fig = plot.new_figure()
+        lap('make_fig')
         if share_x:
             if x_range is None:
                 x_range = fig.x_range
@@ -29,6 +124,7 @@ def _make_plot(plot, width_total_as_session, share_x, share_y):
             fig.ygrid.visible = False
         for step in plot.steps:
             step(fig)
+        lap('steps_replay')
         if width:
             div = Div(text=plot.description, width=width, height=None)
         else:
@@ -37,9 +133,11 @@ def _make_plot(plot, width_total_as_session, share_x, share_y):
 
     if isinstance(plot, Plot):
         if width_total_as_session:
-            return build_plot(plot=plot, width=plot.width_session)[0]
+            plot_made = build_plot(plot=plot, width=plot.width_session)[0]
         else:
-            return build_plot(plot)[0]
+            plot_made = build_plot(plot)[0]
+        lap('layout')
+        return plot_made
     elif isinstance(plot, (list, np.ndarray)):
         x_range = None
         y_range = None
@@ -90,14 +188,33 @@ def _make_plot(plot, width_total_as_session, share_x, share_y):
                                                      y_range=y_range)
                     row_i.append(f_r)
                 row_all.append(row(row_i))
-        return column(row_all)
+        plot_made = column(row_all)
+        lap('layout')
+        return plot_made
+
+
+def _timing_callback(plot):
+    # The timing callback of the session of the first plot of a grid
+    if isinstance(plot, Plot):
+        return getattr(plot.session, 'timing_callback', None)
+    elif isinstance(plot, (list, np.ndarray)):
+        for p_1 in plot:
+            callback = _timing_callback(p_1)
+            if callback is not None:
+                return callback
+    return None
 
 
 def show_base(plot, width_total_as_session=False, share_x=False,
-              share_y=False):
-    show_bokeh(_make_plot(plot=plot,
-                          width_total_as_session=width_total_as_session,
-                          share_x=share_x, share_y=share_y))
+              share_y=False, use_cache=False):
+    timer = StageTimer('show', _timing_callback(plot))
+    plot_made = _make_plot(plot=plot,
+                           width_total_as_session=width_total_as_session,
+                           share_x=share_x, share_y=share_y, timer=timer,
+                           use_cache=use_cache)
+    show_bokeh(plot_made)
+    timer.lap('show')
+    timer.done()
 
 
 def _update_show_default_args(show_base, session):
@@ -105,7 +222,8 @@ def _update_show_default_args(show_base, session):
                      width_total_as_session=session.width_total_as_session,
                      share_x=False, share_y=False):
         show_base(plot=plot, width_total_as_session=width_total_as_session,
-                  share_x=share_x, share_y=share_y)
+                  share_x=share_x, share_y=share_y, use_cache=True)
+    show_updated.__doc__ = api.show.__doc__
     return show_updated
 
 
@@ -117,19 +235,23 @@ def _update_save_default_args(save_base, session):
         save_base(plot=plot, save_path=save_path,
                   file_exists_mode=file_exists_mode,
                   width_total_as_session=width_total_as_session,
-                  share_x=share_x, share_y=share_y)
+                  share_x=share_x, share_y=share_y, use_cache=True)
+    save_updated.__doc__ = api.save.__doc__
     return save_updated
 
 
 def save_base(plot, save_path, file_exists_mode, width_total_as_session,
-              share_x, share_y):
+              share_x, share_y, use_cache=False):
     if not save_path:
         # TODO: Add warning
         return None
 
+    timer = StageTimer('save', _timing_callback(plot))
     plot_made = _make_plot(plot, width_total_as_session=width_total_as_session,
-                           share_x=share_x, share_y=share_y)
+                           share_x=share_x, share_y=share_y, timer=timer,
+                           use_cache=use_cache)
     html = file_html(plot_made, CDN)
+    timer.lap('file_html')
 
     if not save_path.endswith('.html'):
         save_path += '.html'
@@ -139,6 +261,8 @@ def save_base(plot, save_path, file_exists_mode, width_total_as_session,
     elif file_exists_mode.lower() == 'overwrite':
         with open(file=save_path, mode='w',) as f:
             f.write(html)
+    timer.lap('write')
+    timer.done()
 
 
 def is_color(c):
@@ -169,6 +293,239 @@ def format_color(col):
         return col
 
 
+_HEX_DIGITS = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+def format_colors(colors):
+    ''' Vectorized version of `format_color`
+
+    Args:
+        colors (array-like of shape (N, 3) or iterable of colors): RGB colors
+            (each color with values either all between 0 and 1, or between 0
+            and 255), or colors already formatted (names, hexadecimal
+            strings). Iterables mixing both are accepted too
+
+    Returns
+        colors (list): Colors formatted as `format_color` does
+    '''
+    if isinstance(colors, np.ndarray) and colors.dtype.kind in 'biuf':
+        rgb = colors
+    else:
+        colors = list(colors)
+        if all([isinstance(c, str) for c in colors]):
+            return colors
+        try:
+            rgb = np.asarray(colors)
+        except ValueError:  # Inhomogeneous colors
+            rgb = None
+        if (rgb is None) or (rgb.dtype.kind not in 'biuf'):
+            return [format_color(c) for c in colors]
+    if (rgb.ndim != 2) or (rgb.shape[1] != 3):
+        return [format_color(c) for c in colors]
+
+    rgb = rgb.astype(float)
+    in_unit = (rgb.min(axis=1) >= 0) & (rgb.max(axis=1) <= 1)
+    rgb[in_unit] *= 255
+    rgb = np.trunc(rgb)
+    valid = np.all((rgb >= 0) & (rgb <= 255), axis=1)
+    rgb_valid = np.where(valid[:, None], rgb, 0).astype(np.uint8)
+
+    # Each color is written as 7 ASCII characters: '#RRGGBB'
+    chars = np.full((len(rgb), 7), ord('#'), dtype=np.uint8)
+    chars[:, 1::2] = _HEX_DIGITS[rgb_valid >> 4]
+    chars[:, 2::2] = _HEX_DIGITS[rgb_valid & 15]
+    formatted = chars.view('S7').ravel().astype(str).tolist()
+    for i in np.flatnonzero(~valid):
+        # Values out of [0, 255] are kept as `format_color` writes them
+        formatted[i] = from_rgb_to_hex([int(c) for c in rgb[i]])
+    return formatted
+
+
+def _color_to_rgba(color):
+    # Color (hexadecimal string or name) packed as 0xRRGGBBAA, None if it is
+    # not understood
+    color = color.strip().lower()
+    if color.startswith('#') and (len(color) in (4, 7, 9)):
+        digits = color[1:]
+        if len(digits) == 3:
+            digits = ''.join([d * 2 for d in digits])
+        if len(digits) == 6:
+            digits += 'ff'
+        try:
+            return int(digits, 16)
+        except ValueError:
+            return None
+    rgb = getattr(named, color, None)
+    if rgb is None:
+        return None
+    return (rgb.r << 24) | (rgb.g << 16) | (rgb.b << 8) | int(255 * rgb.a)
+
+
+def colors_to_rgba(colors):
+    ''' Colors packed as RGBA in uint32 (0xRRGGBBAA)
+
+    This is the binary format of the colors of Bokeh 3: a column of such
+    colors is embedded as a binary array, instead of a list of strings. Each
+    distinct color is converted once.
+
+    Args:
+        colors (iterable of str): Colors formatted by `format_colors`
+            (hexadecimal strings or names)
+
+    Returns
+        colors (np.ndarray of uint32 or list): The packed colors, or the
+            colors unchanged if one of them cannot be packed
+    '''
+    colors_array = np.asarray(colors)
+    if colors_array.dtype.kind not in 'UO':
+        return colors
+    color_unique, codes = np.unique(colors_array.astype(str),
+                                    return_inverse=True)
+    packed = np.empty(len(color_unique), dtype=np.uint32)
+    for i, color in enumerate(color_unique):
+        rgba = _color_to_rgba(color)
+        if rgba is None:
+            return colors
+        packed[i] = rgba
+    return packed[codes.ravel()]
+
+
+def as_column(values):
+    ''' Values as a contiguous typed array, embedded as a binary array
+
+    Args:
+        values (array-like): Numbers or dates
+
+    Returns
+        values (np.ndarray): The values. Objects which are not numbers nor
+            dates stay an array of objects
+    '''
+    values = np.asarray(values)
+    if values.dtype.kind == 'O':
+        try:
+            values = np.asarray(values.tolist(), dtype=float)
+        except (TypeError, ValueError):
+            pass
+    return np.ascontiguousarray(values)
+
+
+def split_scalars(properties):
+    ''' Split the properties of a glyph into columns and shared values
+
+    Args:
+        properties (dict): Name and value of the properties. A value is
+            either an array (one value per element) or a scalar
+
+    Returns
+        (columns, values): The arrays, to put in the ColumnDataSource, and the
+            arguments of the glyph, where the arrays are replaced by the name
+            of their column
+    '''
+    columns = {name: value for name, value in properties.items()
+               if np.ndim(value) > 0}
+    values = {name: (name if name in columns else value)
+              for name, value in properties.items()}
+    return columns, values
+
+
+def _is_binary(value):
+    # Arrays are embedded as bytes, and the columns of arrays (the lines of
+    # `multi_line`) are binary if all their arrays are
+    if isinstance(value, dict):
+        return (value.get('type') == 'ndarray') and isinstance(
+            value.get('array'), dict) and (value['array'].get('type') ==
+                                           'bytes')
+    if isinstance(value, list):
+        return all([isinstance(v, dict) and _is_binary(v) for v in value])
+    return False
+
+
+def non_binary_columns(html_path):
+    ''' Columns of the ColumnDataSources of a saved HTML file which are not
+    embedded as binary arrays (but as JSON lists)
+
+    The document is read in the serialization format of Bokeh 3 (the data
+    of a ColumnDataSource is a map of `entries`, a binary array is an
+    'ndarray' of 'bytes').
+
+    Args:
+        html_path (str): Path of an HTML file saved by `depict.save`
+
+    Returns
+        columns (list of tuple): (id of the ColumnDataSource, name of the
+            column) of each non-binary column
+
+    Raises
+        ValueError: If no ColumnDataSource is found, i.e. the file is not a
+            document serialized by Bokeh 3
+    '''
+    with open(html_path) as f:
+        html = f.read()
+    columns = []
+    sources = []
+
+    def walk(obj):
+        if isinstance(obj, dict):
+            if (obj.get('name') == 'ColumnDataSource') and (
+                    'attributes' in obj):
+                sources.append(obj['id'])
+                data = obj['attributes'].get('data', {})
+                for name, value in data.get('entries', []):
+                    if not _is_binary(value):
+                        columns.append((obj['id'], name))
+            for v in obj.values():
+                walk(v)
+        elif isinstance(obj, list):
+            for v in obj:
+                walk(v)
+
+    for docs_json in re.findall(
+            r'<script type="application/json"[^>]*>(.*?)</script>', html,
+            flags=re.DOTALL):
+        walk(json.loads(docs_json))
+    if not sources:
+        raise ValueError('No ColumnDataSource found in {}: it is not a '
+                         'document serialized by Bokeh 3'.format(html_path))
+    return columns
+
+
+def group_by_legend(legend, arrays):
+    ''' Split arrays into the groups of elements sharing the same legend
+
+    The legends are encoded once (`np.unique`), and the elements are sorted
+    by code with a stable sort, so that each group is a contiguous slice. The
+    elements keep their order inside their group.
+
+    Args:
+        legend (str or array-like): The legend of each element, or one legend
+            for all the elements
+        arrays (list of array-like or scalars): Arrays with one value per
+            element. The scalars are shared by all the groups
+
+    Returns
+        (legend_unique, groups): The sorted unique legends, and for each
+            array, the list of its groups (in the order of `legend_unique`)
+    '''
+    if np.ndim(legend) == 0:
+        legend_unique = np.array([legend])
+    else:
+        legend_unique, codes = np.unique(np.asarray(legend),
+                                         return_inverse=True)
+        codes = codes.ravel()
+    if len(legend_unique) > 1:
+        order = np.argsort(codes, kind='stable')
+        splits = np.cumsum(np.bincount(codes))[:-1]
+    groups = []
+    for a in arrays:
+        if np.ndim(a) == 0:
+            groups.append([a for _ in legend_unique])
+        elif len(legend_unique) == 1:
+            groups.append([np.array(a)])
+        else:
+            groups.append(np.split(np.asarray(a)[order], splits))
+    return legend_unique, groups
+
+
 def is_iterable(obj):
     ''' Check if an object is iterable
     Cf https://stackoverflow.com/questions/1952464/in-python-how-do-i- \
@@ -1,5 +1,11 @@
-from ..core.tools import format_color
-import seaborn as sns
+from . import colormaps
+from ..core.tools import format_colors
+
+import base64
+from functools import lru_cache
+import zlib
+
+import numpy as np
 
 # TODO: Add formulas to compute palettes
 # TODO: Add a grey scale palette
@@ -24,32928 +30,288 @@ _colors_categories_10 = {
       (129, 114, 179), (147, 120, 96), (218, 139, 195), (140, 140, 140),
       (204, 185, 116), (100, 181, 205)]}
 
-_color_categories_256 = {
- 1: [(204, 101, 101)],
- 2: [(204, 101, 101), (101, 204, 204)],
- 3: [(204, 101, 101), (102, 204, 101), (101, 102, 204)],
- 4: [(204, 101, 101), (153, 204, 101), (101, 204, 204), (152, 101, 204)],
- 5: [(204, 101, 101),
-     (183, 204, 101),
-     (101, 204, 142),
-     (101, 142, 204),
-     (183, 101, 204)],
- 6: [(204, 101, 101),
-     (204, 204, 101),
-     (102, 204, 101),
-     (101, 204, 204),
-     (101, 102, 204),
-     (203, 101, 204)],
- 7: [(204, 101, 101),
-     (204, 189, 101),
-     (131, 204, 101),
-     (101, 204, 160),
-     (101, 160, 204),
-     (131, 101, 204),
-     (204, 101, 189)],
- 8: [(204, 101, 101),
-     (204, 178, 101),
-     (153, 204, 101),
-     (101, 204, 127),
-     (101, 204, 204),
-     (101, 127, 204),
-     (152, 101, 204),
-     (204, 101, 178)],
- 9: [(204, 101, 101),
-     (204, 170, 101),
-     (169, 204, 101),
-     (102, 204, 101),
-     (101, 204, 170),
-     (101, 169, 204),
-     (101, 102, 204),
-     (169, 101, 204),
-     (204, 101, 169)],
- 10: [(204, 101, 101),
-      (204, 163, 101),
-      (183, 204, 101),
-      (122, 204, 101),
-      (101, 204, 142),
-      (101, 204, 204),
-      (101, 142, 204),
-      (122, 101, 204),
-      (183, 101, 204),
-      (204, 101, 163)],
- 11: [(204, 101, 101),
-      (204, 157, 101),
-      (194, 204, 101),
-      (139, 204, 101),
-      (101, 204, 120),
-      (101, 204, 176),
-      (101, 176, 204),
-      (101, 120, 204),
-      (139, 101, 204),
-      (194, 101, 204),
-      (204, 101, 157)],
- 12: [(204, 101, 101),
-      (204, 152, 101),
-      (204, 204, 101),
-      (153, 204, 101),
-      (102, 204, 101),
-      (101, 204, 152),
-      (101, 204, 204),
-      (101, 153, 204),
-      (101, 102, 204),
-      (152, 101, 204),
-      (203, 101, 204),
-      (204, 101, 153)],
- 13: [(204, 101, 101),
-      (204, 149, 101),
-      (204, 196, 101),
-      (164, 204, 101),
-      (117, 204, 101),
-      (101, 204, 133),
-      (101, 204, 180),
-      (101, 180, 204),
-      (101, 133, 204),
-      (117, 101, 204),
-      (164, 101, 204),
-      (204, 101, 196),
-      (204, 101, 149)],
- 14: [(204, 101, 101),
-      (204, 145, 101),
-      (204, 189, 101),
-      (174, 204, 101),
-      (131, 204, 101),
-      (101, 204, 116),
-      (101, 204, 160),
-      (101, 204, 204),
-      (101, 160, 204),
-      (101, 116, 204),
-      (131, 101, 204),
-      (174, 101, 204),
-      (204, 101, 189),
-      (204, 101, 145)],
- 15: [(204, 101, 101),
-      (204, 142, 101),
-      (204, 183, 101),
-      (183, 204, 101),
-      (142, 204, 101),
-      (102, 204, 101),
-      (101, 204, 142),
-      (101, 204, 183),
-      (101, 183, 204),
-      (101, 142, 204),
-      (101, 102, 204),
-      (142, 101, 204),
-      (183, 101, 204),
-      (204, 101, 183),
-      (204, 101, 142)],
- 16: [(204, 101, 101),
-      (204, 140, 101),
-      (204, 178, 101),
-      (191, 204, 101),
-      (153, 204, 101),
-      (114, 204, 101),
-      (101, 204, 127),
-      (101, 204, 165),
-      (101, 204, 204),
-      (101, 165, 204),
-      (101, 127, 204),
-      (114, 101, 204),
-      (152, 101, 204),
-      (191, 101, 204),
-      (204, 101, 178),
-      (204, 101, 140)],
- 17: [(204, 101, 101),
-      (204, 138, 101),
-      (204, 174, 101),
-      (198, 204, 101),
-      (162, 204, 101),
-      (125, 204, 101),
-      (101, 204, 114),
-      (101, 204, 149),
-      (101, 204, 186),
-      (101, 186, 204),
-      (101, 149, 204),
-      (101, 114, 204),
-      (125, 101, 204),
-      (161, 101, 204),
-      (197, 101, 204),
-      (204, 101, 173),
-      (204, 101, 137)],
- 18: [(204, 101, 101),
-      (204, 136, 101),
-      (204, 170, 101),
-      (204, 204, 101),
-      (169, 204, 101),
-      (136, 204, 101),
-      (102, 204, 101),
-      (101, 204, 135),
-      (101, 204, 170),
-      (101, 204, 204),
-      (101, 169, 204),
-      (101, 135, 204),
-      (101, 102, 204),
-      (136, 101, 204),
-      (169, 101, 204),
-      (203, 101, 204),
-      (204, 101, 169),
-      (204, 101, 135)],
- 19: [(204, 101, 101),
-      (204, 134, 101),
-      (204, 166, 101),
-      (204, 198, 101),
-      (177, 204, 101),
-      (144, 204, 101),
-      (112, 204, 101),
-      (101, 204, 123),
-      (101, 204, 155),
-      (101, 204, 187),
-      (101, 187, 204),
-      (101, 155, 204),
-      (101, 123, 204),
-      (112, 101, 204),
-      (144, 101, 204),
-      (177, 101, 204),
-      (204, 101, 198),
-      (204, 101, 166),
-      (204, 101, 134)],
- 20: [(204, 101, 101),
-      (204, 132, 101),
-      (204, 163, 101),
-      (204, 193, 101),
-      (183, 204, 101),
-      (153, 204, 101),
-      (122, 204, 101),
-      (101, 204, 112),
-      (101, 204, 142),
-      (101, 204, 173),
-      (101, 204, 204),
-      (101, 173, 204),
-      (101, 142, 204),
-      (101, 112, 204),
-      (122, 101, 204),
-      (152, 101, 204),
-      (183, 101, 204),
-      (204, 101, 193),
-      (204, 101, 163),
-      (204, 101, 132)],
- 21: [(204, 101, 101),
-      (204, 131, 101),
-      (204, 160, 101),
-      (204, 189, 101),
-      (189, 204, 101),
-      (160, 204, 101),
-      (131, 204, 101),
-      (102, 204, 101),
-      (101, 204, 131),
-      (101, 204, 160),
-      (101, 204, 189),
-      (101, 189, 204),
-      (101, 160, 204),
-      (101, 131, 204),
-      (101, 102, 204),
-      (131, 101, 204),
-      (160, 101, 204),
-      (189, 101, 204),
-      (204, 101, 189),
-      (204, 101, 160),
-      (204, 101, 131)],
- 22: [(204, 101, 101),
-      (204, 129, 101),
-      (204, 157, 101),
-      (204, 185, 101),
-      (194, 204, 101),
-      (166, 204, 101),
-      (139, 204, 101),
-      (111, 204, 101),
-      (101, 204, 120),
-      (101, 204, 148),
-      (101, 204, 176),
-      (101, 204, 204),
-      (101, 176, 204),
-      (101, 148, 204),
-      (101, 120, 204),
-      (111, 101, 204),
-      (139, 101, 204),
-      (166, 101, 204),
-      (194, 101, 204),
-      (204, 101, 185),
-      (204, 101, 157),
-      (204, 101, 129)],
- 23: [(204, 101, 101),
-      (204, 128, 101),
-      (204, 155, 101),
-      (204, 181, 101),
-      (199, 204, 101),
-      (172, 204, 101),
-      (146, 204, 101),
-      (119, 204, 101),
-      (101, 204, 110),
-      (101, 204, 137),
-      (101, 204, 164),
-      (101, 204, 190),
-      (101, 190, 204),
-      (101, 164, 204),
-      (101, 137, 204),
-      (101, 110, 204),
-      (119, 101, 204),
-      (146, 101, 204),
-      (172, 101, 204),
-      (199, 101, 204),
-      (204, 101, 181),
-      (204, 101, 155),
-      (204, 101, 128)],
- 24: [(204, 101, 101),
-      (204, 127, 101),
-      (204, 152, 101),
-      (204, 178, 101),
-      (204, 204, 101),
-      (178, 204, 101),
-      (153, 204, 101),
-      (127, 204, 101),
-      (102, 204, 101),
-      (101, 204, 127),
-      (101, 204, 152),
-      (101, 204, 178),
-      (101, 204, 204),
-      (101, 178, 204),
-      (101, 153, 204),
-      (101, 127, 204),
-      (101, 102, 204),
-      (127, 101, 204),
-      (152, 101, 204),
-      (178, 101, 204),
-      (203, 101, 204),
-      (204, 101, 178),
-      (204, 101, 153),
-      (204, 101, 127)],
- 25: [(204, 101, 101),
-      (204, 126, 101),
-      (204, 150, 101),
-      (204, 175, 101),
-      (204, 199, 101),
-      (183, 204, 101),
-      (159, 204, 101),
-      (134, 204, 101),
-      (110, 204, 101),
-      (101, 204, 118),
-      (101, 204, 142),
-      (101, 204, 167),
-      (101, 204, 191),
-      (101, 191, 204),
-      (101, 167, 204),
-      (101, 142, 204),
-      (101, 118, 204),
-      (110, 101, 204),
-      (134, 101, 204),
-      (159, 101, 204),
-      (183, 101, 204),
-      (204, 101, 199),
-      (204, 101, 175),
-      (204, 101, 150),
-      (204, 101, 126)],
- 26: [(204, 101, 101),
-      (204, 125, 101),
-      (204, 149, 101),
-      (204, 172, 101),
-      (204, 196, 101),
-      (188, 204, 101),
-      (164, 204, 101),
-      (141, 204, 101),
-      (117, 204, 101),
-      (101, 204, 109),
-      (101, 204, 133),
-      (101, 204, 156),
-      (101, 204, 180),
-      (101, 204, 204),
-      (101, 180, 204),
-      (101, 156, 204),
-      (101, 133, 204),
-      (101, 109, 204),
-      (117, 101, 204),
-      (141, 101, 204),
-      (164, 101, 204),
-      (188, 101, 204),
-      (204, 101, 196),
-      (204, 101, 172),
-      (204, 101, 149),
-      (204, 101, 125)],
- 27: [(204, 101, 101),
-      (204, 124, 101),
-      (204, 147, 101),
-      (204, 170, 101),
-      (204, 192, 101),
-      (192, 204, 101),
-      (169, 204, 101),
-      (147, 204, 101),
-      (124, 204, 101),
-      (102, 204, 101),
-      (101, 204, 124),
-      (101, 204, 147),
-      (101, 204, 170),
-      (101, 204, 192),
-      (101, 192, 204),
-      (101, 169, 204),
-      (101, 147, 204),
-      (101, 124, 204),
-      (101, 102, 204),
-      (124, 101, 204),
-      (147, 101, 204),
-      (169, 101, 204),
-      (192, 101, 204),
-      (204, 101, 192),
-      (204, 101, 169),
-      (204, 101, 147),
-      (204, 101, 124)],
- 28: [(204, 101, 101),
-      (204, 123, 101),
-      (204, 145, 101),
-      (204, 167, 101),
-      (204, 189, 101),
-      (196, 204, 101),
-      (174, 204, 101),
-      (153, 204, 101),
-      (131, 204, 101),
-      (109, 204, 101),
-      (101, 204, 116),
-      (101, 204, 138),
-      (101, 204, 160),
-      (101, 204, 182),
-      (101, 204, 204),
-      (101, 182, 204),
-      (101, 160, 204),
-      (101, 138, 204),
-      (101, 116, 204),
-      (109, 101, 204),
-      (131, 101, 204),
-      (152, 101, 204),
-      (174, 101, 204),
-      (196, 101, 204),
-      (204, 101, 189),
-      (204, 101, 167),
-      (204, 101, 145),
-      (204, 101, 123)],
- 29: [(204, 101, 101),
-      (204, 123, 101),
-      (204, 144, 101),
-      (204, 165, 101),
-      (204, 186, 101),
-      (200, 204, 101),
-      (179, 204, 101),
-      (158, 204, 101),
-      (137, 204, 101),
-      (116, 204, 101),
-      (101, 204, 109),
-      (101, 204, 130),
-      (101, 204, 151),
-      (101, 204, 172),
-      (101, 204, 193),
-      (101, 193, 204),
-      (101, 172, 204),
-      (101, 151, 204),
-      (101, 130, 204),
-      (101, 109, 204),
-      (116, 101, 204),
-      (137, 101, 204),
-      (158, 101, 204),
-      (179, 101, 204),
-      (200, 101, 204),
-      (204, 101, 186),
-      (204, 101, 165),
-      (204, 101, 144),
-      (204, 101, 123)],
- 30: [(204, 101, 101),
-      (204, 122, 101),
-      (204, 142, 101),
-      (204, 163, 101),
-      (204, 183, 101),
-      (204, 204, 101),
-      (183, 204, 101),
-      (163, 204, 101),
-      (142, 204, 101),
-      (122, 204, 101),
-      (102, 204, 101),
-      (101, 204, 122),
-      (101, 204, 142),
-      (101, 204, 163),
-      (101, 204, 183),
-      (101, 204, 204),
-      (101, 183, 204),
-      (101, 163, 204),
-      (101, 142, 204),
-      (101, 122, 204),
-      (101, 102, 204),
-      (122, 101, 204),
-      (142, 101, 204),
-      (163, 101, 204),
-      (183, 101, 204),
-      (204, 101, 203),
-      (204, 101, 183),
-      (204, 101, 163),
-      (204, 101, 142),
-      (204, 101, 122)],
- 31: [(204, 101, 101),
-      (204, 121, 101),
-      (204, 141, 101),
-      (204, 161, 101),
-      (204, 180, 101),
-      (204, 200, 101),
-      (187, 204, 101),
-      (167, 204, 101),
-      (148, 204, 101),
-      (128, 204, 101),
-      (108, 204, 101),
-      (101, 204, 115),
-      (101, 204, 134),
-      (101, 204, 154),
-      (101, 204, 174),
-      (101, 204, 194),
-      (101, 194, 204),
-      (101, 174, 204),
-      (101, 154, 204),
-      (101, 134, 204),
-      (101, 115, 204),
-      (108, 101, 204),
-      (128, 101, 204),
-      (148, 101, 204),
-      (167, 101, 204),
-      (187, 101, 204),
-      (204, 101, 200),
-      (204, 101, 180),
-      (204, 101, 161),
-      (204, 101, 141),
-      (204, 101, 121)],
- 32: [(204, 101, 101),
-      (204, 121, 101),
-      (204, 140, 101),
-      (204, 159, 101),
-      (204, 178, 101),
-      (204, 197, 101),
-      (191, 204, 101),
-      (172, 204, 101),
-      (153, 204, 101),
-      (133, 204, 101),
-      (114, 204, 101),
-      (101, 204, 108),
-      (101, 204, 127),
-      (101, 204, 146),
-      (101, 204, 165),
-      (101, 204, 184),
-      (101, 204, 204),
-      (101, 184, 204),
-      (101, 165, 204),
-      (101, 146, 204),
-      (101, 127, 204),
-      (101, 108, 204),
-      (114, 101, 204),
-      (133, 101, 204),
-      (152, 101, 204),
-      (172, 101, 204),
-      (191, 101, 204),
-      (204, 101, 197),
-      (204, 101, 178),
-      (204, 101, 159),
-      (204, 101, 140),
-      (204, 101, 121)],
- 33: [(204, 101, 101),
-      (204, 120, 101),
-      (204, 139, 101),
-      (204, 157, 101),
-      (204, 176, 101),
-      (204, 194, 101),
-      (194, 204, 101),
-      (176, 204, 101),
-      (157, 204, 101),
-      (139, 204, 101),
-      (120, 204, 101),
-      (101, 204, 102),
-      (101, 204, 120),
-      (101, 204, 139),
-      (101, 204, 157),
-      (101, 204, 176),
-      (101, 204, 194),
-      (101, 194, 204),
-      (101, 176, 204),
-      (101, 157, 204),
-      (101, 139, 204),
-      (101, 120, 204),
-      (101, 101, 204),
-      (120, 101, 204),
-      (139, 101, 204),
-      (157, 101, 204),
-      (176, 101, 204),
-      (194, 101, 204),
-      (204, 101, 194),
-      (204, 101, 176),
-      (204, 101, 157),
-      (204, 101, 139),
-      (204, 101, 120)],
- 34: [(204, 101, 101),
-      (204, 119, 101),
-      (204, 138, 101),
-      (204, 155, 101),
-      (204, 174, 101),
-      (204, 191, 101),
-      (198, 204, 101),
-      (180, 204, 101),
-      (162, 204, 101),
-      (144, 204, 101),
-      (125, 204, 101),
-      (108, 204, 101),
-      (101, 204, 114),
-      (101, 204, 131),
-      (101, 204, 149),
-      (101, 204, 168),
-      (101, 204, 186),
-      (101, 204, 204),
-      (101, 186, 204),
-      (101, 167, 204),
-      (101, 149, 204),
-      (101, 131, 204),
-      (101, 114, 204),
-      (107, 101, 204),
-      (125, 101, 204),
-      (143, 101, 204),
-      (161, 101, 204),
-      (179, 101, 204),
-      (197, 101, 204),
-      (204, 101, 191),
-      (204, 101, 173),
-      (204, 101, 156),
-      (204, 101, 137),
-      (204, 101, 119)],
- 35: [(204, 101, 101),
-      (204, 119, 101),
-      (204, 136, 101),
-      (204, 154, 101),
-      (204, 171, 101),
-      (204, 189, 101),
-      (201, 204, 101),
-      (183, 204, 101),
-      (166, 204, 101),
-      (148, 204, 101),
-      (131, 204, 101),
-      (113, 204, 101),
-      (101, 204, 107),
-      (101, 204, 125),
-      (101, 204, 142),
-      (101, 204, 160),
-      (101, 204, 177),
-      (101, 204, 195),
-      (101, 195, 204),
-      (101, 177, 204),
-      (101, 160, 204),
-      (101, 142, 204),
-      (101, 125, 204),
-      (101, 107, 204),
-      (113, 101, 204),
-      (131, 101, 204),
-      (148, 101, 204),
-      (166, 101, 204),
-      (183, 101, 204),
-      (201, 101, 204),
-      (204, 101, 189),
-      (204, 101, 171),
-      (204, 101, 154),
-      (204, 101, 136),
-      (204, 101, 119)],
- 36: [(204, 101, 101),
-      (204, 118, 101),
-      (204, 136, 101),
-      (204, 152, 101),
-      (204, 170, 101),
-      (204, 186, 101),
-      (204, 204, 101),
-      (187, 204, 101),
-      (169, 204, 101),
-      (153, 204, 101),
-      (136, 204, 101),
-      (118, 204, 101),
-      (102, 204, 101),
-      (101, 204, 119),
-      (101, 204, 135),
-      (101, 204, 152),
-      (101, 204, 170),
-      (101, 204, 187),
-      (101, 204, 204),
-      (101, 187, 204),
-      (101, 169, 204),
-      (101, 153, 204),
-      (101, 135, 204),
-      (101, 118, 204),
-      (101, 102, 204),
-      (118, 101, 204),
-      (136, 101, 204),
-      (152, 101, 204),
-      (169, 101, 204),
-      (186, 101, 204),
-      (203, 101, 204),
-      (204, 101, 186),
-      (204, 101, 169),
-      (204, 101, 153),
-      (204, 101, 135),
-      (204, 101, 118)],
- 37: [(204, 101, 101),
-      (204, 118, 101),
-      (204, 135, 101),
-      (204, 151, 101),
-      (204, 168, 101),
-      (204, 184, 101),
-      (204, 201, 101),
-      (190, 204, 101),
-      (173, 204, 101),
-      (157, 204, 101),
-      (140, 204, 101),
-      (124, 204, 101),
-      (107, 204, 101),
-      (101, 204, 113),
-      (101, 204, 129),
-      (101, 204, 146),
-      (101, 204, 162),
-      (101, 204, 179),
-      (101, 204, 195),
-      (101, 195, 204),
-      (101, 179, 204),
-      (101, 162, 204),
-      (101, 146, 204),
-      (101, 129, 204),
-      (101, 113, 204),
-      (107, 101, 204),
-      (124, 101, 204),
-      (140, 101, 204),
-      (157, 101, 204),
-      (173, 101, 204),
-      (190, 101, 204),
-      (204, 101, 201),
-      (204, 101, 184),
-      (204, 101, 168),
-      (204, 101, 151),
-      (204, 101, 135),
-      (204, 101, 118)],
- 38: [(204, 101, 101),
-      (204, 118, 101),
-      (204, 134, 101),
-      (204, 150, 101),
-      (204, 166, 101),
-      (204, 182, 101),
-      (204, 198, 101),
-      (193, 204, 101),
-      (177, 204, 101),
-      (161, 204, 101),
-      (144, 204, 101),
-      (128, 204, 101),
-      (112, 204, 101),
-      (101, 204, 107),
-      (101, 204, 123),
-      (101, 204, 139),
-      (101, 204, 155),
-      (101, 204, 171),
-      (101, 204, 187),
-      (101, 204, 204),
-      (101, 187, 204),
-      (101, 171, 204),
-      (101, 155, 204),
-      (101, 139, 204),
-      (101, 123, 204),
-      (101, 107, 204),
-      (112, 101, 204),
-      (128, 101, 204),
-      (144, 101, 204),
-      (161, 101, 204),
-      (177, 101, 204),
-      (193, 101, 204),
-      (204, 101, 198),
-      (204, 101, 182),
-      (204, 101, 166),
-      (204, 101, 150),
-      (204, 101, 134),
-      (204, 101, 118)],
- 39: [(204, 101, 101),
-      (204, 117, 101),
-      (204, 133, 101),
-      (204, 149, 101),
-      (204, 164, 101),
-      (204, 180, 101),
-      (204, 196, 101),
-      (196, 204, 101),
-      (180, 204, 101),
-      (164, 204, 101),
-      (149, 204, 101),
-      (133, 204, 101),
-      (117, 204, 101),
-      (102, 204, 101),
-      (101, 204, 117),
-      (101, 204, 133),
-      (101, 204, 149),
-      (101, 204, 164),
-      (101, 204, 180),
-      (101, 204, 196),
-      (101, 196, 204),
-      (101, 180, 204),
-      (101, 164, 204),
-      (101, 149, 204),
-      (101, 133, 204),
-      (101, 117, 204),
-      (101, 102, 204),
-      (117, 101, 204),
-      (133, 101, 204),
-      (149, 101, 204),
-      (164, 101, 204),
-      (180, 101, 204),
-      (196, 101, 204),
-      (204, 101, 196),
-      (204, 101, 180),
-      (204, 101, 164),
-      (204, 101, 149),
-      (204, 101, 133),
-      (204, 101, 117)],
- 40: [(204, 101, 101),
-      (204, 117, 101),
-      (204, 132, 101),
-      (204, 147, 101),
-      (204, 163, 101),
-      (204, 178, 101),
-      (204, 193, 101),
-      (198, 204, 101),
-      (183, 204, 101),
-      (168, 204, 101),
-      (153, 204, 101),
-      (137, 204, 101),
-      (122, 204, 101),
-      (107, 204, 101),
-      (101, 204, 112),
-      (101, 204, 127),
-      (101, 204, 142),
-      (101, 204, 158),
-      (101, 204, 173),
-      (101, 204, 188),
-      (101, 204, 204),
-      (101, 188, 204),
-      (101, 173, 204),
-      (101, 158, 204),
-      (101, 142, 204),
-      (101, 127, 204),
-      (101, 112, 204),
-      (107, 101, 204),
-      (122, 101, 204),
-      (137, 101, 204),
-      (152, 101, 204),
-      (168, 101, 204),
-      (183, 101, 204),
-      (198, 101, 204),
-      (204, 101, 193),
-      (204, 101, 178),
-      (204, 101, 163),
-      (204, 101, 147),
-      (204, 101, 132),
-      (204, 101, 117)],
- 41: [(204, 101, 101),
-      (204, 116, 101),
-      (204, 131, 101),
-      (204, 146, 101),
-      (204, 161, 101),
-      (204, 176, 101),
-      (204, 191, 101),
-      (201, 204, 101),
-      (186, 204, 101),
-      (171, 204, 101),
-      (156, 204, 101),
-      (141, 204, 101),
-      (126, 204, 101),
-      (111, 204, 101),
-      (101, 204, 106),
-      (101, 204, 121),
-      (101, 204, 136),
-      (101, 204, 151),
-      (101, 204, 166),
-      (101, 204, 181),
-      (101, 204, 196),
-      (101, 196, 204),
-      (101, 181, 204),
-      (101, 166, 204),
-      (101, 151, 204),
-      (101, 136, 204),
-      (101, 121, 204),
-      (101, 106, 204),
-      (111, 101, 204),
-      (126, 101, 204),
-      (141, 101, 204),
-      (156, 101, 204),
-      (171, 101, 204),
-      (186, 101, 204),
-      (201, 101, 204),
-      (204, 101, 191),
-      (204, 101, 176),
-      (204, 101, 161),
-      (204, 101, 146),
-      (204, 101, 131),
-      (204, 101, 116)],
- 42: [(204, 101, 101),
-      (204, 116, 101),
-      (204, 131, 101),
-      (204, 145, 101),
-      (204, 160, 101),
-      (204, 174, 101),
-      (204, 189, 101),
-      (204, 204, 101),
-      (189, 204, 101),
-      (174, 204, 101),
-      (160, 204, 101),
-      (145, 204, 101),
-      (131, 204, 101),
-      (116, 204, 101),
-      (102, 204, 101),
-      (101, 204, 116),
-      (101, 204, 131),
-      (101, 204, 145),
-      (101, 204, 160),
-      (101, 204, 174),
-      (101, 204, 189),
-      (101, 204, 204),
-      (101, 189, 204),
-      (101, 174, 204),
-      (101, 160, 204),
-      (101, 145, 204),
-      (101, 131, 204),
-      (101, 116, 204),
-      (101, 102, 204),
-      (116, 101, 204),
-      (131, 101, 204),
-      (145, 101, 204),
-      (160, 101, 204),
-      (174, 101, 204),
-      (189, 101, 204),
-      (203, 101, 204),
-      (204, 101, 189),
-      (204, 101, 174),
-      (204, 101, 160),
-      (204, 101, 145),
-      (204, 101, 131),
-      (204, 101, 116)],
- 43: [(204, 101, 101),
-      (204, 116, 101),
-      (204, 130, 101),
-      (204, 144, 101),
-      (204, 158, 101),
-      (204, 173, 101),
-      (204, 187, 101),
-      (204, 201, 101),
-      (192, 204, 101),
-      (177, 204, 101),
-      (163, 204, 101),
-      (149, 204, 101),
-      (135, 204, 101),
-      (120, 204, 101),
-      (106, 204, 101),
-      (101, 204, 111),
-      (101, 204, 125),
-      (101, 204, 139),
-      (101, 204, 154),
-      (101, 204, 168),
-      (101, 204, 182),
-      (101, 204, 196),
-      (101, 196, 204),
-      (101, 182, 204),
-      (101, 168, 204),
-      (101, 154, 204),
-      (101, 139, 204),
-      (101, 125, 204),
-      (101, 111, 204),
-      (106, 101, 204),
-      (120, 101, 204),
-      (135, 101, 204),
-      (149, 101, 204),
-      (163, 101, 204),
-      (177, 101, 204),
-      (192, 101, 204),
-      (204, 101, 201),
-      (204, 101, 187),
-      (204, 101, 173),
-      (204, 101, 158),
-      (204, 101, 144),
-      (204, 101, 130),
-      (204, 101, 116)],
- 44: [(204, 101, 101),
-      (204, 115, 101),
-      (204, 129, 101),
-      (204, 143, 101),
-      (204, 157, 101),
-      (204, 171, 101),
-      (204, 185, 101),
-      (204, 199, 101),
-      (194, 204, 101),
-      (180, 204, 101),
-      (166, 204, 101),
-      (153, 204, 101),
-      (139, 204, 101),
-      (125, 204, 101),
-      (111, 204, 101),
-      (101, 204, 106),
-      (101, 204, 120),
-      (101, 204, 134),
-      (101, 204, 148),
-      (101, 204, 162),
-      (101, 204, 176),
-      (101, 204, 190),
-      (101, 204, 204),
-      (101, 190, 204),
-      (101, 176, 204),
-      (101, 162, 204),
-      (101, 148, 204),
-      (101, 134, 204),
-      (101, 120, 204),
-      (101, 106, 204),
-      (111, 101, 204),
-      (125, 101, 204),
-      (139, 101, 204),
-      (152, 101, 204),
-      (166, 101, 204),
-      (180, 101, 204),
-      (194, 101, 204),
-      (204, 101, 199),
-      (204, 101, 185),
-      (204, 101, 171),
-      (204, 101, 157),
-      (204, 101, 143),
-      (204, 101, 129),
-      (204, 101, 115)],
- 45: [(204, 101, 101),
-      (204, 115, 101),
-      (204, 129, 101),
-      (204, 142, 101),
-      (204, 156, 101),
-      (204, 170, 101),
-      (204, 183, 101),
-      (204, 197, 101),
-      (197, 204, 101),
-      (183, 204, 101),
-      (169, 204, 101),
-      (156, 204, 101),
-      (142, 204, 101),
-      (129, 204, 101),
-      (115, 204, 101),
-      (101, 204, 102),
-      (101, 204, 115),
-      (101, 204, 129),
-      (101, 204, 142),
-      (101, 204, 156),
-      (101, 204, 170),
-      (101, 204, 183),
-      (101, 204, 197),
-      (101, 197, 204),
-      (101, 183, 204),
-      (101, 169, 204),
-      (101, 156, 204),
-      (101, 142, 204),
-      (101, 129, 204),
-      (101, 115, 204),
-      (101, 101, 204),
-      (115, 101, 204),
-      (129, 101, 204),
-      (142, 101, 204),
-      (156, 101, 204),
-      (169, 101, 204),
-      (183, 101, 204),
-      (197, 101, 204),
-      (204, 101, 197),
-      (204, 101, 183),
-      (204, 101, 169),
-      (204, 101, 156),
-      (204, 101, 142),
-      (204, 101, 129),
-      (204, 101, 115)],
- 46: [(204, 101, 101),
-      (204, 115, 101),
-      (204, 128, 101),
-      (204, 141, 101),
-      (204, 155, 101),
-      (204, 168, 101),
-      (204, 181, 101),
-      (204, 195, 101),
-      (199, 204, 101),
-      (186, 204, 101),
-      (172, 204, 101),
-      (159, 204, 101),
-      (146, 204, 101),
-      (133, 204, 101),
-      (119, 204, 101),
-      (106, 204, 101),
-      (101, 204, 110),
-      (101, 204, 124),
-      (101, 204, 137),
-      (101, 204, 150),
-      (101, 204, 164),
-      (101, 204, 177),
-      (101, 204, 190),
-      (101, 204, 204),
-      (101, 190, 204),
-      (101, 177, 204),
-      (101, 164, 204),
-      (101, 150, 204),
-      (101, 137, 204),
-      (101, 124, 204),
-      (101, 110, 204),
-      (106, 101, 204),
-      (119, 101, 204),
-      (133, 101, 204),
-      (146, 101, 204),
-      (159, 101, 204),
-      (172, 101, 204),
-      (186, 101, 204),
-      (199, 101, 204),
-      (204, 101, 195),
-      (204, 101, 181),
-      (204, 101, 168),
-      (204, 101, 155),
-      (204, 101, 141),
-      (204, 101, 128),
-      (204, 101, 115)],
- 47: [(204, 101, 101),
-      (204, 115, 101),
-      (204, 128, 101),
-      (204, 141, 101),
-      (204, 154, 101),
-      (204, 167, 101),
-      (204, 180, 101),
-      (204, 193, 101),
-      (201, 204, 101),
-      (188, 204, 101),
-      (175, 204, 101),
-      (162, 204, 101),
-      (149, 204, 101),
-      (136, 204, 101),
-      (123, 204, 101),
-      (110, 204, 101),
-      (101, 204, 106),
-      (101, 204, 119),
-      (101, 204, 132),
-      (101, 204, 145),
-      (101, 204, 158),
-      (101, 204, 171),
-      (101, 204, 184),
-      (101, 204, 197),
-      (101, 197, 204),
-      (101, 184, 204),
-      (101, 171, 204),
-      (101, 158, 204),
-      (101, 145, 204),
-      (101, 132, 204),
-      (101, 119, 204),
-      (101, 106, 204),
-      (110, 101, 204),
-      (123, 101, 204),
-      (136, 101, 204),
-      (149, 101, 204),
-      (162, 101, 204),
-      (175, 101, 204),
-      (188, 101, 204),
-      (201, 101, 204),
-      (204, 101, 193),
-      (204, 101, 180),
-      (204, 101, 167),
-      (204, 101, 154),
-      (204, 101, 141),
-      (204, 101, 128),
-      (204, 101, 115)],
- 48: [(204, 101, 101),
-      (204, 114, 101),
-      (204, 127, 101),
-      (204, 140, 101),
-      (204, 152, 101),
-      (204, 165, 101),
-      (204, 178, 101),
-      (204, 191, 101),
-      (204, 204, 101),
-      (191, 204, 101),
-      (178, 204, 101),
-      (165, 204, 101),
-      (153, 204, 101),
-      (140, 204, 101),
-      (127, 204, 101),
-      (114, 204, 101),
-      (102, 204, 101),
-      (101, 204, 114),
-      (101, 204, 127),
-      (101, 204, 140),
-      (101, 204, 152),
-      (101, 204, 165),
-      (101, 204, 178),
-      (101, 204, 191),
-      (101, 204, 204),
-      (101, 191, 204),
-      (101, 178, 204),
-      (101, 165, 204),
-      (101, 153, 204),
-      (101, 140, 204),
-      (101, 127, 204),
-      (101, 114, 204),
-      (101, 102, 204),
-      (114, 101, 204),
-      (127, 101, 204),
-      (140, 101, 204),
-      (152, 101, 204),
-      (165, 101, 204),
-      (178, 101, 204),
-      (191, 101, 204),
-      (203, 101, 204),
-      (204, 101, 191),
-      (204, 101, 178),
-      (204, 101, 165),
-      (204, 101, 153),
-      (204, 101, 140),
-      (204, 101, 127),
-      (204, 101, 114)],
- 49: [(204, 101, 101),
-      (204, 114, 101),
-      (204, 126, 101),
-      (204, 139, 101),
-      (204, 151, 101),
-      (204, 164, 101),
-      (204, 176, 101),
-      (204, 189, 101),
-      (204, 201, 101),
-      (193, 204, 101),
-      (181, 204, 101),
-      (168, 204, 101),
-      (156, 204, 101),
-      (143, 204, 101),
-      (131, 204, 101),
-      (118, 204, 101),
-      (106, 204, 101),
-      (101, 204, 110),
-      (101, 204, 122),
-      (101, 204, 135),
-      (101, 204, 147),
-      (101, 204, 160),
-      (101, 204, 172),
-      (101, 204, 185),
-      (101, 204, 197),
-      (101, 197, 204),
-      (101, 185, 204),
-      (101, 172, 204),
-      (101, 160, 204),
-      (101, 147, 204),
-      (101, 135, 204),
-      (101, 122, 204),
-      (101, 110, 204),
-      (106, 101, 204),
-      (118, 101, 204),
-      (131, 101, 204),
-      (143, 101, 204),
-      (156, 101, 204),
-      (168, 101, 204),
-      (181, 101, 204),
-      (193, 101, 204),
-      (204, 101, 201),
-      (204, 101, 189),
-      (204, 101, 176),
-      (204, 101, 164),
-      (204, 101, 151),
-      (204, 101, 139),
-      (204, 101, 126),
-      (204, 101, 114)],
- 50: [(204, 101, 101),
-      (204, 114, 101),
-      (204, 126, 101),
-      (204, 138, 101),
-      (204, 150, 101),
-      (204, 163, 101),
-      (204, 175, 101),
-      (204, 187, 101),
-      (204, 199, 101),
-      (195, 204, 101),
-      (183, 204, 101),
-      (171, 204, 101),
-      (159, 204, 101),
-      (146, 204, 101),
-      (134, 204, 101),
-      (122, 204, 101),
-      (110, 204, 101),
-      (101, 204, 106),
-      (101, 204, 118),
-      (101, 204, 130),
-      (101, 204, 142),
-      (101, 204, 155),
-      (101, 204, 167),
-      (101, 204, 179),
-      (101, 204, 191),
-      (101, 204, 204),
-      (101, 191, 204),
-      (101, 179, 204),
-      (101, 167, 204),
-      (101, 155, 204),
-      (101, 142, 204),
-      (101, 130, 204),
-      (101, 118, 204),
-      (101, 106, 204),
-      (110, 101, 204),
-      (122, 101, 204),
-      (134, 101, 204),
-      (146, 101, 204),
-      (159, 101, 204),
-      (171, 101, 204),
-      (183, 101, 204),
-      (195, 101, 204),
-      (204, 101, 199),
-      (204, 101, 187),
-      (204, 101, 175),
-      (204, 101, 163),
-      (204, 101, 150),
-      (204, 101, 138),
-      (204, 101, 126),
-      (204, 101, 114)],
- 51: [(204, 101, 101),
-      (204, 113, 101),
-      (204, 126, 101),
-      (204, 138, 101),
-      (204, 149, 101),
-      (204, 162, 101),
-      (204, 174, 101),
-      (204, 185, 101),
-      (204, 197, 101),
-      (198, 204, 101),
-      (186, 204, 101),
-      (173, 204, 101),
-      (162, 204, 101),
-      (150, 204, 101),
-      (138, 204, 101),
-      (125, 204, 101),
-      (114, 204, 101),
-      (102, 204, 101),
-      (101, 204, 114),
-      (101, 204, 126),
-      (101, 204, 137),
-      (101, 204, 149),
-      (101, 204, 162),
-      (101, 204, 174),
-      (101, 204, 186),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 186, 204),
-      (101, 173, 204),
-      (101, 162, 204),
-      (101, 149, 204),
-      (101, 137, 204),
-      (101, 125, 204),
-      (101, 114, 204),
-      (101, 102, 204),
-      (113, 101, 204),
-      (125, 101, 204),
-      (138, 101, 204),
-      (149, 101, 204),
-      (161, 101, 204),
-      (173, 101, 204),
-      (185, 101, 204),
-      (197, 101, 204),
-      (204, 101, 197),
-      (204, 101, 185),
-      (204, 101, 173),
-      (204, 101, 162),
-      (204, 101, 150),
-      (204, 101, 137),
-      (204, 101, 125),
-      (204, 101, 113)],
- 52: [(204, 101, 101),
-      (204, 113, 101),
-      (204, 125, 101),
-      (204, 137, 101),
-      (204, 149, 101),
-      (204, 160, 101),
-      (204, 172, 101),
-      (204, 184, 101),
-      (204, 196, 101),
-      (200, 204, 101),
-      (188, 204, 101),
-      (176, 204, 101),
-      (164, 204, 101),
-      (153, 204, 101),
-      (141, 204, 101),
-      (129, 204, 101),
-      (117, 204, 101),
-      (105, 204, 101),
-      (101, 204, 109),
-      (101, 204, 121),
-      (101, 204, 133),
-      (101, 204, 145),
-      (101, 204, 156),
-      (101, 204, 168),
-      (101, 204, 180),
-      (101, 204, 192),
-      (101, 204, 204),
-      (101, 192, 204),
-      (101, 180, 204),
-      (101, 168, 204),
-      (101, 156, 204),
-      (101, 145, 204),
-      (101, 133, 204),
-      (101, 121, 204),
-      (101, 109, 204),
-      (105, 101, 204),
-      (117, 101, 204),
-      (129, 101, 204),
-      (141, 101, 204),
-      (152, 101, 204),
-      (164, 101, 204),
-      (176, 101, 204),
-      (188, 101, 204),
-      (200, 101, 204),
-      (204, 101, 196),
-      (204, 101, 184),
-      (204, 101, 172),
-      (204, 101, 160),
-      (204, 101, 149),
-      (204, 101, 137),
-      (204, 101, 125),
-      (204, 101, 113)],
- 53: [(204, 101, 101),
-      (204, 113, 101),
-      (204, 125, 101),
-      (204, 136, 101),
-      (204, 148, 101),
-      (204, 159, 101),
-      (204, 171, 101),
-      (204, 182, 101),
-      (204, 194, 101),
-      (202, 204, 101),
-      (190, 204, 101),
-      (178, 204, 101),
-      (167, 204, 101),
-      (155, 204, 101),
-      (144, 204, 101),
-      (132, 204, 101),
-      (121, 204, 101),
-      (109, 204, 101),
-      (101, 204, 105),
-      (101, 204, 117),
-      (101, 204, 128),
-      (101, 204, 140),
-      (101, 204, 152),
-      (101, 204, 163),
-      (101, 204, 175),
-      (101, 204, 186),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 186, 204),
-      (101, 175, 204),
-      (101, 163, 204),
-      (101, 152, 204),
-      (101, 140, 204),
-      (101, 128, 204),
-      (101, 117, 204),
-      (101, 105, 204),
-      (109, 101, 204),
-      (121, 101, 204),
-      (132, 101, 204),
-      (144, 101, 204),
-      (155, 101, 204),
-      (167, 101, 204),
-      (178, 101, 204),
-      (190, 101, 204),
-      (202, 101, 204),
-      (204, 101, 194),
-      (204, 101, 182),
-      (204, 101, 171),
-      (204, 101, 159),
-      (204, 101, 148),
-      (204, 101, 136),
-      (204, 101, 125),
-      (204, 101, 113)],
- 54: [(204, 101, 101),
-      (204, 113, 101),
-      (204, 124, 101),
-      (204, 136, 101),
-      (204, 147, 101),
-      (204, 158, 101),
-      (204, 170, 101),
-      (204, 181, 101),
-      (204, 192, 101),
-      (204, 204, 101),
-      (192, 204, 101),
-      (181, 204, 101),
-      (169, 204, 101),
-      (158, 204, 101),
-      (147, 204, 101),
-      (136, 204, 101),
-      (124, 204, 101),
-      (113, 204, 101),
-      (102, 204, 101),
-      (101, 204, 113),
-      (101, 204, 124),
-      (101, 204, 135),
-      (101, 204, 147),
-      (101, 204, 158),
-      (101, 204, 170),
-      (101, 204, 181),
-      (101, 204, 192),
-      (101, 204, 204),
-      (101, 192, 204),
-      (101, 181, 204),
-      (101, 169, 204),
-      (101, 158, 204),
-      (101, 147, 204),
-      (101, 135, 204),
-      (101, 124, 204),
-      (101, 113, 204),
-      (101, 102, 204),
-      (113, 101, 204),
-      (124, 101, 204),
-      (136, 101, 204),
-      (147, 101, 204),
-      (158, 101, 204),
-      (169, 101, 204),
-      (181, 101, 204),
-      (192, 101, 204),
-      (203, 101, 204),
-      (204, 101, 192),
-      (204, 101, 181),
-      (204, 101, 169),
-      (204, 101, 158),
-      (204, 101, 147),
-      (204, 101, 135),
-      (204, 101, 124),
-      (204, 101, 113)],
- 55: [(204, 101, 101),
-      (204, 113, 101),
-      (204, 124, 101),
-      (204, 135, 101),
-      (204, 146, 101),
-      (204, 157, 101),
-      (204, 168, 101),
-      (204, 179, 101),
-      (204, 191, 101),
-      (204, 202, 101),
-      (194, 204, 101),
-      (183, 204, 101),
-      (172, 204, 101),
-      (161, 204, 101),
-      (150, 204, 101),
-      (139, 204, 101),
-      (127, 204, 101),
-      (116, 204, 101),
-      (105, 204, 101),
-      (101, 204, 109),
-      (101, 204, 120),
-      (101, 204, 131),
-      (101, 204, 142),
-      (101, 204, 153),
-      (101, 204, 165),
-      (101, 204, 176),
-      (101, 204, 187),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 187, 204),
-      (101, 176, 204),
-      (101, 165, 204),
-      (101, 153, 204),
-      (101, 142, 204),
-      (101, 131, 204),
-      (101, 120, 204),
-      (101, 109, 204),
-      (105, 101, 204),
-      (116, 101, 204),
-      (127, 101, 204),
-      (139, 101, 204),
-      (150, 101, 204),
-      (161, 101, 204),
-      (172, 101, 204),
-      (183, 101, 204),
-      (194, 101, 204),
-      (204, 101, 202),
-      (204, 101, 191),
-      (204, 101, 179),
-      (204, 101, 168),
-      (204, 101, 157),
-      (204, 101, 146),
-      (204, 101, 135),
-      (204, 101, 124),
-      (204, 101, 113)],
- 56: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 123, 101),
-      (204, 134, 101),
-      (204, 145, 101),
-      (204, 156, 101),
-      (204, 167, 101),
-      (204, 178, 101),
-      (204, 189, 101),
-      (204, 200, 101),
-      (196, 204, 101),
-      (185, 204, 101),
-      (174, 204, 101),
-      (163, 204, 101),
-      (153, 204, 101),
-      (142, 204, 101),
-      (131, 204, 101),
-      (120, 204, 101),
-      (109, 204, 101),
-      (101, 204, 105),
-      (101, 204, 116),
-      (101, 204, 127),
-      (101, 204, 138),
-      (101, 204, 149),
-      (101, 204, 160),
-      (101, 204, 171),
-      (101, 204, 182),
-      (101, 204, 193),
-      (101, 204, 204),
-      (101, 193, 204),
-      (101, 182, 204),
-      (101, 171, 204),
-      (101, 160, 204),
-      (101, 149, 204),
-      (101, 138, 204),
-      (101, 127, 204),
-      (101, 116, 204),
-      (101, 105, 204),
-      (109, 101, 204),
-      (120, 101, 204),
-      (131, 101, 204),
-      (142, 101, 204),
-      (152, 101, 204),
-      (163, 101, 204),
-      (174, 101, 204),
-      (185, 101, 204),
-      (196, 101, 204),
-      (204, 101, 200),
-      (204, 101, 189),
-      (204, 101, 178),
-      (204, 101, 167),
-      (204, 101, 156),
-      (204, 101, 145),
-      (204, 101, 134),
-      (204, 101, 123),
-      (204, 101, 112)],
- 57: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 123, 101),
-      (204, 134, 101),
-      (204, 144, 101),
-      (204, 155, 101),
-      (204, 166, 101),
-      (204, 177, 101),
-      (204, 187, 101),
-      (204, 198, 101),
-      (198, 204, 101),
-      (187, 204, 101),
-      (177, 204, 101),
-      (166, 204, 101),
-      (155, 204, 101),
-      (144, 204, 101),
-      (134, 204, 101),
-      (123, 204, 101),
-      (112, 204, 101),
-      (102, 204, 101),
-      (101, 204, 112),
-      (101, 204, 123),
-      (101, 204, 134),
-      (101, 204, 144),
-      (101, 204, 155),
-      (101, 204, 166),
-      (101, 204, 177),
-      (101, 204, 187),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 187, 204),
-      (101, 177, 204),
-      (101, 166, 204),
-      (101, 155, 204),
-      (101, 144, 204),
-      (101, 134, 204),
-      (101, 123, 204),
-      (101, 112, 204),
-      (101, 102, 204),
-      (112, 101, 204),
-      (123, 101, 204),
-      (134, 101, 204),
-      (144, 101, 204),
-      (155, 101, 204),
-      (166, 101, 204),
-      (177, 101, 204),
-      (187, 101, 204),
-      (198, 101, 204),
-      (204, 101, 198),
-      (204, 101, 187),
-      (204, 101, 177),
-      (204, 101, 166),
-      (204, 101, 155),
-      (204, 101, 144),
-      (204, 101, 134),
-      (204, 101, 123),
-      (204, 101, 112)],
- 58: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 123, 101),
-      (204, 133, 101),
-      (204, 144, 101),
-      (204, 154, 101),
-      (204, 165, 101),
-      (204, 175, 101),
-      (204, 186, 101),
-      (204, 196, 101),
-      (200, 204, 101),
-      (189, 204, 101),
-      (179, 204, 101),
-      (168, 204, 101),
-      (158, 204, 101),
-      (147, 204, 101),
-      (137, 204, 101),
-      (126, 204, 101),
-      (116, 204, 101),
-      (105, 204, 101),
-      (101, 204, 109),
-      (101, 204, 119),
-      (101, 204, 130),
-      (101, 204, 140),
-      (101, 204, 151),
-      (101, 204, 161),
-      (101, 204, 172),
-      (101, 204, 182),
-      (101, 204, 193),
-      (101, 204, 204),
-      (101, 193, 204),
-      (101, 182, 204),
-      (101, 172, 204),
-      (101, 161, 204),
-      (101, 151, 204),
-      (101, 140, 204),
-      (101, 130, 204),
-      (101, 119, 204),
-      (101, 109, 204),
-      (105, 101, 204),
-      (116, 101, 204),
-      (126, 101, 204),
-      (137, 101, 204),
-      (147, 101, 204),
-      (158, 101, 204),
-      (168, 101, 204),
-      (179, 101, 204),
-      (189, 101, 204),
-      (200, 101, 204),
-      (204, 101, 196),
-      (204, 101, 186),
-      (204, 101, 175),
-      (204, 101, 165),
-      (204, 101, 154),
-      (204, 101, 144),
-      (204, 101, 133),
-      (204, 101, 123),
-      (204, 101, 112)],
- 59: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 122, 101),
-      (204, 133, 101),
-      (204, 143, 101),
-      (204, 153, 101),
-      (204, 164, 101),
-      (204, 174, 101),
-      (204, 184, 101),
-      (204, 195, 101),
-      (202, 204, 101),
-      (191, 204, 101),
-      (181, 204, 101),
-      (171, 204, 101),
-      (160, 204, 101),
-      (150, 204, 101),
-      (140, 204, 101),
-      (129, 204, 101),
-      (119, 204, 101),
-      (108, 204, 101),
-      (101, 204, 105),
-      (101, 204, 115),
-      (101, 204, 126),
-      (101, 204, 136),
-      (101, 204, 146),
-      (101, 204, 157),
-      (101, 204, 167),
-      (101, 204, 178),
-      (101, 204, 188),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 188, 204),
-      (101, 178, 204),
-      (101, 167, 204),
-      (101, 157, 204),
-      (101, 146, 204),
-      (101, 136, 204),
-      (101, 126, 204),
-      (101, 115, 204),
-      (101, 105, 204),
-      (108, 101, 204),
-      (119, 101, 204),
-      (129, 101, 204),
-      (140, 101, 204),
-      (150, 101, 204),
-      (160, 101, 204),
-      (171, 101, 204),
-      (181, 101, 204),
-      (191, 101, 204),
-      (202, 101, 204),
-      (204, 101, 195),
-      (204, 101, 184),
-      (204, 101, 174),
-      (204, 101, 164),
-      (204, 101, 153),
-      (204, 101, 143),
-      (204, 101, 133),
-      (204, 101, 122),
-      (204, 101, 112)],
- 60: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 122, 101),
-      (204, 132, 101),
-      (204, 142, 101),
-      (204, 152, 101),
-      (204, 163, 101),
-      (204, 173, 101),
-      (204, 183, 101),
-      (204, 193, 101),
-      (204, 204, 101),
-      (193, 204, 101),
-      (183, 204, 101),
-      (173, 204, 101),
-      (163, 204, 101),
-      (153, 204, 101),
-      (142, 204, 101),
-      (132, 204, 101),
-      (122, 204, 101),
-      (112, 204, 101),
-      (102, 204, 101),
-      (101, 204, 112),
-      (101, 204, 122),
-      (101, 204, 132),
-      (101, 204, 142),
-      (101, 204, 153),
-      (101, 204, 163),
-      (101, 204, 173),
-      (101, 204, 183),
-      (101, 204, 193),
-      (101, 204, 204),
-      (101, 193, 204),
-      (101, 183, 204),
-      (101, 173, 204),
-      (101, 163, 204),
-      (101, 152, 204),
-      (101, 142, 204),
-      (101, 132, 204),
-      (101, 122, 204),
-      (101, 112, 204),
-      (101, 102, 204),
-      (112, 101, 204),
-      (122, 101, 204),
-      (132, 101, 204),
-      (142, 101, 204),
-      (152, 101, 204),
-      (163, 101, 204),
-      (173, 101, 204),
-      (183, 101, 204),
-      (193, 101, 204),
-      (204, 101, 203),
-      (204, 101, 193),
-      (204, 101, 183),
-      (204, 101, 173),
-      (204, 101, 163),
-      (204, 101, 153),
-      (204, 101, 142),
-      (204, 101, 132),
-      (204, 101, 122),
-      (204, 101, 112)],
- 61: [(204, 101, 101),
-      (204, 112, 101),
-      (204, 122, 101),
-      (204, 132, 101),
-      (204, 142, 101),
-      (204, 152, 101),
-      (204, 162, 101),
-      (204, 172, 101),
-      (204, 182, 101),
-      (204, 192, 101),
-      (204, 202, 101),
-      (195, 204, 101),
-      (185, 204, 101),
-      (175, 204, 101),
-      (165, 204, 101),
-      (155, 204, 101),
-      (145, 204, 101),
-      (135, 204, 101),
-      (125, 204, 101),
-      (115, 204, 101),
-      (105, 204, 101),
-      (101, 204, 108),
-      (101, 204, 118),
-      (101, 204, 128),
-      (101, 204, 138),
-      (101, 204, 148),
-      (101, 204, 158),
-      (101, 204, 168),
-      (101, 204, 178),
-      (101, 204, 188),
-      (101, 204, 198),
-      (101, 198, 204),
-      (101, 188, 204),
-      (101, 178, 204),
-      (101, 168, 204),
-      (101, 158, 204),
-      (101, 148, 204),
-      (101, 138, 204),
-      (101, 128, 204),
-      (101, 118, 204),
-      (101, 108, 204),
-      (105, 101, 204),
-      (115, 101, 204),
-      (125, 101, 204),
-      (135, 101, 204),
-      (145, 101, 204),
-      (155, 101, 204),
-      (165, 101, 204),
-      (175, 101, 204),
-      (185, 101, 204),
-      (195, 101, 204),
-      (204, 101, 202),
-      (204, 101, 192),
-      (204, 101, 182),
-      (204, 101, 172),
-      (204, 101, 162),
-      (204, 101, 152),
-      (204, 101, 142),
-      (204, 101, 132),
-      (204, 101, 122),
-      (204, 101, 112)],
- 62: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 121, 101),
-      (204, 131, 101),
-      (204, 141, 101),
-      (204, 151, 101),
-      (204, 161, 101),
-      (204, 171, 101),
-      (204, 180, 101),
-      (204, 190, 101),
-      (204, 200, 101),
-      (197, 204, 101),
-      (187, 204, 101),
-      (177, 204, 101),
-      (167, 204, 101),
-      (157, 204, 101),
-      (148, 204, 101),
-      (138, 204, 101),
-      (128, 204, 101),
-      (118, 204, 101),
-      (108, 204, 101),
-      (101, 204, 105),
-      (101, 204, 115),
-      (101, 204, 125),
-      (101, 204, 134),
-      (101, 204, 144),
-      (101, 204, 154),
-      (101, 204, 164),
-      (101, 204, 174),
-      (101, 204, 184),
-      (101, 204, 194),
-      (101, 204, 204),
-      (101, 194, 204),
-      (101, 184, 204),
-      (101, 174, 204),
-      (101, 164, 204),
-      (101, 154, 204),
-      (101, 144, 204),
-      (101, 134, 204),
-      (101, 125, 204),
-      (101, 115, 204),
-      (101, 105, 204),
-      (108, 101, 204),
-      (118, 101, 204),
-      (128, 101, 204),
-      (138, 101, 204),
-      (148, 101, 204),
-      (157, 101, 204),
-      (167, 101, 204),
-      (177, 101, 204),
-      (187, 101, 204),
-      (197, 101, 204),
-      (204, 101, 200),
-      (204, 101, 190),
-      (204, 101, 180),
-      (204, 101, 171),
-      (204, 101, 161),
-      (204, 101, 151),
-      (204, 101, 141),
-      (204, 101, 131),
-      (204, 101, 121),
-      (204, 101, 111)],
- 63: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 121, 101),
-      (204, 131, 101),
-      (204, 140, 101),
-      (204, 150, 101),
-      (204, 160, 101),
-      (204, 170, 101),
-      (204, 179, 101),
-      (204, 189, 101),
-      (204, 199, 101),
-      (199, 204, 101),
-      (189, 204, 101),
-      (179, 204, 101),
-      (169, 204, 101),
-      (160, 204, 101),
-      (150, 204, 101),
-      (140, 204, 101),
-      (131, 204, 101),
-      (121, 204, 101),
-      (111, 204, 101),
-      (102, 204, 101),
-      (101, 204, 111),
-      (101, 204, 121),
-      (101, 204, 131),
-      (101, 204, 140),
-      (101, 204, 150),
-      (101, 204, 160),
-      (101, 204, 170),
-      (101, 204, 179),
-      (101, 204, 189),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 189, 204),
-      (101, 179, 204),
-      (101, 169, 204),
-      (101, 160, 204),
-      (101, 150, 204),
-      (101, 140, 204),
-      (101, 131, 204),
-      (101, 121, 204),
-      (101, 111, 204),
-      (101, 102, 204),
-      (111, 101, 204),
-      (121, 101, 204),
-      (131, 101, 204),
-      (140, 101, 204),
-      (150, 101, 204),
-      (160, 101, 204),
-      (169, 101, 204),
-      (179, 101, 204),
-      (189, 101, 204),
-      (199, 101, 204),
-      (204, 101, 199),
-      (204, 101, 189),
-      (204, 101, 179),
-      (204, 101, 169),
-      (204, 101, 160),
-      (204, 101, 150),
-      (204, 101, 140),
-      (204, 101, 131),
-      (204, 101, 121),
-      (204, 101, 111)],
- 64: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 121, 101),
-      (204, 130, 101),
-      (204, 140, 101),
-      (204, 149, 101),
-      (204, 159, 101),
-      (204, 168, 101),
-      (204, 178, 101),
-      (204, 188, 101),
-      (204, 197, 101),
-      (200, 204, 101),
-      (191, 204, 101),
-      (181, 204, 101),
-      (172, 204, 101),
-      (162, 204, 101),
-      (153, 204, 101),
-      (143, 204, 101),
-      (133, 204, 101),
-      (124, 204, 101),
-      (114, 204, 101),
-      (105, 204, 101),
-      (101, 204, 108),
-      (101, 204, 117),
-      (101, 204, 127),
-      (101, 204, 137),
-      (101, 204, 146),
-      (101, 204, 156),
-      (101, 204, 165),
-      (101, 204, 175),
-      (101, 204, 184),
-      (101, 204, 194),
-      (101, 204, 204),
-      (101, 194, 204),
-      (101, 184, 204),
-      (101, 175, 204),
-      (101, 165, 204),
-      (101, 156, 204),
-      (101, 146, 204),
-      (101, 137, 204),
-      (101, 127, 204),
-      (101, 117, 204),
-      (101, 108, 204),
-      (105, 101, 204),
-      (114, 101, 204),
-      (124, 101, 204),
-      (133, 101, 204),
-      (143, 101, 204),
-      (152, 101, 204),
-      (162, 101, 204),
-      (172, 101, 204),
-      (181, 101, 204),
-      (191, 101, 204),
-      (200, 101, 204),
-      (204, 101, 197),
-      (204, 101, 188),
-      (204, 101, 178),
-      (204, 101, 168),
-      (204, 101, 159),
-      (204, 101, 149),
-      (204, 101, 140),
-      (204, 101, 130),
-      (204, 101, 121),
-      (204, 101, 111)],
- 65: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 120, 101),
-      (204, 130, 101),
-      (204, 139, 101),
-      (204, 149, 101),
-      (204, 158, 101),
-      (204, 167, 101),
-      (204, 177, 101),
-      (204, 186, 101),
-      (204, 196, 101),
-      (202, 204, 101),
-      (193, 204, 101),
-      (183, 204, 101),
-      (174, 204, 101),
-      (164, 204, 101),
-      (155, 204, 101),
-      (145, 204, 101),
-      (136, 204, 101),
-      (127, 204, 101),
-      (117, 204, 101),
-      (108, 204, 101),
-      (101, 204, 105),
-      (101, 204, 114),
-      (101, 204, 123),
-      (101, 204, 133),
-      (101, 204, 142),
-      (101, 204, 152),
-      (101, 204, 161),
-      (101, 204, 171),
-      (101, 204, 180),
-      (101, 204, 189),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 189, 204),
-      (101, 180, 204),
-      (101, 171, 204),
-      (101, 161, 204),
-      (101, 152, 204),
-      (101, 142, 204),
-      (101, 133, 204),
-      (101, 123, 204),
-      (101, 114, 204),
-      (101, 105, 204),
-      (108, 101, 204),
-      (117, 101, 204),
-      (127, 101, 204),
-      (136, 101, 204),
-      (145, 101, 204),
-      (155, 101, 204),
-      (164, 101, 204),
-      (174, 101, 204),
-      (183, 101, 204),
-      (193, 101, 204),
-      (202, 101, 204),
-      (204, 101, 196),
-      (204, 101, 186),
-      (204, 101, 177),
-      (204, 101, 167),
-      (204, 101, 158),
-      (204, 101, 149),
-      (204, 101, 139),
-      (204, 101, 130),
-      (204, 101, 120),
-      (204, 101, 111)],
- 66: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 120, 101),
-      (204, 129, 101),
-      (204, 139, 101),
-      (204, 148, 101),
-      (204, 157, 101),
-      (204, 166, 101),
-      (204, 176, 101),
-      (204, 185, 101),
-      (204, 194, 101),
-      (204, 204, 101),
-      (194, 204, 101),
-      (185, 204, 101),
-      (176, 204, 101),
-      (166, 204, 101),
-      (157, 204, 101),
-      (148, 204, 101),
-      (139, 204, 101),
-      (129, 204, 101),
-      (120, 204, 101),
-      (111, 204, 101),
-      (101, 204, 102),
-      (101, 204, 111),
-      (101, 204, 120),
-      (101, 204, 129),
-      (101, 204, 139),
-      (101, 204, 148),
-      (101, 204, 157),
-      (101, 204, 166),
-      (101, 204, 176),
-      (101, 204, 185),
-      (101, 204, 194),
-      (101, 204, 204),
-      (101, 194, 204),
-      (101, 185, 204),
-      (101, 176, 204),
-      (101, 166, 204),
-      (101, 157, 204),
-      (101, 148, 204),
-      (101, 139, 204),
-      (101, 129, 204),
-      (101, 120, 204),
-      (101, 111, 204),
-      (101, 101, 204),
-      (111, 101, 204),
-      (120, 101, 204),
-      (129, 101, 204),
-      (139, 101, 204),
-      (148, 101, 204),
-      (157, 101, 204),
-      (166, 101, 204),
-      (176, 101, 204),
-      (185, 101, 204),
-      (194, 101, 204),
-      (204, 101, 203),
-      (204, 101, 194),
-      (204, 101, 185),
-      (204, 101, 176),
-      (204, 101, 166),
-      (204, 101, 157),
-      (204, 101, 148),
-      (204, 101, 139),
-      (204, 101, 129),
-      (204, 101, 120),
-      (204, 101, 111)],
- 67: [(204, 101, 101),
-      (204, 111, 101),
-      (204, 120, 101),
-      (204, 129, 101),
-      (204, 138, 101),
-      (204, 147, 101),
-      (204, 156, 101),
-      (204, 165, 101),
-      (204, 175, 101),
-      (204, 184, 101),
-      (204, 193, 101),
-      (204, 202, 101),
-      (196, 204, 101),
-      (187, 204, 101),
-      (178, 204, 101),
-      (168, 204, 101),
-      (159, 204, 101),
-      (150, 204, 101),
-      (141, 204, 101),
-      (132, 204, 101),
-      (123, 204, 101),
-      (114, 204, 101),
-      (105, 204, 101),
-      (101, 204, 108),
-      (101, 204, 117),
-      (101, 204, 126),
-      (101, 204, 135),
-      (101, 204, 144),
-      (101, 204, 153),
-      (101, 204, 162),
-      (101, 204, 172),
-      (101, 204, 181),
-      (101, 204, 190),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 190, 204),
-      (101, 181, 204),
-      (101, 172, 204),
-      (101, 162, 204),
-      (101, 153, 204),
-      (101, 144, 204),
-      (101, 135, 204),
-      (101, 126, 204),
-      (101, 117, 204),
-      (101, 108, 204),
-      (105, 101, 204),
-      (114, 101, 204),
-      (123, 101, 204),
-      (132, 101, 204),
-      (141, 101, 204),
-      (150, 101, 204),
-      (159, 101, 204),
-      (168, 101, 204),
-      (178, 101, 204),
-      (187, 101, 204),
-      (196, 101, 204),
-      (204, 101, 202),
-      (204, 101, 193),
-      (204, 101, 184),
-      (204, 101, 175),
-      (204, 101, 165),
-      (204, 101, 156),
-      (204, 101, 147),
-      (204, 101, 138),
-      (204, 101, 129),
-      (204, 101, 120),
-      (204, 101, 111)],
- 68: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 119, 101),
-      (204, 129, 101),
-      (204, 138, 101),
-      (204, 146, 101),
-      (204, 155, 101),
-      (204, 165, 101),
-      (204, 174, 101),
-      (204, 182, 101),
-      (204, 191, 101),
-      (204, 201, 101),
-      (198, 204, 101),
-      (189, 204, 101),
-      (180, 204, 101),
-      (170, 204, 101),
-      (162, 204, 101),
-      (153, 204, 101),
-      (144, 204, 101),
-      (135, 204, 101),
-      (125, 204, 101),
-      (117, 204, 101),
-      (108, 204, 101),
-      (101, 204, 105),
-      (101, 204, 114),
-      (101, 204, 123),
-      (101, 204, 131),
-      (101, 204, 140),
-      (101, 204, 149),
-      (101, 204, 159),
-      (101, 204, 168),
-      (101, 204, 177),
-      (101, 204, 186),
-      (101, 204, 195),
-      (101, 204, 204),
-      (101, 195, 204),
-      (101, 186, 204),
-      (101, 177, 204),
-      (101, 167, 204),
-      (101, 159, 204),
-      (101, 149, 204),
-      (101, 140, 204),
-      (101, 131, 204),
-      (101, 122, 204),
-      (101, 114, 204),
-      (101, 105, 204),
-      (107, 101, 204),
-      (116, 101, 204),
-      (125, 101, 204),
-      (135, 101, 204),
-      (143, 101, 204),
-      (152, 101, 204),
-      (161, 101, 204),
-      (170, 101, 204),
-      (179, 101, 204),
-      (188, 101, 204),
-      (197, 101, 204),
-      (204, 101, 200),
-      (204, 101, 191),
-      (204, 101, 182),
-      (204, 101, 173),
-      (204, 101, 164),
-      (204, 101, 156),
-      (204, 101, 146),
-      (204, 101, 137),
-      (204, 101, 128),
-      (204, 101, 119),
-      (204, 101, 110)],
- 69: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 119, 101),
-      (204, 128, 101),
-      (204, 137, 101),
-      (204, 146, 101),
-      (204, 155, 101),
-      (204, 164, 101),
-      (204, 172, 101),
-      (204, 181, 101),
-      (204, 190, 101),
-      (204, 199, 101),
-      (199, 204, 101),
-      (190, 204, 101),
-      (181, 204, 101),
-      (172, 204, 101),
-      (164, 204, 101),
-      (155, 204, 101),
-      (146, 204, 101),
-      (137, 204, 101),
-      (128, 204, 101),
-      (119, 204, 101),
-      (110, 204, 101),
-      (102, 204, 101),
-      (101, 204, 110),
-      (101, 204, 119),
-      (101, 204, 128),
-      (101, 204, 137),
-      (101, 204, 146),
-      (101, 204, 155),
-      (101, 204, 164),
-      (101, 204, 172),
-      (101, 204, 181),
-      (101, 204, 190),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 190, 204),
-      (101, 181, 204),
-      (101, 172, 204),
-      (101, 164, 204),
-      (101, 155, 204),
-      (101, 146, 204),
-      (101, 137, 204),
-      (101, 128, 204),
-      (101, 119, 204),
-      (101, 110, 204),
-      (101, 102, 204),
-      (110, 101, 204),
-      (119, 101, 204),
-      (128, 101, 204),
-      (137, 101, 204),
-      (146, 101, 204),
-      (155, 101, 204),
-      (164, 101, 204),
-      (172, 101, 204),
-      (181, 101, 204),
-      (190, 101, 204),
-      (199, 101, 204),
-      (204, 101, 199),
-      (204, 101, 190),
-      (204, 101, 181),
-      (204, 101, 172),
-      (204, 101, 164),
-      (204, 101, 155),
-      (204, 101, 146),
-      (204, 101, 137),
-      (204, 101, 128),
-      (204, 101, 119),
-      (204, 101, 110)],
- 70: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 119, 101),
-      (204, 128, 101),
-      (204, 136, 101),
-      (204, 145, 101),
-      (204, 154, 101),
-      (204, 163, 101),
-      (204, 171, 101),
-      (204, 180, 101),
-      (204, 189, 101),
-      (204, 198, 101),
-      (201, 204, 101),
-      (192, 204, 101),
-      (183, 204, 101),
-      (174, 204, 101),
-      (166, 204, 101),
-      (157, 204, 101),
-      (148, 204, 101),
-      (139, 204, 101),
-      (131, 204, 101),
-      (122, 204, 101),
-      (113, 204, 101),
-      (104, 204, 101),
-      (101, 204, 107),
-      (101, 204, 116),
-      (101, 204, 125),
-      (101, 204, 134),
-      (101, 204, 142),
-      (101, 204, 151),
-      (101, 204, 160),
-      (101, 204, 169),
-      (101, 204, 177),
-      (101, 204, 186),
-      (101, 204, 195),
-      (101, 204, 204),
-      (101, 195, 204),
-      (101, 186, 204),
-      (101, 177, 204),
-      (101, 169, 204),
-      (101, 160, 204),
-      (101, 151, 204),
-      (101, 142, 204),
-      (101, 134, 204),
-      (101, 125, 204),
-      (101, 116, 204),
-      (101, 107, 204),
-      (104, 101, 204),
-      (113, 101, 204),
-      (122, 101, 204),
-      (131, 101, 204),
-      (139, 101, 204),
-      (148, 101, 204),
-      (157, 101, 204),
-      (166, 101, 204),
-      (174, 101, 204),
-      (183, 101, 204),
-      (192, 101, 204),
-      (201, 101, 204),
-      (204, 101, 198),
-      (204, 101, 189),
-      (204, 101, 180),
-      (204, 101, 171),
-      (204, 101, 163),
-      (204, 101, 154),
-      (204, 101, 145),
-      (204, 101, 136),
-      (204, 101, 128),
-      (204, 101, 119),
-      (204, 101, 110)],
- 71: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 119, 101),
-      (204, 127, 101),
-      (204, 136, 101),
-      (204, 145, 101),
-      (204, 153, 101),
-      (204, 162, 101),
-      (204, 170, 101),
-      (204, 179, 101),
-      (204, 188, 101),
-      (204, 196, 101),
-      (202, 204, 101),
-      (193, 204, 101),
-      (185, 204, 101),
-      (176, 204, 101),
-      (168, 204, 101),
-      (159, 204, 101),
-      (150, 204, 101),
-      (142, 204, 101),
-      (133, 204, 101),
-      (124, 204, 101),
-      (116, 204, 101),
-      (107, 204, 101),
-      (101, 204, 104),
-      (101, 204, 113),
-      (101, 204, 122),
-      (101, 204, 130),
-      (101, 204, 139),
-      (101, 204, 147),
-      (101, 204, 156),
-      (101, 204, 165),
-      (101, 204, 173),
-      (101, 204, 182),
-      (101, 204, 191),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 191, 204),
-      (101, 182, 204),
-      (101, 173, 204),
-      (101, 165, 204),
-      (101, 156, 204),
-      (101, 147, 204),
-      (101, 139, 204),
-      (101, 130, 204),
-      (101, 122, 204),
-      (101, 113, 204),
-      (101, 104, 204),
-      (107, 101, 204),
-      (116, 101, 204),
-      (124, 101, 204),
-      (133, 101, 204),
-      (142, 101, 204),
-      (150, 101, 204),
-      (159, 101, 204),
-      (168, 101, 204),
-      (176, 101, 204),
-      (185, 101, 204),
-      (193, 101, 204),
-      (202, 101, 204),
-      (204, 101, 196),
-      (204, 101, 188),
-      (204, 101, 179),
-      (204, 101, 170),
-      (204, 101, 162),
-      (204, 101, 153),
-      (204, 101, 145),
-      (204, 101, 136),
-      (204, 101, 127),
-      (204, 101, 119),
-      (204, 101, 110)],
- 72: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 118, 101),
-      (204, 127, 101),
-      (204, 136, 101),
-      (204, 144, 101),
-      (204, 152, 101),
-      (204, 161, 101),
-      (204, 170, 101),
-      (204, 178, 101),
-      (204, 186, 101),
-      (204, 195, 101),
-      (204, 204, 101),
-      (195, 204, 101),
-      (187, 204, 101),
-      (178, 204, 101),
-      (169, 204, 101),
-      (161, 204, 101),
-      (153, 204, 101),
-      (144, 204, 101),
-      (136, 204, 101),
-      (127, 204, 101),
-      (118, 204, 101),
-      (110, 204, 101),
-      (102, 204, 101),
-      (101, 204, 110),
-      (101, 204, 119),
-      (101, 204, 127),
-      (101, 204, 135),
-      (101, 204, 144),
-      (101, 204, 152),
-      (101, 204, 161),
-      (101, 204, 170),
-      (101, 204, 178),
-      (101, 204, 187),
-      (101, 204, 195),
-      (101, 204, 204),
-      (101, 195, 204),
-      (101, 187, 204),
-      (101, 178, 204),
-      (101, 169, 204),
-      (101, 161, 204),
-      (101, 153, 204),
-      (101, 144, 204),
-      (101, 135, 204),
-      (101, 127, 204),
-      (101, 118, 204),
-      (101, 110, 204),
-      (101, 102, 204),
-      (110, 101, 204),
-      (118, 101, 204),
-      (127, 101, 204),
-      (136, 101, 204),
-      (144, 101, 204),
-      (152, 101, 204),
-      (161, 101, 204),
-      (169, 101, 204),
-      (178, 101, 204),
-      (186, 101, 204),
-      (195, 101, 204),
-      (203, 101, 204),
-      (204, 101, 195),
-      (204, 101, 186),
-      (204, 101, 178),
-      (204, 101, 169),
-      (204, 101, 161),
-      (204, 101, 153),
-      (204, 101, 144),
-      (204, 101, 135),
-      (204, 101, 127),
-      (204, 101, 118),
-      (204, 101, 110)],
- 73: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 118, 101),
-      (204, 127, 101),
-      (204, 135, 101),
-      (204, 143, 101),
-      (204, 152, 101),
-      (204, 160, 101),
-      (204, 169, 101),
-      (204, 177, 101),
-      (204, 185, 101),
-      (204, 194, 101),
-      (204, 202, 101),
-      (197, 204, 101),
-      (188, 204, 101),
-      (180, 204, 101),
-      (171, 204, 101),
-      (163, 204, 101),
-      (155, 204, 101),
-      (146, 204, 101),
-      (138, 204, 101),
-      (129, 204, 101),
-      (121, 204, 101),
-      (113, 204, 101),
-      (104, 204, 101),
-      (101, 204, 107),
-      (101, 204, 115),
-      (101, 204, 124),
-      (101, 204, 132),
-      (101, 204, 141),
-      (101, 204, 149),
-      (101, 204, 157),
-      (101, 204, 166),
-      (101, 204, 174),
-      (101, 204, 183),
-      (101, 204, 191),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 191, 204),
-      (101, 183, 204),
-      (101, 174, 204),
-      (101, 166, 204),
-      (101, 157, 204),
-      (101, 149, 204),
-      (101, 141, 204),
-      (101, 132, 204),
-      (101, 124, 204),
-      (101, 115, 204),
-      (101, 107, 204),
-      (104, 101, 204),
-      (113, 101, 204),
-      (121, 101, 204),
-      (129, 101, 204),
-      (138, 101, 204),
-      (146, 101, 204),
-      (155, 101, 204),
-      (163, 101, 204),
-      (171, 101, 204),
-      (180, 101, 204),
-      (188, 101, 204),
-      (197, 101, 204),
-      (204, 101, 202),
-      (204, 101, 194),
-      (204, 101, 185),
-      (204, 101, 177),
-      (204, 101, 169),
-      (204, 101, 160),
-      (204, 101, 152),
-      (204, 101, 143),
-      (204, 101, 135),
-      (204, 101, 127),
-      (204, 101, 118),
-      (204, 101, 110)],
- 74: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 118, 101),
-      (204, 126, 101),
-      (204, 135, 101),
-      (204, 143, 101),
-      (204, 151, 101),
-      (204, 159, 101),
-      (204, 168, 101),
-      (204, 176, 101),
-      (204, 184, 101),
-      (204, 192, 101),
-      (204, 201, 101),
-      (198, 204, 101),
-      (190, 204, 101),
-      (181, 204, 101),
-      (173, 204, 101),
-      (165, 204, 101),
-      (157, 204, 101),
-      (148, 204, 101),
-      (140, 204, 101),
-      (132, 204, 101),
-      (124, 204, 101),
-      (115, 204, 101),
-      (107, 204, 101),
-      (101, 204, 104),
-      (101, 204, 113),
-      (101, 204, 121),
-      (101, 204, 129),
-      (101, 204, 137),
-      (101, 204, 146),
-      (101, 204, 154),
-      (101, 204, 162),
-      (101, 204, 170),
-      (101, 204, 179),
-      (101, 204, 187),
-      (101, 204, 195),
-      (101, 204, 204),
-      (101, 195, 204),
-      (101, 187, 204),
-      (101, 179, 204),
-      (101, 170, 204),
-      (101, 162, 204),
-      (101, 154, 204),
-      (101, 146, 204),
-      (101, 137, 204),
-      (101, 129, 204),
-      (101, 121, 204),
-      (101, 113, 204),
-      (101, 104, 204),
-      (107, 101, 204),
-      (115, 101, 204),
-      (124, 101, 204),
-      (132, 101, 204),
-      (140, 101, 204),
-      (148, 101, 204),
-      (157, 101, 204),
-      (165, 101, 204),
-      (173, 101, 204),
-      (181, 101, 204),
-      (190, 101, 204),
-      (198, 101, 204),
-      (204, 101, 201),
-      (204, 101, 192),
-      (204, 101, 184),
-      (204, 101, 176),
-      (204, 101, 168),
-      (204, 101, 159),
-      (204, 101, 151),
-      (204, 101, 143),
-      (204, 101, 135),
-      (204, 101, 126),
-      (204, 101, 118),
-      (204, 101, 110)],
- 75: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 118, 101),
-      (204, 126, 101),
-      (204, 134, 101),
-      (204, 142, 101),
-      (204, 150, 101),
-      (204, 159, 101),
-      (204, 167, 101),
-      (204, 175, 101),
-      (204, 183, 101),
-      (204, 191, 101),
-      (204, 199, 101),
-      (199, 204, 101),
-      (191, 204, 101),
-      (183, 204, 101),
-      (175, 204, 101),
-      (167, 204, 101),
-      (159, 204, 101),
-      (150, 204, 101),
-      (142, 204, 101),
-      (134, 204, 101),
-      (126, 204, 101),
-      (118, 204, 101),
-      (110, 204, 101),
-      (101, 204, 102),
-      (101, 204, 110),
-      (101, 204, 118),
-      (101, 204, 126),
-      (101, 204, 134),
-      (101, 204, 142),
-      (101, 204, 150),
-      (101, 204, 159),
-      (101, 204, 167),
-      (101, 204, 175),
-      (101, 204, 183),
-      (101, 204, 191),
-      (101, 204, 199),
-      (101, 199, 204),
-      (101, 191, 204),
-      (101, 183, 204),
-      (101, 175, 204),
-      (101, 167, 204),
-      (101, 159, 204),
-      (101, 150, 204),
-      (101, 142, 204),
-      (101, 134, 204),
-      (101, 126, 204),
-      (101, 118, 204),
-      (101, 110, 204),
-      (101, 101, 204),
-      (110, 101, 204),
-      (118, 101, 204),
-      (126, 101, 204),
-      (134, 101, 204),
-      (142, 101, 204),
-      (150, 101, 204),
-      (159, 101, 204),
-      (167, 101, 204),
-      (175, 101, 204),
-      (183, 101, 204),
-      (191, 101, 204),
-      (199, 101, 204),
-      (204, 101, 199),
-      (204, 101, 191),
-      (204, 101, 183),
-      (204, 101, 175),
-      (204, 101, 167),
-      (204, 101, 159),
-      (204, 101, 150),
-      (204, 101, 142),
-      (204, 101, 134),
-      (204, 101, 126),
-      (204, 101, 118),
-      (204, 101, 110)],
- 76: [(204, 101, 101),
-      (204, 110, 101),
-      (204, 118, 101),
-      (204, 126, 101),
-      (204, 134, 101),
-      (204, 142, 101),
-      (204, 150, 101),
-      (204, 158, 101),
-      (204, 166, 101),
-      (204, 174, 101),
-      (204, 182, 101),
-      (204, 190, 101),
-      (204, 198, 101),
-      (201, 204, 101),
-      (193, 204, 101),
-      (185, 204, 101),
-      (177, 204, 101),
-      (169, 204, 101),
-      (161, 204, 101),
-      (153, 204, 101),
-      (144, 204, 101),
-      (136, 204, 101),
-      (128, 204, 101),
-      (120, 204, 101),
-      (112, 204, 101),
-      (104, 204, 101),
-      (101, 204, 107),
-      (101, 204, 115),
-      (101, 204, 123),
-      (101, 204, 131),
-      (101, 204, 139),
-      (101, 204, 147),
-      (101, 204, 155),
-      (101, 204, 163),
-      (101, 204, 171),
-      (101, 204, 179),
-      (101, 204, 187),
-      (101, 204, 195),
-      (101, 204, 204),
-      (101, 195, 204),
-      (101, 187, 204),
-      (101, 179, 204),
-      (101, 171, 204),
-      (101, 163, 204),
-      (101, 155, 204),
-      (101, 147, 204),
-      (101, 139, 204),
-      (101, 131, 204),
-      (101, 123, 204),
-      (101, 115, 204),
-      (101, 107, 204),
-      (104, 101, 204),
-      (112, 101, 204),
-      (120, 101, 204),
-      (128, 101, 204),
-      (136, 101, 204),
-      (144, 101, 204),
-      (152, 101, 204),
-      (161, 101, 204),
-      (169, 101, 204),
-      (177, 101, 204),
-      (185, 101, 204),
-      (193, 101, 204),
-      (201, 101, 204),
-      (204, 101, 198),
-      (204, 101, 190),
-      (204, 101, 182),
-      (204, 101, 174),
-      (204, 101, 166),
-      (204, 101, 158),
-      (204, 101, 150),
-      (204, 101, 142),
-      (204, 101, 134),
-      (204, 101, 126),
-      (204, 101, 118),
-      (204, 101, 110)],
- 77: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 117, 101),
-      (204, 125, 101),
-      (204, 133, 101),
-      (204, 141, 101),
-      (204, 149, 101),
-      (204, 157, 101),
-      (204, 165, 101),
-      (204, 173, 101),
-      (204, 181, 101),
-      (204, 189, 101),
-      (204, 197, 101),
-      (202, 204, 101),
-      (194, 204, 101),
-      (186, 204, 101),
-      (178, 204, 101),
-      (170, 204, 101),
-      (162, 204, 101),
-      (154, 204, 101),
-      (147, 204, 101),
-      (139, 204, 101),
-      (131, 204, 101),
-      (123, 204, 101),
-      (115, 204, 101),
-      (107, 204, 101),
-      (101, 204, 104),
-      (101, 204, 112),
-      (101, 204, 120),
-      (101, 204, 128),
-      (101, 204, 136),
-      (101, 204, 144),
-      (101, 204, 152),
-      (101, 204, 160),
-      (101, 204, 168),
-      (101, 204, 176),
-      (101, 204, 184),
-      (101, 204, 192),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 192, 204),
-      (101, 184, 204),
-      (101, 176, 204),
-      (101, 168, 204),
-      (101, 160, 204),
-      (101, 152, 204),
-      (101, 144, 204),
-      (101, 136, 204),
-      (101, 128, 204),
-      (101, 120, 204),
-      (101, 112, 204),
-      (101, 104, 204),
-      (107, 101, 204),
-      (115, 101, 204),
-      (123, 101, 204),
-      (131, 101, 204),
-      (139, 101, 204),
-      (147, 101, 204),
-      (154, 101, 204),
-      (162, 101, 204),
-      (170, 101, 204),
-      (178, 101, 204),
-      (186, 101, 204),
-      (194, 101, 204),
-      (202, 101, 204),
-      (204, 101, 197),
-      (204, 101, 189),
-      (204, 101, 181),
-      (204, 101, 173),
-      (204, 101, 165),
-      (204, 101, 157),
-      (204, 101, 149),
-      (204, 101, 141),
-      (204, 101, 133),
-      (204, 101, 125),
-      (204, 101, 117),
-      (204, 101, 109)],
- 78: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 117, 101),
-      (204, 125, 101),
-      (204, 133, 101),
-      (204, 141, 101),
-      (204, 149, 101),
-      (204, 156, 101),
-      (204, 164, 101),
-      (204, 172, 101),
-      (204, 180, 101),
-      (204, 188, 101),
-      (204, 196, 101),
-      (204, 204, 101),
-      (196, 204, 101),
-      (188, 204, 101),
-      (180, 204, 101),
-      (172, 204, 101),
-      (164, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (141, 204, 101),
-      (133, 204, 101),
-      (125, 204, 101),
-      (117, 204, 101),
-      (109, 204, 101),
-      (102, 204, 101),
-      (101, 204, 109),
-      (101, 204, 117),
-      (101, 204, 125),
-      (101, 204, 133),
-      (101, 204, 141),
-      (101, 204, 149),
-      (101, 204, 156),
-      (101, 204, 164),
-      (101, 204, 172),
-      (101, 204, 180),
-      (101, 204, 188),
-      (101, 204, 196),
-      (101, 204, 204),
-      (101, 196, 204),
-      (101, 188, 204),
-      (101, 180, 204),
-      (101, 172, 204),
-      (101, 164, 204),
-      (101, 156, 204),
-      (101, 149, 204),
-      (101, 141, 204),
-      (101, 133, 204),
-      (101, 125, 204),
-      (101, 117, 204),
-      (101, 109, 204),
-      (101, 102, 204),
-      (109, 101, 204),
-      (117, 101, 204),
-      (125, 101, 204),
-      (133, 101, 204),
-      (141, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (164, 101, 204),
-      (172, 101, 204),
-      (180, 101, 204),
-      (188, 101, 204),
-      (196, 101, 204),
-      (203, 101, 204),
-      (204, 101, 196),
-      (204, 101, 188),
-      (204, 101, 180),
-      (204, 101, 172),
-      (204, 101, 164),
-      (204, 101, 156),
-      (204, 101, 149),
-      (204, 101, 141),
-      (204, 101, 133),
-      (204, 101, 125),
-      (204, 101, 117),
-      (204, 101, 109)],
- 79: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 117, 101),
-      (204, 125, 101),
-      (204, 132, 101),
-      (204, 140, 101),
-      (204, 148, 101),
-      (204, 156, 101),
-      (204, 163, 101),
-      (204, 171, 101),
-      (204, 179, 101),
-      (204, 187, 101),
-      (204, 194, 101),
-      (204, 202, 101),
-      (197, 204, 101),
-      (189, 204, 101),
-      (182, 204, 101),
-      (174, 204, 101),
-      (166, 204, 101),
-      (158, 204, 101),
-      (151, 204, 101),
-      (143, 204, 101),
-      (135, 204, 101),
-      (127, 204, 101),
-      (120, 204, 101),
-      (112, 204, 101),
-      (104, 204, 101),
-      (101, 204, 107),
-      (101, 204, 114),
-      (101, 204, 122),
-      (101, 204, 130),
-      (101, 204, 138),
-      (101, 204, 145),
-      (101, 204, 153),
-      (101, 204, 161),
-      (101, 204, 169),
-      (101, 204, 176),
-      (101, 204, 184),
-      (101, 204, 192),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 192, 204),
-      (101, 184, 204),
-      (101, 176, 204),
-      (101, 169, 204),
-      (101, 161, 204),
-      (101, 153, 204),
-      (101, 145, 204),
-      (101, 138, 204),
-      (101, 130, 204),
-      (101, 122, 204),
-      (101, 114, 204),
-      (101, 107, 204),
-      (104, 101, 204),
-      (112, 101, 204),
-      (120, 101, 204),
-      (127, 101, 204),
-      (135, 101, 204),
-      (143, 101, 204),
-      (151, 101, 204),
-      (158, 101, 204),
-      (166, 101, 204),
-      (174, 101, 204),
-      (182, 101, 204),
-      (189, 101, 204),
-      (197, 101, 204),
-      (204, 101, 202),
-      (204, 101, 194),
-      (204, 101, 187),
-      (204, 101, 179),
-      (204, 101, 171),
-      (204, 101, 163),
-      (204, 101, 156),
-      (204, 101, 148),
-      (204, 101, 140),
-      (204, 101, 132),
-      (204, 101, 125),
-      (204, 101, 117),
-      (204, 101, 109)],
- 80: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 117, 101),
-      (204, 124, 101),
-      (204, 132, 101),
-      (204, 140, 101),
-      (204, 147, 101),
-      (204, 155, 101),
-      (204, 163, 101),
-      (204, 170, 101),
-      (204, 178, 101),
-      (204, 186, 101),
-      (204, 193, 101),
-      (204, 201, 101),
-      (198, 204, 101),
-      (191, 204, 101),
-      (183, 204, 101),
-      (175, 204, 101),
-      (168, 204, 101),
-      (160, 204, 101),
-      (153, 204, 101),
-      (145, 204, 101),
-      (137, 204, 101),
-      (130, 204, 101),
-      (122, 204, 101),
-      (114, 204, 101),
-      (107, 204, 101),
-      (101, 204, 104),
-      (101, 204, 112),
-      (101, 204, 119),
-      (101, 204, 127),
-      (101, 204, 135),
-      (101, 204, 142),
-      (101, 204, 150),
-      (101, 204, 158),
-      (101, 204, 165),
-      (101, 204, 173),
-      (101, 204, 181),
-      (101, 204, 188),
-      (101, 204, 196),
-      (101, 204, 204),
-      (101, 196, 204),
-      (101, 188, 204),
-      (101, 181, 204),
-      (101, 173, 204),
-      (101, 165, 204),
-      (101, 158, 204),
-      (101, 150, 204),
-      (101, 142, 204),
-      (101, 135, 204),
-      (101, 127, 204),
-      (101, 119, 204),
-      (101, 112, 204),
-      (101, 104, 204),
-      (107, 101, 204),
-      (114, 101, 204),
-      (122, 101, 204),
-      (130, 101, 204),
-      (137, 101, 204),
-      (145, 101, 204),
-      (152, 101, 204),
-      (160, 101, 204),
-      (168, 101, 204),
-      (175, 101, 204),
-      (183, 101, 204),
-      (191, 101, 204),
-      (198, 101, 204),
-      (204, 101, 201),
-      (204, 101, 193),
-      (204, 101, 186),
-      (204, 101, 178),
-      (204, 101, 170),
-      (204, 101, 163),
-      (204, 101, 155),
-      (204, 101, 147),
-      (204, 101, 140),
-      (204, 101, 132),
-      (204, 101, 124),
-      (204, 101, 117),
-      (204, 101, 109)],
- 81: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 117, 101),
-      (204, 124, 101),
-      (204, 132, 101),
-      (204, 139, 101),
-      (204, 147, 101),
-      (204, 154, 101),
-      (204, 162, 101),
-      (204, 170, 101),
-      (204, 177, 101),
-      (204, 185, 101),
-      (204, 192, 101),
-      (204, 200, 101),
-      (200, 204, 101),
-      (192, 204, 101),
-      (185, 204, 101),
-      (177, 204, 101),
-      (169, 204, 101),
-      (162, 204, 101),
-      (154, 204, 101),
-      (147, 204, 101),
-      (139, 204, 101),
-      (132, 204, 101),
-      (124, 204, 101),
-      (117, 204, 101),
-      (109, 204, 101),
-      (102, 204, 101),
-      (101, 204, 109),
-      (101, 204, 117),
-      (101, 204, 124),
-      (101, 204, 132),
-      (101, 204, 139),
-      (101, 204, 147),
-      (101, 204, 154),
-      (101, 204, 162),
-      (101, 204, 170),
-      (101, 204, 177),
-      (101, 204, 185),
-      (101, 204, 192),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 192, 204),
-      (101, 185, 204),
-      (101, 177, 204),
-      (101, 169, 204),
-      (101, 162, 204),
-      (101, 154, 204),
-      (101, 147, 204),
-      (101, 139, 204),
-      (101, 132, 204),
-      (101, 124, 204),
-      (101, 117, 204),
-      (101, 109, 204),
-      (101, 102, 204),
-      (109, 101, 204),
-      (117, 101, 204),
-      (124, 101, 204),
-      (132, 101, 204),
-      (139, 101, 204),
-      (147, 101, 204),
-      (154, 101, 204),
-      (162, 101, 204),
-      (169, 101, 204),
-      (177, 101, 204),
-      (185, 101, 204),
-      (192, 101, 204),
-      (200, 101, 204),
-      (204, 101, 200),
-      (204, 101, 192),
-      (204, 101, 185),
-      (204, 101, 177),
-      (204, 101, 169),
-      (204, 101, 162),
-      (204, 101, 154),
-      (204, 101, 147),
-      (204, 101, 139),
-      (204, 101, 132),
-      (204, 101, 124),
-      (204, 101, 117),
-      (204, 101, 109)],
- 82: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 124, 101),
-      (204, 131, 101),
-      (204, 139, 101),
-      (204, 146, 101),
-      (204, 154, 101),
-      (204, 161, 101),
-      (204, 169, 101),
-      (204, 176, 101),
-      (204, 184, 101),
-      (204, 191, 101),
-      (204, 199, 101),
-      (201, 204, 101),
-      (194, 204, 101),
-      (186, 204, 101),
-      (179, 204, 101),
-      (171, 204, 101),
-      (164, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (141, 204, 101),
-      (134, 204, 101),
-      (126, 204, 101),
-      (119, 204, 101),
-      (111, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 114),
-      (101, 204, 121),
-      (101, 204, 129),
-      (101, 204, 136),
-      (101, 204, 144),
-      (101, 204, 151),
-      (101, 204, 159),
-      (101, 204, 166),
-      (101, 204, 174),
-      (101, 204, 181),
-      (101, 204, 189),
-      (101, 204, 196),
-      (101, 204, 204),
-      (101, 196, 204),
-      (101, 189, 204),
-      (101, 181, 204),
-      (101, 174, 204),
-      (101, 166, 204),
-      (101, 159, 204),
-      (101, 151, 204),
-      (101, 144, 204),
-      (101, 136, 204),
-      (101, 129, 204),
-      (101, 121, 204),
-      (101, 114, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (111, 101, 204),
-      (119, 101, 204),
-      (126, 101, 204),
-      (134, 101, 204),
-      (141, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (164, 101, 204),
-      (171, 101, 204),
-      (179, 101, 204),
-      (186, 101, 204),
-      (194, 101, 204),
-      (201, 101, 204),
-      (204, 101, 199),
-      (204, 101, 191),
-      (204, 101, 184),
-      (204, 101, 176),
-      (204, 101, 169),
-      (204, 101, 161),
-      (204, 101, 154),
-      (204, 101, 146),
-      (204, 101, 139),
-      (204, 101, 131),
-      (204, 101, 124),
-      (204, 101, 116),
-      (204, 101, 109)],
- 83: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 124, 101),
-      (204, 131, 101),
-      (204, 138, 101),
-      (204, 146, 101),
-      (204, 153, 101),
-      (204, 160, 101),
-      (204, 168, 101),
-      (204, 175, 101),
-      (204, 183, 101),
-      (204, 190, 101),
-      (204, 197, 101),
-      (202, 204, 101),
-      (195, 204, 101),
-      (188, 204, 101),
-      (180, 204, 101),
-      (173, 204, 101),
-      (165, 204, 101),
-      (158, 204, 101),
-      (151, 204, 101),
-      (143, 204, 101),
-      (136, 204, 101),
-      (129, 204, 101),
-      (121, 204, 101),
-      (114, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 111),
-      (101, 204, 119),
-      (101, 204, 126),
-      (101, 204, 133),
-      (101, 204, 141),
-      (101, 204, 148),
-      (101, 204, 156),
-      (101, 204, 163),
-      (101, 204, 170),
-      (101, 204, 178),
-      (101, 204, 185),
-      (101, 204, 192),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 192, 204),
-      (101, 185, 204),
-      (101, 178, 204),
-      (101, 170, 204),
-      (101, 163, 204),
-      (101, 156, 204),
-      (101, 148, 204),
-      (101, 141, 204),
-      (101, 133, 204),
-      (101, 126, 204),
-      (101, 119, 204),
-      (101, 111, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (114, 101, 204),
-      (121, 101, 204),
-      (129, 101, 204),
-      (136, 101, 204),
-      (143, 101, 204),
-      (151, 101, 204),
-      (158, 101, 204),
-      (165, 101, 204),
-      (173, 101, 204),
-      (180, 101, 204),
-      (188, 101, 204),
-      (195, 101, 204),
-      (202, 101, 204),
-      (204, 101, 197),
-      (204, 101, 190),
-      (204, 101, 183),
-      (204, 101, 175),
-      (204, 101, 168),
-      (204, 101, 160),
-      (204, 101, 153),
-      (204, 101, 146),
-      (204, 101, 138),
-      (204, 101, 131),
-      (204, 101, 124),
-      (204, 101, 116),
-      (204, 101, 109)],
- 84: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 123, 101),
-      (204, 131, 101),
-      (204, 138, 101),
-      (204, 145, 101),
-      (204, 152, 101),
-      (204, 160, 101),
-      (204, 167, 101),
-      (204, 174, 101),
-      (204, 182, 101),
-      (204, 189, 101),
-      (204, 196, 101),
-      (204, 204, 101),
-      (196, 204, 101),
-      (189, 204, 101),
-      (182, 204, 101),
-      (174, 204, 101),
-      (167, 204, 101),
-      (160, 204, 101),
-      (153, 204, 101),
-      (145, 204, 101),
-      (138, 204, 101),
-      (131, 204, 101),
-      (123, 204, 101),
-      (116, 204, 101),
-      (109, 204, 101),
-      (102, 204, 101),
-      (101, 204, 109),
-      (101, 204, 116),
-      (101, 204, 123),
-      (101, 204, 131),
-      (101, 204, 138),
-      (101, 204, 145),
-      (101, 204, 152),
-      (101, 204, 160),
-      (101, 204, 167),
-      (101, 204, 174),
-      (101, 204, 182),
-      (101, 204, 189),
-      (101, 204, 196),
-      (101, 204, 204),
-      (101, 196, 204),
-      (101, 189, 204),
-      (101, 182, 204),
-      (101, 174, 204),
-      (101, 167, 204),
-      (101, 160, 204),
-      (101, 153, 204),
-      (101, 145, 204),
-      (101, 138, 204),
-      (101, 131, 204),
-      (101, 123, 204),
-      (101, 116, 204),
-      (101, 109, 204),
-      (101, 102, 204),
-      (109, 101, 204),
-      (116, 101, 204),
-      (123, 101, 204),
-      (131, 101, 204),
-      (138, 101, 204),
-      (145, 101, 204),
-      (152, 101, 204),
-      (160, 101, 204),
-      (167, 101, 204),
-      (174, 101, 204),
-      (182, 101, 204),
-      (189, 101, 204),
-      (196, 101, 204),
-      (203, 101, 204),
-      (204, 101, 196),
-      (204, 101, 189),
-      (204, 101, 182),
-      (204, 101, 174),
-      (204, 101, 167),
-      (204, 101, 160),
-      (204, 101, 153),
-      (204, 101, 145),
-      (204, 101, 138),
-      (204, 101, 131),
-      (204, 101, 123),
-      (204, 101, 116),
-      (204, 101, 109)],
- 85: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 123, 101),
-      (204, 130, 101),
-      (204, 138, 101),
-      (204, 145, 101),
-      (204, 152, 101),
-      (204, 159, 101),
-      (204, 166, 101),
-      (204, 174, 101),
-      (204, 181, 101),
-      (204, 188, 101),
-      (204, 195, 101),
-      (204, 202, 101),
-      (198, 204, 101),
-      (190, 204, 101),
-      (183, 204, 101),
-      (176, 204, 101),
-      (169, 204, 101),
-      (162, 204, 101),
-      (154, 204, 101),
-      (147, 204, 101),
-      (140, 204, 101),
-      (133, 204, 101),
-      (125, 204, 101),
-      (118, 204, 101),
-      (111, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 114),
-      (101, 204, 121),
-      (101, 204, 128),
-      (101, 204, 135),
-      (101, 204, 142),
-      (101, 204, 149),
-      (101, 204, 157),
-      (101, 204, 164),
-      (101, 204, 171),
-      (101, 204, 178),
-      (101, 204, 186),
-      (101, 204, 193),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 193, 204),
-      (101, 186, 204),
-      (101, 178, 204),
-      (101, 171, 204),
-      (101, 164, 204),
-      (101, 157, 204),
-      (101, 149, 204),
-      (101, 142, 204),
-      (101, 135, 204),
-      (101, 128, 204),
-      (101, 121, 204),
-      (101, 114, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (111, 101, 204),
-      (118, 101, 204),
-      (125, 101, 204),
-      (133, 101, 204),
-      (140, 101, 204),
-      (147, 101, 204),
-      (154, 101, 204),
-      (161, 101, 204),
-      (169, 101, 204),
-      (176, 101, 204),
-      (183, 101, 204),
-      (190, 101, 204),
-      (197, 101, 204),
-      (204, 101, 202),
-      (204, 101, 195),
-      (204, 101, 188),
-      (204, 101, 181),
-      (204, 101, 173),
-      (204, 101, 166),
-      (204, 101, 159),
-      (204, 101, 152),
-      (204, 101, 145),
-      (204, 101, 137),
-      (204, 101, 130),
-      (204, 101, 123),
-      (204, 101, 116),
-      (204, 101, 109)],
- 86: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 123, 101),
-      (204, 130, 101),
-      (204, 137, 101),
-      (204, 144, 101),
-      (204, 151, 101),
-      (204, 158, 101),
-      (204, 166, 101),
-      (204, 173, 101),
-      (204, 180, 101),
-      (204, 187, 101),
-      (204, 194, 101),
-      (204, 201, 101),
-      (199, 204, 101),
-      (192, 204, 101),
-      (185, 204, 101),
-      (177, 204, 101),
-      (170, 204, 101),
-      (163, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (142, 204, 101),
-      (135, 204, 101),
-      (128, 204, 101),
-      (120, 204, 101),
-      (113, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 111),
-      (101, 204, 118),
-      (101, 204, 125),
-      (101, 204, 132),
-      (101, 204, 139),
-      (101, 204, 147),
-      (101, 204, 154),
-      (101, 204, 161),
-      (101, 204, 168),
-      (101, 204, 175),
-      (101, 204, 182),
-      (101, 204, 189),
-      (101, 204, 196),
-      (101, 204, 204),
-      (101, 196, 204),
-      (101, 189, 204),
-      (101, 182, 204),
-      (101, 175, 204),
-      (101, 168, 204),
-      (101, 161, 204),
-      (101, 154, 204),
-      (101, 147, 204),
-      (101, 139, 204),
-      (101, 132, 204),
-      (101, 125, 204),
-      (101, 118, 204),
-      (101, 111, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (113, 101, 204),
-      (120, 101, 204),
-      (128, 101, 204),
-      (135, 101, 204),
-      (142, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (163, 101, 204),
-      (170, 101, 204),
-      (177, 101, 204),
-      (185, 101, 204),
-      (192, 101, 204),
-      (199, 101, 204),
-      (204, 101, 201),
-      (204, 101, 194),
-      (204, 101, 187),
-      (204, 101, 180),
-      (204, 101, 173),
-      (204, 101, 166),
-      (204, 101, 158),
-      (204, 101, 151),
-      (204, 101, 144),
-      (204, 101, 137),
-      (204, 101, 130),
-      (204, 101, 123),
-      (204, 101, 116),
-      (204, 101, 109)],
- 87: [(204, 101, 101),
-      (204, 109, 101),
-      (204, 116, 101),
-      (204, 123, 101),
-      (204, 130, 101),
-      (204, 137, 101),
-      (204, 144, 101),
-      (204, 151, 101),
-      (204, 158, 101),
-      (204, 165, 101),
-      (204, 172, 101),
-      (204, 179, 101),
-      (204, 186, 101),
-      (204, 193, 101),
-      (204, 200, 101),
-      (200, 204, 101),
-      (193, 204, 101),
-      (186, 204, 101),
-      (179, 204, 101),
-      (172, 204, 101),
-      (165, 204, 101),
-      (158, 204, 101),
-      (151, 204, 101),
-      (144, 204, 101),
-      (137, 204, 101),
-      (130, 204, 101),
-      (123, 204, 101),
-      (116, 204, 101),
-      (109, 204, 101),
-      (102, 204, 101),
-      (101, 204, 109),
-      (101, 204, 116),
-      (101, 204, 123),
-      (101, 204, 130),
-      (101, 204, 137),
-      (101, 204, 144),
-      (101, 204, 151),
-      (101, 204, 158),
-      (101, 204, 165),
-      (101, 204, 172),
-      (101, 204, 179),
-      (101, 204, 186),
-      (101, 204, 193),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 193, 204),
-      (101, 186, 204),
-      (101, 179, 204),
-      (101, 172, 204),
-      (101, 165, 204),
-      (101, 158, 204),
-      (101, 151, 204),
-      (101, 144, 204),
-      (101, 137, 204),
-      (101, 130, 204),
-      (101, 123, 204),
-      (101, 116, 204),
-      (101, 109, 204),
-      (101, 102, 204),
-      (109, 101, 204),
-      (116, 101, 204),
-      (123, 101, 204),
-      (130, 101, 204),
-      (137, 101, 204),
-      (144, 101, 204),
-      (151, 101, 204),
-      (158, 101, 204),
-      (165, 101, 204),
-      (172, 101, 204),
-      (179, 101, 204),
-      (186, 101, 204),
-      (193, 101, 204),
-      (200, 101, 204),
-      (204, 101, 200),
-      (204, 101, 193),
-      (204, 101, 186),
-      (204, 101, 179),
-      (204, 101, 172),
-      (204, 101, 165),
-      (204, 101, 158),
-      (204, 101, 151),
-      (204, 101, 144),
-      (204, 101, 137),
-      (204, 101, 130),
-      (204, 101, 123),
-      (204, 101, 116),
-      (204, 101, 109)],
- 88: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 122, 101),
-      (204, 129, 101),
-      (204, 136, 101),
-      (204, 143, 101),
-      (204, 150, 101),
-      (204, 157, 101),
-      (204, 164, 101),
-      (204, 171, 101),
-      (204, 178, 101),
-      (204, 185, 101),
-      (204, 192, 101),
-      (204, 199, 101),
-      (201, 204, 101),
-      (194, 204, 101),
-      (187, 204, 101),
-      (180, 204, 101),
-      (173, 204, 101),
-      (166, 204, 101),
-      (159, 204, 101),
-      (153, 204, 101),
-      (146, 204, 101),
-      (139, 204, 101),
-      (132, 204, 101),
-      (125, 204, 101),
-      (118, 204, 101),
-      (111, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 113),
-      (101, 204, 120),
-      (101, 204, 127),
-      (101, 204, 134),
-      (101, 204, 141),
-      (101, 204, 148),
-      (101, 204, 155),
-      (101, 204, 162),
-      (101, 204, 169),
-      (101, 204, 176),
-      (101, 204, 183),
-      (101, 204, 190),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 190, 204),
-      (101, 183, 204),
-      (101, 176, 204),
-      (101, 169, 204),
-      (101, 162, 204),
-      (101, 155, 204),
-      (101, 148, 204),
-      (101, 141, 204),
-      (101, 134, 204),
-      (101, 127, 204),
-      (101, 120, 204),
-      (101, 113, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (111, 101, 204),
-      (118, 101, 204),
-      (125, 101, 204),
-      (132, 101, 204),
-      (139, 101, 204),
-      (146, 101, 204),
-      (152, 101, 204),
-      (159, 101, 204),
-      (166, 101, 204),
-      (173, 101, 204),
-      (180, 101, 204),
-      (187, 101, 204),
-      (194, 101, 204),
-      (201, 101, 204),
-      (204, 101, 199),
-      (204, 101, 192),
-      (204, 101, 185),
-      (204, 101, 178),
-      (204, 101, 171),
-      (204, 101, 164),
-      (204, 101, 157),
-      (204, 101, 150),
-      (204, 101, 143),
-      (204, 101, 136),
-      (204, 101, 129),
-      (204, 101, 122),
-      (204, 101, 115),
-      (204, 101, 108)],
- 89: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 122, 101),
-      (204, 129, 101),
-      (204, 136, 101),
-      (204, 143, 101),
-      (204, 150, 101),
-      (204, 157, 101),
-      (204, 163, 101),
-      (204, 170, 101),
-      (204, 177, 101),
-      (204, 184, 101),
-      (204, 191, 101),
-      (204, 198, 101),
-      (202, 204, 101),
-      (195, 204, 101),
-      (189, 204, 101),
-      (182, 204, 101),
-      (175, 204, 101),
-      (168, 204, 101),
-      (161, 204, 101),
-      (154, 204, 101),
-      (147, 204, 101),
-      (140, 204, 101),
-      (134, 204, 101),
-      (127, 204, 101),
-      (120, 204, 101),
-      (113, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 111),
-      (101, 204, 118),
-      (101, 204, 124),
-      (101, 204, 131),
-      (101, 204, 138),
-      (101, 204, 145),
-      (101, 204, 152),
-      (101, 204, 159),
-      (101, 204, 166),
-      (101, 204, 173),
-      (101, 204, 179),
-      (101, 204, 186),
-      (101, 204, 193),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 193, 204),
-      (101, 186, 204),
-      (101, 179, 204),
-      (101, 173, 204),
-      (101, 166, 204),
-      (101, 159, 204),
-      (101, 152, 204),
-      (101, 145, 204),
-      (101, 138, 204),
-      (101, 131, 204),
-      (101, 124, 204),
-      (101, 118, 204),
-      (101, 111, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (113, 101, 204),
-      (120, 101, 204),
-      (127, 101, 204),
-      (134, 101, 204),
-      (140, 101, 204),
-      (147, 101, 204),
-      (154, 101, 204),
-      (161, 101, 204),
-      (168, 101, 204),
-      (175, 101, 204),
-      (182, 101, 204),
-      (189, 101, 204),
-      (195, 101, 204),
-      (202, 101, 204),
-      (204, 101, 198),
-      (204, 101, 191),
-      (204, 101, 184),
-      (204, 101, 177),
-      (204, 101, 170),
-      (204, 101, 163),
-      (204, 101, 157),
-      (204, 101, 150),
-      (204, 101, 143),
-      (204, 101, 136),
-      (204, 101, 129),
-      (204, 101, 122),
-      (204, 101, 115),
-      (204, 101, 108)],
- 90: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 122, 101),
-      (204, 129, 101),
-      (204, 136, 101),
-      (204, 142, 101),
-      (204, 149, 101),
-      (204, 156, 101),
-      (204, 163, 101),
-      (204, 170, 101),
-      (204, 176, 101),
-      (204, 183, 101),
-      (204, 190, 101),
-      (204, 197, 101),
-      (204, 204, 101),
-      (197, 204, 101),
-      (190, 204, 101),
-      (183, 204, 101),
-      (176, 204, 101),
-      (169, 204, 101),
-      (163, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (142, 204, 101),
-      (136, 204, 101),
-      (129, 204, 101),
-      (122, 204, 101),
-      (115, 204, 101),
-      (108, 204, 101),
-      (101, 204, 102),
-      (101, 204, 108),
-      (101, 204, 115),
-      (101, 204, 122),
-      (101, 204, 129),
-      (101, 204, 135),
-      (101, 204, 142),
-      (101, 204, 149),
-      (101, 204, 156),
-      (101, 204, 163),
-      (101, 204, 170),
-      (101, 204, 176),
-      (101, 204, 183),
-      (101, 204, 190),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 190, 204),
-      (101, 183, 204),
-      (101, 176, 204),
-      (101, 169, 204),
-      (101, 163, 204),
-      (101, 156, 204),
-      (101, 149, 204),
-      (101, 142, 204),
-      (101, 135, 204),
-      (101, 129, 204),
-      (101, 122, 204),
-      (101, 115, 204),
-      (101, 108, 204),
-      (101, 101, 204),
-      (108, 101, 204),
-      (115, 101, 204),
-      (122, 101, 204),
-      (129, 101, 204),
-      (136, 101, 204),
-      (142, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (163, 101, 204),
-      (169, 101, 204),
-      (176, 101, 204),
-      (183, 101, 204),
-      (190, 101, 204),
-      (197, 101, 204),
-      (204, 101, 203),
-      (204, 101, 197),
-      (204, 101, 190),
-      (204, 101, 183),
-      (204, 101, 176),
-      (204, 101, 169),
-      (204, 101, 163),
-      (204, 101, 156),
-      (204, 101, 149),
-      (204, 101, 142),
-      (204, 101, 135),
-      (204, 101, 129),
-      (204, 101, 122),
-      (204, 101, 115),
-      (204, 101, 108)],
- 91: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 122, 101),
-      (204, 128, 101),
-      (204, 135, 101),
-      (204, 142, 101),
-      (204, 149, 101),
-      (204, 155, 101),
-      (204, 162, 101),
-      (204, 169, 101),
-      (204, 175, 101),
-      (204, 182, 101),
-      (204, 189, 101),
-      (204, 196, 101),
-      (204, 202, 101),
-      (198, 204, 101),
-      (191, 204, 101),
-      (184, 204, 101),
-      (178, 204, 101),
-      (171, 204, 101),
-      (164, 204, 101),
-      (158, 204, 101),
-      (151, 204, 101),
-      (144, 204, 101),
-      (137, 204, 101),
-      (131, 204, 101),
-      (124, 204, 101),
-      (117, 204, 101),
-      (110, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 113),
-      (101, 204, 119),
-      (101, 204, 126),
-      (101, 204, 133),
-      (101, 204, 140),
-      (101, 204, 146),
-      (101, 204, 153),
-      (101, 204, 160),
-      (101, 204, 167),
-      (101, 204, 173),
-      (101, 204, 180),
-      (101, 204, 187),
-      (101, 204, 193),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 193, 204),
-      (101, 187, 204),
-      (101, 180, 204),
-      (101, 173, 204),
-      (101, 167, 204),
-      (101, 160, 204),
-      (101, 153, 204),
-      (101, 146, 204),
-      (101, 140, 204),
-      (101, 133, 204),
-      (101, 126, 204),
-      (101, 119, 204),
-      (101, 113, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (110, 101, 204),
-      (117, 101, 204),
-      (124, 101, 204),
-      (131, 101, 204),
-      (137, 101, 204),
-      (144, 101, 204),
-      (151, 101, 204),
-      (158, 101, 204),
-      (164, 101, 204),
-      (171, 101, 204),
-      (178, 101, 204),
-      (184, 101, 204),
-      (191, 101, 204),
-      (198, 101, 204),
-      (204, 101, 202),
-      (204, 101, 196),
-      (204, 101, 189),
-      (204, 101, 182),
-      (204, 101, 175),
-      (204, 101, 169),
-      (204, 101, 162),
-      (204, 101, 155),
-      (204, 101, 149),
-      (204, 101, 142),
-      (204, 101, 135),
-      (204, 101, 128),
-      (204, 101, 122),
-      (204, 101, 115),
-      (204, 101, 108)],
- 92: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 121, 101),
-      (204, 128, 101),
-      (204, 135, 101),
-      (204, 141, 101),
-      (204, 148, 101),
-      (204, 155, 101),
-      (204, 161, 101),
-      (204, 168, 101),
-      (204, 175, 101),
-      (204, 181, 101),
-      (204, 188, 101),
-      (204, 195, 101),
-      (204, 201, 101),
-      (199, 204, 101),
-      (192, 204, 101),
-      (186, 204, 101),
-      (179, 204, 101),
-      (172, 204, 101),
-      (166, 204, 101),
-      (159, 204, 101),
-      (153, 204, 101),
-      (146, 204, 101),
-      (139, 204, 101),
-      (133, 204, 101),
-      (126, 204, 101),
-      (119, 204, 101),
-      (113, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 110),
-      (101, 204, 117),
-      (101, 204, 124),
-      (101, 204, 130),
-      (101, 204, 137),
-      (101, 204, 144),
-      (101, 204, 150),
-      (101, 204, 157),
-      (101, 204, 164),
-      (101, 204, 170),
-      (101, 204, 177),
-      (101, 204, 184),
-      (101, 204, 190),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 190, 204),
-      (101, 184, 204),
-      (101, 177, 204),
-      (101, 170, 204),
-      (101, 164, 204),
-      (101, 157, 204),
-      (101, 150, 204),
-      (101, 144, 204),
-      (101, 137, 204),
-      (101, 130, 204),
-      (101, 124, 204),
-      (101, 117, 204),
-      (101, 110, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (113, 101, 204),
-      (119, 101, 204),
-      (126, 101, 204),
-      (133, 101, 204),
-      (139, 101, 204),
-      (146, 101, 204),
-      (152, 101, 204),
-      (159, 101, 204),
-      (166, 101, 204),
-      (172, 101, 204),
-      (179, 101, 204),
-      (186, 101, 204),
-      (192, 101, 204),
-      (199, 101, 204),
-      (204, 101, 201),
-      (204, 101, 195),
-      (204, 101, 188),
-      (204, 101, 181),
-      (204, 101, 175),
-      (204, 101, 168),
-      (204, 101, 161),
-      (204, 101, 155),
-      (204, 101, 148),
-      (204, 101, 141),
-      (204, 101, 135),
-      (204, 101, 128),
-      (204, 101, 121),
-      (204, 101, 115),
-      (204, 101, 108)],
- 93: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 121, 101),
-      (204, 128, 101),
-      (204, 134, 101),
-      (204, 141, 101),
-      (204, 148, 101),
-      (204, 154, 101),
-      (204, 161, 101),
-      (204, 167, 101),
-      (204, 174, 101),
-      (204, 180, 101),
-      (204, 187, 101),
-      (204, 194, 101),
-      (204, 200, 101),
-      (200, 204, 101),
-      (194, 204, 101),
-      (187, 204, 101),
-      (180, 204, 101),
-      (174, 204, 101),
-      (167, 204, 101),
-      (161, 204, 101),
-      (154, 204, 101),
-      (148, 204, 101),
-      (141, 204, 101),
-      (134, 204, 101),
-      (128, 204, 101),
-      (121, 204, 101),
-      (115, 204, 101),
-      (108, 204, 101),
-      (101, 204, 102),
-      (101, 204, 108),
-      (101, 204, 115),
-      (101, 204, 121),
-      (101, 204, 128),
-      (101, 204, 134),
-      (101, 204, 141),
-      (101, 204, 148),
-      (101, 204, 154),
-      (101, 204, 161),
-      (101, 204, 167),
-      (101, 204, 174),
-      (101, 204, 180),
-      (101, 204, 187),
-      (101, 204, 194),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 194, 204),
-      (101, 187, 204),
-      (101, 180, 204),
-      (101, 174, 204),
-      (101, 167, 204),
-      (101, 161, 204),
-      (101, 154, 204),
-      (101, 148, 204),
-      (101, 141, 204),
-      (101, 134, 204),
-      (101, 128, 204),
-      (101, 121, 204),
-      (101, 115, 204),
-      (101, 108, 204),
-      (101, 101, 204),
-      (108, 101, 204),
-      (115, 101, 204),
-      (121, 101, 204),
-      (128, 101, 204),
-      (134, 101, 204),
-      (141, 101, 204),
-      (148, 101, 204),
-      (154, 101, 204),
-      (161, 101, 204),
-      (167, 101, 204),
-      (174, 101, 204),
-      (180, 101, 204),
-      (187, 101, 204),
-      (194, 101, 204),
-      (200, 101, 204),
-      (204, 101, 200),
-      (204, 101, 194),
-      (204, 101, 187),
-      (204, 101, 180),
-      (204, 101, 174),
-      (204, 101, 167),
-      (204, 101, 161),
-      (204, 101, 154),
-      (204, 101, 148),
-      (204, 101, 141),
-      (204, 101, 134),
-      (204, 101, 128),
-      (204, 101, 121),
-      (204, 101, 115),
-      (204, 101, 108)],
- 94: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 115, 101),
-      (204, 121, 101),
-      (204, 128, 101),
-      (204, 134, 101),
-      (204, 141, 101),
-      (204, 147, 101),
-      (204, 154, 101),
-      (204, 160, 101),
-      (204, 167, 101),
-      (204, 173, 101),
-      (204, 180, 101),
-      (204, 186, 101),
-      (204, 193, 101),
-      (204, 199, 101),
-      (201, 204, 101),
-      (195, 204, 101),
-      (188, 204, 101),
-      (182, 204, 101),
-      (175, 204, 101),
-      (169, 204, 101),
-      (162, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (143, 204, 101),
-      (136, 204, 101),
-      (130, 204, 101),
-      (123, 204, 101),
-      (117, 204, 101),
-      (110, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 112),
-      (101, 204, 119),
-      (101, 204, 125),
-      (101, 204, 132),
-      (101, 204, 138),
-      (101, 204, 145),
-      (101, 204, 151),
-      (101, 204, 158),
-      (101, 204, 164),
-      (101, 204, 171),
-      (101, 204, 177),
-      (101, 204, 184),
-      (101, 204, 190),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 190, 204),
-      (101, 184, 204),
-      (101, 177, 204),
-      (101, 171, 204),
-      (101, 164, 204),
-      (101, 158, 204),
-      (101, 151, 204),
-      (101, 145, 204),
-      (101, 138, 204),
-      (101, 132, 204),
-      (101, 125, 204),
-      (101, 119, 204),
-      (101, 112, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (110, 101, 204),
-      (117, 101, 204),
-      (123, 101, 204),
-      (130, 101, 204),
-      (136, 101, 204),
-      (143, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (162, 101, 204),
-      (169, 101, 204),
-      (175, 101, 204),
-      (182, 101, 204),
-      (188, 101, 204),
-      (195, 101, 204),
-      (201, 101, 204),
-      (204, 101, 199),
-      (204, 101, 193),
-      (204, 101, 186),
-      (204, 101, 180),
-      (204, 101, 173),
-      (204, 101, 167),
-      (204, 101, 160),
-      (204, 101, 154),
-      (204, 101, 147),
-      (204, 101, 141),
-      (204, 101, 134),
-      (204, 101, 128),
-      (204, 101, 121),
-      (204, 101, 115),
-      (204, 101, 108)],
- 95: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 114, 101),
-      (204, 121, 101),
-      (204, 127, 101),
-      (204, 134, 101),
-      (204, 140, 101),
-      (204, 147, 101),
-      (204, 153, 101),
-      (204, 159, 101),
-      (204, 166, 101),
-      (204, 172, 101),
-      (204, 179, 101),
-      (204, 185, 101),
-      (204, 192, 101),
-      (204, 198, 101),
-      (202, 204, 101),
-      (196, 204, 101),
-      (190, 204, 101),
-      (183, 204, 101),
-      (177, 204, 101),
-      (170, 204, 101),
-      (164, 204, 101),
-      (157, 204, 101),
-      (151, 204, 101),
-      (144, 204, 101),
-      (138, 204, 101),
-      (132, 204, 101),
-      (125, 204, 101),
-      (119, 204, 101),
-      (112, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 110),
-      (101, 204, 117),
-      (101, 204, 123),
-      (101, 204, 129),
-      (101, 204, 136),
-      (101, 204, 142),
-      (101, 204, 149),
-      (101, 204, 155),
-      (101, 204, 162),
-      (101, 204, 168),
-      (101, 204, 175),
-      (101, 204, 181),
-      (101, 204, 187),
-      (101, 204, 194),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 194, 204),
-      (101, 187, 204),
-      (101, 181, 204),
-      (101, 175, 204),
-      (101, 168, 204),
-      (101, 162, 204),
-      (101, 155, 204),
-      (101, 149, 204),
-      (101, 142, 204),
-      (101, 136, 204),
-      (101, 129, 204),
-      (101, 123, 204),
-      (101, 117, 204),
-      (101, 110, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (112, 101, 204),
-      (119, 101, 204),
-      (125, 101, 204),
-      (132, 101, 204),
-      (138, 101, 204),
-      (144, 101, 204),
-      (151, 101, 204),
-      (157, 101, 204),
-      (164, 101, 204),
-      (170, 101, 204),
-      (177, 101, 204),
-      (183, 101, 204),
-      (190, 101, 204),
-      (196, 101, 204),
-      (202, 101, 204),
-      (204, 101, 198),
-      (204, 101, 192),
-      (204, 101, 185),
-      (204, 101, 179),
-      (204, 101, 172),
-      (204, 101, 166),
-      (204, 101, 159),
-      (204, 101, 153),
-      (204, 101, 147),
-      (204, 101, 140),
-      (204, 101, 134),
-      (204, 101, 127),
-      (204, 101, 121),
-      (204, 101, 114),
-      (204, 101, 108)],
- 96: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 114, 101),
-      (204, 121, 101),
-      (204, 127, 101),
-      (204, 133, 101),
-      (204, 140, 101),
-      (204, 146, 101),
-      (204, 152, 101),
-      (204, 159, 101),
-      (204, 165, 101),
-      (204, 172, 101),
-      (204, 178, 101),
-      (204, 184, 101),
-      (204, 191, 101),
-      (204, 197, 101),
-      (204, 204, 101),
-      (197, 204, 101),
-      (191, 204, 101),
-      (184, 204, 101),
-      (178, 204, 101),
-      (172, 204, 101),
-      (165, 204, 101),
-      (159, 204, 101),
-      (153, 204, 101),
-      (146, 204, 101),
-      (140, 204, 101),
-      (133, 204, 101),
-      (127, 204, 101),
-      (121, 204, 101),
-      (114, 204, 101),
-      (108, 204, 101),
-      (102, 204, 101),
-      (101, 204, 108),
-      (101, 204, 114),
-      (101, 204, 121),
-      (101, 204, 127),
-      (101, 204, 133),
-      (101, 204, 140),
-      (101, 204, 146),
-      (101, 204, 152),
-      (101, 204, 159),
-      (101, 204, 165),
-      (101, 204, 172),
-      (101, 204, 178),
-      (101, 204, 184),
-      (101, 204, 191),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 191, 204),
-      (101, 184, 204),
-      (101, 178, 204),
-      (101, 172, 204),
-      (101, 165, 204),
-      (101, 159, 204),
-      (101, 153, 204),
-      (101, 146, 204),
-      (101, 140, 204),
-      (101, 133, 204),
-      (101, 127, 204),
-      (101, 121, 204),
-      (101, 114, 204),
-      (101, 108, 204),
-      (101, 102, 204),
-      (108, 101, 204),
-      (114, 101, 204),
-      (121, 101, 204),
-      (127, 101, 204),
-      (133, 101, 204),
-      (140, 101, 204),
-      (146, 101, 204),
-      (152, 101, 204),
-      (159, 101, 204),
-      (165, 101, 204),
-      (172, 101, 204),
-      (178, 101, 204),
-      (184, 101, 204),
-      (191, 101, 204),
-      (197, 101, 204),
-      (203, 101, 204),
-      (204, 101, 197),
-      (204, 101, 191),
-      (204, 101, 184),
-      (204, 101, 178),
-      (204, 101, 172),
-      (204, 101, 165),
-      (204, 101, 159),
-      (204, 101, 153),
-      (204, 101, 146),
-      (204, 101, 140),
-      (204, 101, 133),
-      (204, 101, 127),
-      (204, 101, 121),
-      (204, 101, 114),
-      (204, 101, 108)],
- 97: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 114, 101),
-      (204, 120, 101),
-      (204, 127, 101),
-      (204, 133, 101),
-      (204, 139, 101),
-      (204, 146, 101),
-      (204, 152, 101),
-      (204, 158, 101),
-      (204, 165, 101),
-      (204, 171, 101),
-      (204, 177, 101),
-      (204, 184, 101),
-      (204, 190, 101),
-      (204, 196, 101),
-      (204, 202, 101),
-      (198, 204, 101),
-      (192, 204, 101),
-      (186, 204, 101),
-      (179, 204, 101),
-      (173, 204, 101),
-      (167, 204, 101),
-      (160, 204, 101),
-      (154, 204, 101),
-      (148, 204, 101),
-      (141, 204, 101),
-      (135, 204, 101),
-      (129, 204, 101),
-      (123, 204, 101),
-      (116, 204, 101),
-      (110, 204, 101),
-      (104, 204, 101),
-      (101, 204, 106),
-      (101, 204, 112),
-      (101, 204, 118),
-      (101, 204, 125),
-      (101, 204, 131),
-      (101, 204, 137),
-      (101, 204, 144),
-      (101, 204, 150),
-      (101, 204, 156),
-      (101, 204, 162),
-      (101, 204, 169),
-      (101, 204, 175),
-      (101, 204, 181),
-      (101, 204, 188),
-      (101, 204, 194),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 194, 204),
-      (101, 188, 204),
-      (101, 181, 204),
-      (101, 175, 204),
-      (101, 169, 204),
-      (101, 162, 204),
-      (101, 156, 204),
-      (101, 150, 204),
-      (101, 144, 204),
-      (101, 137, 204),
-      (101, 131, 204),
-      (101, 125, 204),
-      (101, 118, 204),
-      (101, 112, 204),
-      (101, 106, 204),
-      (104, 101, 204),
-      (110, 101, 204),
-      (116, 101, 204),
-      (123, 101, 204),
-      (129, 101, 204),
-      (135, 101, 204),
-      (141, 101, 204),
-      (148, 101, 204),
-      (154, 101, 204),
-      (160, 101, 204),
-      (167, 101, 204),
-      (173, 101, 204),
-      (179, 101, 204),
-      (186, 101, 204),
-      (192, 101, 204),
-      (198, 101, 204),
-      (204, 101, 202),
-      (204, 101, 196),
-      (204, 101, 190),
-      (204, 101, 184),
-      (204, 101, 177),
-      (204, 101, 171),
-      (204, 101, 165),
-      (204, 101, 158),
-      (204, 101, 152),
-      (204, 101, 146),
-      (204, 101, 139),
-      (204, 101, 133),
-      (204, 101, 127),
-      (204, 101, 120),
-      (204, 101, 114),
-      (204, 101, 108)],
- 98: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 114, 101),
-      (204, 120, 101),
-      (204, 126, 101),
-      (204, 133, 101),
-      (204, 139, 101),
-      (204, 145, 101),
-      (204, 151, 101),
-      (204, 158, 101),
-      (204, 164, 101),
-      (204, 170, 101),
-      (204, 176, 101),
-      (204, 183, 101),
-      (204, 189, 101),
-      (204, 195, 101),
-      (204, 201, 101),
-      (199, 204, 101),
-      (193, 204, 101),
-      (187, 204, 101),
-      (181, 204, 101),
-      (174, 204, 101),
-      (168, 204, 101),
-      (162, 204, 101),
-      (156, 204, 101),
-      (149, 204, 101),
-      (143, 204, 101),
-      (137, 204, 101),
-      (131, 204, 101),
-      (124, 204, 101),
-      (118, 204, 101),
-      (112, 204, 101),
-      (106, 204, 101),
-      (101, 204, 104),
-      (101, 204, 110),
-      (101, 204, 116),
-      (101, 204, 122),
-      (101, 204, 129),
-      (101, 204, 135),
-      (101, 204, 141),
-      (101, 204, 147),
-      (101, 204, 154),
-      (101, 204, 160),
-      (101, 204, 166),
-      (101, 204, 172),
-      (101, 204, 179),
-      (101, 204, 185),
-      (101, 204, 191),
-      (101, 204, 197),
-      (101, 204, 204),
-      (101, 197, 204),
-      (101, 191, 204),
-      (101, 185, 204),
-      (101, 179, 204),
-      (101, 172, 204),
-      (101, 166, 204),
-      (101, 160, 204),
-      (101, 154, 204),
-      (101, 147, 204),
-      (101, 141, 204),
-      (101, 135, 204),
-      (101, 129, 204),
-      (101, 122, 204),
-      (101, 116, 204),
-      (101, 110, 204),
-      (101, 104, 204),
-      (106, 101, 204),
-      (112, 101, 204),
-      (118, 101, 204),
-      (124, 101, 204),
-      (131, 101, 204),
-      (137, 101, 204),
-      (143, 101, 204),
-      (149, 101, 204),
-      (156, 101, 204),
-      (162, 101, 204),
-      (168, 101, 204),
-      (174, 101, 204),
-      (181, 101, 204),
-      (187, 101, 204),
-      (193, 101, 204),
-      (199, 101, 204),
-      (204, 101, 201),
-      (204, 101, 195),
-      (204, 101, 189),
-      (204, 101, 183),
-      (204, 101, 176),
-      (204, 101, 170),
-      (204, 101, 164),
-      (204, 101, 158),
-      (204, 101, 151),
-      (204, 101, 145),
-      (204, 101, 139),
-      (204, 101, 133),
-      (204, 101, 126),
-      (204, 101, 120),
-      (204, 101, 114),
-      (204, 101, 108)],
- 99: [(204, 101, 101),
-      (204, 108, 101),
-      (204, 114, 101),
-      (204, 120, 101),
-      (204, 126, 101),
-      (204, 132, 101),
-      (204, 139, 101),
-      (204, 145, 101),
-      (204, 151, 101),
-      (204, 157, 101),
-      (204, 163, 101),
-      (204, 170, 101),
-      (204, 176, 101),
-      (204, 182, 101),
-      (204, 188, 101),
-      (204, 194, 101),
-      (204, 200, 101),
-      (200, 204, 101),
-      (194, 204, 101),
-      (188, 204, 101),
-      (182, 204, 101),
-      (176, 204, 101),
-      (169, 204, 101),
-      (163, 204, 101),
-      (157, 204, 101),
-      (151, 204, 101),
-      (145, 204, 101),
-      (139, 204, 101),
-      (132, 204, 101),
-      (126, 204, 101),
-      (120, 204, 101),
-      (114, 204, 101),
-      (108, 204, 101),
-      (101, 204, 102),
-      (101, 204, 108),
-      (101, 204, 114),
-      (101, 204, 120),
-      (101, 204, 126),
-      (101, 204, 132),
-      (101, 204, 139),
-      (101, 204, 145),
-      (101, 204, 151),
-      (101, 204, 157),
-      (101, 204, 163),
-      (101, 204, 170),
-      (101, 204, 176),
-      (101, 204, 182),
-      (101, 204, 188),
-      (101, 204, 194),
-      (101, 204, 200),
-      (101, 200, 204),
-      (101, 194, 204),
-      (101, 188, 204),
-      (101, 182, 204),
-      (101, 176, 204),
-      (101, 169, 204),
-      (101, 163, 204),
-      (101, 157, 204),
-      (101, 151, 204),
-      (101, 145, 204),
-      (101, 139, 204),
-      (101, 132, 204),
-      (101, 126, 204),
-      (101, 120, 204),
-      (101, 114, 204),
-      (101, 108, 204),
-      (101, 101, 204),
-      (108, 101, 204),
-      (114, 101, 204),
-      (120, 101, 204),
-      (126, 101, 204),
-      (132, 101, 204),
-      (139, 101, 204),
-      (145, 101, 204),
-      (151, 101, 204),
-      (157, 101, 204),
-      (163, 101, 204),
-      (169, 101, 204),
-      (176, 101, 204),
-      (182, 101, 204),
-      (188, 101, 204),
-      (194, 101, 204),
-      (200, 101, 204),
-      (204, 101, 200),
-      (204, 101, 194),
-      (204, 101, 188),
-      (204, 101, 182),
-      (204, 101, 176),
-      (204, 101, 169),
-      (204, 101, 163),
-      (204, 101, 157),
-      (204, 101, 151),
-      (204, 101, 145),
-      (204, 101, 139),
-      (204, 101, 132),
-      (204, 101, 126),
-      (204, 101, 120),
-      (204, 101, 114),
-      (204, 101, 108)],
- 100: [(204, 101, 101),
-       (204, 108, 101),
-       (204, 114, 101),
-       (204, 120, 101),
-       (204, 126, 101),
-       (204, 132, 101),
-       (204, 138, 101),
-       (204, 144, 101),
-       (204, 150, 101),
-       (204, 157, 101),
-       (204, 163, 101),
-       (204, 169, 101),
-       (204, 175, 101),
-       (204, 181, 101),
-       (204, 187, 101),
-       (204, 193, 101),
-       (204, 199, 101),
-       (201, 204, 101),
-       (195, 204, 101),
-       (189, 204, 101),
-       (183, 204, 101),
-       (177, 204, 101),
-       (171, 204, 101),
-       (165, 204, 101),
-       (159, 204, 101),
-       (153, 204, 101),
-       (146, 204, 101),
-       (140, 204, 101),
-       (134, 204, 101),
-       (128, 204, 101),
-       (122, 204, 101),
-       (116, 204, 101),
-       (110, 204, 101),
-       (104, 204, 101),
-       (101, 204, 106),
-       (101, 204, 112),
-       (101, 204, 118),
-       (101, 204, 124),
-       (101, 204, 130),
-       (101, 204, 136),
-       (101, 204, 142),
-       (101, 204, 148),
-       (101, 204, 155),
-       (101, 204, 161),
-       (101, 204, 167),
-       (101, 204, 173),
-       (101, 204, 179),
-       (101, 204, 185),
-       (101, 204, 191),
-       (101, 204, 197),
-       (101, 204, 204),
-       (101, 197, 204),
-       (101, 191, 204),
-       (101, 185, 204),
-       (101, 179, 204),
-       (101, 173, 204),
-       (101, 167, 204),
-       (101, 161, 204),
-       (101, 155, 204),
-       (101, 148, 204),
-       (101, 142, 204),
-       (101, 136, 204),
-       (101, 130, 204),
-       (101, 124, 204),
-       (101, 118, 204),
-       (101, 112, 204),
-       (101, 106, 204),
-       (104, 101, 204),
-       (110, 101, 204),
-       (116, 101, 204),
-       (122, 101, 204),
-       (128, 101, 204),
-       (134, 101, 204),
-       (140, 101, 204),
-       (146, 101, 204),
-       (152, 101, 204),
-       (159, 101, 204),
-       (165, 101, 204),
-       (171, 101, 204),
-       (177, 101, 204),
-       (183, 101, 204),
-       (189, 101, 204),
-       (195, 101, 204),
-       (201, 101, 204),
-       (204, 101, 199),
-       (204, 101, 193),
-       (204, 101, 187),
-       (204, 101, 181),
-       (204, 101, 175),
-       (204, 101, 169),
-       (204, 101, 163),
-       (204, 101, 157),
-       (204, 101, 150),
-       (204, 101, 144),
-       (204, 101, 138),
-       (204, 101, 132),
-       (204, 101, 126),
-       (204, 101, 120),
-       (204, 101, 114),
-       (204, 101, 108)],
- 101: [(204, 101, 101),
-       (204, 108, 101),
-       (204, 114, 101),
-       (204, 120, 101),
-       (204, 126, 101),
-       (204, 132, 101),
-       (204, 138, 101),
-       (204, 144, 101),
-       (204, 150, 101),
-       (204, 156, 101),
-       (204, 162, 101),
-       (204, 168, 101),
-       (204, 174, 101),
-       (204, 180, 101),
-       (204, 186, 101),
-       (204, 192, 101),
-       (204, 198, 101),
-       (202, 204, 101),
-       (196, 204, 101),
-       (190, 204, 101),
-       (184, 204, 101),
-       (178, 204, 101),
-       (172, 204, 101),
-       (166, 204, 101),
-       (160, 204, 101),
-       (154, 204, 101),
-       (148, 204, 101),
-       (142, 204, 101),
-       (136, 204, 101),
-       (130, 204, 101),
-       (124, 204, 101),
-       (118, 204, 101),
-       (112, 204, 101),
-       (106, 204, 101),
-       (101, 204, 104),
-       (101, 204, 110),
-       (101, 204, 116),
-       (101, 204, 122),
-       (101, 204, 128),
-       (101, 204, 134),
-       (101, 204, 140),
-       (101, 204, 146),
-       (101, 204, 152),
-       (101, 204, 158),
-       (101, 204, 164),
-       (101, 204, 170),
-       (101, 204, 176),
-       (101, 204, 182),
-       (101, 204, 188),
-       (101, 204, 194),
-       (101, 204, 200),
-       (101, 200, 204),
-       (101, 194, 204),
-       (101, 188, 204),
-       (101, 182, 204),
-       (101, 176, 204),
-       (101, 170, 204),
-       (101, 164, 204),
-       (101, 158, 204),
-       (101, 152, 204),
-       (101, 146, 204),
-       (101, 140, 204),
-       (101, 134, 204),
-       (101, 128, 204),
-       (101, 122, 204),
-       (101, 116, 204),
-       (101, 110, 204),
-       (101, 104, 204),
-       (106, 101, 204),
-       (112, 101, 204),
-       (118, 101, 204),
-       (124, 101, 204),
-       (130, 101, 204),
-       (136, 101, 204),
-       (142, 101, 204),
-       (148, 101, 204),
-       (154, 101, 204),
-       (160, 101, 204),
-       (166, 101, 204),
-       (172, 101, 204),
-       (178, 101, 204),
-       (184, 101, 204),
-       (190, 101, 204),
-       (196, 101, 204),
-       (202, 101, 204),
-       (204, 101, 198),
-       (204, 101, 192),
-       (204, 101, 186),
-       (204, 101, 180),
-       (204, 101, 174),
-       (204, 101, 168),
-       (204, 101, 162),
-       (204, 101, 156),
-       (204, 101, 150),
-       (204, 101, 144),
-       (204, 101, 138),
-       (204, 101, 132),
-       (204, 101, 126),
-       (204, 101, 120),
-       (204, 101, 114),
-       (204, 101, 108)],
- 102: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 126, 101),
-       (204, 132, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 149, 101),
-       (204, 155, 101),
-       (204, 162, 101),
-       (204, 168, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 185, 101),
-       (204, 191, 101),
-       (204, 197, 101),
-       (204, 204, 101),
-       (198, 204, 101),
-       (192, 204, 101),
-       (186, 204, 101),
-       (180, 204, 101),
-       (173, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (156, 204, 101),
-       (150, 204, 101),
-       (144, 204, 101),
-       (138, 204, 101),
-       (132, 204, 101),
-       (125, 204, 101),
-       (119, 204, 101),
-       (114, 204, 101),
-       (108, 204, 101),
-       (102, 204, 101),
-       (101, 204, 108),
-       (101, 204, 114),
-       (101, 204, 120),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 137),
-       (101, 204, 143),
-       (101, 204, 149),
-       (101, 204, 156),
-       (101, 204, 162),
-       (101, 204, 168),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 186),
-       (101, 204, 192),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 192, 204),
-       (101, 186, 204),
-       (101, 180, 204),
-       (101, 173, 204),
-       (101, 167, 204),
-       (101, 162, 204),
-       (101, 156, 204),
-       (101, 149, 204),
-       (101, 143, 204),
-       (101, 137, 204),
-       (101, 131, 204),
-       (101, 125, 204),
-       (101, 119, 204),
-       (101, 114, 204),
-       (101, 108, 204),
-       (101, 102, 204),
-       (107, 101, 204),
-       (113, 101, 204),
-       (119, 101, 204),
-       (125, 101, 204),
-       (132, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (149, 101, 204),
-       (155, 101, 204),
-       (161, 101, 204),
-       (167, 101, 204),
-       (173, 101, 204),
-       (179, 101, 204),
-       (185, 101, 204),
-       (191, 101, 204),
-       (197, 101, 204),
-       (204, 101, 203),
-       (204, 101, 197),
-       (204, 101, 191),
-       (204, 101, 185),
-       (204, 101, 179),
-       (204, 101, 173),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 156),
-       (204, 101, 150),
-       (204, 101, 143),
-       (204, 101, 137),
-       (204, 101, 131),
-       (204, 101, 125),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 103: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 125, 101),
-       (204, 131, 101),
-       (204, 137, 101),
-       (204, 143, 101),
-       (204, 149, 101),
-       (204, 155, 101),
-       (204, 161, 101),
-       (204, 167, 101),
-       (204, 173, 101),
-       (204, 179, 101),
-       (204, 185, 101),
-       (204, 191, 101),
-       (204, 197, 101),
-       (204, 203, 101),
-       (199, 204, 101),
-       (193, 204, 101),
-       (187, 204, 101),
-       (181, 204, 101),
-       (175, 204, 101),
-       (169, 204, 101),
-       (163, 204, 101),
-       (157, 204, 101),
-       (151, 204, 101),
-       (145, 204, 101),
-       (139, 204, 101),
-       (133, 204, 101),
-       (127, 204, 101),
-       (121, 204, 101),
-       (115, 204, 101),
-       (109, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 111),
-       (101, 204, 117),
-       (101, 204, 123),
-       (101, 204, 129),
-       (101, 204, 135),
-       (101, 204, 141),
-       (101, 204, 147),
-       (101, 204, 153),
-       (101, 204, 159),
-       (101, 204, 165),
-       (101, 204, 171),
-       (101, 204, 177),
-       (101, 204, 183),
-       (101, 204, 189),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 189, 204),
-       (101, 183, 204),
-       (101, 177, 204),
-       (101, 171, 204),
-       (101, 165, 204),
-       (101, 159, 204),
-       (101, 153, 204),
-       (101, 147, 204),
-       (101, 141, 204),
-       (101, 135, 204),
-       (101, 129, 204),
-       (101, 123, 204),
-       (101, 117, 204),
-       (101, 111, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (109, 101, 204),
-       (115, 101, 204),
-       (121, 101, 204),
-       (127, 101, 204),
-       (133, 101, 204),
-       (139, 101, 204),
-       (145, 101, 204),
-       (151, 101, 204),
-       (157, 101, 204),
-       (163, 101, 204),
-       (169, 101, 204),
-       (175, 101, 204),
-       (181, 101, 204),
-       (187, 101, 204),
-       (193, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 197),
-       (204, 101, 191),
-       (204, 101, 185),
-       (204, 101, 179),
-       (204, 101, 173),
-       (204, 101, 167),
-       (204, 101, 161),
-       (204, 101, 155),
-       (204, 101, 149),
-       (204, 101, 143),
-       (204, 101, 137),
-       (204, 101, 131),
-       (204, 101, 125),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 104: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 125, 101),
-       (204, 131, 101),
-       (204, 137, 101),
-       (204, 143, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 160, 101),
-       (204, 166, 101),
-       (204, 172, 101),
-       (204, 178, 101),
-       (204, 184, 101),
-       (204, 190, 101),
-       (204, 196, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (194, 204, 101),
-       (188, 204, 101),
-       (182, 204, 101),
-       (176, 204, 101),
-       (170, 204, 101),
-       (164, 204, 101),
-       (158, 204, 101),
-       (153, 204, 101),
-       (147, 204, 101),
-       (141, 204, 101),
-       (135, 204, 101),
-       (129, 204, 101),
-       (123, 204, 101),
-       (117, 204, 101),
-       (111, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 109),
-       (101, 204, 115),
-       (101, 204, 121),
-       (101, 204, 127),
-       (101, 204, 133),
-       (101, 204, 139),
-       (101, 204, 145),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 162),
-       (101, 204, 168),
-       (101, 204, 174),
-       (101, 204, 180),
-       (101, 204, 186),
-       (101, 204, 192),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 192, 204),
-       (101, 186, 204),
-       (101, 180, 204),
-       (101, 174, 204),
-       (101, 168, 204),
-       (101, 162, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 145, 204),
-       (101, 139, 204),
-       (101, 133, 204),
-       (101, 127, 204),
-       (101, 121, 204),
-       (101, 115, 204),
-       (101, 109, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (111, 101, 204),
-       (117, 101, 204),
-       (123, 101, 204),
-       (129, 101, 204),
-       (135, 101, 204),
-       (141, 101, 204),
-       (147, 101, 204),
-       (152, 101, 204),
-       (158, 101, 204),
-       (164, 101, 204),
-       (170, 101, 204),
-       (176, 101, 204),
-       (182, 101, 204),
-       (188, 101, 204),
-       (194, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 196),
-       (204, 101, 190),
-       (204, 101, 184),
-       (204, 101, 178),
-       (204, 101, 172),
-       (204, 101, 166),
-       (204, 101, 160),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 143),
-       (204, 101, 137),
-       (204, 101, 131),
-       (204, 101, 125),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 105: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 125, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 142, 101),
-       (204, 148, 101),
-       (204, 154, 101),
-       (204, 160, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 177, 101),
-       (204, 183, 101),
-       (204, 189, 101),
-       (204, 195, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (195, 204, 101),
-       (189, 204, 101),
-       (183, 204, 101),
-       (177, 204, 101),
-       (171, 204, 101),
-       (166, 204, 101),
-       (160, 204, 101),
-       (154, 204, 101),
-       (148, 204, 101),
-       (142, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (125, 204, 101),
-       (119, 204, 101),
-       (113, 204, 101),
-       (107, 204, 101),
-       (101, 204, 102),
-       (101, 204, 107),
-       (101, 204, 113),
-       (101, 204, 119),
-       (101, 204, 125),
-       (101, 204, 131),
-       (101, 204, 136),
-       (101, 204, 142),
-       (101, 204, 148),
-       (101, 204, 154),
-       (101, 204, 160),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 177),
-       (101, 204, 183),
-       (101, 204, 189),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 189, 204),
-       (101, 183, 204),
-       (101, 177, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 160, 204),
-       (101, 154, 204),
-       (101, 148, 204),
-       (101, 142, 204),
-       (101, 136, 204),
-       (101, 131, 204),
-       (101, 125, 204),
-       (101, 119, 204),
-       (101, 113, 204),
-       (101, 107, 204),
-       (101, 101, 204),
-       (107, 101, 204),
-       (113, 101, 204),
-       (119, 101, 204),
-       (125, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (142, 101, 204),
-       (148, 101, 204),
-       (154, 101, 204),
-       (160, 101, 204),
-       (166, 101, 204),
-       (171, 101, 204),
-       (177, 101, 204),
-       (183, 101, 204),
-       (189, 101, 204),
-       (195, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 195),
-       (204, 101, 189),
-       (204, 101, 183),
-       (204, 101, 177),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 160),
-       (204, 101, 154),
-       (204, 101, 148),
-       (204, 101, 142),
-       (204, 101, 136),
-       (204, 101, 131),
-       (204, 101, 125),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 106: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 125, 101),
-       (204, 130, 101),
-       (204, 136, 101),
-       (204, 142, 101),
-       (204, 148, 101),
-       (204, 153, 101),
-       (204, 159, 101),
-       (204, 165, 101),
-       (204, 171, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 188, 101),
-       (204, 194, 101),
-       (204, 200, 101),
-       (202, 204, 101),
-       (196, 204, 101),
-       (190, 204, 101),
-       (184, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (167, 204, 101),
-       (161, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (144, 204, 101),
-       (138, 204, 101),
-       (132, 204, 101),
-       (127, 204, 101),
-       (121, 204, 101),
-       (115, 204, 101),
-       (109, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 111),
-       (101, 204, 117),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 134),
-       (101, 204, 140),
-       (101, 204, 146),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 163),
-       (101, 204, 169),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 186),
-       (101, 204, 192),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 192, 204),
-       (101, 186, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 169, 204),
-       (101, 163, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 146, 204),
-       (101, 140, 204),
-       (101, 134, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 117, 204),
-       (101, 111, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (109, 101, 204),
-       (115, 101, 204),
-       (121, 101, 204),
-       (127, 101, 204),
-       (132, 101, 204),
-       (138, 101, 204),
-       (144, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (161, 101, 204),
-       (167, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (184, 101, 204),
-       (190, 101, 204),
-       (196, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 194),
-       (204, 101, 188),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 171),
-       (204, 101, 165),
-       (204, 101, 159),
-       (204, 101, 153),
-       (204, 101, 148),
-       (204, 101, 142),
-       (204, 101, 136),
-       (204, 101, 130),
-       (204, 101, 125),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 107: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 119, 101),
-       (204, 124, 101),
-       (204, 130, 101),
-       (204, 136, 101),
-       (204, 142, 101),
-       (204, 147, 101),
-       (204, 153, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 170, 101),
-       (204, 176, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 193, 101),
-       (204, 199, 101),
-       (203, 204, 101),
-       (197, 204, 101),
-       (191, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (174, 204, 101),
-       (168, 204, 101),
-       (163, 204, 101),
-       (157, 204, 101),
-       (151, 204, 101),
-       (145, 204, 101),
-       (140, 204, 101),
-       (134, 204, 101),
-       (128, 204, 101),
-       (122, 204, 101),
-       (117, 204, 101),
-       (111, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 109),
-       (101, 204, 115),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 132),
-       (101, 204, 138),
-       (101, 204, 143),
-       (101, 204, 149),
-       (101, 204, 155),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 172),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 189),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 189, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 172, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 155, 204),
-       (101, 149, 204),
-       (101, 143, 204),
-       (101, 138, 204),
-       (101, 132, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 115, 204),
-       (101, 109, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (111, 101, 204),
-       (117, 101, 204),
-       (122, 101, 204),
-       (128, 101, 204),
-       (134, 101, 204),
-       (140, 101, 204),
-       (145, 101, 204),
-       (151, 101, 204),
-       (157, 101, 204),
-       (163, 101, 204),
-       (168, 101, 204),
-       (174, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (191, 101, 204),
-       (197, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 193),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 176),
-       (204, 101, 170),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 153),
-       (204, 101, 147),
-       (204, 101, 142),
-       (204, 101, 136),
-       (204, 101, 130),
-       (204, 101, 124),
-       (204, 101, 119),
-       (204, 101, 113),
-       (204, 101, 107)],
- 108: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 118, 101),
-       (204, 124, 101),
-       (204, 130, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 147, 101),
-       (204, 152, 101),
-       (204, 158, 101),
-       (204, 164, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 181, 101),
-       (204, 186, 101),
-       (204, 192, 101),
-       (204, 198, 101),
-       (204, 204, 101),
-       (198, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (181, 204, 101),
-       (175, 204, 101),
-       (169, 204, 101),
-       (164, 204, 101),
-       (158, 204, 101),
-       (153, 204, 101),
-       (147, 204, 101),
-       (141, 204, 101),
-       (136, 204, 101),
-       (130, 204, 101),
-       (124, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (107, 204, 101),
-       (102, 204, 101),
-       (101, 204, 107),
-       (101, 204, 113),
-       (101, 204, 119),
-       (101, 204, 124),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 141),
-       (101, 204, 147),
-       (101, 204, 152),
-       (101, 204, 158),
-       (101, 204, 164),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 181),
-       (101, 204, 187),
-       (101, 204, 192),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 192, 204),
-       (101, 187, 204),
-       (101, 181, 204),
-       (101, 175, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 158, 204),
-       (101, 153, 204),
-       (101, 147, 204),
-       (101, 141, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 124, 204),
-       (101, 118, 204),
-       (101, 113, 204),
-       (101, 107, 204),
-       (101, 102, 204),
-       (107, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (124, 101, 204),
-       (130, 101, 204),
-       (136, 101, 204),
-       (141, 101, 204),
-       (147, 101, 204),
-       (152, 101, 204),
-       (158, 101, 204),
-       (164, 101, 204),
-       (169, 101, 204),
-       (175, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (192, 101, 204),
-       (198, 101, 204),
-       (203, 101, 204),
-       (204, 101, 198),
-       (204, 101, 192),
-       (204, 101, 186),
-       (204, 101, 181),
-       (204, 101, 175),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 147),
-       (204, 101, 141),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 124),
-       (204, 101, 118),
-       (204, 101, 113),
-       (204, 101, 107)],
- 109: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 118, 101),
-       (204, 124, 101),
-       (204, 130, 101),
-       (204, 135, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 152, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 169, 101),
-       (204, 174, 101),
-       (204, 180, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 197, 101),
-       (204, 203, 101),
-       (199, 204, 101),
-       (193, 204, 101),
-       (188, 204, 101),
-       (182, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (154, 204, 101),
-       (148, 204, 101),
-       (143, 204, 101),
-       (137, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (120, 204, 101),
-       (115, 204, 101),
-       (109, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 122),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 139),
-       (101, 204, 145),
-       (101, 204, 150),
-       (101, 204, 156),
-       (101, 204, 161),
-       (101, 204, 167),
-       (101, 204, 173),
-       (101, 204, 178),
-       (101, 204, 184),
-       (101, 204, 189),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 189, 204),
-       (101, 184, 204),
-       (101, 178, 204),
-       (101, 173, 204),
-       (101, 167, 204),
-       (101, 161, 204),
-       (101, 156, 204),
-       (101, 150, 204),
-       (101, 145, 204),
-       (101, 139, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 122, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (109, 101, 204),
-       (115, 101, 204),
-       (120, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (137, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (154, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (182, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 197),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 180),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 152),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 124),
-       (204, 101, 118),
-       (204, 101, 113),
-       (204, 101, 107)],
- 110: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 118, 101),
-       (204, 124, 101),
-       (204, 129, 101),
-       (204, 135, 101),
-       (204, 140, 101),
-       (204, 146, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 163, 101),
-       (204, 168, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 185, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (194, 204, 101),
-       (189, 204, 101),
-       (183, 204, 101),
-       (178, 204, 101),
-       (172, 204, 101),
-       (166, 204, 101),
-       (161, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (133, 204, 101),
-       (127, 204, 101),
-       (122, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 120),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 137),
-       (101, 204, 142),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 159),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 176),
-       (101, 204, 181),
-       (101, 204, 187),
-       (101, 204, 192),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 192, 204),
-       (101, 187, 204),
-       (101, 181, 204),
-       (101, 176, 204),
-       (101, 170, 204),
-       (101, 165, 204),
-       (101, 159, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 142, 204),
-       (101, 137, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 120, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (122, 101, 204),
-       (127, 101, 204),
-       (133, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (172, 101, 204),
-       (178, 101, 204),
-       (183, 101, 204),
-       (189, 101, 204),
-       (194, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 185),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 168),
-       (204, 101, 163),
-       (204, 101, 157),
-       (204, 101, 152),
-       (204, 101, 146),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 129),
-       (204, 101, 124),
-       (204, 101, 118),
-       (204, 101, 113),
-       (204, 101, 107)],
- 111: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 113, 101),
-       (204, 118, 101),
-       (204, 124, 101),
-       (204, 129, 101),
-       (204, 135, 101),
-       (204, 140, 101),
-       (204, 146, 101),
-       (204, 151, 101),
-       (204, 157, 101),
-       (204, 162, 101),
-       (204, 168, 101),
-       (204, 173, 101),
-       (204, 179, 101),
-       (204, 184, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (184, 204, 101),
-       (179, 204, 101),
-       (173, 204, 101),
-       (168, 204, 101),
-       (162, 204, 101),
-       (157, 204, 101),
-       (151, 204, 101),
-       (146, 204, 101),
-       (140, 204, 101),
-       (135, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (107, 204, 101),
-       (102, 204, 101),
-       (101, 204, 107),
-       (101, 204, 113),
-       (101, 204, 118),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 146),
-       (101, 204, 151),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 168),
-       (101, 204, 173),
-       (101, 204, 179),
-       (101, 204, 184),
-       (101, 204, 190),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 190, 204),
-       (101, 184, 204),
-       (101, 179, 204),
-       (101, 173, 204),
-       (101, 168, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 151, 204),
-       (101, 146, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 118, 204),
-       (101, 113, 204),
-       (101, 107, 204),
-       (101, 102, 204),
-       (107, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (135, 101, 204),
-       (140, 101, 204),
-       (146, 101, 204),
-       (151, 101, 204),
-       (157, 101, 204),
-       (162, 101, 204),
-       (168, 101, 204),
-       (173, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 184),
-       (204, 101, 179),
-       (204, 101, 173),
-       (204, 101, 168),
-       (204, 101, 162),
-       (204, 101, 157),
-       (204, 101, 151),
-       (204, 101, 146),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 129),
-       (204, 101, 124),
-       (204, 101, 118),
-       (204, 101, 113),
-       (204, 101, 107)],
- 112: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 118, 101),
-       (204, 123, 101),
-       (204, 129, 101),
-       (204, 134, 101),
-       (204, 140, 101),
-       (204, 145, 101),
-       (204, 151, 101),
-       (204, 156, 101),
-       (204, 162, 101),
-       (204, 167, 101),
-       (204, 173, 101),
-       (204, 178, 101),
-       (204, 183, 101),
-       (204, 189, 101),
-       (204, 194, 101),
-       (204, 200, 101),
-       (202, 204, 101),
-       (196, 204, 101),
-       (191, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (153, 204, 101),
-       (147, 204, 101),
-       (142, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (125, 204, 101),
-       (120, 204, 101),
-       (114, 204, 101),
-       (109, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 122),
-       (101, 204, 127),
-       (101, 204, 132),
-       (101, 204, 138),
-       (101, 204, 143),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 171),
-       (101, 204, 176),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 176, 204),
-       (101, 171, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 143, 204),
-       (101, 138, 204),
-       (101, 132, 204),
-       (101, 127, 204),
-       (101, 122, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (109, 101, 204),
-       (114, 101, 204),
-       (120, 101, 204),
-       (125, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (142, 101, 204),
-       (147, 101, 204),
-       (152, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (191, 101, 204),
-       (196, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 194),
-       (204, 101, 189),
-       (204, 101, 183),
-       (204, 101, 178),
-       (204, 101, 173),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 145),
-       (204, 101, 140),
-       (204, 101, 134),
-       (204, 101, 129),
-       (204, 101, 123),
-       (204, 101, 118),
-       (204, 101, 112),
-       (204, 101, 107)],
- 113: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 118, 101),
-       (204, 123, 101),
-       (204, 129, 101),
-       (204, 134, 101),
-       (204, 139, 101),
-       (204, 145, 101),
-       (204, 150, 101),
-       (204, 156, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 172, 101),
-       (204, 177, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 194, 101),
-       (204, 199, 101),
-       (203, 204, 101),
-       (197, 204, 101),
-       (192, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (170, 204, 101),
-       (165, 204, 101),
-       (159, 204, 101),
-       (154, 204, 101),
-       (148, 204, 101),
-       (143, 204, 101),
-       (138, 204, 101),
-       (132, 204, 101),
-       (127, 204, 101),
-       (121, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 130),
-       (101, 204, 136),
-       (101, 204, 141),
-       (101, 204, 147),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 185),
-       (101, 204, 190),
-       (101, 204, 195),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 195, 204),
-       (101, 190, 204),
-       (101, 185, 204),
-       (101, 179, 204),
-       (101, 174, 204),
-       (101, 168, 204),
-       (101, 163, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 147, 204),
-       (101, 141, 204),
-       (101, 136, 204),
-       (101, 130, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (127, 101, 204),
-       (132, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (154, 101, 204),
-       (159, 101, 204),
-       (165, 101, 204),
-       (170, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (192, 101, 204),
-       (197, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 194),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 177),
-       (204, 101, 172),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 156),
-       (204, 101, 150),
-       (204, 101, 145),
-       (204, 101, 139),
-       (204, 101, 134),
-       (204, 101, 129),
-       (204, 101, 123),
-       (204, 101, 118),
-       (204, 101, 112),
-       (204, 101, 107)],
- 114: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 118, 101),
-       (204, 123, 101),
-       (204, 128, 101),
-       (204, 134, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 193, 101),
-       (204, 198, 101),
-       (204, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (177, 204, 101),
-       (171, 204, 101),
-       (166, 204, 101),
-       (161, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (134, 204, 101),
-       (128, 204, 101),
-       (123, 204, 101),
-       (118, 204, 101),
-       (112, 204, 101),
-       (107, 204, 101),
-       (102, 204, 101),
-       (101, 204, 107),
-       (101, 204, 112),
-       (101, 204, 118),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 134),
-       (101, 204, 139),
-       (101, 204, 144),
-       (101, 204, 150),
-       (101, 204, 155),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 177),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 155, 204),
-       (101, 150, 204),
-       (101, 144, 204),
-       (101, 139, 204),
-       (101, 134, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 118, 204),
-       (101, 112, 204),
-       (101, 107, 204),
-       (101, 102, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (118, 101, 204),
-       (123, 101, 204),
-       (128, 101, 204),
-       (134, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (171, 101, 204),
-       (177, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (203, 101, 204),
-       (204, 101, 198),
-       (204, 101, 193),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 134),
-       (204, 101, 128),
-       (204, 101, 123),
-       (204, 101, 118),
-       (204, 101, 112),
-       (204, 101, 107)],
- 115: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 123, 101),
-       (204, 128, 101),
-       (204, 133, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 149, 101),
-       (204, 155, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 171, 101),
-       (204, 176, 101),
-       (204, 181, 101),
-       (204, 187, 101),
-       (204, 192, 101),
-       (204, 197, 101),
-       (204, 203, 101),
-       (199, 204, 101),
-       (194, 204, 101),
-       (188, 204, 101),
-       (183, 204, 101),
-       (178, 204, 101),
-       (172, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (146, 204, 101),
-       (141, 204, 101),
-       (135, 204, 101),
-       (130, 204, 101),
-       (125, 204, 101),
-       (119, 204, 101),
-       (114, 204, 101),
-       (109, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 110),
-       (101, 204, 116),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 132),
-       (101, 204, 137),
-       (101, 204, 142),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 158),
-       (101, 204, 164),
-       (101, 204, 169),
-       (101, 204, 174),
-       (101, 204, 180),
-       (101, 204, 185),
-       (101, 204, 190),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 190, 204),
-       (101, 185, 204),
-       (101, 180, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 158, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 142, 204),
-       (101, 137, 204),
-       (101, 132, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 116, 204),
-       (101, 110, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (109, 101, 204),
-       (114, 101, 204),
-       (119, 101, 204),
-       (125, 101, 204),
-       (130, 101, 204),
-       (135, 101, 204),
-       (141, 101, 204),
-       (146, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (162, 101, 204),
-       (167, 101, 204),
-       (172, 101, 204),
-       (178, 101, 204),
-       (183, 101, 204),
-       (188, 101, 204),
-       (194, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 197),
-       (204, 101, 192),
-       (204, 101, 187),
-       (204, 101, 181),
-       (204, 101, 176),
-       (204, 101, 171),
-       (204, 101, 165),
-       (204, 101, 160),
-       (204, 101, 155),
-       (204, 101, 149),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 123),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 116: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 123, 101),
-       (204, 128, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 144, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 181, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (195, 204, 101),
-       (189, 204, 101),
-       (184, 204, 101),
-       (179, 204, 101),
-       (174, 204, 101),
-       (168, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (153, 204, 101),
-       (147, 204, 101),
-       (142, 204, 101),
-       (137, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (121, 204, 101),
-       (116, 204, 101),
-       (110, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 119),
-       (101, 204, 124),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 145),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 161),
-       (101, 204, 167),
-       (101, 204, 172),
-       (101, 204, 177),
-       (101, 204, 182),
-       (101, 204, 188),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 188, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 161, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 145, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 124, 204),
-       (101, 119, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (110, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (137, 101, 204),
-       (142, 101, 204),
-       (147, 101, 204),
-       (152, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (168, 101, 204),
-       (174, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (189, 101, 204),
-       (195, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 181),
-       (204, 101, 175),
-       (204, 101, 170),
-       (204, 101, 165),
-       (204, 101, 160),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 144),
-       (204, 101, 138),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 123),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 117: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 128, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 180, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 196, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (196, 204, 101),
-       (190, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (175, 204, 101),
-       (169, 204, 101),
-       (164, 204, 101),
-       (159, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (143, 204, 101),
-       (138, 204, 101),
-       (133, 204, 101),
-       (128, 204, 101),
-       (122, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (107, 204, 101),
-       (101, 204, 102),
-       (101, 204, 107),
-       (101, 204, 112),
-       (101, 204, 117),
-       (101, 204, 122),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 138),
-       (101, 204, 143),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 159),
-       (101, 204, 164),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 185),
-       (101, 204, 190),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 190, 204),
-       (101, 185, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 159, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 143, 204),
-       (101, 138, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 122, 204),
-       (101, 117, 204),
-       (101, 112, 204),
-       (101, 107, 204),
-       (101, 101, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (117, 101, 204),
-       (122, 101, 204),
-       (128, 101, 204),
-       (133, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (159, 101, 204),
-       (164, 101, 204),
-       (170, 101, 204),
-       (175, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (190, 101, 204),
-       (196, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 196),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 180),
-       (204, 101, 175),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 143),
-       (204, 101, 138),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 118: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 148, 101),
-       (204, 153, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 169, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 184, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 200, 101),
-       (202, 204, 101),
-       (197, 204, 101),
-       (191, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (145, 204, 101),
-       (140, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (119, 204, 101),
-       (114, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 110),
-       (101, 204, 115),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 136),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 167),
-       (101, 204, 172),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 188),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 188, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 136, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 115, 204),
-       (101, 110, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (114, 101, 204),
-       (119, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (134, 101, 204),
-       (140, 101, 204),
-       (145, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (191, 101, 204),
-       (197, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 184),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 153),
-       (204, 101, 148),
-       (204, 101, 143),
-       (204, 101, 138),
-       (204, 101, 133),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 119: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 132, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 148, 101),
-       (204, 153, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 168, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 184, 101),
-       (204, 189, 101),
-       (204, 194, 101),
-       (204, 199, 101),
-       (203, 204, 101),
-       (198, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (177, 204, 101),
-       (172, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (146, 204, 101),
-       (141, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (125, 204, 101),
-       (120, 204, 101),
-       (115, 204, 101),
-       (110, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 114),
-       (101, 204, 119),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 134),
-       (101, 204, 139),
-       (101, 204, 144),
-       (101, 204, 149),
-       (101, 204, 155),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 186),
-       (101, 204, 191),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 191, 204),
-       (101, 186, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 170, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 155, 204),
-       (101, 149, 204),
-       (101, 144, 204),
-       (101, 139, 204),
-       (101, 134, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 119, 204),
-       (101, 114, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (110, 101, 204),
-       (115, 101, 204),
-       (120, 101, 204),
-       (125, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (141, 101, 204),
-       (146, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (161, 101, 204),
-       (167, 101, 204),
-       (172, 101, 204),
-       (177, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (192, 101, 204),
-       (197, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 194),
-       (204, 101, 189),
-       (204, 101, 184),
-       (204, 101, 179),
-       (204, 101, 173),
-       (204, 101, 168),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 148),
-       (204, 101, 143),
-       (204, 101, 137),
-       (204, 101, 132),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 120: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 132, 101),
-       (204, 137, 101),
-       (204, 142, 101),
-       (204, 147, 101),
-       (204, 152, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 168, 101),
-       (204, 173, 101),
-       (204, 178, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 193, 101),
-       (204, 198, 101),
-       (204, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (188, 204, 101),
-       (183, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (168, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (153, 204, 101),
-       (147, 204, 101),
-       (142, 204, 101),
-       (137, 204, 101),
-       (132, 204, 101),
-       (127, 204, 101),
-       (122, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (107, 204, 101),
-       (102, 204, 101),
-       (101, 204, 107),
-       (101, 204, 112),
-       (101, 204, 117),
-       (101, 204, 122),
-       (101, 204, 127),
-       (101, 204, 132),
-       (101, 204, 137),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 153),
-       (101, 204, 158),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 173),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 188),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 188, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 173, 204),
-       (101, 168, 204),
-       (101, 163, 204),
-       (101, 158, 204),
-       (101, 152, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 137, 204),
-       (101, 132, 204),
-       (101, 127, 204),
-       (101, 122, 204),
-       (101, 117, 204),
-       (101, 112, 204),
-       (101, 107, 204),
-       (101, 102, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (117, 101, 204),
-       (122, 101, 204),
-       (127, 101, 204),
-       (132, 101, 204),
-       (137, 101, 204),
-       (142, 101, 204),
-       (147, 101, 204),
-       (152, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (168, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (183, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (204, 101, 203),
-       (204, 101, 198),
-       (204, 101, 193),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 178),
-       (204, 101, 173),
-       (204, 101, 168),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 147),
-       (204, 101, 142),
-       (204, 101, 137),
-       (204, 101, 132),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 121: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 132, 101),
-       (204, 137, 101),
-       (204, 142, 101),
-       (204, 147, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 162, 101),
-       (204, 167, 101),
-       (204, 172, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 193, 101),
-       (204, 198, 101),
-       (204, 203, 101),
-       (199, 204, 101),
-       (194, 204, 101),
-       (189, 204, 101),
-       (184, 204, 101),
-       (179, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (164, 204, 101),
-       (159, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (134, 204, 101),
-       (128, 204, 101),
-       (123, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 110),
-       (101, 204, 115),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 145),
-       (101, 204, 150),
-       (101, 204, 155),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 176),
-       (101, 204, 181),
-       (101, 204, 186),
-       (101, 204, 191),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 191, 204),
-       (101, 186, 204),
-       (101, 181, 204),
-       (101, 176, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 155, 204),
-       (101, 150, 204),
-       (101, 145, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 115, 204),
-       (101, 110, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (123, 101, 204),
-       (128, 101, 204),
-       (134, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (159, 101, 204),
-       (164, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (189, 101, 204),
-       (194, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 198),
-       (204, 101, 193),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 172),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 157),
-       (204, 101, 152),
-       (204, 101, 147),
-       (204, 101, 142),
-       (204, 101, 137),
-       (204, 101, 132),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 122: [(204, 101, 101),
-       (204, 107, 101),
-       (204, 112, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 132, 101),
-       (204, 137, 101),
-       (204, 142, 101),
-       (204, 147, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 162, 101),
-       (204, 167, 101),
-       (204, 172, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 192, 101),
-       (204, 197, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (175, 204, 101),
-       (170, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (145, 204, 101),
-       (140, 204, 101),
-       (135, 204, 101),
-       (130, 204, 101),
-       (125, 204, 101),
-       (120, 204, 101),
-       (115, 204, 101),
-       (110, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 113),
-       (101, 204, 118),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 138),
-       (101, 204, 143),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 158),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 173),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 188),
-       (101, 204, 193),
-       (101, 204, 198),
-       (101, 204, 204),
-       (101, 198, 204),
-       (101, 193, 204),
-       (101, 188, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 173, 204),
-       (101, 168, 204),
-       (101, 163, 204),
-       (101, 158, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 143, 204),
-       (101, 138, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 118, 204),
-       (101, 113, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (110, 101, 204),
-       (115, 101, 204),
-       (120, 101, 204),
-       (125, 101, 204),
-       (130, 101, 204),
-       (135, 101, 204),
-       (140, 101, 204),
-       (145, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (170, 101, 204),
-       (175, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 197),
-       (204, 101, 192),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 172),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 157),
-       (204, 101, 152),
-       (204, 101, 147),
-       (204, 101, 142),
-       (204, 101, 137),
-       (204, 101, 132),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 117),
-       (204, 101, 112),
-       (204, 101, 107)],
- 123: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 126, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 151, 101),
-       (204, 156, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 176, 101),
-       (204, 181, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (196, 204, 101),
-       (191, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (166, 204, 101),
-       (161, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (146, 204, 101),
-       (141, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (121, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (106, 204, 101),
-       (101, 204, 102),
-       (101, 204, 106),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 136),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 176),
-       (101, 204, 181),
-       (101, 204, 186),
-       (101, 204, 191),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 191, 204),
-       (101, 186, 204),
-       (101, 181, 204),
-       (101, 176, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 136, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 106, 204),
-       (101, 101, 204),
-       (106, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (141, 101, 204),
-       (146, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (191, 101, 204),
-       (196, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 181),
-       (204, 101, 176),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 136),
-       (204, 101, 131),
-       (204, 101, 126),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 124: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 126, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 151, 101),
-       (204, 156, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 200, 101),
-       (202, 204, 101),
-       (197, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (177, 204, 101),
-       (172, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (143, 204, 101),
-       (138, 204, 101),
-       (133, 204, 101),
-       (128, 204, 101),
-       (123, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 110),
-       (101, 204, 115),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 134),
-       (101, 204, 139),
-       (101, 204, 144),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 159),
-       (101, 204, 164),
-       (101, 204, 169),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 184),
-       (101, 204, 189),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 189, 204),
-       (101, 184, 204),
-       (101, 179, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 159, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 144, 204),
-       (101, 139, 204),
-       (101, 134, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 115, 204),
-       (101, 110, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (123, 101, 204),
-       (128, 101, 204),
-       (133, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (162, 101, 204),
-       (167, 101, 204),
-       (172, 101, 204),
-       (177, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (192, 101, 204),
-       (197, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 136),
-       (204, 101, 131),
-       (204, 101, 126),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 125: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 126, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 180, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (203, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (188, 204, 101),
-       (183, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (159, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (110, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 113),
-       (101, 204, 118),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 167),
-       (101, 204, 172),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 186),
-       (101, 204, 191),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 191, 204),
-       (101, 186, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 118, 204),
-       (101, 113, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (110, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (134, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (159, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (183, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 180),
-       (204, 101, 175),
-       (204, 101, 170),
-       (204, 101, 165),
-       (204, 101, 160),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 136),
-       (204, 101, 131),
-       (204, 101, 126),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 126: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 126, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 145, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 184, 101),
-       (204, 189, 101),
-       (204, 194, 101),
-       (204, 199, 101),
-       (204, 204, 101),
-       (199, 204, 101),
-       (194, 204, 101),
-       (189, 204, 101),
-       (184, 204, 101),
-       (179, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (145, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (121, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 145),
-       (101, 204, 150),
-       (101, 204, 155),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 184),
-       (101, 204, 189),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 189, 204),
-       (101, 184, 204),
-       (101, 179, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 155, 204),
-       (101, 150, 204),
-       (101, 145, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (145, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (189, 101, 204),
-       (194, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 194),
-       (204, 101, 189),
-       (204, 101, 184),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 160),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 145),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 126),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 127: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 135, 101),
-       (204, 140, 101),
-       (204, 145, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 169, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 193, 101),
-       (204, 198, 101),
-       (204, 203, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (166, 204, 101),
-       (161, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (137, 204, 101),
-       (132, 204, 101),
-       (127, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 119),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 143),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 158),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 172),
-       (101, 204, 177),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 158, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 143, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 119, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (127, 101, 204),
-       (132, 101, 204),
-       (137, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 198),
-       (204, 101, 193),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 145),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 128: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 130, 101),
-       (204, 135, 101),
-       (204, 140, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 173, 101),
-       (204, 178, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 197, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (191, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (143, 204, 101),
-       (138, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (119, 204, 101),
-       (114, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 122),
-       (101, 204, 127),
-       (101, 204, 132),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 189),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 189, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 170, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 132, 204),
-       (101, 127, 204),
-       (101, 122, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (114, 101, 204),
-       (119, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (162, 101, 204),
-       (167, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (191, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 197),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 178),
-       (204, 101, 173),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 129: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 125, 101),
-       (204, 130, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 168, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (168, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (130, 204, 101),
-       (125, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 144),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 168, 204),
-       (101, 163, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 144, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (125, 101, 204),
-       (130, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (168, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 168),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 125),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 130: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 125, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 172, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (202, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (188, 204, 101),
-       (183, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (122, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (117, 101, 204),
-       (122, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (183, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 172),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 125),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 131: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 125, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 153, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 167, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 181, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (184, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (170, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (142, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (128, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (114, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 117),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 145),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 159),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 173),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 173, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 159, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 145, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 117, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (114, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (128, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (142, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (170, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 181),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 125),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 111),
-       (204, 101, 106)],
- 132: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 120, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 134, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 199, 101),
-       (204, 204, 101),
-       (199, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (120, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (106, 204, 101),
-       (101, 204, 102),
-       (101, 204, 106),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 134),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 171),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 185),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 185, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 171, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 134, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 106, 204),
-       (101, 101, 204),
-       (106, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (120, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (134, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 157),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 134),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 120),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 106)],
- 133: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 120, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 189, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (172, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 169),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 192),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 192, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (172, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 189),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 143),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 120),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 106)],
- 134: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 202, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (132, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (101, 204, 103),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 167),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 103, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (132, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 202),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 170),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 138),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 106)],
- 135: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (106, 204, 101),
-       (101, 204, 102),
-       (101, 204, 106),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 106, 204),
-       (101, 101, 204),
-       (106, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 106)],
- 136: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 124, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 160, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (175, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (130, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (103, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 172, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (130, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (202, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 137: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 138: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 139: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 140: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 141: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 110),
-       (204, 101, 106)],
- 142: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 143: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 144: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 145: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 146: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 147: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (102, 204, 101),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 102, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 148: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 149: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 150: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (101, 204, 102),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 151: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 201),
-       (101, 201, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 152: [(204, 101, 101),
-       (204, 106, 101),
-       (204, 110, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 110),
-       (204, 101, 106)],
- 153: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (101, 204, 102),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 101, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 154: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 155: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 156: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 157: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 158: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 159: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 101, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 160: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 161: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 162: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 163: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 164: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 165: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 166: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 109),
-       (204, 101, 105)],
- 167: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 168: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 169: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 170: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 171: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 172: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 143),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 143, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 173: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 174: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 105)],
- 175: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 176: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 177: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 178: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 179: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 180: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 181: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 182: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 183: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 108),
-       (204, 101, 105)],
- 184: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 185: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 186: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 187: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 188: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 189: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 190: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 191: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 192: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 193: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 194: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 195: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 196: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 197: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 198: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 199: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 200: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 201: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 202: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 203: [(204, 101, 101),
-       (204, 105, 101),
-       (204, 108, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 108),
-       (204, 101, 105)],
- 204: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 205: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 206: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 207: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 208: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 209: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 210: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 102),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 101, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 211: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 212: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 213: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 214: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 215: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 216: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 217: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 218: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 219: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 220: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 221: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 222: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 113, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 113),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 223: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 224: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 225: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 226: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 227: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 228: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 229: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 110, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 118, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 199),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 199, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 118),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 110),
-       (204, 101, 107),
-       (204, 101, 104)],
- 230: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 231: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 232: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 233: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 123, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 234: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 102),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 101, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 235: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 115, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (108, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 115),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 236: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 237: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 120, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 194),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 194, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 120),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 238: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 239: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 125, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 125),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 240: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 130, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 130),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 241: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 135, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 242: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 243: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (104, 204, 101),
-       (101, 204, 102),
-       (101, 204, 104),
-       (101, 204, 107),
-       (101, 204, 109),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 109, 204),
-       (101, 107, 204),
-       (101, 104, 204),
-       (101, 101, 204),
-       (104, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 244: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 107, 101),
-       (204, 109, 101),
-       (204, 112, 101),
-       (204, 114, 101),
-       (204, 117, 101),
-       (204, 119, 101),
-       (204, 122, 101),
-       (204, 124, 101),
-       (204, 127, 101),
-       (204, 129, 101),
-       (204, 132, 101),
-       (204, 134, 101),
-       (204, 137, 101),
-       (204, 139, 101),
-       (204, 142, 101),
-       (204, 144, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 191),
-       (101, 204, 193),
-       (101, 204, 196),
-       (101, 204, 198),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 198, 204),
-       (101, 196, 204),
-       (101, 193, 204),
-       (101, 191, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 144),
-       (204, 101, 142),
-       (204, 101, 139),
-       (204, 101, 137),
-       (204, 101, 134),
-       (204, 101, 132),
-       (204, 101, 129),
-       (204, 101, 127),
-       (204, 101, 124),
-       (204, 101, 122),
-       (204, 101, 119),
-       (204, 101, 117),
-       (204, 101, 114),
-       (204, 101, 112),
-       (204, 101, 109),
-       (204, 101, 107),
-       (204, 101, 104)],
- 245: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 246: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (104, 204, 101),
-       (101, 204, 102),
-       (101, 204, 104),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 104, 204),
-       (101, 101, 204),
-       (104, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 247: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 144, 101),
-       (204, 146, 101),
-       (204, 149, 101),
-       (204, 151, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 111),
-       (101, 204, 113),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 185),
-       (101, 204, 187),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 187, 204),
-       (101, 185, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 113, 204),
-       (101, 111, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (184, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 151),
-       (204, 101, 149),
-       (204, 101, 146),
-       (204, 101, 144),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 248: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 134, 101),
-       (204, 136, 101),
-       (204, 139, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 161, 101),
-       (204, 163, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (170, 204, 101),
-       (167, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (111, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 176, 204),
-       (101, 174, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (167, 101, 204),
-       (170, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 163),
-       (204, 101, 161),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 139),
-       (204, 101, 136),
-       (204, 101, 134),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 249: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 129, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 151, 101),
-       (204, 153, 101),
-       (204, 156, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 173, 101),
-       (204, 175, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (200, 204, 101),
-       (197, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 136),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 192),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 192, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 136, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 121, 204),
-       (101, 119, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 175),
-       (204, 101, 173),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 156),
-       (204, 101, 153),
-       (204, 101, 151),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 129),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 250: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 124, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 146, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 163, 101),
-       (204, 165, 101),
-       (204, 168, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 185, 101),
-       (204, 187, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (132, 204, 101),
-       (129, 204, 101),
-       (127, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (115, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 123),
-       (101, 204, 125),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 167),
-       (101, 204, 169),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 181),
-       (101, 204, 184),
-       (101, 204, 186),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 186, 204),
-       (101, 184, 204),
-       (101, 181, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 152, 204),
-       (101, 150, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (115, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (127, 101, 204),
-       (129, 101, 204),
-       (132, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (183, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 187),
-       (204, 101, 185),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 170),
-       (204, 101, 168),
-       (204, 101, 165),
-       (204, 101, 163),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 146),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 124),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 251: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 119, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 141, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 153, 101),
-       (204, 155, 101),
-       (204, 158, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 175, 101),
-       (204, 177, 101),
-       (204, 180, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 187, 101),
-       (204, 189, 101),
-       (204, 192, 101),
-       (204, 194, 101),
-       (204, 197, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (203, 204, 101),
-       (201, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (149, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (137, 204, 101),
-       (135, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 161),
-       (101, 204, 163),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 175),
-       (101, 204, 178),
-       (101, 204, 180),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 180, 204),
-       (101, 178, 204),
-       (101, 175, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 163, 204),
-       (101, 161, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (135, 101, 204),
-       (137, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 197),
-       (204, 101, 194),
-       (204, 101, 192),
-       (204, 101, 189),
-       (204, 101, 187),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 180),
-       (204, 101, 177),
-       (204, 101, 175),
-       (204, 101, 172),
-       (204, 101, 170),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 158),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 141),
-       (204, 101, 138),
-       (204, 101, 136),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 119),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 252: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 136, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 148, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 165, 101),
-       (204, 167, 101),
-       (204, 170, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 177, 101),
-       (204, 179, 101),
-       (204, 182, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 194, 101),
-       (204, 196, 101),
-       (204, 199, 101),
-       (204, 201, 101),
-       (204, 204, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (196, 204, 101),
-       (194, 204, 101),
-       (191, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (184, 204, 101),
-       (182, 204, 101),
-       (179, 204, 101),
-       (177, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (165, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (128, 204, 101),
-       (126, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 119),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 131),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 138),
-       (101, 204, 140),
-       (101, 204, 143),
-       (101, 204, 145),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 152),
-       (101, 204, 155),
-       (101, 204, 157),
-       (101, 204, 160),
-       (101, 204, 162),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 174),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 174, 204),
-       (101, 172, 204),
-       (101, 169, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 162, 204),
-       (101, 160, 204),
-       (101, 157, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 145, 204),
-       (101, 143, 204),
-       (101, 140, 204),
-       (101, 138, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 131, 204),
-       (101, 128, 204),
-       (101, 126, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (114, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (126, 101, 204),
-       (128, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (165, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (177, 101, 204),
-       (179, 101, 204),
-       (182, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (189, 101, 204),
-       (191, 101, 204),
-       (194, 101, 204),
-       (196, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (203, 101, 204),
-       (204, 101, 201),
-       (204, 101, 199),
-       (204, 101, 196),
-       (204, 101, 194),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 182),
-       (204, 101, 179),
-       (204, 101, 177),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 165),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 153),
-       (204, 101, 150),
-       (204, 101, 148),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 253: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 131, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 143, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 160, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 169, 101),
-       (204, 172, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 184, 101),
-       (204, 186, 101),
-       (204, 189, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 196, 101),
-       (204, 198, 101),
-       (204, 201, 101),
-       (204, 203, 101),
-       (201, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (194, 204, 101),
-       (192, 204, 101),
-       (189, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (182, 204, 101),
-       (180, 204, 101),
-       (177, 204, 101),
-       (175, 204, 101),
-       (172, 204, 101),
-       (170, 204, 101),
-       (168, 204, 101),
-       (165, 204, 101),
-       (163, 204, 101),
-       (160, 204, 101),
-       (158, 204, 101),
-       (156, 204, 101),
-       (153, 204, 101),
-       (151, 204, 101),
-       (148, 204, 101),
-       (146, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (139, 204, 101),
-       (136, 204, 101),
-       (134, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (122, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (110, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 106),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 118),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 130),
-       (101, 204, 132),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 142),
-       (101, 204, 144),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 154),
-       (101, 204, 156),
-       (101, 204, 159),
-       (101, 204, 161),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 168),
-       (101, 204, 171),
-       (101, 204, 173),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 185),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 197),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 197, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 185, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 168, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 161, 204),
-       (101, 159, 204),
-       (101, 156, 204),
-       (101, 154, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 144, 204),
-       (101, 142, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 132, 204),
-       (101, 130, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 118, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 106, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (110, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (122, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (134, 101, 204),
-       (136, 101, 204),
-       (139, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (146, 101, 204),
-       (148, 101, 204),
-       (151, 101, 204),
-       (153, 101, 204),
-       (156, 101, 204),
-       (158, 101, 204),
-       (160, 101, 204),
-       (163, 101, 204),
-       (165, 101, 204),
-       (168, 101, 204),
-       (170, 101, 204),
-       (172, 101, 204),
-       (175, 101, 204),
-       (177, 101, 204),
-       (180, 101, 204),
-       (182, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (189, 101, 204),
-       (192, 101, 204),
-       (194, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (201, 101, 204),
-       (204, 101, 203),
-       (204, 101, 201),
-       (204, 101, 198),
-       (204, 101, 196),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 189),
-       (204, 101, 186),
-       (204, 101, 184),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 172),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 160),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 143),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 131),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 254: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 114, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 150, 101),
-       (204, 152, 101),
-       (204, 155, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 167, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 179, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 186, 101),
-       (204, 188, 101),
-       (204, 191, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 198, 101),
-       (204, 200, 101),
-       (204, 203, 101),
-       (202, 204, 101),
-       (199, 204, 101),
-       (197, 204, 101),
-       (195, 204, 101),
-       (192, 204, 101),
-       (190, 204, 101),
-       (187, 204, 101),
-       (185, 204, 101),
-       (183, 204, 101),
-       (180, 204, 101),
-       (178, 204, 101),
-       (175, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (168, 204, 101),
-       (166, 204, 101),
-       (163, 204, 101),
-       (161, 204, 101),
-       (159, 204, 101),
-       (156, 204, 101),
-       (154, 204, 101),
-       (151, 204, 101),
-       (149, 204, 101),
-       (146, 204, 101),
-       (144, 204, 101),
-       (142, 204, 101),
-       (139, 204, 101),
-       (137, 204, 101),
-       (134, 204, 101),
-       (132, 204, 101),
-       (130, 204, 101),
-       (127, 204, 101),
-       (125, 204, 101),
-       (122, 204, 101),
-       (120, 204, 101),
-       (118, 204, 101),
-       (115, 204, 101),
-       (113, 204, 101),
-       (110, 204, 101),
-       (108, 204, 101),
-       (106, 204, 101),
-       (103, 204, 101),
-       (101, 204, 102),
-       (101, 204, 105),
-       (101, 204, 107),
-       (101, 204, 110),
-       (101, 204, 112),
-       (101, 204, 114),
-       (101, 204, 117),
-       (101, 204, 119),
-       (101, 204, 122),
-       (101, 204, 124),
-       (101, 204, 126),
-       (101, 204, 129),
-       (101, 204, 131),
-       (101, 204, 134),
-       (101, 204, 136),
-       (101, 204, 138),
-       (101, 204, 141),
-       (101, 204, 143),
-       (101, 204, 146),
-       (101, 204, 148),
-       (101, 204, 150),
-       (101, 204, 153),
-       (101, 204, 155),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 167),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 179),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 191),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 191, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 179, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 170, 204),
-       (101, 167, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 155, 204),
-       (101, 153, 204),
-       (101, 150, 204),
-       (101, 148, 204),
-       (101, 146, 204),
-       (101, 143, 204),
-       (101, 141, 204),
-       (101, 138, 204),
-       (101, 136, 204),
-       (101, 134, 204),
-       (101, 131, 204),
-       (101, 129, 204),
-       (101, 126, 204),
-       (101, 124, 204),
-       (101, 122, 204),
-       (101, 119, 204),
-       (101, 117, 204),
-       (101, 114, 204),
-       (101, 112, 204),
-       (101, 110, 204),
-       (101, 107, 204),
-       (101, 105, 204),
-       (101, 102, 204),
-       (103, 101, 204),
-       (106, 101, 204),
-       (108, 101, 204),
-       (110, 101, 204),
-       (113, 101, 204),
-       (115, 101, 204),
-       (118, 101, 204),
-       (120, 101, 204),
-       (122, 101, 204),
-       (125, 101, 204),
-       (127, 101, 204),
-       (130, 101, 204),
-       (132, 101, 204),
-       (134, 101, 204),
-       (137, 101, 204),
-       (139, 101, 204),
-       (142, 101, 204),
-       (144, 101, 204),
-       (146, 101, 204),
-       (149, 101, 204),
-       (151, 101, 204),
-       (154, 101, 204),
-       (156, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (163, 101, 204),
-       (166, 101, 204),
-       (168, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (175, 101, 204),
-       (178, 101, 204),
-       (180, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (187, 101, 204),
-       (190, 101, 204),
-       (192, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (199, 101, 204),
-       (202, 101, 204),
-       (204, 101, 203),
-       (204, 101, 200),
-       (204, 101, 198),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 191),
-       (204, 101, 188),
-       (204, 101, 186),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 179),
-       (204, 101, 176),
-       (204, 101, 174),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 167),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 155),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 138),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 126),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 114),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 255: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 126, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 138, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 157, 101),
-       (204, 159, 101),
-       (204, 162, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 169, 101),
-       (204, 171, 101),
-       (204, 174, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 181, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 193, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (202, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (195, 204, 101),
-       (193, 204, 101),
-       (190, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (183, 204, 101),
-       (181, 204, 101),
-       (178, 204, 101),
-       (176, 204, 101),
-       (173, 204, 101),
-       (171, 204, 101),
-       (169, 204, 101),
-       (166, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (159, 204, 101),
-       (157, 204, 101),
-       (154, 204, 101),
-       (152, 204, 101),
-       (150, 204, 101),
-       (147, 204, 101),
-       (145, 204, 101),
-       (142, 204, 101),
-       (140, 204, 101),
-       (138, 204, 101),
-       (135, 204, 101),
-       (133, 204, 101),
-       (130, 204, 101),
-       (128, 204, 101),
-       (125, 204, 101),
-       (123, 204, 101),
-       (121, 204, 101),
-       (118, 204, 101),
-       (116, 204, 101),
-       (114, 204, 101),
-       (111, 204, 101),
-       (109, 204, 101),
-       (106, 204, 101),
-       (104, 204, 101),
-       (102, 204, 101),
-       (101, 204, 104),
-       (101, 204, 106),
-       (101, 204, 109),
-       (101, 204, 111),
-       (101, 204, 114),
-       (101, 204, 116),
-       (101, 204, 118),
-       (101, 204, 121),
-       (101, 204, 123),
-       (101, 204, 126),
-       (101, 204, 128),
-       (101, 204, 130),
-       (101, 204, 133),
-       (101, 204, 135),
-       (101, 204, 137),
-       (101, 204, 140),
-       (101, 204, 142),
-       (101, 204, 145),
-       (101, 204, 147),
-       (101, 204, 149),
-       (101, 204, 152),
-       (101, 204, 154),
-       (101, 204, 157),
-       (101, 204, 159),
-       (101, 204, 162),
-       (101, 204, 164),
-       (101, 204, 166),
-       (101, 204, 169),
-       (101, 204, 171),
-       (101, 204, 174),
-       (101, 204, 176),
-       (101, 204, 178),
-       (101, 204, 181),
-       (101, 204, 183),
-       (101, 204, 186),
-       (101, 204, 188),
-       (101, 204, 190),
-       (101, 204, 193),
-       (101, 204, 195),
-       (101, 204, 198),
-       (101, 204, 200),
-       (101, 204, 202),
-       (101, 202, 204),
-       (101, 200, 204),
-       (101, 198, 204),
-       (101, 195, 204),
-       (101, 193, 204),
-       (101, 190, 204),
-       (101, 188, 204),
-       (101, 186, 204),
-       (101, 183, 204),
-       (101, 181, 204),
-       (101, 178, 204),
-       (101, 176, 204),
-       (101, 173, 204),
-       (101, 171, 204),
-       (101, 169, 204),
-       (101, 166, 204),
-       (101, 164, 204),
-       (101, 162, 204),
-       (101, 159, 204),
-       (101, 157, 204),
-       (101, 154, 204),
-       (101, 152, 204),
-       (101, 149, 204),
-       (101, 147, 204),
-       (101, 145, 204),
-       (101, 142, 204),
-       (101, 140, 204),
-       (101, 137, 204),
-       (101, 135, 204),
-       (101, 133, 204),
-       (101, 130, 204),
-       (101, 128, 204),
-       (101, 125, 204),
-       (101, 123, 204),
-       (101, 121, 204),
-       (101, 118, 204),
-       (101, 116, 204),
-       (101, 114, 204),
-       (101, 111, 204),
-       (101, 109, 204),
-       (101, 106, 204),
-       (101, 104, 204),
-       (101, 102, 204),
-       (104, 101, 204),
-       (106, 101, 204),
-       (109, 101, 204),
-       (111, 101, 204),
-       (113, 101, 204),
-       (116, 101, 204),
-       (118, 101, 204),
-       (121, 101, 204),
-       (123, 101, 204),
-       (125, 101, 204),
-       (128, 101, 204),
-       (130, 101, 204),
-       (133, 101, 204),
-       (135, 101, 204),
-       (138, 101, 204),
-       (140, 101, 204),
-       (142, 101, 204),
-       (145, 101, 204),
-       (147, 101, 204),
-       (149, 101, 204),
-       (152, 101, 204),
-       (154, 101, 204),
-       (157, 101, 204),
-       (159, 101, 204),
-       (161, 101, 204),
-       (164, 101, 204),
-       (166, 101, 204),
-       (169, 101, 204),
-       (171, 101, 204),
-       (173, 101, 204),
-       (176, 101, 204),
-       (178, 101, 204),
-       (181, 101, 204),
-       (183, 101, 204),
-       (185, 101, 204),
-       (188, 101, 204),
-       (190, 101, 204),
-       (193, 101, 204),
-       (195, 101, 204),
-       (197, 101, 204),
-       (200, 101, 204),
-       (202, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 193),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 181),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 169),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 162),
-       (204, 101, 159),
-       (204, 101, 157),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 150),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)],
- 256: [(204, 101, 101),
-       (204, 104, 101),
-       (204, 106, 101),
-       (204, 109, 101),
-       (204, 111, 101),
-       (204, 113, 101),
-       (204, 116, 101),
-       (204, 118, 101),
-       (204, 121, 101),
-       (204, 123, 101),
-       (204, 125, 101),
-       (204, 128, 101),
-       (204, 130, 101),
-       (204, 133, 101),
-       (204, 135, 101),
-       (204, 137, 101),
-       (204, 140, 101),
-       (204, 142, 101),
-       (204, 145, 101),
-       (204, 147, 101),
-       (204, 149, 101),
-       (204, 152, 101),
-       (204, 154, 101),
-       (204, 156, 101),
-       (204, 159, 101),
-       (204, 161, 101),
-       (204, 164, 101),
-       (204, 166, 101),
-       (204, 168, 101),
-       (204, 171, 101),
-       (204, 173, 101),
-       (204, 176, 101),
-       (204, 178, 101),
-       (204, 180, 101),
-       (204, 183, 101),
-       (204, 185, 101),
-       (204, 188, 101),
-       (204, 190, 101),
-       (204, 192, 101),
-       (204, 195, 101),
-       (204, 197, 101),
-       (204, 200, 101),
-       (204, 202, 101),
-       (203, 204, 101),
-       (200, 204, 101),
-       (198, 204, 101),
-       (196, 204, 101),
-       (193, 204, 101),
-       (191, 204, 101),
-       (188, 204, 101),
-       (186, 204, 101),
-       (184, 204, 101),
-       (181, 204, 101),
-       (179, 204, 101),
-       (176, 204, 101),
-       (174, 204, 101),
-       (172, 204, 101),
-       (169, 204, 101),
-       (167, 204, 101),
-       (164, 204, 101),
-       (162, 204, 101),
-       (160, 204, 101),
-       (157, 204, 101),
-       (155, 204, 101),
-       (153, 204, 101),
-       (150, 204, 101),
-       (148, 204, 101),
-       (145, 204, 101),
-       (143, 204, 101),
-       (141, 204, 101),
-       (138, 204, 101),
-       (136, 204, 101),
-       (133, 204, 101),
-       (131, 204, 101),
-       (129, 204, 101),
-       (126, 204, 101),
-       (124, 204, 101),
-       (121, 204, 101),
-       (119, 204, 101),
-       (117, 204, 101),
-       (114, 204, 101),
-       (112, 204, 101),
-       (109, 204, 101),
-       (107, 204, 101),
-       (105, 204, 101),
-       (102, 204, 101),
-       (101, 204, 103),
-       (101, 204, 105),
-       (101, 204, 108),
-       (101, 204, 110),
-       (101, 204, 113),
-       (101, 204, 115),
-       (101, 204, 117),
-       (101, 204, 120),
-       (101, 204, 122),
-       (101, 204, 125),
-       (101, 204, 127),
-       (101, 204, 129),
-       (101, 204, 132),
-       (101, 204, 134),
-       (101, 204, 137),
-       (101, 204, 139),
-       (101, 204, 141),
-       (101, 204, 144),
-       (101, 204, 146),
-       (101, 204, 149),
-       (101, 204, 151),
-       (101, 204, 153),
-       (101, 204, 156),
-       (101, 204, 158),
-       (101, 204, 160),
-       (101, 204, 163),
-       (101, 204, 165),
-       (101, 204, 168),
-       (101, 204, 170),
-       (101, 204, 172),
-       (101, 204, 175),
-       (101, 204, 177),
-       (101, 204, 180),
-       (101, 204, 182),
-       (101, 204, 184),
-       (101, 204, 187),
-       (101, 204, 189),
-       (101, 204, 192),
-       (101, 204, 194),
-       (101, 204, 196),
-       (101, 204, 199),
-       (101, 204, 201),
-       (101, 204, 204),
-       (101, 201, 204),
-       (101, 199, 204),
-       (101, 196, 204),
-       (101, 194, 204),
-       (101, 192, 204),
-       (101, 189, 204),
-       (101, 187, 204),
-       (101, 184, 204),
-       (101, 182, 204),
-       (101, 180, 204),
-       (101, 177, 204),
-       (101, 175, 204),
-       (101, 172, 204),
-       (101, 170, 204),
-       (101, 168, 204),
-       (101, 165, 204),
-       (101, 163, 204),
-       (101, 160, 204),
-       (101, 158, 204),
-       (101, 156, 204),
-       (101, 153, 204),
-       (101, 151, 204),
-       (101, 149, 204),
-       (101, 146, 204),
-       (101, 144, 204),
-       (101, 141, 204),
-       (101, 139, 204),
-       (101, 137, 204),
-       (101, 134, 204),
-       (101, 132, 204),
-       (101, 129, 204),
-       (101, 127, 204),
-       (101, 125, 204),
-       (101, 122, 204),
-       (101, 120, 204),
-       (101, 117, 204),
-       (101, 115, 204),
-       (101, 113, 204),
-       (101, 110, 204),
-       (101, 108, 204),
-       (101, 105, 204),
-       (101, 103, 204),
-       (102, 101, 204),
-       (105, 101, 204),
-       (107, 101, 204),
-       (109, 101, 204),
-       (112, 101, 204),
-       (114, 101, 204),
-       (117, 101, 204),
-       (119, 101, 204),
-       (121, 101, 204),
-       (124, 101, 204),
-       (126, 101, 204),
-       (129, 101, 204),
-       (131, 101, 204),
-       (133, 101, 204),
-       (136, 101, 204),
-       (138, 101, 204),
-       (141, 101, 204),
-       (143, 101, 204),
-       (145, 101, 204),
-       (148, 101, 204),
-       (150, 101, 204),
-       (152, 101, 204),
-       (155, 101, 204),
-       (157, 101, 204),
-       (160, 101, 204),
-       (162, 101, 204),
-       (164, 101, 204),
-       (167, 101, 204),
-       (169, 101, 204),
-       (172, 101, 204),
-       (174, 101, 204),
-       (176, 101, 204),
-       (179, 101, 204),
-       (181, 101, 204),
-       (184, 101, 204),
-       (186, 101, 204),
-       (188, 101, 204),
-       (191, 101, 204),
-       (193, 101, 204),
-       (196, 101, 204),
-       (198, 101, 204),
-       (200, 101, 204),
-       (203, 101, 204),
-       (204, 101, 202),
-       (204, 101, 200),
-       (204, 101, 197),
-       (204, 101, 195),
-       (204, 101, 192),
-       (204, 101, 190),
-       (204, 101, 188),
-       (204, 101, 185),
-       (204, 101, 183),
-       (204, 101, 180),
-       (204, 101, 178),
-       (204, 101, 176),
-       (204, 101, 173),
-       (204, 101, 171),
-       (204, 101, 168),
-       (204, 101, 166),
-       (204, 101, 164),
-       (204, 101, 161),
-       (204, 101, 159),
-       (204, 101, 156),
-       (204, 101, 154),
-       (204, 101, 152),
-       (204, 101, 149),
-       (204, 101, 147),
-       (204, 101, 145),
-       (204, 101, 142),
-       (204, 101, 140),
-       (204, 101, 137),
-       (204, 101, 135),
-       (204, 101, 133),
-       (204, 101, 130),
-       (204, 101, 128),
-       (204, 101, 125),
-       (204, 101, 123),
-       (204, 101, 121),
-       (204, 101, 118),
-       (204, 101, 116),
-       (204, 101, 113),
-       (204, 101, 111),
-       (204, 101, 109),
-       (204, 101, 106),
-       (204, 101, 104)]}
+# `categories_256` palettes for 1 to 256 colors, concatenated as a single
+# array of 32896 RGB triplets (uint8), zlib-compressed and base64-encoded.
+# The palette with n colors starts at the row n * (n - 1) / 2. The array is
+# decoded the first time it is needed.
+_color_categories_256_packed = (
+    b'eNrlW3djE1cS/7SrS0IJpvcSimmhhGbTCaEYAgmEEMDUQGjShzrvzL7xvGn7VpJlSP64u8SW'
+    b'9pX5tZn1DapqUC38Z7Dw3z34z8J/zQ7qn8xU9T//Vf/zserY4C/414X/9NL/9PEnL6q99f9c'
+    b'ra4O9tY/eVH/20N8yK76B7vwUQ/rH9yp5ponNP80V/9qrv7B9Xqtrbjcws+ODbZWuOj1+meX'
+    b'qr8H1ZH6nzZXg9+r3wfV5sGRavB3/YFL9Y9hjdnm4Yv/svBP/eZfqsGZavCu+mVQbaj/ZX81'
+    b'eFQ9GlT7BxuqwS/1Z94NqjP1b07Wh7o/wHOtr4+28Murg2p9fcD7zRlPNjv9q972sWbd7N+P'
+    b'NfvHf68GR+treQVbWdtczo369zfqK1oLm37VXNTR+veH68XeD6qfB9WO+t/XwgGeVc9gm2sH'
+    b'O6rBtWrwT/2Ve4PqUP2Rg/W94oUebLY0vfij6fpHCx+Za+4Ef1QNDlSDm9XgffVgUJ0YVGvq'
+    b'H22rBheqwXw1P6guDKptgzXV4EQ1eFB/a2FHNwfVgfpT++qqDd7UJ5xtarcGLuFes6lj9eO2'
+    b'wtHgKt5ANffVH9wL9/qivsqrcNU956fpR3jtV5uy7KkhMXhao+ImAOP7Bhuna3gsfHYBIadr'
+    b'kHxf1Ti52UDlKaBlT/3Z3XDEP6sPg+rXQfXToNpU/3R1NTgEcHhZvRzUWFm419WDTdXgp2rw'
+    b'azX4UD/kT7iU3U0NZ+qyYtlm60riQexf0E/72S+qwc5qcLYa/FYvsHCZV+B+V9e/2Aj3eauG'
+    b'xgJ0bsGVbqx3uVC0K82tLpzgt0F1dlDtrL+xA2Dyaw3153CCHxvArwLMX6xhv/ClBeRfrMFf'
+    b'rarx/yOc+XnDgl8BYQC67dXgFCDodfUaEHNqUG1vzuj+Dn8xV/9i4YH8d4Csk3CgF/VK9+EK'
+    b'9ta7QK4dhmo/rr/3GKp9uObdKkDGDLDvXYOEW8DBbc0zTwCZnlUfB9Ufg+oy1G19c+ofqsE5'
+    b'uJE3NQAXDnduUP1QL7kein25GvxRDT7Wj30GbDzRPHYr3P31RRpfh+vf2hw/+nX+u37+62qw'
+    b'BW78GpTiY02yW4DWBUitrH+9Dsp7Ho77dw3xhWs6D5hYN1gJyD0NVzhfP/wj1PIa1HlL8/Cj'
+    b'AI6HtTq8ghPPQqlBdlYCOH+C+3pSP+AJHPonQOLKWmX2w1X/2sjRPwDUKyBKWxqSHQH2/d7s'
+    b'7ncg1ZGabQu/7rV+Iv/1whLqE5sACBfgAl7VivMIZPAEgHJlI4Z7Aei366pj6W4BbPfW51wB'
+    b'PDgOd/xHI5KvQJIuAjQ2NaschGu+W6PxExTpJhRi4RlT9SfwMccAkwvi97Z6O6hV8ipUcmEr'
+    b'KwZTsI/ToDALtf7UgPMuFOxgs9BGWGgGuAKbnQdKzMInNjZw2gRajR+azz403XyIHjMHj+k3'
+    b'x+YfgrWmAe+3obyfahm7B5d7FBi4ov7QFAjoAgZ+huuBc/0BV/wTqONUffLtgKNLoOYv67U+'
+    b'AVZuA3/YcgdAu24Ca9/XDHsAcDwBeF7TXOM2qPkFuOt0urugo0eAbStq59gNPL4Gd/2m8ZrH'
+    b'UJOzgH5YcQMA9AwI1qNaDt4BPH6B4u8HresVf059CAVQfA4etg9E7TrQ6k29s7/gLmYBT1ub'
+    b'i10D5DoGonKvEdTnUIDLgJld9Y2sAO04BKW8DbB535jjQ1CJU2CRGxpF3AuFugZseVXX4Bnc'
+    b'3EUg/M7G+L4D2h+Ewt+sXQ3P+ydc3jnA2QJ3v6vdcCdoz0WoxLMGsa+AgNeg/Hsb4cSlTwL2'
+    b'7y8a8H2A/8n0uV6Xj+rP9e2PwiN/ADTgRc7XG30N0LoOhZkGpfiu/uj3QNIjwOTbgEI4+2Mo'
+    b'z3kA2I76mr4D5ZmGcl8HjL1uUD2fKnQCjGF9o8F7QEEuwU09ra35b0DGTSh6eipe/magwWkg'
+    b'1O8NXV7Cpf4MgnKg2S7tdQbq9KgRwA+QTO4CTY8DA9ct7uEYVOsOAOWfWo7/As5fBEClj/Y6'
+    b'fZp/dK75KEq98+ndAJoLcMF/1oLxAXD4KxjDT8CTTU05VoNyHAJR+AWuOd3GA2DVWSDM9jrf'
+    b'fAeqtx8AfgUc51kTsd4Cdm+DQPwIQpLv5Dz436OaiZ+AYb/BTZ8BpG9rshM+fh8g7jJU8Ulz'
+    b'J0/gsi8D4vY1W18NInUQ4PEzZLHnDTveQNlvAZjYZtYC149CLW+ALLxquPQQHHUWJHcX2G6v'
+    b'+xfMT/fdL8DjdwK2zsHF/w4E+1TvHq/yImBrL8hoqtRWIMQpYOSvgHK4n6dQ2qsgRdOgblCs'
+    b'jcDf4wAbBMKbhkEvAOu/gNYcAVliWzoMWLgOdzpfF/gt4OxuAs+BZgUs2UZg/jFA2y2wp3RL'
+    b'f0ARLgA2f2iOgWc4kCB0F8D8tuHUPODiOmDu8OKuptKusNL3m3O/B0jfAyDhF3ZktdsJqKbv'
+    b'PKtlm3/nDAA7fWcKmI6LXAMNe7rIsqdsHfzOVLOxHWkRLMiTWsw+AsLxfmcBgnvAHr5t8u0W'
+    b'4NDJVJZHi7n7USr8SaDoljr0fgtutgdoNJOQ8rwJwO+AG1j7M8beDoLI4UU/rsXrMzD7YarM'
+    b'CeDTlibP41K7E4oRAezesDgzgOLdzZHwPPtA+xEBD0FBPjdB8XECzmngOtvedtjeKeD6HUBn'
+    b'uoY/QdQuA5wPgvZMNWXFr023f2168Wtiqbn0nX70NbbUT+AptxO0P9en+gsu/RoA4ghQev1i'
+    b'fTcD7RYYMQtK8DuwCO5wHmCBSnAMuL25KfF6UI8jwLxrAKW/Gq/5nLh0G+zmp2yTa0AEDyQ0'
+    b'4e2/qMHxDlB7HyqWr4aFxgUPJ+wiPt408olFQ0wdXjwePxviA7n4rulrXiRkIYIPgLSvyfaJ'
+    b'KLkJPsNu5QHYNAKSvtYb4Zv+1zCmet9MC+6Hb56HAiIJ3jUnxEogXA6BSLHSbwIxPAqajmXM'
+    b'bxVBcw4Y9AMYWao+qhVCFLH2YpHjyL0b4GgnQBrYbrfCbo8D3H6BkjypJRVx82eq5FlYcw+s'
+    b'ubLBwDpY9mCCOKLneXO3z1MxEXQH4ajr6qOuhHPugXOeTej5syEHhoEnAD3Uv+Ow4a3Zhvcx'
+    b'DN0DrKdL+guklkC7L32zJ788G315Rn45XLYfrqz2/HMq7Ov6wG+BaFieC4D7aZC5dQ0qVoJF'
+    b'7gaunU7lVfeMkDoNdNsNXrmyqdAOEKGTAGME49PGMT+DfCGqflZnhqC9Bej6Y8LjXXCblzWw'
+    b'/kkcwArnKxM8diQOnWfYSjMAKvL5xKEdiwjhZ0ZsIQH/abTiJbjd3cSHH0GftjQJnXZOCLuT'
+    b'KPGhDgpIwzkGbPpyb+Tv6y/PLX4Zg0rw/bQ4ysAZMF8q+D/1yZGVWDOix3aIIQkwG0CcDwEx'
+    b'L6ay5zePgLsI3DwEEr2hwcxaMC6UBEIr0vNjk2cIc1dA4lGM2P43w/6PwP4vp+KBBn5OVMHK'
+    b'I+APLq6PyFmbNBQJQ8hj90/FR9iipK1twIPnP5hgj8hDtn5elEQE72U4whE4wubsCHvgCIi/'
+    b'm+DDTxev8ClY8c0E/iOgjen7vdEf0fb9fodHHAZj4ECAi3gHFKZCngUW7Vu8SMLSTpCQE6CZ'
+    b'BIeXTS1e5nA8Afq1M4PTNhC/H4EOBOf5xvcRERyRp0BL2EFWJ8M4DIhGIbsPEvqqbnneJ0Tc'
+    b'yXexwwDV3pxXiMu3je0QKAjXe0EO4TpWgM+inB5PuERdeL6oS69AUe8Buoldu8E2Vy+eZXdi'
+    b'J6LTuVEkiHhEb0xPaXsEKlX8FLYRJNt5sEYi6/u6V3yd+M5hive6kEG/aQaG65NZHAOzQdW0'
+    b'qoOqeQ5Yj5axvh7GfQOJeysUmFMGif+6ae3fM+24DsaD8qNORPKBkKcyJwVD4hFxjiURXt8M'
+    b'Bmk7qINEv3sJtVAjAgsBH3UoXQ3ey/YkhUQf1AGmZs/BUAj+pKnsUBvToU4w7D7MLhjVYA5k'
+    b'FUmET9kogbcrCQJ/0Hz0oOnsQeZ25th2+oslDx7EzkWcJOCgUH5u7IpKjiBGfdmSIXAd3DQK'
+    b'1ZkcPqxeHMpnkmJuh9ySQLgl1yoiRFKJz0m6Cc0zYOPW0Xamo51jtX/SAPp94iciCMl1NNsR'
+    b'QRE3hVw/zzCdV41AdD5xnV0Tv6OjiWKIaRSN98106DXoOfHjXDrdTuN0Bxiyb4E9qfv+LUny'
+    b'2UR69qDeGJ9V8CBUxaGedTkB6nFzWZ+SkjxQpNsN5rcmA+e2pG2nGKysChLQTyWp3baIzzUQ'
+    b'CnYr6j1IkpJ08iVoE2L9sn3GVZAOdoA8EWkIEC9quCPWkcaELLUvRKne2tUc8R9rg+XgQuqo'
+    b'K9P3RYhHhfm7Uc5/wA44gZDS+1N2WGUf82Iyy0eNKZAKP0pmedF6Vm/cjyt5Vr/0cWxrxPCL'
+    b'OdCSor7IwXGO6VeO27XJBA8nN0W4OTUlGpwEjf4hpS8G3V1METmlXmTqyplwkemiOizJGbGK'
+    b'UPKm0VhiOyIOd3co2x0BmMyROE98yCtLoCNuTSfHThimuzsEd0d8IDlKevuGMYyYTz5gnVew'
+    b'AsnPqkGixAnLH9dbgid6j5vLHocxu+SJsEHMTygEaH0cgKDpn5JGIWI4PVDvNkEf8k3zwmJt'
+    b'MlOUKTRmhCGqXqoySguSBG0QlQotdW39OuMb6NI2JaPgFEbOoVh9WvQdzhM0aZRSzJ7q1JhC'
+    b'ZnPovGyU+W0SBUIiEjnfI2KbtolKQ9KAbFG1JjAi+VBp2FWKeyQ6I1tQu94uqvRLRUEMcdbB'
+    b't6WDE2duMY1gxUEFu8VIfTi50voM5GN+aOET+x0eyrb5A3soB2a60PfpNn/PyXM0mcFGA+27'
+    b'k6ahxyM8SSWh7iRCSCH0UpS13RLwG5NnHU00J1ImeKKSv2VaiSyaYerrHP9Q4iXaA+JpviHS'
+    b'B6YdhFC+082QdhnsNyZHPMI2i1yyqo8gvZZrErvW7yCOb87vlLhEQveh0Xb0skfpBi4nHSm+'
+    b'gRuQBv4wavUHpIEb/kN7S/bc4oei2hc+F+ZV68A1SVbO5oBNl6tv9kqSFVUxJMJUSh8HkgBe'
+    b'SO6Uw/YfRbALSQMPpIQ0JbmwLxkUsTaHLeo/aStx7CwT7K2QpldG90Age9IECOSYidyjcr+c'
+    b'Edtz9aItO3gQ9CXlVqTA+z3qMC05wvtkhUTi4qsQfAtLx8VBPbeXP3p6+EdPd9iyQlt/yEdz'
+    b'9SEgc0n7vHjLBDhOvL0paa3OOEIh4ShLHrcYnBk2iH63mKsfZVEh0WR1SoZ7c7kgWj9ZzMOf'
+    b'cy0mBnKNVxdCFkfMJuSRdSbvICUSopHvGslCGyedIz0iHuYIIVATv0nn2HWLuxbSQRLKfISc'
+    b'lFhOqkQObd0JqR2yETMKCRNUkoQUMwoKCAle/ujekj69y6PRWUZ7OooUBziK34fFG+coRFqi'
+    b'SKFv5fTB/hHdAKWVw9xHCycnqisaGPaSjEFouGgIKCmc9wnm6DWo3ZyfaAvOzWBO5PI9m8MR'
+    b'nfd9w08ULI50FBa1d86jbbkiomwRSxVmCOxcAFDHt2VUEveO8sJZinr7btF90IiFDHDPxLyr'
+    b'Lod0EbmKcYf0KxWWVBfjzpVcGvnTe0u/QKen9zsvkLa/OS1AWoZxkAM/udJrFisImqRle1Ii'
+    b'zJmFOWsv02EOf1R5hh8SS6LuWeZ8mA4ZudYndE4z2SFhIDVmDsXZi5l2hjkJxi51RST3XBso'
+    b'a7xY9Kk3iQH3EwNIfA6x8JVTbD0LM1zdOIdzFHEScIWg3LE+Y9lGZuJcgm6nJnW+kU/yrBcp'
+    b'2NzJNY781rmlfeyWLrFE9tio82OWnC6xBfbJBXoTWCNeYE4uQC42whqHWTC5zggxn3nZi6TY'
+    b'dxWlD6RQZZFue/KcYyxaES0cRN1Lbowh5ViyzO0G77YmQxbSdDdJ9wvpa/OM29dZzDrc4a44'
+    b'cB8t0ptz+2HODOccgn3iKJzhPq6IHDNuSbx6cIY/zISWnO5ZCki3cym0rmsFC6Z4Xcdzr74v'
+    b'y87XwLLrNTAPKMvDqnhykouutwzXxHwZOsoOdRQHwX0LxHQascxU896AL8OP4i3Td0HMlXFX'
+    b'ymerBtX/mj+A+Z6FKFL4WZcuAe1P5V67Abr4bwf/g2nROpYWtHz9JnW+7zP/TOdL89HsMcY/'
+    b'zcIywYEc/gek8cvj1cbnv0gRQmmK702rQAEKtKCpZXoTW6n7MiJaDLUSF1BBIFYkUSGObC5u'
+    b'IVWFHXAa+ajjoiAcwWcrNzeuPcoUOJOELnCLc26P2w/JD4d4kgauC8QkLnTc5RzO7rSUm9TB'
+    b'wR6RiYsQeZ1FW27bXO5IHZ5m/RHpN5ciElaeEdQFcv/WGoHaqkDBnUKIHk8juFLPqNa0v9h8'
+    b'h8WmjcVajzWnjtXP4F6+mLpDPBblLCQWyXnutmQcCHcSC9JZjEGKxRTqyDswOwp6KRwKycAE'
+    b'QfZB0S4nsshDJIMoTuQgynnJq1A1KEcWXCPaldAnEfOY/5oMQzEkY2QnIzqLsCeUF7XDRyOS'
+    b'TKgUL9vajNFYM/J7LolCO3IvpgzDtYr0F/NF2U2igmC+wPiHEswwgraCgQkjBgqjt1hv4usN'
+    b'tRi5c9f14HDY4WCK4nKMYY0Ix4rHKyc4wOUY0wBDiiD4rtxoNO3Q1RIyufxzQeFes8vgONKA'
+    b'R51Tlnox2pFfE/N4V8KNFMMvdqXOfQoBQzJgusLMk1ybpJkzjwSTxx6H6TuUG2hlUfg0ycd9'
+    b'bodN9i15/VA2hbKg+zAHxwiEAZLEjMt025XuTlcq9IVipAMZCqxCPCnf0Xq95VhyuPX6wy+Z'
+    b'jkh5mVQbEx8nIllEcnaqIloSJwb3PxoMMO6vTtjBkMldiZIL0RHjM2D1XcIqyQ0lFzImipo4'
+    b'vWH0p/6DwguXN/KmREdyee6FpDiYbk+wVIHtgX+xh9PFksLx2Mm8nlIMZyQXVbJfdkouAjx8'
+    b'ch2/lg76gMUZhljqS35l2Yl0bpola6YDvJaUMLi0ku5QVst9n4LonVzNsckL73Yru1tyjyss'
+    b'ZYcIoux7JTeQ/awzWpN15ZNeddglMQmMY9VdbNXTrOWcY0V92RT1M8vEmi1nc7/czuaFTBbW'
+    b'MSgdZD3GJYumCr1CjC6xMH6QcWbdojKsZIThweespX/U2aRswLPWfXbDs8yuKZj7N7wvv2GT'
+    b'NikhUDbnTBXCy0PXukwf9HG13N9hE5JXGYZfsSHJHUsIrdJSXXn64vIrVGneSAsv8kB7nYn+'
+    b'8ST6BZdsatO9dkDdc0RYr9prWXh2+IVnWhYe4bj9EU7cds+cuCq4iOreVyKlg8uUoRibmbFz'
+    b'+lJi+j132RzPJFU8MXHLy4mELJqychqX5TmDvvyqNYMvtdV4qKt+3QjWR5b0NYPDE5N08EPv'
+    b'dzSrO51O516Ul7m1xkKzni7aEWaMfxy9LLjt71iTs9NRru740kK9k3Vz3zVhY9nWHmFhSh0T'
+    b'WTsvdlzpNpRpMdnTjdblQranXU84tdpozXMIMnt8dx4T7INrG965MRe0qUqgaCHOA3KHwmKG'
+    b'Iaq3qWgpmcSC2v3aTV0rhpsWc3Ptnr389PiXn7aXLzy6ybT+qMuro2tHEUTPC6+rrskmHMXS'
+    b'GRHCtZMKuivMC5nTZiqiuJIakSC0xCq666AolE7niPDyhZ0HrGMZRrhLIPJ78llFLjgiQnGP'
+    b'EXrnI1+QnmutCBRMc1bltQ+kXthrnmcCxRU5zrl/Hqe46vEcx82GoY+bLI9yXPB5jHSUZ3l2'
+    b'MNrylHCG3oF1Adx4TAFgIEAEcM8lBnL5I+PhoZZJEMGQJw6yXVMGLBaYIkjOy8MW4yGSkPcx'
+    b'FDq4BZAGc/NlmYeUwNRBHj06VoFkWFMxpU3SQTIhUgIyAp0+LC2ia9BOqNUw5IIWA50DciiY'
+    b'OKD4RXZAakhezFIQhU8tyWRIBYXQuVtooo79ORh1/BWmoNO36ra8TcyOuomZ9k2MfA39pdqE'
+    b'8CchDGSPAAiBBkFLEkcRzhx1oqZAeLQpD9QSAS+oFTQlUtg0tQaWQIl8LGxCdCZs8oAKIbIC'
+    b'qSQvx+Gicoi4wHVa8JMJ5cc8LQqF4F0KBZb8JoRMicTMHUtopc8OUyQ4LH4wYCEwIXIbj+1C'
+    b'K1V2Quc0NRt9S+THsopwxRSdE0+wDJsiQPMIyc3T2kTvC9lH+Sbm7E1gmhrHPkQnT/vggnGD'
+    b'CUbeVH3O3ZxyvTARkerahGtXbujU3mC61LLxIRsqaAEVAZ/Hu1y7cEgseqwjloo7ssHzFVcO'
+    b'0lDR6WLA4dMdqy48Xmghv5dnXZayeNJESxOGYt7HFNzHN42C6Ss54F9JMV/uWHLOkw72XjhO'
+    b'/l/9/1RZlXffGh9kK9zlmcFS4uLR955lb0OVxtTTLlD1zMXcR+9L2so49tEfx1asKxFuJ4RE'
+    b'WC5LYprAQlhF/sgBi//vKo5ZEYVENhZyYnGHG6+WV54LcxprDvNwqu1GZACVykQWuc0U9qxK'
+    b'h2GBKKLyDjZgMvZOn7PuzVQUYTrWrQhxE6mdfNjTWYdBnqiQD/O46usbYYW6ak9n8wELd2NP'
+    b'9fmQYx9rr4trRGr7c6oRtTNkhAm5FBkpxFN0JQMKttL7wnYzjq1QchtxN+liaAaxK+2GTJHa'
+    b'Cy4wZM4qv5msJtklU6Qc6cgdzWR4eqKmS8sMpRbGJrJoLb7UahxhLQ/NipXi8YBNAYosSfsA'
+    b'kxk+saTswvWXGjCKUdQI0psDp1IUX6gR9Oid2jA+pCCD1MnyVJ6kqB1Uuve9dT3aJrkK0wQr'
+    b'5xRFfy422hAEdL6X0seb5AMMN2RPXIUpP7B3Wzx4e7ZA3TJlXr9YG61icS2mHjEEMqUIas+u'
+    b'Kevmu9nIdtNz0TNdsKH54Tc07W6o0/XMOdfTt6k+xIacegnvvMg2JGw8AeijChWC6lyUeb7J'
+    b'4SyUkDdNIlcI+eEpR/GLzFxIs4gWvLvOxZCznYdiYVvCKChdfJRjUpF1+CBIJK+2km3NS3ac'
+    b'lUxzngf1zzIdawXi5iWyOr1azCVxXX5J3NtFXOfjU4dlNEEViV17Ox/MJFVcmWOIZ1NhYUKj'
+    b'8zHRZ5XbtW/wDnxaDUecqu3MqyaU2rRVC9c8cphGJgK8o41fyp7GtCGeEkfck3VJP6g9iRbd'
+    b'AhNHkkggnqmJJjAXSQ1wHUI8WfIZZwq3ziFKBbgEbMolwLM2HUVYbtTKJKYZ55wgW1A70b0L'
+    b'Ifgtrx1Lj7xPFcqkDU7c0xpbLUUndDQ3XVPBQ9554iQgtU1C6pv8XYvAk2lzPJm8zJLJRxb7'
+    b'RYN2XZXvMMvaXcrn6XgXmMdm5+yp92Vua3x76k96WxpYelt9A1Ulgr7LADvp5xqniTuZd5U3'
+    b'huTgjbxzOum0cmtsCd2mkp1nf0quvCLed5R9aYr4MG8TWOZsvS3TBPPbMoXUvLDxMbEMXhpb'
+    b'5VaoYoxIDZ7zlNXxW2vIhHX80Zl6YR3Fzj7b26I6etvihligqJyPxQjTO3uQ78zjo7WzwgsT'
+    b'pXzoTsMC7IuBmBe20h9HfKu65GEFrBBhI0hrHG9CGSsR/ZkivSgUizKQtVbzWgHOxlFNP6nG'
+    b'SjYzksYOq/5Di9kIMlui/k5qXeKCjpUEhTvrfdmbG+PO+mPeXHhtsbCFaTaWj9jXQ9WNs9AI'
+    b'PI3jkC+8cX6Mzaot2cau0L2snl95OuLk265m6suvd3meN3RhqydybbATmOtqqX7W9bzL8/vi'
+    b'yhY6RDEnCo3V2lzvC9/fWDfnNTLj25+2f938CcFTGVinplar0I2WJcgib+rgpGWvjbnaMHR2'
+    b'EjFdaXLccZlWq+OTlYeFZ+gWWgfPjvUVhha3q3kqFlEgNlzR5ihlFlco0ooIBMI5Qv4K8RO2'
+    b'JtKKBUHCn+h3YtsVaUolZNHyCHMTsaBLiUWCD/yDJwOfIiJTeeYrep8wKvMtTk9ui9PRFoe4'
+    b'wjl/f/3xb7HsCnkH6bW3LDl7EcszEp7/Qq32mlyesjw5dLjs2YkXtCy50VrjNR+e3eVyyFO0'
+    b'1/DybrxjoXlDzuMgOZ6nOLxFSlmaJwZTEbkp87jKBwZMtPmkkXdxPNeYvuK0I2YjZ4oizzW8'
+    b'HeEz2qTbfOBiTh09X+HRi+Vq3jF57kfpgfclfCwU1ppHf9NdzHZYMcZs6kyDNptOR72/3F2O'
+    b'e4teGzXKLsOLpDARC2QOys9OHtPqo8OEOapnMk7UMVMtRTItk2Xs1mZjpjJqDHIN4gJkzhu0'
+    b'ZZstPZNJyt46O5p+o9sDv+K6t9eWqGVId1gpgetgoadKZNxtdyn0XPepOl5o1ynguBZLbYy6'
+    b'VfUlXeNS27d2HcppVhrXDbW2R93T0LSpY9H1NEznjJxAOq2JmU75Lntfz0bHvsv+kmzUuU4v'
+    b'c3jCmQOU0CnCG0mSMCGdL9sUXjfdYu7jyWfId8+KxOhCt96hyOumR9i6MExKcSqxCwX13Egn'
+    b'4oLSb3JKH2uTMqRPqvsRCirMXYdidaOm1IsGw0shpidZrPdEVDiniMaW2q/IMSp6DGHxwpNE'
+    b'P2lleDEB5P6ps4joKourbzqTmHCIro3xSTQbYoJgGn2w0d5XtdfhNjoXbZRS/Xj3al3qTmuv'
+    b'XFBv5oIqhh8s25tJL7Ao0XDicCEXf5NYZtjjsiqa4zYFoCkDNyoz72m1WpHpvxh68YbJtH4z'
+    b'8uU531RWMZ3j4waOgZ3dMNBqqlywuF19yryKxxR+r1etAKDvde3ivXIX4Fe7y79a7lj3LMdS'
+    b'OtAqrhqyu2zIfqPe3Wq88hhgOhbvSFPy/5RnK97gt0aWccCA+5ZOLWX04sMIHQbivfa+tu0u'
+    b'zV77S7NduFo+DucpmycYT2gd4PIhhSde3MB4fvVJxn2BD3V53ObJ0JPbYk3wbIyHQz4KyCUs'
+    b'0C8vcceWm/JhieJqJ+O5m49Y8MXDmMBgmdknq+syFbfL7QYGEWea2M8+ZuOWEtE181eBRwTY'
+    b'9fxM97R5vyC6xYngQbsan2sUs43PNczA0Lrd3le446XZruggxrhj/4KDoGMKcA5ijmBT0QJ7'
+    b'0yOPNsswE3ogwx1VIjA53fyErqFHdHGEMD3Z6ilIiU2fC6J6MSrM+Cts2ZQ2ZnVe6DGVWAQJ'
+    b'c2yjvGOVdc1mUhNud99yu1wr9OhOi7GZ1ASUVxn2scHCsYgTptvpbNmXL5U8ixYByOzhQmCY'
+    b'fVHseZSBQvKZCdMLFWY3z3bcC9Fshkxv0/PDb3rGSkL+poe+5rmWa+5bMrf0m6ZrFv29J8w5'
+    b'oAnNInB6MifyEDVLioLCTYiFItRT5ozluU03Yguk2Cm6JiV2ptJRTypyvWfaInmyTkQotOeC'
+    b'Yp4yLDwoLovxD/k26Z3opak5Tf2Il41IoUXYoICvb3q1ayubnMumhCRaVPLCYvUgkRZdqs50'
+    b'YgagnGW1g2nqo0Tk0F4ogijrTahXFYML8nDKSWLiRv3fCAjRjkjTlu5cpGmLDh4lm+59tfte'
+    b'sk3zbmXs+06XTW8SqOvWsYmGBFqwKegxcHvIpnTKtU/HJuqyLEaS0RAp9XCDAiqNY6g71LJN'
+    b'qZopiY57ZJDUHdLAQLdbNOJgCujJH7W0vBXQrq5jKpNt6l9IufWggzySRjO6IaBhEr1z7o6T'
+    b'EhG0uhgdoeJAwnsC675Nx9E9+THryrVTqpbRbMtN8dbpT7eMoelwfFMDFsQSM7VaHU2hyY8J'
+    b'KmYGpN6RBjdDUZMGN7x91DHQ33fv6936Uu67P+mtb7e2zicNppDzSMg6nfcWyrkgmsap8zd/'
+    b'M+R7EB+S8DSre2FPzh1tMe3zumWfPNDSqMSxoTVME83mkscV0/aVnIuux8vi3EHNHoKP/7oA'
+    b'hsdx7vyeMlJrnPc+PGlxRW8NLbw7pvcbyoy8i+c5kect7qN8RtymMH8ymnJR5/7Pc6IPd8L6'
+    b'FMM679xaowv3UR5x8z6Id8peCuCpqyNm+JCbt3A8LXI35VOr7kzlMyARYHhg5C0zTbtVQ/RV'
+    b'7n6Urc+1bF282hv77v2L500GD2GBwCvQc8Tz3CtU0rNV0dfRZNmyJ0FZ3m3w6Cu6UiHzfLiV'
+    b'qw1/WxKYq0i/vMFTWsmFkk+ZeUMdRBoxKuIBWPVKQuk9fxVtB2/zRkDOTzlyhFzyiQB7G9hX'
+    b'sy6t9LzTE8GGdx7inaDlU+L69+bXL2KZcFk+gA41h49FtdjzgCD6Dwv6HPfrc9zzli+IN9pl'
+    b'ac7Yly8K9UBGxwQ+bewIng05ePbn4NE9Kx8n6XymiCtSMR8nmdFSdNx8mu4Y1td3gCXdfX/J'
+    b'D9B2/QfVAS7kBxDjGkUAPWbSIVnM2s2sJiaSjnOJOZmZk/m8yZT/fFSmR5Oe9Yr5h4jKYjrp'
+    b'mNfGXD11jyLe+ZtpOX9r4DnAw9wBxIsDsz8sg9BmBaEjCkKmhj7KIWT1WTq3mS2imECFFdAW'
+    b'pociOnt6Hvxn7sGOCj3NSWyagM6eYi7iu5jJATFzFaMRLzxbPZc52NE5wux3xfA1RNE2hSLx'
+    b'mvKyM5myunWvadSTqcvq/dkRf0wSetnXd4YlPkDQvI/rDE4Rdlpn0IMTb+zj92Jeog4s2RxA'
+    b'tJmaHv54o6vAFkJF8oxZD1G8EVDoa3r2FkcjL1o7fZk3CPLGWN4QrgxLexwsmb2l39f3w844'
+    b'6C2D1r7M3bwO0+vu70ctcjCeuB82+EGX02ZwXo8fzFeCCUW/pc0PpiwnwzlFMZz2+XDy5nNd'
+    b'aG0Oucwz7Gs5Q6/tGNPLf4zp9mOMWIq59jP0l/8YQfK7XhZd+6XxuzD5dfS7kgRe1kUUBtjC'
+    b'EN7F8ko6oeIc3i/rJa4X90MjgKo1fTx0zdtz7iFC1LDG1ykLDqtU5RlkKO/rGqWcSOv1dzGu'
+    b'vEQ4PlzNts3Lylgez8u6HqP3LzrJ0h+jBFqjn2QcBWkjyRAM6c71cisst5FxqNZMZ/0dQny7'
+    b'20jQA5b4+heErv4kajKcJ3Yvy0SoMgGe9CcGsJIBbsmLmAfOYT61nIQDrOQkBLCO5mhWJmDL'
+    b'H25g6XqYEraow5SM4UbW4nLqx6+J26g/EcJMgC29f5eO9SZhL51gNprDTARmkwpjkyrORGgz'
+    b'qUj2VSFtHBow+mF6/7rzjH6YufF0l3PLBrbu5BmCORM00Ekp20Q8dNh2YAjnWUq8lYt1cddZ'
+    b'7jxL46TlyaBY38rNZwnMtDwZdOlAy8PO+CBXkg/GIQkl4a3gPL1/35EmdZ7+l3KkOJXGRhR2'
+    b'prFwx0FhNG+Nu4bYjkKti+NC3DiMYK9xnIvjT1uXGieGuLcbFnjDJaChetUhQt2wJjtcTu2u'
+    b'eMPloKF8dohoN2zfOlxa7Yg9L3176cELrI5CeA2FF/C8AN6xgf26TzWpI4nOYklP1aVQZngt'
+    b'DuPl/UWn8NrFdstbjOKuqVMkL+8yip23UyPYpdEo753K28FiBJrtk45IhbJudbg6yJpOpYOf'
+    b'2REW+68ulxlndaowRxFKA81RkTYrMyiVUUvzanPZ+0kzVei+w+l2C+OSDrXmTKIAhGYPX5It'
+    b'RK4tEIySMaUOgeakpcyIxcGmhzrY/FIdbLroYGMp11xBuZypyxIdrACHolx6NtYa2/MuWDcj'
+    b'rRLf2l8VOLIe+ul+pNW+Oupha9TQLYke/bWZcuvQojVA6a5EdcStvZaeaY4biqLdilv9toFM'
+    b'PL1obfXjmUybNbdOmuKxzGiqGE9mWscYoTvHw5nWEVo4byqZz8SDtHjqFKIxbv7j5BHHX6Yf'
+    b'casSB8V4UBN69L/qbBM8GPUskzlbcdGCAVs8NvR750Ldj6OwryLCrOPhYTASDboyXyGDmB8M'
+    b'2+IRou/Xwaw3iI5Bwgr76HiQGIxHR8Zk0J4VGoCKI4jJIBYXBkjRdzp1i127MPUHiaRAJwNz'
+    b'C6JWGeUK+ebFyCCRiI4m76x59hcDRi9wiYjMZyGjwZJnf28W4qXkMjnxhqc8THY9W+/ffrzJ'
+    b'nq0/2eOx0nlzYi8xlxidIl7AOm4GXkDx+jc+Vy3zcfPPBPh01bO7ETSzJKaYfyxQYOXeuwuv'
+    b'Q+Xx0oxgfvft9XJeUvH6VG/cPxQ4vRRmuoIzbzWTSqvjeUN/c5DsG7pZQK8/MDO09/7JUk7v'
+    b'nUZrFjMbVod+Jve8KUOnvOK8NPTeb7QmMjNJj4xPs0vwUkscpi118Zogc5RiNgrx8Xr/gROO'
+    b'63hzRcfTHfpSn9AqoDkRM4N1bIDW4NlkYOwQZnwx+702izffM5odbWyDZtcXqqg5qzVDjDmM'
+    b'MF84hi4fD1rMCGpmNOe1o/n+IM4xcWtrvisuQ6nZ/sUxTb8e4aNb1bmbIVs7oRlEdQ03GTXk'
+    b'Xr86LKPZSeg0Y/5VRpmW8rd22gzjTsJ8gazs3nwTpMcTZhzVacbslVgXb7420ZHNDNzmDGZk'
+    b'oBZmmiBzl4mNHukWthTBCXv/jUNO+IT9ZTjkyGUMjNEh5KewgeoabvTwQkmO6f56KKp7qMAe'
+    b'R9bVIOLoNkqPRv0AoF9EB31wHFODTsrq9HWvqFMOzX9Hg6t+d6vbxSDHBf6h/vxDpxydxT2H'
+    b'HKqSZgzoVMxOWSdX104mORotR+FkkHX03M3q/fVsqiTT6Vyup2/0ZxQjI1a/byqJ5qA9Je2V'
+    b'fm8x9CF7/5lzTvyQ2GdN+JzFxdQxXZyz1TDVTEAws9VLgpguph4FwSAYrop3G55tjk9pdQAS'
+    b'A/JgxFqWDYIBT9eUp2xTzwdaM5AeJYsGemTceu2lF/Q8U3GmBF5k95xTv/Aoq2eQELySesHd'
+    b'S0Id9dYzTy/uFVO0kJ+HHH56ScjrwqyJQRz6vPjuzX46QtebjBTmIZHgy6TI68XicOvNKdU5'
+    b'e2VHnf5yjzpdetTlKGn/yz2qKKmYXMZGahH1U1trFhuMCEai/xR/CaEyg/gLKzGk9bozMRkS'
+    b'diq60FB7ReMi4pGYDHkNmhjV0l9bWbFBvPkSw6E47ooY6PVoaqogHDVOSGIqPQKAxQsi0Y6K'
+    b'0btIgqbTiFFYPlsQUyKR7E1HFaG3S1V1eDALK/oYke/jnCTGRZYCi8FfbKoiD4o+JqTrEFwt'
+    b'yUmiZVMvcEU3IyZjZioUKV+85BRzI/GnIsUYjrsZc2ZtBv0CZRKNm5hZlzQ0wVF7/7HTLsdR'
+    b'zcnDBE5rFXZTwWnLDdYirTnLDlzHjE1xv9o9TgStnBhqi6lS0LX6alwSnsQo1Ozm2hKF+EPZ'
+    b'YLBkRmIzJ4qGzplFmE4releN5LNhmy4G+UMhOYiKYvLC7cecpH3K/jg4aABag7F4MaNrO2Xn'
+    b'iq7lNdsA862pOWpimmyODsVb09bA2ErdFUa0mPJ5e9DirRmPg/5OvSMOBmsazFfDZmBkMG/3'
+    b'wRxkKXMs3EWoxBixMCSbE7bigFF44NnlOfDMSAdepvL2l6nCbeXd03bgVuN1CGyyt9CKgt6g'
+    b'Ta5E0jBfK+uG3pyPe/ZrdrlKn4NmiEcrc57qGdJGw5Ba3ai1p9dB8p4fJPMJRuDAGtIiXXmQ'
+    b'3jMeSAevBWJP8gdxPF0N4cBehXdbLwf8yLGmrMit3YLOWN1V2qPxBStRxjRe05I6WodyXoRu'
+    b'zVjWTCOYy3m5MngDtJSo1vOqX9pQXaBb+sCmbnlNUtmBe//BM4/3wHOlB+ZTjn/FmQvIrJkc'
+    b'+1OnyKWH7GUhRA+fdZMY2/LSKLYOXrpPDF1KW5Q3vhsiWntJ05p7eM68ZNjWb+7Lw6ZnVG3x'
+    b'q79sdTbTSNdSlyewoXQ7NuehKL1cfPYnIfq1aNfg6c0x8Q9wlhPey3rm3n/z2Mt35v7Xfexh'
+    b'ic3PPBbTGjmfdO0oTbseh4bHsaywqRwtoowlilrTkiEce+Ig7+ReYTgTyayTY3cdIXQPKp16'
+    b'jyVW8k6ZtEtW6TQtGiKftc1PRNfVKZkuAc5bU1phE9KmaoXNZmsgbz127z988uU7tjlRmdjJ'
+    b'2woeNCSBgbc2Yf5cJXCy1rgW9NthdGl94xG0n4GNj6DqQWgLOtD4zVaYXoJBWmtED7JqOGNp'
+    b'7b2D3BaMHIZCe9B+m3E1sDRziuhPWkwnD4K6OXVoq7mXYcyyd21RgtGape3BCLVraC2jegnP'
+    b'zTFTENfN9BZOXcyhYhBdzUYlmLEVAz6YN5VnONGrFItc0JmWhPZgutglzIjDT492+PkJHX66'
+    b'w+HHXva54rKHk8YJHL4Y86Ls5lxZGLvZrlnTGMH2Ensr71vEW4SyVFMynCi39+46Xx7pSqZR'
+    b'BcFGvCEsn0+UhFll7+ZkxuzVRaoz3yssDexFu16SZ4XPiSGkNZ8RqS52eDPMi0FFQeV1vImL'
+    b'X9LJiGw3stoLky9JtcW0L+S8mE+ZkT7OdlYbp2c1YiYZZ1uznxHzuS7In+qC/JL5XJnmlbSx'
+    b'3oguPvyOYXKOd/5DI5zfbOnGcf4zBc1sWdQRxd/RpfjilVOZ4YnpTex5hfWPzz/VAfw7yoof'
+    b'G344vSLmx12t53lxeyOmV+LPJljgEf/3zHg4LxrbQtv3X8gEr98KA188xhIjev5/iGKZR/xV'
+    b'VDy69KJ+nHZFe8vmOfH0Ms58Xfmf4f//kdWvmQ==')
+
+
+_color_categories_256 = None
+
+
+def _categories_256_rgb(nb_colors):
+    """ Palette of `categories_256` with `nb_colors` colors (1 to 256)
+
+    Returns:
+        np.ndarray of uint8 of shape (nb_colors, 3)
+    """
+    global _color_categories_256
+    if _color_categories_256 is None:
+        packed = zlib.decompress(
+            base64.b64decode(_color_categories_256_packed))
+        _color_categories_256 = np.frombuffer(packed, dtype=np.uint8)\
+            .reshape(-1, 3)
+    start = nb_colors * (nb_colors - 1) // 2
+    return _color_categories_256[start:start + nb_colors]
 
 
 def categories_10(nb_colors):
     if nb_colors <= 10:
-        return [format_color(c) for c in _colors_categories_10[nb_colors]]
+        return format_colors(_colors_categories_10[nb_colors])
     elif nb_colors <= 256:
-        return [format_color(c) for c in _color_categories_256[nb_colors]]
+        return format_colors(_categories_256_rgb(nb_colors))
     else:
-        return [format_color(_color_categories_256[256][i % 256])
-                for i in range(nb_colors)]
+        return format_colors(
+            _categories_256_rgb(256)[np.arange(nb_colors) % 256])
 
 
 def categories_256(nb_colors):
     if nb_colors <= 256:
-        return [format_color(c) for c in _color_categories_256[nb_colors]]
+        return format_colors(_categories_256_rgb(nb_colors))
     else:
-        return [format_color(_color_categories_256[256][i % 256])
-                for i in range(nb_colors)]
+        return format_colors(
+            _categories_256_rgb(256)[np.arange(nb_colors) % 256])
 
 
 def linear_purple(nb_colors):
-    return [format_color(c) for c in sns.cubehelix_palette(nb_colors)]
+    return format_colors(colormaps.cubehelix(nb_colors))
 
 
 def linear_blue_red(nb_colors):
-    return [format_color(c) for c in sns.color_palette("coolwarm", nb_colors)]
+    return format_colors(colormaps.coolwarm(nb_colors))
 
 
 def linear_blue(nb_colors):
-    return [format_color(c)
-            for c in sns.color_palette(palette="Blues", n_colors=nb_colors)]
+    return format_colors(colormaps.blues(nb_colors))
 
 
 palette_from_name_to_function = {
@@ -32955,3 +321,35 @@ palette_from_name_to_function = {
     'linear_blue_red': linear_blue_red,
     'linear_blue': linear_blue,
 }
+
+
+@lru_cache(maxsize=128)
+def _get_palette_cached(palette_name, nb_colors):
+    return tuple(palette_from_name_to_function[palette_name](nb_colors))
+
+
+def get_palette(palette_name, nb_colors):
+    """ Palette `palette_name` with `nb_colors` colors, as hexadecimal strings
+
+    The palettes are memoized in a bounded LRU cache keyed by
+    (palette_name, nb_colors). See `palette_cache_info` and
+    `clear_palette_cache`.
+
+    Args:
+        palette_name (str): A key of `palette_from_name_to_function`
+        nb_colors (int): Number of colors needed
+
+    Returns:
+        list of str: A new list, it can be modified by the caller
+    """
+    return list(_get_palette_cached(palette_name, int(nb_colors)))
+
+
+def palette_cache_info():
+    """ Statistics of the palette cache (hits, misses, maxsize, currsize) """
+    return _get_palette_cached.cache_info()
+
+
+def clear_palette_cache():
+    """ Empty the palette cache and reset its statistics """
+    _get_palette_cached.cache_clear()
@@ -0,0 +1,157 @@
+""" Continuous colormaps computed with NumPy
+
+The linear palettes of depict used to be sampled from seaborn (and thus from
+matplotlib). The few colormaps needed are computed here instead, with the
+same lookup tables and the same sampling rules, so that the colors are
+identical without importing seaborn or matplotlib.
+"""
+import numpy as np
+
+_LUT_SIZE = 256
+
+# Anchors of the 'coolwarm' diverging colormap (K. Moreland), evenly spaced
+# between 0 and 1
+_coolwarm_anchors = (
+    (0.2298057, 0.298717966, 0.753683153),
+    (0.26623388, 0.353094838, 0.801466763),
+    (0.30386891, 0.406535296, 0.84495867),
+    (0.342804478, 0.458757618, 0.883725899),
+    (0.38301334, 0.50941904, 0.917387822),
+    (0.424369608, 0.558148092, 0.945619588),
+    (0.46666708, 0.604562568, 0.968154911),
+    (0.509635204, 0.648280772, 0.98478814),
+    (0.552953156, 0.688929332, 0.995375608),
+    (0.596262162, 0.726149107, 0.999836203),
+    (0.639176211, 0.759599947, 0.998151185),
+    (0.681291281, 0.788964712, 0.990363227),
+    (0.722193294, 0.813952739, 0.976574709),
+    (0.761464949, 0.834302879, 0.956945269),
+    (0.798691636, 0.849786142, 0.931688648),
+    (0.833466556, 0.860207984, 0.901068838),
+    (0.865395197, 0.86541021, 0.865395561),
+    (0.897787179, 0.848937047, 0.820880546),
+    (0.924127593, 0.827384882, 0.774508472),
+    (0.944468518, 0.800927443, 0.726736146),
+    (0.958852946, 0.769767752, 0.678007945),
+    (0.96732803, 0.734132809, 0.628751763),
+    (0.969954137, 0.694266682, 0.579375448),
+    (0.966811177, 0.650421156, 0.530263762),
+    (0.958003065, 0.602842431, 0.481775914),
+    (0.943660866, 0.551750968, 0.434243684),
+    (0.923944917, 0.49730856, 0.387970225),
+    (0.89904617, 0.439559467, 0.343229596),
+    (0.869186849, 0.378313092, 0.300267182),
+    (0.834620542, 0.312874446, 0.259301199),
+    (0.795631745, 0.24128379, 0.220525627),
+    (0.752534934, 0.157246067, 0.184115123),
+    (0.705673158, 0.01555616, 0.150232812))
+
+# Anchors of the 'Blues' sequential colormap (ColorBrewer), evenly spaced
+# between 0 and 1
+_blues_anchors = (
+    (247, 251, 255), (222, 235, 247), (198, 219, 239), (158, 202, 225),
+    (107, 174, 214), (66, 146, 198), (33, 113, 181), (8, 81, 156),
+    (8, 48, 107))
+
+_luts = {}
+
+
+def interpolate_anchors(anchors, lut_size=_LUT_SIZE):
+    """ Lookup table linearly interpolated between evenly spaced colors
+
+    Args:
+        anchors (array-like of shape (M, 3)): RGB colors, with values
+            between 0 and 1, evenly spaced between 0 and 1
+        lut_size (int): Number of colors in the lookup table
+
+    Returns:
+        np.ndarray of shape (lut_size, 3)
+    """
+    anchors = np.asarray(anchors, dtype=float)
+    x = np.linspace(0, 1, len(anchors)) * (lut_size - 1)
+    x_lut = (lut_size - 1) * np.linspace(0, 1, lut_size)
+    ind = np.searchsorted(x, x_lut)[1:-1]
+    distance = ((x_lut[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1]))[:, None]
+    lut = np.concatenate([
+        anchors[:1],
+        distance * (anchors[ind] - anchors[ind - 1]) + anchors[ind - 1],
+        anchors[-1:],
+    ])
+    return np.clip(lut, 0.0, 1.0)
+
+
+def cubehelix_lut(start=0., rot=.4, gamma=1., hue=.8, lut_size=_LUT_SIZE):
+    """ Lookup table of the cubehelix color scheme
+
+    Cf D. A. Green (2011). "A colour scheme for the display of astronomical
+    intensity images". Bulletin of the Astronomical Society of India, Vol. 39,
+    p. 289-295.
+
+    Args:
+        start (float): Hue to start the helix, in [0, 3]
+        rot (float): Number of rotations of the helix
+        gamma (float): Gamma factor emphasizing dark (< 1) or light (> 1)
+            colors
+        hue (float): Saturation of the colors
+        lut_size (int): Number of colors in the lookup table
+
+    Returns:
+        np.ndarray of shape (lut_size, 3)
+    """
+    x = np.linspace(0, 1, lut_size)
+    xg = x ** gamma
+    a = hue * xg * (1 - xg) / 2
+    phi = 2 * np.pi * (start / 3 + rot * x)
+    lut = np.empty((lut_size, 3))
+    for i, (p_0, p_1) in enumerate([(-0.14861, 1.78277),
+                                    (-0.29227, -0.90649),
+                                    (1.97294, 0.0)]):
+        lut[:, i] = xg + a * (p_0 * np.cos(phi) + p_1 * np.sin(phi))
+    return np.clip(lut, 0, 1)
+
+
+def _get_lut(name):
+    if name not in _luts:
+        if name == 'cubehelix':
+            _luts[name] = cubehelix_lut()
+        elif name == 'coolwarm':
+            _luts[name] = interpolate_anchors(_coolwarm_anchors)
+        elif name == 'blues':
+            _luts[name] = interpolate_anchors(np.array(_blues_anchors) / 255)
+        else:
+            raise ValueError('Unknown colormap: {}'.format(name))
+    return _luts[name]
+
+
+def sample_lut(lut, values):
+    """ Colors of a lookup table at positions `values` (between 0 and 1)
+
+    A value v picks the entry int(v * len(lut)), 1 picking the last entry.
+
+    Returns:
+        np.ndarray of shape (len(values), 3)
+    """
+    lut_size = len(lut)
+    indexes = np.array(values, dtype=float) * lut_size
+    indexes[indexes == lut_size] = lut_size - 1
+    indexes = np.clip(indexes, 0, lut_size - 1).astype(int)
+    return lut[indexes]
+
+
+def cubehelix(nb_colors, light=.85, dark=.15):
+    """ Sequential cubehelix colors, from `light` to `dark` """
+    return sample_lut(_get_lut('cubehelix'),
+                      np.linspace(light, dark, int(nb_colors)))
+
+
+def coolwarm(nb_colors):
+    """ Diverging colors from blue to red, the two extremes excluded """
+    return sample_lut(_get_lut('coolwarm'),
+                      np.linspace(0, 1, int(nb_colors) + 2)[1:-1])
+
+
+def blues(nb_colors):
+    """ Sequential colors from light to dark blue, the two extremes
+    excluded """
+    return sample_lut(_get_lut('blues'),
+                      np.linspace(0, 1, int(nb_colors) + 2)[1:-1])
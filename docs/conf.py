@@ -30,7 +30,7 @@ release = '0.1.5'
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = ['sphinx.ext.autodoc', 'sphinx.ext.napoleon']
-autodoc_mock_imports = ['numpy', 'bokeh', 'seaborn', 'pandas']
+autodoc_mock_imports = ['numpy', 'bokeh', 'pandas']
 
 # napoleon settings
 napoleon_google_docstring = True
@@ -0,0 +1,52 @@
+import pickle
+
+from depict.core.accumulator import HistogramAccumulator
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def samples():
+    return np.random.RandomState(0).lognormal(size=100000)
+
+
+@pytest.mark.parametrize("log", [False, True])
+def test_accumulator_as_numpy(samples, log):
+    acc = HistogramAccumulator(0.1, 5, nb_bins=30, log=log)
+    for chunk in np.array_split(samples, 7):
+        acc.add(chunk, chunk_size=1000)
+    expected, edges = np.histogram(samples, bins=acc.edges)
+    assert np.array_equal(acc.counts, expected)
+    assert acc.underflow == np.sum(samples < 0.1)
+    assert acc.overflow == np.sum(samples > 5)
+    assert acc.nb_samples == len(samples)
+    centers, widths, counts = acc.bars()
+    assert np.allclose(centers - widths / 2, edges[:-1])
+
+
+def test_accumulator_merge_and_pickle(samples):
+    first = HistogramAccumulator(0, 10, nb_bins=20).add(samples[:50000])
+    second = HistogramAccumulator(0, 10, nb_bins=20).add(samples[50000:])
+    merged = pickle.loads(pickle.dumps(first)).merge(second)
+    expected = HistogramAccumulator(0, 10, nb_bins=20).add(samples)
+    assert np.array_equal(merged.counts, expected.counts)
+    assert merged.overflow == expected.overflow
+
+
+def test_accumulator_nan():
+    acc = HistogramAccumulator(0, 1).add([np.nan, 0, 0.5, 1])
+    assert acc.nb_samples == 3
+    assert acc.counts[-1] == 1
+
+
+@pytest.mark.parametrize("kwargs", [{'low': 1, 'high': 0},
+                                    {'low': 0, 'high': 1, 'log': True},
+                                    {'low': 0, 'high': 1, 'nb_bins': 0}])
+def test_accumulator_invalid(kwargs):
+    with pytest.raises(ValueError):
+        HistogramAccumulator(**kwargs)
+
+
+def test_accumulator_merge_other_bins():
+    with pytest.raises(ValueError):
+        HistogramAccumulator(0, 1).merge(HistogramAccumulator(0, 2))
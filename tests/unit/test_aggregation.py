@@ -0,0 +1,68 @@
+from depict.core.aggregation import hexbin, raster
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def points():
+    rng = np.random.RandomState(0)
+    return rng.rand(10000), rng.rand(10000), rng.randn(10000)
+
+
+@pytest.mark.parametrize("chunk_size", [100, 2 ** 20])
+def test_raster_count(points, chunk_size):
+    x, y, _ = points
+    grid = raster(x, y, shape=(20, 30), x_bounds=(0, 1), y_bounds=(0, 1),
+                  chunk_size=chunk_size)
+    expected = np.histogram2d(y, x, bins=[20, 30], range=[[0, 1], [0, 1]])[0]
+    assert np.array_equal(grid, expected)
+
+
+@pytest.mark.parametrize("reduction", ['mean', 'max'])
+def test_raster_mean_max(points, reduction):
+    x, y, values = points
+    grid = raster(x, y, shape=(4, 5), x_bounds=(0, 1), y_bounds=(0, 1),
+                  values=values, reduction=reduction, chunk_size=999)
+    cell = (np.floor(y * 4) == 1) & (np.floor(x * 5) == 2)
+    expected = getattr(np, reduction)(values[cell])
+    assert np.isclose(grid[1, 2], expected)
+
+
+def test_raster_empty_cells_and_outside_points():
+    grid = raster(np.array([0.1, 5.]), np.array([0.1, 0.1]), shape=(2, 2),
+                  x_bounds=(0, 1), y_bounds=(0, 1), values=np.array([3., 4.]),
+                  reduction='max')
+    assert grid[0, 0] == 3
+    assert np.isnan(grid[1, 1])
+
+
+def test_raster_invalid_reduction(points):
+    x, y, _ = points
+    with pytest.raises(ValueError):
+        raster(x, y, shape=(2, 2), x_bounds=(0, 1), y_bounds=(0, 1),
+               reduction='sum')
+    with pytest.raises(ValueError):
+        raster(x, y, shape=(2, 2), x_bounds=(0, 1), y_bounds=(0, 1),
+               reduction='mean')
+
+
+@pytest.mark.parametrize("aspect_scale", [1., 2.5])
+def test_hexbin_count_matches_bokeh(points, aspect_scale):
+    from bokeh.util.hex import hexbin as hexbin_bokeh
+    x, y, _ = points
+    q, r, counts = hexbin(x, y, size=0.05, x_bounds=(0, 1), y_bounds=(0, 1),
+                          aspect_scale=aspect_scale, chunk_size=1000)
+    expected = hexbin_bokeh(x, y, 0.05, aspect_scale=aspect_scale)
+    assert sorted(zip(q, r, counts)) == sorted(zip(
+        expected.q, expected.r, expected.counts.astype(float)))
+
+
+def test_hexbin_mean(points):
+    x, y, values = points
+    q, r, means = hexbin(x, y, size=0.2, x_bounds=(0, 1), y_bounds=(0, 1),
+                         values=values, reduction='mean')
+    _, _, means_chunked = hexbin(x, y, size=0.2, x_bounds=(0, 1),
+                                 y_bounds=(0, 1), values=values,
+                                 reduction='mean', chunk_size=7)
+    assert np.allclose(means, means_chunked)
+    assert np.all(np.abs(means) < np.abs(values).max())
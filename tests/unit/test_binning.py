@@ -0,0 +1,51 @@
+from depict.core import binning
+from depict.core.binning import histogram_samples
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def samples():
+    return np.random.RandomState(0).lognormal(size=100000)
+
+
+@pytest.mark.parametrize("bins", [1, 10, 'fd', [0, 1, 2, 5, 100]])
+def test_histogram_samples_as_numpy(samples, bins):
+    centers, widths, counts = histogram_samples(samples, bins)
+    expected, edges = np.histogram(samples, bins=bins)
+    assert np.array_equal(counts, expected)
+    assert np.allclose(centers - widths / 2, edges[:-1])
+
+
+def test_histogram_samples_quantile(samples):
+    _, _, counts = histogram_samples(samples, 'quantile', nb_bins=4)
+    assert list(counts) == [25000] * 4
+
+
+def test_histogram_samples_approximate_quantiles(samples, monkeypatch):
+    monkeypatch.setattr(binning, 'EXACT_QUANTILES_MAX_SAMPLES', 1000)
+    _, _, counts = histogram_samples(samples, 'quantile', nb_bins=4)
+    assert np.allclose(counts, 25000, atol=50)
+
+
+def test_histogram_samples_nan(samples):
+    samples[:10] = np.nan
+    _, _, counts = histogram_samples(samples, 10)
+    assert counts.sum() == len(samples) - 10
+
+
+def test_histogram_samples_datetime():
+    dates = pd.date_range('2020-01-01', periods=1000, freq='10min')
+    centers, widths, counts = histogram_samples(dates, '1h')
+    assert centers[0] == np.datetime64('2020-01-01T00:30')
+    assert np.all(widths == np.timedelta64(1, 'h'))
+    assert list(counts[:3]) == [6, 6, 6]
+    assert counts.sum() == 1000
+
+
+def test_histogram_samples_invalid_bins(samples):
+    with pytest.raises(ValueError):
+        histogram_samples(samples, 'sturges')
+    with pytest.raises(ValueError):
+        histogram_samples(samples, [3, 2, 1])
@@ -0,0 +1,37 @@
+import pytest
+from depict.tools.color_palettes import categories_10, categories_256, \
+    get_palette, palette_cache_info, clear_palette_cache, linear_blue, \
+    linear_blue_red, linear_purple
+
+
+@pytest.mark.parametrize("nb_colors", [1, 9, 10, 11, 100, 256, 257, 600])
+def test_categories_length(nb_colors):
+    assert len(categories_10(nb_colors)) == nb_colors
+    assert len(categories_256(nb_colors)) == nb_colors
+
+
+def test_categories_values():
+    assert categories_10(2) == ['#4C72B0', '#DD8452']
+    assert categories_256(3) == ['#CC6565', '#66CC65', '#6566CC']
+    assert categories_256(256)[-1] == '#CC6568'
+    assert categories_10(12)[:2] == ['#CC6565', '#CC9865']
+    assert categories_10(300)[256] == categories_256(256)[0]
+
+
+def test_palette_cache():
+    clear_palette_cache()
+    assert palette_cache_info().currsize == 0
+    palette = get_palette('categories_10', 5)
+    palette[0] = 'red'  # The cached palette is not modified
+    assert get_palette('categories_10', 5) == categories_10(5)
+    info = palette_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    clear_palette_cache()
+    assert palette_cache_info().currsize == 0
+
+
+def test_linear_values():
+    assert linear_purple(3) == ['#EDD1CB', '#AA678F', '#2C1E3D']
+    assert linear_blue_red(3) == ['#8DAFFD', '#DDDCDB', '#F39879']
+    assert linear_blue(3) == ['#C5DAEE', '#6AADD5', '#2070B4']
+    assert linear_blue(256)[-1] == '#08306B'
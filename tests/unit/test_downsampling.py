@@ -0,0 +1,57 @@
+from depict.core.downsampling import lttb_indexes, min_max_indexes
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("nb_values", [5, 1000, 1001, 99999])
+def test_min_max_indexes_keeps_extremes(nb_values):
+    y = np.random.RandomState(0).randn(nb_values).cumsum()
+    indexes = min_max_indexes(y, 100)
+    assert len(indexes) <= max(100, nb_values)
+    assert np.all(np.diff(indexes) > 0)
+    assert {0, nb_values - 1, np.argmin(y), np.argmax(y)} <= set(indexes)
+
+
+def _lttb_reference(x, y, nb_points):
+    nb_values = len(y)
+    bucket_size = int(np.ceil((nb_values - 2) / (nb_points - 2)))
+    starts = list(range(1, nb_values - 1, bucket_size))
+    indexes = [0]
+    for i, start in enumerate(starts):
+        if i + 1 < len(starts):
+            end_next = min(starts[i + 1] + bucket_size, nb_values - 1)
+            x_c = x[starts[i + 1]:end_next].mean()
+            y_c = y[starts[i + 1]:end_next].mean()
+        else:
+            x_c, y_c = x[-1], y[-1]
+        a = indexes[-1]
+        candidates = np.arange(start, min(start + bucket_size, nb_values - 1))
+        areas = [abs((x[a] - x_c) * (y[j] - y[a]) - (x[a] - x[j]) * (
+            y_c - y[a])) for j in candidates]
+        indexes.append(candidates[np.argmax(areas)])
+    return indexes + [nb_values - 1]
+
+
+@pytest.mark.parametrize("nb_values, nb_points", [(1000, 100), (1003, 17),
+                                                  (10, 4)])
+def test_lttb_indexes_reference(nb_values, nb_points):
+    rng = np.random.RandomState(0)
+    x = np.sort(rng.rand(nb_values))
+    y = rng.randn(nb_values).cumsum()
+    assert list(lttb_indexes(x, y, nb_points)) == _lttb_reference(
+        x, y, nb_points)
+
+
+def test_lttb_indexes_datetime():
+    x = pd.date_range('2020-01-01', periods=1000, freq='min')
+    y = np.random.rand(1000)
+    indexes = lttb_indexes(x, y, 50)
+    assert len(indexes) <= 50
+    assert indexes[0] == 0 and indexes[-1] == 999
+
+
+def test_short_series_not_downsampled():
+    assert list(lttb_indexes(np.arange(5), np.arange(5), 10)) == list(
+        range(5))
+    assert list(min_max_indexes(np.arange(5), 10)) == list(range(5))
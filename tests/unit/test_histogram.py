@@ -0,0 +1,82 @@
+import depict
+from depict.core.tools import colors_to_rgba, format_colors
+from depict.tools.color_palettes import get_palette
+import numpy as np
+import pytest
+
+
+def test_histogram_basic():
+    depict.histogram(y=[1, 2, 3], show_plot=False)
+
+
+@pytest.mark.parametrize("color_mapping", ['python', 'browser'])
+def test_histogram_continuous_color_mapping(color_mapping):
+    depict.session(show_plot=False)
+    # One bar by color of the palette
+    y = np.arange(256.)
+    plot = depict.histogram(y=y, color=y, colorbar_type='continuous',
+                            color_mapping=color_mapping)
+    glyph_renderer = plot.figure.renderers[0]
+    data = glyph_renderer.data_source.data
+    if color_mapping == 'browser':
+        assert np.array_equal(data['color_value'], y)
+        color_mapper = glyph_renderer.glyph.fill_color['transform']
+        assert (color_mapper.low, color_mapper.high) == (0, 255)
+    else:
+        palette = get_palette('categories_10', 256)
+        assert np.array_equal(data['color'],
+                              colors_to_rgba(format_colors(palette)))
+
+
+def test_histogram_categorical_color_codes():
+    depict.session(show_plot=False)
+    color = [2., 1., 2., 3.] * 3
+    plot = depict.histogram(y=np.arange(12), color=color,
+                            colorbar_type='categorical', legend=None,
+                            color_mapping='browser')
+    glyph_renderer = plot.figure.renderers[0]
+    codes = glyph_renderer.data_source.data['color_value']
+    assert list(codes) == [1, 0, 1, 2] * 3
+    color_mapper = glyph_renderer.glyph.fill_color['transform']
+    assert (color_mapper.low, color_mapper.high) == (-0.5, 2.5)
+
+
+@pytest.mark.parametrize("color", [None, (0.1, 0.2, 0.3)])
+def test_histogram_scalar_color(color):
+    plot = depict.histogram(y=np.arange(100), color=color, show_plot=False)
+    renderer = plot.figure.renderers[0]
+    assert set(renderer.data_source.data) == {'top', 'left', 'right'}
+    if color is not None:
+        assert renderer.glyph.fill_color == '#19334C'
+
+
+def test_histogram_bins():
+    samples = np.random.randn(1000)
+    plot = depict.histogram(y=samples, bins=20, show_plot=False)
+    fig = plot.figure
+    data = fig.renderers[0].data_source.data
+    assert sum(data['top']) == 1000
+    assert len(data['top']) == 20
+
+
+def test_histogram_bins_with_x():
+    with pytest.raises(ValueError):
+        depict.histogram(y=[1, 2], x=[1, 2], bins=2, show_plot=False)
+
+
+def test_histogram_accumulator():
+    acc = depict.HistogramAccumulator(0, 1, nb_bins=5).add(np.random.rand(100))
+    plot = depict.histogram(y=acc, show_plot=False)
+    fig = plot.figure
+    data = fig.renderers[0].data_source.data
+    assert sum(data['top']) == 100
+    assert len(data['top']) == 5
+
+
+def test_histogram_datetime_edges():
+    x = np.array(['2020-01-01', '2020-01-03'], dtype='datetime64[ns]')
+    plot = depict.histogram(x=x, y=[1, 2], bar_width='1D', show_plot=False)
+    fig = plot.figure
+    data = fig.renderers[0].data_source.data
+    assert list(data['left']) == list(x - np.timedelta64(12, 'h'))
+    assert list(data['right']) == list(x + np.timedelta64(12, 'h'))
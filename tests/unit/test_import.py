@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+
+def test_import_is_lazy():
+    code = ('import sys, depict\n'
+            'slow = ("bokeh", "pandas", "seaborn", "matplotlib", "numpy", '
+            '"inspect")\n'
+            'print(any(m in sys.modules for m in slow))')
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_classes_imported_on_first_access():
+    code = ('import sys, depict\n'
+            'assert "depict.core.accumulator" not in sys.modules\n'
+            'from depict import HistogramAccumulator, TimingCollector\n'
+            'from depict.core.accumulator import HistogramAccumulator as H\n'
+            'from depict.core.timing import TimingCollector as T\n'
+            'assert (HistogramAccumulator, TimingCollector) == (H, T)\n'
+            'assert "HistogramAccumulator" in dir(depict)')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_default_session_created_on_first_call():
+    code = ('import depict\n'
+            'assert depict._SESSION is None\n'
+            'depict.line([1, 2, 3], show_plot=False)\n'
+            'assert depict._SESSION is not None')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_function_follows_session():
+    code = ('import depict\n'
+            'line = depict.line\n'
+            'depict.session(show_plot=False)\n'
+            'assert line([1, 2, 3]).session is depict._SESSION')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_function_documented():
+    code = ('import depict, inspect\n'
+            'names = ["line", "point", "histogram", "show", "save"]\n'
+            'lazy = [(str(inspect.signature(getattr(depict, n))),\n'
+            '         getattr(depict, n).__doc__) for n in names]\n'
+            'assert all("Args:" in doc for _, doc in lazy)\n'
+            'depict.session()\n'
+            'bound = [(str(inspect.signature(getattr(depict, n))),\n'
+            '          getattr(depict, n).__doc__) for n in names]\n'
+            'assert lazy == bound, (lazy, bound)')
+    subprocess.run([sys.executable, '-c', code], check=True)
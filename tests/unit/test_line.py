@@ -1,5 +1,72 @@
 import depict
+import numpy as np
 import pytest
 
+
 def test_hello_world():
-    depict.line([1, 2, 4], show_plot=False)
\ No newline at end of file
+    depict.line([1, 2, 4], show_plot=False)
+
+
+def test_line_2d_single_multi_line():
+    plot = depict.line(y=np.random.rand(50, 10), line_width=2,
+                       style=['solid', '--'] * 25, show_plot=False)
+    renderers = plot.figure.renderers
+    assert [type(r.glyph).__name__ for r in renderers] == ['MultiLine']
+    data = renderers[0].data_source.data
+    assert len(data['ys']) == 50
+    assert renderers[0].glyph.line_width == 2
+    assert data['line_dash'][:2] == ['solid', 'dashed']
+    assert data['color'].dtype == np.uint32
+
+
+def test_line_2d_legend_one_glyph_per_line():
+    plot = depict.line(y=np.random.rand(3, 10), legend=['a', 'b', 'c'],
+                       show_plot=False)
+    renderers = plot.figure.renderers
+    assert [type(r.glyph).__name__ for r in renderers] == ['Line'] * 3
+
+
+def test_line_shared_x_multi_line():
+    x = np.arange(10)
+    plot = depict.line(y=np.random.rand(4, 10), x=x, show_plot=False)
+    renderer = plot.figure.renderers[0]
+    assert 'xs' not in renderer.data_source.data
+    expr = renderer.glyph.xs.expr
+    assert np.array_equal(expr.args['x'], x)
+
+
+def test_line_shared_x_legend_one_source():
+    x = np.arange(10)
+    plot = depict.line(y=np.random.rand(3, 10), x=x, legend=['a', 'b', 'c'],
+                       show_plot=False)
+    renderers = plot.figure.renderers
+    sources = set([r.data_source.id for r in renderers])
+    assert len(sources) == 1
+    assert sorted(renderers[0].data_source.data) == ['x', 'y0', 'y1', 'y2']
+
+
+def test_line_shared_x_datetime():
+    x = ['2020-01-0{}'.format(i) for i in range(1, 6)]
+    plot = depict.line(y=np.random.rand(2, 5), x=x, legend=['a', 'b'],
+                       show_plot=False)
+    renderers = plot.figure.renderers
+    assert len(set([r.data_source.id for r in renderers])) == 1
+
+
+@pytest.mark.parametrize("downsampling", ['lttb', 'min_max'])
+def test_line_downsampling(downsampling):
+    y = np.random.rand(3, 10000)
+    plot = depict.line(y=y, width=500, downsampling=downsampling,
+                       points_per_pixel=2, fill_between=True,
+                       show_plot=False)
+    data = plot.figure.renderers[0].data_source.data
+    assert len(data['ys'][2]) <= 1000
+    # The lines filled between keep the same x
+    assert np.array_equal(data['xs'][0], data['xs'][1])
+    assert len(data['ys'][0]) < 2000
+
+
+def test_line_downsampling_invalid():
+    with pytest.raises(ValueError):
+        depict.line(y=np.random.rand(10000), downsampling='random',
+                    show_plot=False)
@@ -0,0 +1,73 @@
+from bokeh.plotting import figure
+import depict
+from depict.core.plot import Plot
+import pytest
+
+
+def _counting_plot(calls):
+    def make_figure():
+        calls.append(1)
+        return figure()
+
+    def step(f):
+        f.line(x=[1, 2], y=[1, 2])
+    return Plot(make_figure=make_figure, steps=[step], description='',
+                width=900, grid_visible=True, width_session=900,
+                session=None)
+
+
+def test_plot_figure_is_lazy_and_cached():
+    calls = []
+    plot = _counting_plot(calls)
+    assert calls == []
+    fig = plot.figure
+    assert len(fig.renderers) == 1
+    assert plot.figure is fig
+    assert len(calls) == 1
+
+
+def test_plot_figure_invalidated_by_steps():
+    calls = []
+    plot = _counting_plot(calls)
+    fig = plot.figure
+    plot.steps.append(plot.steps[0])
+    assert plot.figure is not fig
+    assert len(plot.figure.renderers) == 2
+    plot.steps = plot.steps[:1]
+    assert len(plot.figure.renderers) == 1
+    assert len(calls) == 3
+
+
+def test_plot_invalid_range():
+    with pytest.raises(ValueError):
+        depict.line(y=[1, 2, 3], x_range=1, show_plot=False)
+
+
+def test_plot_sum_is_flattened_lazily():
+    calls = []
+    plots = [_counting_plot(calls) for _ in range(5000)]
+    for i, plot in enumerate(plots):
+        plot.description = str(i)
+    plot_sum = sum(plots)
+    assert calls == []
+    assert plot_sum.steps == [plot.steps[0] for plot in plots]
+    assert plot_sum.description == '<br>'.join(
+        [str(i) for i in range(5000)])
+    nested = (plots[0] + plots[1]) + (plots[2] + plots[3])
+    assert nested.description == '0<br>1<br>2<br>3'
+    assert len(nested.figure.renderers) == 4
+    assert len(calls) == 1
+
+
+def test_plot_sum_snapshot_when_flattened():
+    plot_1, plot_2 = _counting_plot([]), _counting_plot([])
+    plot_sum = plot_1 + plot_2
+    # Before the sum is flattened, it sees the changes of its operands
+    plot_1.steps = plot_1.steps * 2
+    plot_1.description = 'a'
+    assert len(plot_sum.steps) == 3
+    # Its steps and description are then taken together, and kept
+    plot_1.steps.append(plot_1.steps[0])
+    plot_2.description = 'b'
+    assert len(plot_sum.steps) == 3
+    assert plot_sum.description == 'a<br>'
@@ -0,0 +1,95 @@
+import depict
+from depict.core.tools import colors_to_rgba, format_colors
+from depict.tools.color_palettes import get_palette
+import numpy as np
+import pytest
+
+
+def test_point_basic():
+    depict.point(x=[1, 2, 3], y=[4, 5, 2], show_plot=False)
+
+
+@pytest.mark.parametrize("color_mapping", ['python', 'browser'])
+def test_point_continuous_color_mapping(color_mapping):
+    depict.session(show_plot=False)
+    # One point by color of the palette
+    x = np.arange(256.)
+    plot = depict.point(x=x, y=x, color=x, colorbar_type='continuous',
+                        color_mapping=color_mapping)
+    glyph_renderer = plot.figure.renderers[0]
+    data = glyph_renderer.data_source.data
+    if color_mapping == 'browser':
+        assert glyph_renderer.glyph.fill_color['field'] == 'color_value'
+        assert np.array_equal(data['color_value'], x)
+        color_mapper = glyph_renderer.glyph.fill_color['transform']
+        assert (color_mapper.low, color_mapper.high) == (0, 255)
+    else:
+        palette = get_palette('categories_10', 256)
+        assert np.array_equal(data['color'],
+                              colors_to_rgba(format_colors(palette)))
+
+
+def test_point_categorical_color_codes():
+    color = [2., 1., 2., 3.] * 3
+    plot = depict.point(x=np.arange(12), y=np.arange(12), color=color,
+                        colorbar_type='categorical', legend=None,
+                        color_mapping='browser', show_plot=False)
+    glyph_renderer = plot.figure.renderers[0]
+    codes = glyph_renderer.data_source.data['color_value']
+    assert list(codes) == [1, 0, 1, 2] * 3
+    color_mapper = glyph_renderer.glyph.fill_color['transform']
+    assert (color_mapper.low, color_mapper.high) == (-0.5, 2.5)
+
+
+def test_point_invalid_color_mapping():
+    with pytest.raises(ValueError):
+        depict.point(x=[1, 2], y=[1, 2], color_mapping='gpu',
+                     show_plot=False)
+
+
+@pytest.mark.parametrize("reduction", ['count', 'mean', 'max'])
+def test_point_raster_aggregation(reduction):
+    x = np.random.rand(10000)
+    plot = depict.point(x=x, y=x, color=x, aggregation='raster',
+                        reduction=reduction, width=300, height=200,
+                        show_plot=False)
+    renderers = plot.figure.renderers
+    assert [type(r.glyph).__name__ for r in renderers] == ['Image']
+    assert renderers[0].data_source.data['image'][0].shape == (200, 300)
+
+
+def test_point_invalid_aggregation():
+    with pytest.raises(ValueError):
+        depict.point(x=[1, 2], y=[1, 2], aggregation='voronoi',
+                     show_plot=False)
+    with pytest.raises(ValueError):
+        depict.point(x=[1, 2], y=[1, 2], aggregation='raster',
+                     reduction='mean', show_plot=False)
+
+
+def test_point_hexbin_aggregation():
+    x = np.random.rand(10000)
+    plot = depict.point(x=x, y=x, aggregation='hexbin', hex_size=10,
+                        show_plot=False)
+    renderers = plot.figure.renderers
+    assert [type(r.glyph).__name__ for r in renderers] == ['HexTile']
+    assert sum(renderers[0].data_source.data['value']) == 10000
+
+
+def test_point_legend_array():
+    legend = np.array(['a', 'b', 'a', 'c'])
+    plot = depict.point(x=np.arange(4), y=np.arange(4), legend=legend,
+                        show_plot=False)
+    fig = plot.figure
+    data = [r.data_source.data for r in fig.renderers]
+    assert [list(d['x']) for d in data] == [[0, 2], [1], [3]]
+
+
+def test_point_scalar_properties():
+    plot = depict.point(x=np.arange(100), y=np.arange(100), size=3, alpha=0.5,
+                        color=(0.1, 0.2, 0.3), show_plot=False)
+    renderer = plot.figure.renderers[0]
+    assert set(renderer.data_source.data) == {'x', 'y'}
+    assert renderer.glyph.size == 3
+    assert renderer.glyph.fill_alpha == 0.5
+    assert renderer.glyph.fill_color == '#19334C'
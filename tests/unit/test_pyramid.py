@@ -0,0 +1,98 @@
+from depict.core.pyramid import PYRAMID_FACTOR, Pyramid, is_sorted
+import depict
+from bokeh.models import ColumnDataSource
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("method", ['lttb', 'min_max', 'sample'])
+def test_pyramid_levels(method):
+    x = np.arange(10000)
+    y = np.random.rand(10000)
+    pyramid = Pyramid(data={'x': x, 'y': y}, x_name='x', nb_points=100,
+                      max_points=1000, method=method)
+    sizes = [sum([len(chunk['x']) for chunk in level])
+             for level in pyramid.levels]
+    assert sizes[0] <= 100
+    assert sizes[-1] == 10000
+    assert len(sizes) == 5
+    # Each level has about PYRAMID_FACTOR times more points than the
+    # previous one (the decimation may keep fewer points than asked)
+    level_sizes = pyramid.level_sizes() + [10000]
+    assert all([s_1 <= PYRAMID_FACTOR * (s_0 + 1)
+                for s_0, s_1 in zip(level_sizes[:-1], level_sizes[1:])])
+    assert all([s <= s_max for s, s_max in zip(sizes, level_sizes)])
+    for level in pyramid.levels:
+        assert all([len(chunk['x']) <= 1000 for chunk in level])
+        x_level = np.concatenate([chunk['x'] for chunk in level])
+        assert is_sorted(x_level)
+        assert np.array_equal(y[x_level],
+                              np.concatenate([chunk['y'] for chunk in level]))
+
+
+@pytest.mark.parametrize("nb_values", [1001, 4100, 10000, 65537])
+def test_pyramid_payload(nb_values):
+    x = np.arange(nb_values)
+    pyramid = Pyramid(data={'x': x, 'y': np.random.rand(nb_values)},
+                      x_name='x', nb_points=250, max_points=1000,
+                      method='min_max')
+    nb_embedded = sum([len(chunk['x']) for level in pyramid.levels
+                       for chunk in level])
+    assert nb_embedded <= nb_values * 4 / 3 + 250
+
+
+def test_pyramid_several_columns():
+    x = np.arange(10000)
+    y_1 = np.zeros(10000)
+    y_1[1234] = 1
+    y_2 = np.zeros(10000)
+    y_2[5678] = -1
+    pyramid = Pyramid(data={'x': x, 'y1': y_1, 'y2': y_2}, x_name='x',
+                      nb_points=100, max_points=1000, method='min_max',
+                      y_names=('y1', 'y2'))
+    for size, indexes in zip(pyramid.level_sizes(),
+                             pyramid.level_indexes()):
+        assert len(indexes) <= size
+        assert (1234 in indexes) and (5678 in indexes)
+
+
+def test_line_pyramid():
+    depict.session(show_plot=False, pyramid=True, pyramid_max_points=1000)
+    plot = depict.line(y=np.random.rand(2, 10000), width=500)
+    fig = plot.figure
+    assert len(fig.renderers) == 2
+    assert len(fig.renderers[0].data_source.data['x']) <= 1000
+    assert len(fig.x_range.js_property_callbacks['change:start']) == 2
+    depict.session()
+
+
+def test_point_pyramid():
+    depict.session(show_plot=False, pyramid=True, pyramid_max_points=1000)
+    x = np.random.rand(5000)
+    plot = depict.point(x=x, y=x, color=x, color_mapping='browser')
+    fig = plot.figure
+    data = fig.renderers[0].data_source.data
+    assert len(data['x']) <= 1000
+    assert is_sorted(data['x'])
+    assert np.array_equal(data['x'], data['color_value'])
+    depict.session()
+
+
+def test_line_pyramid_fill_between():
+    depict.session(show_plot=False, pyramid=True, pyramid_max_points=1000)
+    y = np.random.rand(2, 10000)
+    plot = depict.line(y=y, width=500, fill_between=True)
+    fig = plot.figure
+    area = fig.renderers[-1]
+    assert area.glyph.y1 == 'y1'
+    assert len(area.data_source.data['x']) <= 1000
+    # The lines and the area share the sources of one pyramid
+    assert all([r.data_source is area.data_source for r in fig.renderers])
+    assert len(fig.x_range.js_property_callbacks['change:start']) == 1
+    # x, y1 and y2 embedded once: 4/3 of the points, plus the coarsest level
+    # in the pyramid and in the source displayed
+    nb_embedded = sum([len(column) for source in
+                       fig.select({'type': ColumnDataSource})
+                       for column in source.data.values()])
+    assert nb_embedded <= 3 * (10000 * 4 / 3 + 2 * 1000)
+    depict.session()
@@ -1,4 +1,5 @@
 import depict
+import numpy as np
 import pytest
 
 
@@ -33,3 +34,22 @@ def test_params_valid_session(width, height, save_path, file_exists_mode,
                    show_plot=show_plot,
                    width_total_as_session=width_total_as_session,
                    automatic_color_mapping=automatic_color_mapping)
+
+
+@pytest.mark.parametrize("output_backend, nb_points, expected", [
+    ('canvas', 1000, 'canvas'), ('webgl', 10, 'webgl'),
+    ('auto', 100, 'canvas'), ('auto', 1000, 'webgl')])
+def test_session_output_backend(output_backend, nb_points, expected):
+    depict.session(show_plot=False, output_backend=output_backend,
+                   webgl_threshold=500)
+    plot = depict.point(x=np.arange(nb_points), y=np.arange(nb_points))
+    assert plot.figure.output_backend == expected
+    assert plot.new_figure().output_backend == expected
+    plot_sum = plot + depict.line(y=np.arange(nb_points))
+    assert plot_sum.nb_points == 2 * nb_points
+    depict.session()
+
+
+def test_session_invalid_output_backend():
+    with pytest.raises(ValueError):
+        depict.session(output_backend='svg')
@@ -0,0 +1,46 @@
+import depict
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def timings():
+    timings = depict.TimingCollector()
+    depict.session(show_plot=False, timing_callback=timings)
+    yield timings
+    depict.session()
+
+
+@pytest.mark.parametrize("function", ['line', 'point', 'histogram'])
+def test_timing_plot_stages(timings, function):
+    getattr(depict, function)(x=np.arange(10), y=np.random.rand(10))
+    assert len(timings.records) == 1
+    record = timings.records[0]
+    assert record['function'] == function
+    assert {'input', 'color', 'axis_type', 'steps', 'plot'} <= set(
+        record['durations'])
+    assert all(d >= 0 for d in record['durations'].values())
+    assert sum(record['durations'].values()) <= record['total']
+
+
+def test_timing_histogram_stages(timings):
+    # Each stage is timed once, in order
+    depict.histogram(x=np.arange(10), y=np.random.rand(10))
+    assert list(timings.records[0]['durations']) == [
+        'input', 'color', 'options', 'axis_type', 'bars', 'steps', 'plot']
+
+
+def test_timing_save_stages(timings, tmpdir):
+    plot = depict.line(y=[1, 2, 3])
+    depict.save([plot, [plot, plot]], str(tmpdir.join('plot.html')),
+                'overwrite')
+    record = timings.records[-1]
+    assert record['function'] == 'save'
+    assert {'make_fig', 'steps_replay', 'layout', 'file_html', 'write'} <= \
+        set(record['durations'])
+    assert set(timings.total_by_stage('save')) == set(record['durations'])
+
+
+def test_timing_without_callback():
+    depict.session(show_plot=False)
+    depict.line(y=[1, 2, 3])
@@ -0,0 +1,104 @@
+import depict
+import numpy as np
+import pytest
+from depict.core.tools import colors_to_rgba, format_color, format_colors
+from depict.core.tools import group_by_legend, non_binary_columns
+
+
+def test_format_colors_as_format_color():
+    rng = np.random.RandomState(0)
+    colors_float = rng.rand(100, 3)
+    colors_int = rng.randint(0, 256, size=(100, 3))
+    assert format_colors(colors_float) == [format_color(tuple(c)) for c in
+                                           colors_float.tolist()]
+    assert format_colors(colors_int.tolist()) == [
+        format_color(tuple(c)) for c in colors_int.tolist()]
+
+
+@pytest.mark.parametrize("colors, expected", [
+    ([], []),
+    (['red', '#FFFFFF'], ['red', '#FFFFFF']),
+    (['red', (1., 0., 0.)], ['red', '#FF0000']),
+    (np.array([[0, 0, 1], [0, 0, 255]]), ['#0000FF', '#0000FF']),
+])
+def test_format_colors(colors, expected):
+    assert format_colors(colors) == expected
+
+
+def test_group_by_legend():
+    legend = ['b', 'a', 'b', 'c', 'a']
+    legend_unique, (values, squares) = group_by_legend(
+        legend, [np.arange(5), np.arange(5) ** 2])
+    assert list(legend_unique) == ['a', 'b', 'c']
+    assert [list(v) for v in values] == [[1, 4], [0, 2], [3]]
+    assert [list(s) for s in squares] == [[1, 16], [0, 4], [9]]
+
+
+def test_colors_to_rgba():
+    packed = colors_to_rgba(['#FF0000', 'blue', '#00ff0080', '#FF0000'])
+    assert packed.dtype == np.uint32
+    assert list(packed) == [0xFF0000FF, 0x0000FFFF, 0x00FF0080, 0xFF0000FF]
+    assert colors_to_rgba(['red', 'rgb(1, 2, 3)']) == ['red', 'rgb(1, 2, 3)']
+
+
+@pytest.mark.parametrize("function, kwargs", [
+    ('line', {'y': [[1, 2, 3], [2, 3, 4]]}),
+    ('point', {'x': [1, 2, 3], 'y': [2, 1, 3], 'color': [1, 2, 3],
+               'colorbar_type': 'continuous'}),
+    ('histogram', {'y': [1, 2, 3], 'color': ['red', 'blue', 'red']}),
+])
+def test_saved_columns_are_binary(tmpdir, function, kwargs):
+    depict.session(show_plot=False)
+    plot = getattr(depict, function)(**kwargs)
+    path = str(tmpdir.join('plot.html'))
+    depict.save(plot, path, 'overwrite')
+    assert non_binary_columns(path) == []
+
+
+def test_non_binary_columns_unknown_document(tmpdir):
+    path = tmpdir.join('page.html')
+    path.write('<html><body>No plot</body></html>')
+    with pytest.raises(ValueError):
+        non_binary_columns(str(path))
+
+
+def test_layout_cache(tmpdir):
+    timings = depict.TimingCollector()
+    depict.session(show_plot=False, timing_callback=timings)
+    plot = depict.line(y=[1, 2, 3])
+    path = str(tmpdir.join('plot.html'))
+    depict.save([plot, plot], path, 'overwrite')
+    depict.save([plot, plot], path, 'overwrite')
+    assert 'layout_cache' not in timings.records[-2]['durations']
+    assert 'layout_cache' in timings.records[-1]['durations']
+    # Other options, changed plot or cleared cache: the layout is rebuilt
+    depict.save([plot, plot], path, 'overwrite', share_x=True)
+    plot.description = 'changed'
+    depict.save([plot, plot], path, 'overwrite')
+    depict.clear_cache(plot)
+    depict.save([plot, plot], path, 'overwrite')
+    assert all(['layout_cache' not in record['durations']
+                for record in timings.records[-3:]])
+    # Other figure or session options: the layout is rebuilt
+    plot.make_figure = depict.line(y=[1, 2], title='other').make_figure
+    depict.save([plot, plot], path, 'overwrite')
+    depict.save([plot, plot], path, 'overwrite')
+    plot.session.background_color = '#000000'
+    depict.save([plot, plot], path, 'overwrite')
+    assert 'layout_cache' not in timings.records[-3]['durations']
+    assert 'layout_cache' in timings.records[-2]['durations']
+    assert 'layout_cache' not in timings.records[-1]['durations']
+
+
+def test_layout_cache_explicit_only(tmpdir):
+    from depict.core import tools
+    depict.session(show_plot=False)
+    depict.clear_cache()
+    path = str(tmpdir.join('plot.html'))
+    plot = depict.line(y=[1, 2, 3], save_path=path)
+    depict.point(x=[1, 2, 3], y=[1, 2, 3], save_path=path)
+    depict.histogram(y=[1, 2, 3], save_path=path)
+    assert len(tools._LAYOUT_CACHE) == 0
+    depict.save(plot, path)
+    assert len(tools._LAYOUT_CACHE) == 1
+    depict.session()